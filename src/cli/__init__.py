@@ -20,58 +20,53 @@ Usage:
     python -m src.cli trajectories export -o data.jsonl
 """
 
+import importlib
+from typing import Any
+
 import typer
 
-from src.cli.run import run_command
-from src.cli.validate import validate_command
-from src.cli.catalog import catalog_app, catalog_command
-from src.cli.schedule import schedule_app, schedule_command
-from src.cli.health import health_command
-from src.cli.monitor import monitor_app
-from src.cli.citation import citation_app
-from src.cli.synthesize import synthesize_command
-from src.cli.feedback import app as feedback_app
-from src.cli.research import research_app
-from src.cli.trajectories import trajectories_app
+from src.cli.registry import LazyCommandGroup
+
+# Create main app. Subcommands are resolved lazily from
+# ``src.cli.registry.COMMANDS`` so that invoking one command only
+# imports that command's module (and its services).
+app = typer.Typer(
+    cls=LazyCommandGroup,
+    help="ARISP: Automated Research Ingestion & Synthesis Pipeline",
+)
+
+
+@app.callback()
+def _main() -> None:
+    # Every command lives in the lazy registry; this callback only makes
+    # Typer build ``app`` as a group rather than a single command.
+    pass
+
 
-# Create main app
-app = typer.Typer(help="ARISP: Automated Research Ingestion & Synthesis Pipeline")
+# Backward-compatible re-exports, imported on first attribute access.
+_EXPORTS = {
+    "run_command": ("src.cli.run", "run_command"),
+    "validate_command": ("src.cli.validate", "validate_command"),
+    "catalog_app": ("src.cli.catalog", "catalog_app"),
+    "catalog_command": ("src.cli.catalog", "catalog_command"),
+    "schedule_app": ("src.cli.schedule", "schedule_app"),
+    "schedule_command": ("src.cli.schedule", "schedule_command"),
+    "health_command": ("src.cli.health", "health_command"),
+    "synthesize_command": ("src.cli.synthesize", "synthesize_command"),
+    "feedback_app": ("src.cli.feedback", "app"),
+    "monitor_app": ("src.cli.monitor", "monitor_app"),
+    "research_app": ("src.cli.research", "research_app"),
+    "trajectories_app": ("src.cli.trajectories", "trajectories_app"),
+    "citation_app": ("src.cli.citation", "citation_app"),
+}
 
-# Register individual commands
-app.command(name="run")(run_command)
-app.command(name="validate")(validate_command)
-app.command(name="health")(health_command)
-app.command(name="synthesize")(synthesize_command)
 
-# Register sub-applications
-app.add_typer(catalog_app, name="catalog")
-app.add_typer(schedule_app, name="schedule")
-app.add_typer(feedback_app, name="feedback")
-app.add_typer(monitor_app, name="monitor")
-app.add_typer(citation_app, name="citation")
-app.add_typer(research_app, name="research")
-app.add_typer(trajectories_app, name="trajectories")
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), attr)
 
-# Legacy command registrations for backward compatibility
-# These allow the old invocation style: python -m src.cli catalog show
-# as well as: python -m src.cli catalog <action>
-app.command(name="catalog-legacy", hidden=True)(catalog_command)
-app.command(name="schedule-legacy", hidden=True)(schedule_command)
 
-# Re-export for backward compatibility
-__all__ = [
-    "app",
-    "run_command",
-    "validate_command",
-    "catalog_app",
-    "catalog_command",
-    "schedule_app",
-    "schedule_command",
-    "health_command",
-    "synthesize_command",
-    "feedback_app",
-    "monitor_app",
-    "research_app",
-    "trajectories_app",
-    "citation_app",
-]
+__all__ = ["app", *_EXPORTS]
@@ -268,6 +268,11 @@ def expand_command(
     direction: CrawlDirection = typer.Option(
         CrawlDirection.BOTH, "--direction", help="Crawl direction"
     ),
+    layer_parallel: bool = typer.Option(
+        False,
+        "--layer-parallel",
+        help="Expand each BFS level concurrently and persist it in one batch",
+    ),
     db_path: Optional[Path] = typer.Option(
         None, "--db-path", help="Override citation DB path"
     ),
@@ -282,10 +287,18 @@ def expand_command(
         max_depth=depth,
         max_papers_per_level=max_papers,
         direction=direction,
+        layer_parallel=layer_parallel,
     )
 
     cr = _build_crawler(db_path=db_path)
-    result = asyncio.run(cr.crawl(paper_id, config=config))
+
+    async def _crawl() -> Any:
+        try:
+            return await cr.crawl(paper_id, config=config)
+        finally:
+            await cr.aclose()
+
+    result = asyncio.run(_crawl())
 
     if emit_json:
         typer.echo(
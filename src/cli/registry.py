@@ -0,0 +1,149 @@
+"""Lazy subcommand registry for the ARISP CLI.
+
+Importing a CLI module pulls in its service layer (pydantic models,
+storage, provider clients, ...). The top-level ``app`` therefore does
+not import any of them up front: each subcommand is described by a
+:class:`LazyCommand` entry and :class:`LazyCommandGroup` imports the
+owning module only when that subcommand is actually invoked.
+
+``--help`` on the top-level app is rendered from the registry's help
+strings, so listing commands imports nothing either.
+"""
+
+import importlib
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Where to find a subcommand and how to describe it without importing.
+
+    Attributes:
+        module: Dotted module path that defines the command.
+        attr: Attribute name of the command function or ``typer.Typer``
+            sub-application inside ``module``.
+        help: One-line help shown in the top-level command listing.
+            Must match the command's own (first-line) help text.
+        hidden: Hide the command from help output.
+    """
+
+    module: str
+    attr: str
+    help: str
+    hidden: bool = False
+
+
+# Order is the order commands are listed in ``--help``.
+COMMANDS: Dict[str, LazyCommand] = {
+    "run": LazyCommand(
+        "src.cli.run",
+        "run_command",
+        "Run the research pipeline based on configuration.",
+    ),
+    "validate": LazyCommand(
+        "src.cli.validate",
+        "validate_command",
+        "Validate configuration file syntax and semantics.",
+    ),
+    "health": LazyCommand(
+        "src.cli.health",
+        "health_command",
+        "Start standalone health server.",
+    ),
+    "synthesize": LazyCommand(
+        "src.cli.synthesize",
+        "synthesize_command",
+        "Run cross-topic knowledge synthesis.",
+    ),
+    # Legacy command registrations for backward compatibility.
+    "catalog-legacy": LazyCommand(
+        "src.cli.catalog",
+        "catalog_command",
+        "Manage research catalog (legacy interface).",
+        hidden=True,
+    ),
+    "schedule-legacy": LazyCommand(
+        "src.cli.schedule",
+        "schedule_command",
+        "Start scheduler daemon with health server (legacy interface).",
+        hidden=True,
+    ),
+    "catalog": LazyCommand("src.cli.catalog", "catalog_app", "Manage research catalog"),
+    "schedule": LazyCommand(
+        "src.cli.schedule", "schedule_app", "Manage research scheduler"
+    ),
+    "feedback": LazyCommand(
+        "src.cli.feedback",
+        "app",
+        "Manage paper feedback for personalized recommendations.",
+    ),
+    "monitor": LazyCommand(
+        "src.cli.monitor",
+        "monitor_app",
+        "Proactive paper monitoring (Milestone 9.1)",
+    ),
+    "citation": LazyCommand(
+        "src.cli.citation",
+        "citation_app",
+        "Citation graph intelligence (Phase 9.2)",
+    ),
+    "research": LazyCommand(
+        "src.cli.research", "research_app", "Deep Research Agent commands"
+    ),
+    "trajectories": LazyCommand(
+        "src.cli.trajectories",
+        "trajectories_app",
+        "Trajectory management commands",
+    ),
+}
+
+
+def load_command(name: str, spec: LazyCommand) -> Any:
+    """Import ``spec.module`` and build the click command for ``name``.
+
+    The object is registered on a throwaway ``typer.Typer`` exactly as
+    ``app.command()`` / ``app.add_typer()`` would register it, so the
+    resulting command behaves the same as an eagerly registered one.
+    """
+    target = getattr(importlib.import_module(spec.module), spec.attr)
+    holder = typer.Typer()
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name, hidden=spec.hidden)
+    else:
+        holder.command(name=name, hidden=spec.hidden)(target)
+    return typer.main.get_group(holder).commands[name]
+
+
+class LazyCommandGroup(TyperGroup):
+    """Top-level group that resolves subcommands from :data:`COMMANDS`."""
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._describe_only = False
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        return list(COMMANDS)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        spec = COMMANDS.get(cmd_name)
+        if spec is None:
+            return None
+        if self._describe_only:
+            # Help listing only needs the name and the one-line help;
+            # don't import the module to get them.
+            return TyperCommand(name=cmd_name, help=spec.help, hidden=spec.hidden)
+        command = load_command(cmd_name, spec)
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        self._describe_only = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._describe_only = False
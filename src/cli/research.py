@@ -5,14 +5,19 @@ Provides interactive research sessions using the DRA.
 Usage:
     python -m src.cli research "What are the key techniques in ToT?"
     python -m src.cli research --question-file questions.txt
+    python -m src.cli research -f questions.txt -j 8 --token-budget 500000
 """
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
+import click
 import structlog
 import typer
+from typer.core import TyperGroup
 
+from src.cli.research_client import DEFAULT_SOCKET_NAME, ResearchClient
 from src.cli.utils import (
     display_error,
     display_info,
@@ -28,8 +33,40 @@ logger = structlog.get_logger()
 REASONING_TRUNCATE_LIMIT = 500
 OBSERVATION_TRUNCATE_LIMIT = 300
 
+# ctx.meta key holding a leading subcommand and its arguments
+_SUBCOMMAND_ARGS_KEY = "research.subcommand_args"
+
+
+class ResearchGroup(TyperGroup):
+    """Group whose leading subcommand name is not taken as the question.
+
+    The callback's optional ``question`` argument would otherwise consume
+    ``status``/``serve``/``reload`` and run them as research questions.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if args and args[0] in self.commands:
+            # Parse only the group defaults; invoke() runs the subcommand
+            super().parse_args(ctx, [])
+            ctx.meta[_SUBCOMMAND_ARGS_KEY] = args
+            return []
+        return super().parse_args(ctx, args)
+
+    def invoke(self, ctx: click.Context) -> object:
+        args = ctx.meta.pop(_SUBCOMMAND_ARGS_KEY, None)
+        if args is None:
+            return super().invoke(ctx)
+        with ctx:
+            cmd_name, cmd, cmd_args = self.resolve_command(ctx, args)
+            assert cmd is not None and cmd_name is not None
+            ctx.invoked_subcommand = cmd_name
+            click.Command.invoke(self, ctx)
+            with cmd.make_context(cmd_name, cmd_args, parent=ctx) as sub_ctx:
+                return sub_ctx.command.invoke(sub_ctx)
+
+
 # Create research sub-application
-research_app = typer.Typer(help="Deep Research Agent commands")
+research_app = typer.Typer(help="Deep Research Agent commands", cls=ResearchGroup)
 
 
 @research_app.callback(invoke_without_command=True)
@@ -70,15 +107,49 @@ def research_command(
         "-v",
         help="Show detailed progress during research",
     ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Research sessions to run concurrently",
+    ),
+    llm_concurrency: int = typer.Option(
+        4,
+        "--llm-concurrency",
+        min=1,
+        help="LLM calls in flight across all sessions",
+    ),
+    token_budget: Optional[int] = typer.Option(
+        None,
+        "--token-budget",
+        min=1,
+        help="Total LLM token budget for all questions",
+    ),
+    server_socket: Optional[Path] = typer.Option(
+        None,
+        "--server-socket",
+        help="Research server socket (default: <corpus_dir>/research.sock)",
+    ),
+    no_server: bool = typer.Option(
+        False,
+        "--no-server",
+        help="Run in this process even if a research server is running",
+    ),
 ) -> None:
     """Execute a deep research session.
 
     Asks questions to the DRA which searches the offline corpus,
     reasons about findings, and synthesizes answers with citations.
+    Multiple questions share one loaded corpus and run concurrently;
+    results are reported as each session finishes. When a research
+    server (``arisp research serve``) is running for the corpus, the
+    questions are sent to it instead of loading the corpus here.
 
     Examples:
         arisp research "What techniques improve LLM reasoning?"
         arisp research -f questions.txt -o results.md
+        arisp research -f questions.txt -j 8 --token-budget 500000
     """
     # If a subcommand was invoked, skip the default behavior
     if ctx.invoked_subcommand is not None:
@@ -113,31 +184,82 @@ def research_command(
 
     # Load config
     config = load_config(config_path)
+    corpus_dir = _corpus_dir(config)
+
+    results: list[str] = [""] * len(questions)
+
+    def _report(outcome, done: int) -> None:
+        """Record and display one finished session."""
+        q = outcome.question
+        if len(questions) > 1:
+            display_info(f"\n[{done}/{len(questions)}] Finished: {q[:80]}")
+
+        if outcome.error is not None:
+            display_error(f"Research failed: {outcome.error}")
+            results[outcome.index] = f"# Question: {q}\n\n**Error:** {outcome.error}\n"
+            return
+
+        result = outcome.result
+        results[outcome.index] = _format_result(result, verbose=verbose)
+
+        # Display summary
+        if result.answer:
+            display_success(f"✓ Answer produced in {result.total_turns} turns")
+            if result.papers_consulted:
+                display_info(
+                    f"  Papers consulted: {', '.join(result.papers_consulted[:5])}"
+                    + ("..." if len(result.papers_consulted) > 5 else "")
+                )
+        else:
+            display_warning(
+                f"✗ No answer produced (exhausted={result.exhausted}, "
+                f"turns={result.total_turns})"
+            )
+
+    def _finish(tokens_used: int) -> None:
+        """Report token usage and write the collected results."""
+        if token_budget is not None:
+            display_info(f"LLM tokens used: {tokens_used:,} / {token_budget:,}")
+
+        # Output results
+        output_content = "\n\n---\n\n".join(results)
+
+        if output_file:
+            output_file.write_text(output_content)
+            display_success(f"\nResults saved to {output_file}")
+        else:
+            typer.echo("\n" + "=" * 60)
+            typer.echo(output_content)
+            typer.echo("=" * 60)
+
+    # Dispatch to a warm research server when one is running
+    client = ResearchClient(server_socket or corpus_dir / DEFAULT_SOCKET_NAME)
+    if not no_server and client.is_running():
+        display_info(f"Dispatching to research server at {client.socket_path}")
+        outcomes = client.research(
+            questions,
+            max_turns=max_turns,
+            concurrency=concurrency,
+            llm_concurrency=llm_concurrency,
+            token_budget=token_budget,
+        )
+        for done, outcome in enumerate(outcomes, start=1):
+            _report(outcome, done)
+        _finish(client.tokens_used)
+        return
 
     # Initialize DRA components
     display_info("Initializing Deep Research Agent...")
 
     try:
         from src.models.dra import AgentLimits
-        from src.services.dra.agent import DeepResearchAgent
-        from src.services.dra.browser import ResearchBrowser
+        from src.services.dra.agent import ResearchSessionRunner
         from src.services.dra.corpus_manager import CorpusManager
-        from src.services.llm.service import LLMService
     except ImportError as e:
         display_error(f"Failed to import DRA modules: {e}")
         display_warning("Ensure all DRA dependencies are installed")
         raise typer.Exit(code=1)
 
-    # Get corpus directory from config or use default
-    corpus_dir = Path(
-        getattr(
-            getattr(config.settings, "dra_settings", None),
-            "corpus_dir",
-            "./data/dra/corpus",
-        )
-        or "./data/dra/corpus"
-    )
-
     # Initialize corpus manager
     try:
         from src.models.dra import CorpusConfig
@@ -153,11 +275,61 @@ def research_command(
         display_error(f"Failed to load corpus: {e}")
         raise typer.Exit(code=1)
 
-    # Initialize browser
-    browser = ResearchBrowser(corpus_manager=corpus_manager)
-    display_success("✓ Research browser initialized")
+    llm_service = _create_llm_service(config)
+
+    # Each session gets its own browser and agent over the shared corpus
+    limits = AgentLimits(max_turns=max_turns)
+    session_runner = ResearchSessionRunner(
+        corpus_manager=corpus_manager,
+        llm_service=llm_service,
+        limits=limits,
+        max_concurrent_sessions=concurrency,
+        max_concurrent_llm_calls=llm_concurrency,
+        max_total_tokens=token_budget,
+    )
+    display_success("✓ Deep Research Agent ready")
+
+    if len(questions) > 1:
+        display_info(
+            f"\nResearching {len(questions)} questions "
+            f"({min(concurrency, len(questions))} at a time)..."
+        )
+    else:
+        display_info(f"\nResearching: {questions[0]}")
+    if verbose:
+        display_info("Starting ReAct loop...")
+
+    # Process questions, reporting each session as soon as it finishes
+    async def _run_sessions() -> None:
+        done = 0
+        async for outcome in session_runner.run(questions):
+            done += 1
+            _report(outcome, done)
+
+    asyncio.run(_run_sessions())
+    _finish(session_runner.gate.tokens_used)
+
+
+def _corpus_dir(config) -> Path:
+    """Corpus directory from the research config (or the default)."""
+    return Path(
+        getattr(
+            getattr(config.settings, "dra_settings", None),
+            "corpus_dir",
+            "./data/dra/corpus",
+        )
+        or "./data/dra/corpus"
+    )
+
+
+def _create_llm_service(config):
+    """Build the LLM service from the config's ``llm_settings``.
+
+    Raises:
+        typer.Exit: If LLM settings are missing or the service fails to start
+    """
+    from src.services.llm.service import LLMService
 
-    # Initialize LLM service
     try:
         llm_settings = config.settings.llm_settings
         if llm_settings is None:
@@ -185,63 +357,7 @@ def research_command(
         display_error(f"Failed to initialize LLM service: {e}")
         raise typer.Exit(code=1)
 
-    # Create agent with limits
-    limits = AgentLimits(max_turns=max_turns)
-    agent = DeepResearchAgent(
-        browser=browser,
-        llm_service=llm_service,
-        limits=limits,
-    )
-    display_success("✓ Deep Research Agent ready")
-
-    # Process questions
-    results: list[str] = []
-    for i, q in enumerate(questions, 1):
-        if len(questions) > 1:
-            display_info(f"\n[{i}/{len(questions)}] Processing: {q[:80]}...")
-        else:
-            display_info(f"\nResearching: {q}")
-
-        # Execute research
-        try:
-            if verbose:
-                display_info("Starting ReAct loop...")
-
-            result = agent.research(q)
-
-            # Format result
-            formatted = _format_result(result, verbose=verbose)
-            results.append(formatted)
-
-            # Display summary
-            if result.answer:
-                display_success(f"✓ Answer produced in {result.total_turns} turns")
-                if result.papers_consulted:
-                    display_info(
-                        f"  Papers consulted: {', '.join(result.papers_consulted[:5])}"
-                        + ("..." if len(result.papers_consulted) > 5 else "")
-                    )
-            else:
-                display_warning(
-                    f"✗ No answer produced (exhausted={result.exhausted}, "
-                    f"turns={result.total_turns})"
-                )
-
-        except Exception as e:
-            logger.exception("research_failed", question=q[:100])
-            display_error(f"Research failed: {e}")
-            results.append(f"# Question: {q}\n\n**Error:** {e}\n")
-
-    # Output results
-    output_content = "\n\n---\n\n".join(results)
-
-    if output_file:
-        output_file.write_text(output_content)
-        display_success(f"\nResults saved to {output_file}")
-    else:
-        typer.echo("\n" + "=" * 60)
-        typer.echo(output_content)
-        typer.echo("=" * 60)
+    return llm_service
 
 
 def _format_result(result, verbose: bool = False) -> str:
@@ -361,14 +477,7 @@ def status_command(
     config = load_config(config_path)
 
     # Get corpus directory
-    corpus_dir = Path(
-        getattr(
-            getattr(config.settings, "dra_settings", None),
-            "corpus_dir",
-            "./data/dra/corpus",
-        )
-        or "./data/dra/corpus"
-    )
+    corpus_dir = _corpus_dir(config)
 
     display_info("Deep Research Agent Status")
     display_info("=" * 40)
@@ -397,6 +506,108 @@ def status_command(
     except Exception as e:
         display_error(f"Failed to read corpus: {e}")
 
+    client = ResearchClient(corpus_dir / DEFAULT_SOCKET_NAME)
+    if client.is_running():
+        server = client.status()
+        display_success(f"✓ Research server running at {client.socket_path}")
+        display_info(
+            f"  Serving: {server['papers']} papers, {server['chunks']} chunks "
+            f"(reloads: {server['reloads']})"
+        )
+
+
+@research_app.command("serve")
+@handle_errors
+def serve_command(
+    config_path: Path = typer.Option(
+        "config/research_config.yaml",
+        "--config",
+        "-c",
+        help="Path to research config YAML",
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Socket to listen on (default: <corpus_dir>/research.sock)",
+    ),
+    registry_path: Optional[Path] = typer.Option(
+        None,
+        "--registry",
+        "-r",
+        help="Registry to refresh the corpus from when it changes",
+    ),
+    reload_interval: float = typer.Option(
+        30.0,
+        "--reload-interval",
+        help="Seconds between corpus change checks (0 disables hot reload)",
+    ),
+) -> None:
+    """Keep the corpus and embedding model warm for research requests.
+
+    ``arisp research`` dispatches to the server while it is running.
+    """
+    from src.models.dra import CorpusConfig
+    from src.services.dra.server import ResearchServer, serve_research
+
+    config = load_config(config_path)
+    corpus_dir = _corpus_dir(config)
+    socket_path = socket_path or corpus_dir / DEFAULT_SOCKET_NAME
+
+    if ResearchClient(socket_path).is_running():
+        display_error(f"A research server is already running at {socket_path}")
+        raise typer.Exit(code=1)
+    # Left behind by a server that did not shut down cleanly
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    display_info("Loading corpus and warming up the search engine...")
+    server = ResearchServer(
+        corpus_config=CorpusConfig(corpus_dir=str(corpus_dir)),
+        llm_service=_create_llm_service(config),
+        registry_path=registry_path,
+    )
+    status = server.status()
+    display_success(
+        f"✓ Research server ready: {status['papers']} papers, "
+        f"{status['chunks']} chunks"
+    )
+    display_info(f"Listening on {socket_path} (Ctrl+C to stop)")
+
+    try:
+        asyncio.run(serve_research(server, socket_path, reload_interval))
+    except KeyboardInterrupt:
+        pass
+    display_info("Research server stopped")
+
+
+@research_app.command("reload")
+@handle_errors
+def reload_command(
+    config_path: Path = typer.Option(
+        "config/research_config.yaml",
+        "--config",
+        "-c",
+        help="Path to research config YAML",
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Server socket (default: <corpus_dir>/research.sock)",
+    ),
+) -> None:
+    """Make a running research server reload its corpus now."""
+    config = load_config(config_path)
+    client = ResearchClient(socket_path or _corpus_dir(config) / DEFAULT_SOCKET_NAME)
+
+    if not client.is_running():
+        display_error(f"No research server running at {client.socket_path}")
+        raise typer.Exit(code=1)
+
+    status = client.reload()
+    display_success(
+        f"✓ Corpus reloaded: {status['papers']} papers, {status['chunks']} chunks"
+    )
+
 
 # Standalone command for direct registration
 @handle_errors
@@ -434,4 +645,6 @@ def research_single_command(
         max_turns=max_turns,
         output_file=None,
         verbose=verbose,
+        server_socket=None,
+        no_server=False,
     )
@@ -0,0 +1,151 @@
+"""Client for the research server (``arisp research serve``).
+
+Kept to the standard library and the DRA models so that dispatching a
+question to a running server never imports the search stack, the
+embedding model or the LLM providers; see :mod:`src.services.dra.server`.
+"""
+
+import http.client
+import json
+import socket
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from src.models.dra import ResearchSessionOutcome
+
+# Socket file name inside the corpus directory
+DEFAULT_SOCKET_NAME = "research.sock"
+
+# How long to wait for a liveness answer before running in-process
+PROBE_TIMEOUT_SECONDS = 1.0
+
+
+class ResearchServerError(Exception):
+    """The research server rejected a request or broke off a response."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: Path, timeout: Optional[float]):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self._socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class ResearchClient:
+    """Talks to a research server over its Unix domain socket."""
+
+    def __init__(self, socket_path: Path):
+        """Initialize client.
+
+        Args:
+            socket_path: Server socket path
+        """
+        self.socket_path = socket_path
+        self.tokens_used = 0
+
+    def is_running(self) -> bool:
+        """Check whether a server answers on the socket."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            self._request_json("GET", "/live", timeout=PROBE_TIMEOUT_SECONDS)
+        except (OSError, ResearchServerError):
+            return False
+        return True
+
+    def status(self) -> dict[str, Any]:
+        """Loaded corpus summary."""
+        return self._request_json("GET", "/research/status")
+
+    def reload(self, force: bool = True) -> dict[str, Any]:
+        """Ask the server to reload its corpus.
+
+        Args:
+            force: Reload even if the server detects no change
+        """
+        return self._request_json(
+            "POST", f"/research/reload?force={str(force).lower()}"
+        )
+
+    def research(
+        self,
+        questions: list[str],
+        max_turns: int = 50,
+        concurrency: int = 4,
+        llm_concurrency: int = 4,
+        token_budget: Optional[int] = None,
+    ) -> Iterator[ResearchSessionOutcome]:
+        """Run ``questions`` on the server, yielding outcomes as they finish.
+
+        ``tokens_used`` is set once the batch is complete.
+
+        Raises:
+            ResearchServerError: If the request is rejected or the stream
+                ends before the batch is complete
+        """
+        body = {
+            "questions": questions,
+            "max_turns": max_turns,
+            "concurrency": concurrency,
+            "llm_concurrency": llm_concurrency,
+            "token_budget": token_budget,
+        }
+        connection = _UnixHTTPConnection(self.socket_path, timeout=None)
+        try:
+            response = self._send(connection, "POST", "/research", body)
+            for line in response:
+                if not line.strip():
+                    continue
+                message = json.loads(line)
+                if "outcome" in message:
+                    yield ResearchSessionOutcome.model_validate(message["outcome"])
+                elif "tokens_used" in message:
+                    self.tokens_used = message["tokens_used"]
+                    return
+            raise ResearchServerError("Research server closed the stream early")
+        finally:
+            connection.close()
+
+    def _request_json(
+        self, method: str, path: str, timeout: Optional[float] = None
+    ) -> dict[str, Any]:
+        connection = _UnixHTTPConnection(self.socket_path, timeout=timeout)
+        try:
+            response = self._send(connection, method, path)
+            result: dict[str, Any] = json.loads(response.read())
+            return result
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: Optional[dict[str, Any]] = None,
+    ) -> http.client.HTTPResponse:
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        connection.request(
+            method,
+            path,
+            body=json.dumps(body) if body is not None else None,
+            headers=headers,
+        )
+        response = connection.getresponse()
+        if response.status != 200:
+            detail = response.read().decode("utf-8", errors="replace")
+            raise ResearchServerError(
+                f"Research server returned {response.status}: {detail[:500]}"
+            )
+        return response
@@ -40,6 +40,11 @@ def run_command(
         "--no-synthesis",
         help="Skip Knowledge Base synthesis (faster runs)",
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Extract each topic as soon as it is discovered",
+    ),
 ):
     """Run the research pipeline based on configuration."""
     # 1. Load Config
@@ -71,6 +76,7 @@ def run_command(
         config_path=config_path,
         enable_phase2=phase2_enabled,
         enable_synthesis=not no_synthesis,
+        stream_extraction=stream,
     )
 
     result = asyncio.run(pipeline.run())
@@ -102,22 +102,18 @@ def list_command(
 
     try:
         collector = TrajectoryCollector(storage_dir=storage_dir)
-        trajectories = collector.filter_quality(
+        # Headers only, newest first; turns are not loaded for a listing
+        trajectories = collector.summaries(
             min_turns=0,
             require_answer=False,
             min_quality_score=min_quality,
+            limit=limit,
         )
 
         if not trajectories:
             display_info("No trajectories found matching criteria")
             return
 
-        # Sort by created_at (newest first)
-        trajectories.sort(key=lambda t: t.created_at, reverse=True)
-
-        # Apply limit
-        trajectories = trajectories[:limit]
-
         display_info(f"Found {len(trajectories)} trajectories")
         display_info("=" * 60)
 
@@ -131,7 +127,7 @@ def list_command(
             )
 
             # Display trajectory summary
-            status = "✓" if traj.answer else "✗"
+            status = "✓" if traj.has_answer else "✗"
             quality_bar = "█" * int(traj.quality_score * 10) + "░" * (
                 10 - int(traj.quality_score * 10)
             )
@@ -140,7 +136,7 @@ def list_command(
             typer.echo(f"  Question: {question_display}")
             typer.echo(
                 f"  Quality: [{quality_bar}] {traj.quality_score:.2f} | "
-                f"Turns: {len(traj.turns)} | Papers: {traj.papers_opened}"
+                f"Turns: {traj.turn_count} | Papers: {traj.papers_opened}"
             )
             typer.echo(f"  Created: {created_str}")
 
@@ -148,13 +144,8 @@ def list_command(
                 typer.echo(f"  Unique searches: {traj.unique_searches}")
                 typer.echo(f"  Find operations: {traj.find_operations}")
                 typer.echo(f"  Context tokens: {traj.context_length_tokens:,}")
-                if traj.answer:
-                    answer_preview = (
-                        traj.answer[:100] + "..."
-                        if len(traj.answer) > 100
-                        else traj.answer
-                    )
-                    typer.echo(f"  Answer: {answer_preview}")
+                if traj.answer_preview:
+                    typer.echo(f"  Answer: {traj.answer_preview}")
 
         display_info("=" * 60)
         display_success(f"Listed {len(trajectories)} trajectories")
@@ -218,7 +209,7 @@ def analyze_command(
         collector = TrajectoryCollector(storage_dir=storage_dir)
 
         # Filter quality trajectories
-        trajectories = collector.filter_quality(
+        trajectories = collector.summaries(
             min_turns=3,
             require_answer=True,
             min_quality_score=min_quality,
@@ -231,8 +222,12 @@ def analyze_command(
 
         display_info(f"Analyzing {len(trajectories)} quality trajectories...")
 
-        # Analyze patterns
-        insights = collector.analyze_patterns(trajectories)
+        # Analyze patterns from the indexed pattern counts
+        insights = collector.analyze_patterns(
+            min_turns=3,
+            require_answer=True,
+            min_quality_score=min_quality,
+        )
 
         # Display insights
         display_info("\n📊 Trajectory Analysis Results")
@@ -575,12 +570,8 @@ def stats_command(
     try:
         collector = TrajectoryCollector(storage_dir=storage_dir)
 
-        # Load all trajectories (no filter)
-        all_trajectories = collector.filter_quality(
-            min_turns=0,
-            require_answer=False,
-            min_quality_score=0.0,
-        )
+        # All trajectory headers (no filter)
+        all_trajectories = collector.summaries()
 
         if not all_trajectories:
             display_info("No trajectories found")
@@ -588,9 +579,9 @@ def stats_command(
 
         # Compute statistics
         total = len(all_trajectories)
-        with_answer = sum(1 for t in all_trajectories if t.answer)
+        with_answer = sum(1 for t in all_trajectories if t.has_answer)
         avg_quality = sum(t.quality_score for t in all_trajectories) / total
-        avg_turns = sum(len(t.turns) for t in all_trajectories) / total
+        avg_turns = sum(t.turn_count for t in all_trajectories) / total
         total_tokens = sum(t.context_length_tokens for t in all_trajectories)
 
         # Quality distribution
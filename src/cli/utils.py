@@ -12,7 +12,6 @@ import typer
 
 from src.models.config import ResearchConfig
 from src.services.config_manager import ConfigManager, ConfigValidationError
-from src.storage.intelligence_graph.connection import _trunc
 from src.utils.logging import configure_logging
 
 # Configure structured logging
@@ -62,6 +61,10 @@ def handle_errors(func: F) -> F:
         except typer.Exit:
             raise
         except Exception as exc:
+            # Imported here: the storage package is heavy and only needed
+            # on the error path, not on every CLI start.
+            from src.storage.intelligence_graph.connection import _trunc
+
             typer.secho(
                 "Operation failed (see logs for details)",
                 fg=typer.colors.RED,
@@ -1,7 +1,7 @@
 """Data models for checkpoint system."""
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Set
+from typing import Dict, List, Set
 from datetime import datetime
 
 
@@ -25,6 +25,9 @@ class Checkpoint(BaseModel):
     total_processed: int = 0
     last_updated: datetime = Field(default_factory=datetime.now)
     completed: bool = False
+    # Provider batch jobs awaiting collection: batch id -> paper IDs,
+    # in request order
+    batches: Dict[str, List[str]] = Field(default_factory=dict)
 
     @property
     def processed_set(self) -> Set[str]:
@@ -14,6 +14,10 @@ class ConcurrencyConfig(BaseModel):
     max_concurrent_downloads: int = Field(default=5, ge=1, le=20)
     max_concurrent_conversions: int = Field(default=3, ge=1, le=10)
     max_concurrent_llm: int = Field(default=2, ge=1, le=5)
+    # Research topics discovered/extracted at once; provider calls stay
+    # bounded by each provider's shared RateLimiter and extraction by the
+    # download/LLM semaphores above, whatever the topic count
+    max_concurrent_topics: int = Field(default=1, ge=1, le=20)
 
     # Queue settings
     queue_size: int = Field(default=100, ge=10, le=1000)
@@ -73,6 +73,22 @@ class LLMSettings(BaseModel):
     )
     temperature: float = Field(0.0, ge=0.0, le=1.0, description="Sampling temperature")
     timeout: int = Field(300, gt=0, le=600, description="Request timeout in seconds")
+    section_token_threshold: Optional[int] = Field(
+        None,
+        ge=1000,
+        le=200000,
+        description="Prompt tokens above which papers are extracted by section",
+    )
+    max_concurrent_sections: int = Field(
+        4, ge=1, le=16, description="Concurrent section extraction calls per paper"
+    )
+    batch_mode: bool = Field(
+        False, description="Submit extractions as provider batch jobs"
+    )
+    batch_size: int = Field(100, ge=1, le=10000, description="Requests per batch job")
+    batch_poll_seconds: float = Field(
+        60.0, gt=0, le=3600, description="Seconds between batch status polls"
+    )
 
 
 class CostLimitSettings(BaseModel):
@@ -219,6 +219,12 @@ class SynthesisConfig(BaseModel):
         le=1000000,
         description="Maximum tokens per question",
     )
+    max_concurrent_questions: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum questions synthesized concurrently",
+    )
     output_path: str = Field(
         default="output/Global_Synthesis.md",
         description="Path to output file",
@@ -340,6 +346,11 @@ class SynthesisState(BaseModel):
         default=None,
         description="Hash of registry state at last synthesis",
     )
+    last_change_sequence: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Registry change-journal sequence at last synthesis",
+    )
     last_report_id: Optional[str] = Field(
         default=None,
         description="ID of last generated report",
@@ -178,6 +178,22 @@ class ResearchResult(BaseModel):
     duration_seconds: float = Field(0.0, ge=0.0, description="Session duration")
 
 
+class ResearchSessionOutcome(BaseModel):
+    """Result of one question in a concurrent research batch.
+
+    Attributes:
+        index: Position of the question in the submitted batch
+        question: Research question
+        result: Session result (None if the session failed)
+        error: Error message if the session failed
+    """
+
+    index: int = Field(..., ge=0, description="Position in the batch")
+    question: str = Field(..., description="Research question")
+    result: Optional[ResearchResult] = Field(None, description="Session result")
+    error: Optional[str] = Field(None, description="Failure message")
+
+
 class TrajectoryInsights(BaseModel):
     """Insights extracted from trajectory analysis.
 
@@ -272,6 +288,41 @@ class TrajectoryRecord(BaseModel):
         return round(v, 4)
 
 
+class TrajectorySummary(BaseModel):
+    """Header of a recorded trajectory, without its turns.
+
+    Served from the trajectory index so listings and statistics don't
+    have to parse every trajectory file.
+
+    Attributes:
+        trajectory_id: Unique trajectory identifier
+        question: Research question
+        has_answer: Whether a final answer was produced
+        answer_preview: First characters of the answer (if produced)
+        quality_score: Quality score (0.0-1.0)
+        turn_count: Number of turns
+        papers_opened: Number of papers opened
+        unique_searches: Number of unique search queries
+        find_operations: Number of find operations
+        context_length_tokens: Total context length
+        created_at: When trajectory was recorded
+    """
+
+    trajectory_id: str = Field(..., max_length=256, description="Trajectory ID")
+    question: str = Field(..., max_length=2000, description="Research question")
+    has_answer: bool = Field(False, description="Answer produced")
+    answer_preview: Optional[str] = Field(
+        default=None, max_length=200, description="Answer preview"
+    )
+    quality_score: float = Field(0.0, ge=0.0, le=1.0, description="Quality score")
+    turn_count: int = Field(0, ge=0, description="Turn count")
+    papers_opened: int = Field(0, ge=0, description="Papers opened")
+    unique_searches: int = Field(0, ge=0, description="Unique searches")
+    find_operations: int = Field(0, ge=0, description="Find operations")
+    context_length_tokens: int = Field(0, ge=0, description="Context tokens")
+    created_at: datetime = Field(..., description="Creation timestamp")
+
+
 class AgentLimits(BaseModel):
     """Resource limits for agent sessions (SR-8.4).
 
@@ -334,6 +385,8 @@ class SearchConfig(BaseModel):
         sparse_weight: Weight for sparse (BM25) retrieval
         default_top_k: Default number of results to return
         max_top_k: Maximum allowed top_k value
+        query_cache_size: Query embeddings kept in the LRU (0 = disabled)
+        result_cache_size: Fused result lists kept in the LRU (0 = disabled)
     """
 
     dense_weight: float = Field(
@@ -344,6 +397,12 @@ class SearchConfig(BaseModel):
     )
     default_top_k: int = Field(10, ge=1, le=100, description="Default results count")
     max_top_k: int = Field(50, ge=1, le=500, description="Maximum results count")
+    query_cache_size: int = Field(
+        256, ge=0, le=100000, description="Cached query embeddings"
+    )
+    result_cache_size: int = Field(
+        256, ge=0, le=100000, description="Cached search result lists"
+    )
 
     @field_validator("sparse_weight")
     @classmethod
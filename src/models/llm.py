@@ -152,6 +152,34 @@ class FallbackProviderConfig(BaseModel):
     )
 
 
+class BatchConfig(BaseModel):
+    """Configuration for batch-submission mode
+
+    Extraction requests are collected into provider batch jobs, which
+    are cheaper than interactive calls and not subject to the interactive
+    rate limits, at the price of latency (results arrive within hours).
+    """
+
+    max_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Requests per batch job",
+    )
+    flush_interval_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=3600.0,
+        description="Seconds a partial batch waits for more requests",
+    )
+    poll_interval_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=3600.0,
+        description="Seconds between batch status polls",
+    )
+
+
 class LLMConfig(BaseModel):
     """LLM provider configuration
 
@@ -184,6 +212,21 @@ class LLMConfig(BaseModel):
     timeout: int = Field(
         default=300, gt=0, le=600, description="Request timeout in seconds"
     )
+    section_token_threshold: Optional[int] = Field(
+        default=None,
+        ge=1000,
+        le=200000,
+        description=(
+            "Extract papers whose prompt exceeds this many tokens section by "
+            "section (map-reduce); None sends every paper in one prompt"
+        ),
+    )
+    max_concurrent_sections: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Section-level extraction calls in flight per paper",
+    )
 
     # Phase 3.3: Retry, circuit breaker, and fallback configuration
     retry: RetryConfig = Field(
@@ -196,6 +239,10 @@ class LLMConfig(BaseModel):
     fallback: Optional[FallbackProviderConfig] = Field(
         default=None, description="Fallback provider configuration"
     )
+    batch: Optional[BatchConfig] = Field(
+        default=None,
+        description="Batch-submission mode (None extracts interactively)",
+    )
 
     @field_validator("api_key")
     @classmethod
@@ -4,6 +4,7 @@ This module defines the data structures for:
 - Registry entries (canonical paper identity)
 - Processing actions (full process, backfill, skip, map only)
 - Identity resolution results
+- The append-only registry change journal
 """
 
 import re
@@ -27,6 +28,35 @@ class ProcessingAction(str, Enum):
     SKIP = "skip"  # Already processed for this topic, nothing to do
 
 
+# Journal records kept in the registry. Older records are dropped; a reader
+# whose last-seen sequence predates the retained range gets no answer from
+# ``RegistryState.changes_since`` and must fall back to a full comparison.
+MAX_CHANGE_JOURNAL_ENTRIES = 10_000
+
+
+class RegistryChangeKind(str, Enum):
+    """Kind of entry change recorded in the registry change journal."""
+
+    ADDED = "added"  # New entry
+    UPDATED = "updated"  # Existing entry's content or affiliations changed
+
+
+class RegistryChange(BaseModel):
+    """One record of the registry's append-only change journal."""
+
+    sequence: int = Field(
+        ...,
+        ge=1,
+        description="Monotonically increasing sequence number of the change",
+    )
+    paper_id: str = Field(..., description="Canonical paper UUID that changed")
+    kind: RegistryChangeKind = Field(..., description="Kind of change")
+    recorded_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="When the change was recorded",
+    )
+
+
 class RegistryEntry(BaseModel):
     """A single paper entry in the global registry.
 
@@ -231,12 +261,32 @@ class RegistryState(BaseModel):
         description="Map of provider:id to paper_id (e.g., arxiv:2301.12345)",
     )
 
-    def add_entry(self, entry: RegistryEntry) -> None:
+    # Append-only change journal, so readers can find what changed since a
+    # sequence number they saw without scanning every entry
+    change_sequence: int = Field(
+        default=0,
+        ge=0,
+        description="Sequence number of the latest recorded change",
+    )
+    change_journal: List[RegistryChange] = Field(
+        default_factory=list,
+        description="Most recent entry changes, in sequence order",
+    )
+
+    def add_entry(self, entry: RegistryEntry, record_change: bool = True) -> None:
         """Add or update an entry and rebuild indexes.
 
         Args:
             entry: Registry entry to add.
+            record_change: Whether to journal an update of an existing
+                entry (set False when the update changed nothing). New
+                entries are always journaled.
         """
+        if entry.paper_id not in self.entries:
+            self.record_change(entry.paper_id, RegistryChangeKind.ADDED)
+        elif record_change:
+            self.record_change(entry.paper_id, RegistryChangeKind.UPDATED)
+
         self.entries[entry.paper_id] = entry
         self.updated_at = datetime.now(timezone.utc)
 
@@ -253,3 +303,47 @@ class RegistryState(BaseModel):
     def get_entry_count(self) -> int:
         """Return the number of entries in the registry."""
         return len(self.entries)
+
+    def record_change(self, paper_id: str, kind: RegistryChangeKind) -> int:
+        """Append a change to the journal.
+
+        Args:
+            paper_id: Canonical paper UUID that changed.
+            kind: Kind of change.
+
+        Returns:
+            Sequence number assigned to the change.
+        """
+        self.change_sequence += 1
+        self.change_journal.append(
+            RegistryChange(sequence=self.change_sequence, paper_id=paper_id, kind=kind)
+        )
+        if len(self.change_journal) > MAX_CHANGE_JOURNAL_ENTRIES:
+            del self.change_journal[:-MAX_CHANGE_JOURNAL_ENTRIES]
+        return self.change_sequence
+
+    def changes_since(self, sequence: int) -> Optional[List[RegistryChange]]:
+        """Return the changes recorded after ``sequence``.
+
+        Runs in O(changes): journal sequence numbers are contiguous, so the
+        start position is computed rather than searched.
+
+        Args:
+            sequence: Last sequence number the caller has seen.
+
+        Returns:
+            Changes with a higher sequence number, oldest first, or None
+            if the journal cannot answer: the records after ``sequence``
+            were already dropped, or ``sequence`` is ahead of this
+            registry (e.g., it was cleared since).
+        """
+        if sequence > self.change_sequence:
+            return None
+        first = (
+            self.change_journal[0].sequence
+            if self.change_journal
+            else self.change_sequence + 1
+        )
+        if sequence < first - 1:
+            return None
+        return self.change_journal[sequence - first + 1 :]
@@ -208,6 +208,12 @@ class SynthesisStats(BaseModel):
     user_notes_preserved: int = Field(
         default=0, description="Number of user notes preserved"
     )
+    sections_rendered: int = Field(
+        default=0, description="Paper sections rendered because their inputs changed"
+    )
+    sections_reused: int = Field(
+        default=0, description="Paper sections reused from the section store"
+    )
     synthesis_duration_ms: int = Field(
         default=0, description="Time taken for synthesis in milliseconds"
     )
@@ -33,6 +33,8 @@ from src.services.dedup_service import DeduplicationService
 from src.services.filter_service import FilterService
 from src.services.checkpoint_service import CheckpointService
 from src.services.llm import LLMService
+from src.services.llm.batch import BatchExtractor
+from src.services.llm.providers.base import BatchProvider
 
 # Phase 3.5 integration
 from src.services.registry_service import RegistryService
@@ -113,7 +115,10 @@ class ConcurrentPipeline:
             llm_semaphore=self.llm_sem,
         )
 
-        # Statistics
+        # Statistics per run ID: topics processed concurrently share this
+        # pipeline. ``stats``/``worker_stats`` are the most recent run's.
+        self.run_stats: Dict[str, PipelineStats] = {}
+        self.run_worker_stats: Dict[str, List[WorkerStats]] = {}
         self.stats = PipelineStats()
         self.worker_stats: List[WorkerStats] = []
 
@@ -156,9 +161,17 @@ class ConcurrentPipeline:
             ExtractedPaper as they complete (unordered)
         """
         start_time = time.time()
-
-        # Clear processing results for this run
-        self.processing_results = []
+        stats = PipelineStats()
+        worker_stats: List[WorkerStats] = []
+        self.run_stats[run_id] = stats
+        self.run_worker_stats[run_id] = worker_stats
+        self.stats, self.worker_stats = stats, worker_stats
+
+        # Replace this topic's processing results; other topics may be
+        # processed concurrently through the same pipeline
+        self.processing_results = [
+            r for r in self.processing_results if r.topic_slug != topic_slug
+        ]
 
         logger.info(
             "concurrent_processing_started", run_id=run_id, total_papers=len(papers)
@@ -256,8 +269,8 @@ class ConcurrentPipeline:
             # Fallback to legacy deduplication (Phase 3)
             new_papers, duplicates = self.dedup_service.find_duplicates(papers)
 
-        self.stats.total_papers = len(papers)
-        self.stats.papers_deduplicated = len(duplicates)
+        stats.total_papers = len(papers)
+        stats.papers_deduplicated = len(duplicates)
 
         logger.info(
             "deduplication_complete",
@@ -292,8 +305,15 @@ class ConcurrentPipeline:
             maxsize=self.config.queue_size
         )
 
-        # Start workers
-        num_workers = min(self.config.max_concurrent_downloads, len(pending_papers))
+        # Batch mode: extractions wait on provider batch jobs, so every
+        # pending paper gets a worker (downloads stay bounded by download_sem,
+        # interactive extractions of long papers by llm_sem)
+        batch = self._create_batch_extractor(run_id, targets, topic_slug)
+        if batch is not None:
+            batch.start()
+            num_workers = len(pending_papers)
+        else:
+            num_workers = min(self.config.max_concurrent_downloads, len(pending_papers))
 
         workers: List[asyncio.Task] = [
             asyncio.create_task(
@@ -303,12 +323,15 @@ class ConcurrentPipeline:
                     results_queue=results_queue,
                     targets=targets,
                     run_id=run_id,
+                    stats=stats,
+                    run_worker_stats=worker_stats,
+                    batch=batch,
                 )
             )
             for i in range(num_workers)
         ]
 
-        self.stats.active_workers = num_workers
+        stats.active_workers = num_workers
 
         # Update metrics
         ACTIVE_WORKERS.labels(worker_type="pipeline").set(num_workers)
@@ -333,7 +356,7 @@ class ConcurrentPipeline:
             yield result
 
             completed += 1
-            self.stats.papers_completed = completed
+            stats.papers_completed = completed
             processed_paper_ids.append(result.metadata.paper_id)
 
             # Phase 3.5: Persist to global registry after successful extraction
@@ -374,7 +397,7 @@ class ConcurrentPipeline:
                 )
 
             # Update stats
-            self.stats.queue_size = input_queue.qsize()
+            stats.queue_size = input_queue.qsize()
             QUEUE_SIZE.labels(queue_name="input").set(input_queue.qsize())
             QUEUE_SIZE.labels(queue_name="results").set(results_queue.qsize())
 
@@ -389,6 +412,8 @@ class ConcurrentPipeline:
         # Wait for producer and workers to finish
         await producer
         await asyncio.gather(*workers, return_exceptions=True)
+        if batch is not None:
+            await batch.aclose()
 
         # Reset worker metrics
         ACTIVE_WORKERS.labels(worker_type="pipeline").set(0)
@@ -411,21 +436,21 @@ class ConcurrentPipeline:
         self.checkpoint_service.clear_checkpoint(run_id)
 
         # Final statistics
-        self.stats.total_duration_seconds = time.time() - start_time
+        stats.total_duration_seconds = time.time() - start_time
 
         # Track skipped/failed papers
-        PAPERS_PROCESSED.labels(status="skipped").inc(self.stats.papers_deduplicated)
+        PAPERS_PROCESSED.labels(status="skipped").inc(stats.papers_deduplicated)
 
         logger.info(
             "concurrent_processing_complete",
             run_id=run_id,
             total_papers=len(papers),
-            completed=self.stats.papers_completed,
-            failed=self.stats.papers_failed,
-            deduplicated=self.stats.papers_deduplicated,
-            duration_seconds=round(self.stats.total_duration_seconds, 2),
+            completed=stats.papers_completed,
+            failed=stats.papers_failed,
+            deduplicated=stats.papers_deduplicated,
+            duration_seconds=round(stats.total_duration_seconds, 2),
             papers_per_minute=round(
-                self.stats.papers_completed / (self.stats.total_duration_seconds / 60),
+                stats.papers_completed / (stats.total_duration_seconds / 60),
                 2,
             ),
         )
@@ -453,6 +478,9 @@ class ConcurrentPipeline:
         results_queue: asyncio.Queue,
         targets: List[ExtractionTarget],
         run_id: str,
+        stats: PipelineStats,
+        run_worker_stats: List[WorkerStats],
+        batch: Optional[BatchExtractor] = None,
     ) -> None:
         """Worker coroutine: Process papers from queue.
 
@@ -470,9 +498,12 @@ class ConcurrentPipeline:
             results_queue: Queue for completed results
             targets: Extraction targets
             run_id: Run identifier
+            stats: Statistics of the run
+            run_worker_stats: The run's worker statistics, appended to
+            batch: Batch extractor, in batch mode
         """
         worker_stats = WorkerStats(worker_id=worker_id)
-        self.worker_stats.append(worker_stats)
+        run_worker_stats.append(worker_stats)
 
         logger.info("worker_started", worker_id=worker_id)
 
@@ -493,14 +524,16 @@ class ConcurrentPipeline:
                 start_time = time.time()
 
                 try:
-                    result = await self._process_single_paper(paper, targets, worker_id)
+                    result = await self._process_single_paper(
+                        paper, targets, worker_id, stats, batch
+                    )
 
                     if result:
                         await results_queue.put(result)
                         worker_stats.papers_processed += 1
                     else:
                         worker_stats.papers_failed += 1
-                        self.stats.papers_failed += 1
+                        stats.papers_failed += 1
                         PAPERS_PROCESSED.labels(status="failed").inc()
 
                 except Exception as e:
@@ -512,7 +545,7 @@ class ConcurrentPipeline:
                         exc_info=True,
                     )
                     worker_stats.papers_failed += 1
-                    self.stats.papers_failed += 1
+                    stats.papers_failed += 1
                     PAPERS_PROCESSED.labels(status="failed").inc()
 
                 finally:
@@ -542,7 +575,12 @@ class ConcurrentPipeline:
         )
 
     async def _process_single_paper(
-        self, paper: PaperMetadata, targets: List[ExtractionTarget], worker_id: int
+        self,
+        paper: PaperMetadata,
+        targets: List[ExtractionTarget],
+        worker_id: int,
+        stats: PipelineStats,
+        batch: Optional[BatchExtractor] = None,
     ) -> Optional[ExtractedPaper]:
         """Process single paper with full pipeline.
 
@@ -552,6 +590,8 @@ class ConcurrentPipeline:
             paper: Paper to process
             targets: Extraction targets
             worker_id: Worker ID (for logging)
+            stats: Statistics of the run
+            batch: Batch extractor, in batch mode
 
         Returns:
             ExtractedPaper or None if processing failed
@@ -559,10 +599,43 @@ class ConcurrentPipeline:
         # Check cache first to track stats locally
         cached_extraction = self.cache_service.get_extraction(paper.paper_id, targets)
         if cached_extraction:
-            self.stats.papers_cached += 1
+            stats.papers_cached += 1
 
         # Delegate to paper processor
-        return await self._paper_processor.process(paper, targets, worker_id)
+        return await self._paper_processor.process(
+            paper, targets, worker_id, batch=batch
+        )
+
+    def _create_batch_extractor(
+        self,
+        run_id: str,
+        targets: List[ExtractionTarget],
+        topic_slug: Optional[str],
+    ) -> Optional[BatchExtractor]:
+        """Create the run's batch extractor if the LLM service is in batch mode.
+
+        Submitted batches are checkpointed per topic rather than per run
+        ID (a timestamp), so that the next run of a crashed topic resumes
+        polling them.
+
+        Returns:
+            BatchExtractor, or None to extract interactively
+        """
+        batch_provider = getattr(self.llm_service, "batch_provider", None)
+        if not isinstance(batch_provider, BatchProvider):
+            return None
+        batch_config = self.llm_service.config.batch
+        if batch_config is None:
+            return None
+        return BatchExtractor(
+            llm_service=self.llm_service,
+            batch_provider=batch_provider,
+            checkpoint_service=self.checkpoint_service,
+            run_id=f"batches-{topic_slug or run_id}",
+            targets=targets,
+            config=batch_config,
+            llm_semaphore=self.llm_sem,
+        )
 
     async def _collect_results(
         self, results_queue: asyncio.Queue, num_workers: int
@@ -593,9 +666,15 @@ class ConcurrentPipeline:
             except Exception as e:  # pragma: no cover (defensive catch-all)
                 logger.error("result_collection_error", error=str(e), exc_info=True)
 
-    def get_stats(self) -> PipelineStats:
-        """Get current pipeline statistics"""
-        return self.stats
+    def get_stats(self, run_id: Optional[str] = None) -> PipelineStats:
+        """Get pipeline statistics.
+
+        Args:
+            run_id: Run to report on (default: the most recently started)
+        """
+        if run_id is None:
+            return self.stats
+        return self.run_stats[run_id]
 
     def get_processing_results(self) -> List[ProcessingResult]:
         """Get processing results for Phase 3.6 synthesis.
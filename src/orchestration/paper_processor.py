@@ -18,6 +18,7 @@ from src.services.pdf_extractors.fallback_service import FallbackPDFService
 # Phase 3 integrations
 from src.services.cache_service import CacheService
 from src.services.llm import LLMService
+from src.services.llm.batch import BatchExtractor
 
 # Phase 9.5: shared download path (REQ-9.5.1.1)
 from src.services.pdf_acquisition import acquire_pdf
@@ -78,6 +79,7 @@ class PaperProcessor:
         paper: PaperMetadata,
         targets: List[ExtractionTarget],
         worker_id: int,
+        batch: Optional[BatchExtractor] = None,
     ) -> Optional[ExtractedPaper]:
         """Process single paper with full pipeline.
 
@@ -91,6 +93,7 @@ class PaperProcessor:
             paper: Paper to process
             targets: Extraction targets
             worker_id: Worker ID (for logging)
+            batch: Batch extractor to extract through (batch mode)
 
         Returns:
             ExtractedPaper or None if processing failed
@@ -126,7 +129,7 @@ class PaperProcessor:
 
         # Extract with LLM
         return await self._extract_with_llm(
-            paper, targets, markdown_content, pdf_available, worker_id
+            paper, targets, markdown_content, pdf_available, worker_id, batch
         )
 
     async def _extract_content(
@@ -226,6 +229,7 @@ class PaperProcessor:
         markdown_content: str,
         pdf_available: bool,
         worker_id: int,
+        batch: Optional[BatchExtractor] = None,
     ) -> Optional[ExtractedPaper]:
         """Extract information using LLM.
 
@@ -235,34 +239,40 @@ class PaperProcessor:
             markdown_content: Content to extract from
             pdf_available: Whether PDF was available
             worker_id: Worker ID for logging
+            batch: Batch extractor to extract through (batch mode)
 
         Returns:
             ExtractedPaper or None if extraction failed
         """
-        async with self.llm_sem:
-            try:
-                extraction = await self.llm_service.extract(
-                    markdown_content, targets, paper
-                )
-
-                logger.info(
-                    "llm_extraction_complete",
-                    worker_id=worker_id,
-                    paper_id=paper.paper_id,
-                )
-
-                # Cache extraction result (Phase 3)
-                self.cache_service.set_extraction(paper.paper_id, targets, extraction)
-
-                return ExtractedPaper(
-                    metadata=paper, extraction=extraction, pdf_available=pdf_available
-                )
-
-            except Exception as e:
-                logger.error(
-                    "llm_extraction_failed",
-                    worker_id=worker_id,
-                    paper_id=paper.paper_id,
-                    error=str(e),
-                )
-                return None
+        try:
+            if batch is not None:
+                # Waits for the paper's batch job without holding an LLM slot;
+                # the extractor takes one for a long paper it runs interactively
+                extraction = await batch.extract(markdown_content, paper)
+            else:
+                async with self.llm_sem:
+                    extraction = await self.llm_service.extract(
+                        markdown_content, targets, paper
+                    )
+
+            logger.info(
+                "llm_extraction_complete",
+                worker_id=worker_id,
+                paper_id=paper.paper_id,
+            )
+
+            # Cache extraction result (Phase 3)
+            self.cache_service.set_extraction(paper.paper_id, targets, extraction)
+
+            return ExtractedPaper(
+                metadata=paper, extraction=extraction, pdf_available=pdf_available
+            )
+
+        except Exception as e:
+            logger.error(
+                "llm_extraction_failed",
+                worker_id=worker_id,
+                paper_id=paper.paper_id,
+                error=str(e),
+            )
+            return None
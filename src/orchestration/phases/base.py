@@ -87,6 +87,17 @@ class PipelinePhase(ABC, Generic[T]):
             self.context.add_error(self.name, str(e))
             raise
 
+    def _topic_concurrency(self) -> int:
+        """Number of topics this phase may process at once.
+
+        Returns:
+            ``settings.concurrency.max_concurrent_topics`` (1 when no
+            concurrency settings are configured)
+        """
+        assert self.context.config is not None
+        concurrency = self.context.config.settings.concurrency
+        return concurrency.max_concurrent_topics if concurrency is not None else 1
+
     def _get_default_result(self) -> T:
         """Get default result when phase is skipped.
 
@@ -5,6 +5,7 @@ Phase 7.1: Added discovery statistics support and integrated filtering.
 Phase 7.2: Enhanced with multi-source discovery, query expansion, and citations.
 """
 
+import asyncio
 import time
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
@@ -126,6 +127,8 @@ class DiscoveryPhase(PipelinePhase[DiscoveryResult]):
     - Store discovered papers in context
     - Phase 7.1: Incremental discovery and filtering
     - Phase 7.2: Multi-source discovery with query expansion and citations
+    - Streaming mode: hand each finished topic to the extraction phase
+      through ``topic_queue`` (``None`` marks the end of discovery)
     """
 
     def __init__(
@@ -135,6 +138,7 @@ class DiscoveryPhase(PipelinePhase[DiscoveryResult]):
         query_expansion_config: Optional[QueryExpansionConfig] = None,
         citation_config: Optional[CitationExplorationConfig] = None,
         aggregation_config: Optional[AggregationConfig] = None,
+        topic_queue: Optional["asyncio.Queue[Optional[ResearchTopic]]"] = None,
     ):
         """Initialize DiscoveryPhase.
 
@@ -144,12 +148,15 @@ class DiscoveryPhase(PipelinePhase[DiscoveryResult]):
             query_expansion_config: Query expansion configuration
             citation_config: Citation exploration configuration
             aggregation_config: Result aggregation configuration
+            topic_queue: Queue to put each topic on once its papers are
+                stored in the context (streaming mode)
         """
         super().__init__(context)
         self.multi_source_enabled = multi_source_enabled
         self.query_expansion_config = query_expansion_config
         self.citation_config = citation_config
         self.aggregation_config = aggregation_config
+        self.topic_queue = topic_queue
 
     @property
     def name(self) -> str:
@@ -169,34 +176,30 @@ class DiscoveryPhase(PipelinePhase[DiscoveryResult]):
         assert self.context.discovery_service is not None
         assert self.context.catalog_service is not None
 
-        for topic in self.context.config.research_topics:
-            topic_result = await self._discover_topic(topic)
-            result.topic_results.append(topic_result)
-
-            if topic_result.success:
-                result.topics_processed += 1
-                result.total_papers += len(topic_result.papers)
-                # Phase 9.5 REQ-9.5.2.4: roll up per-topic source breakdowns
-                # into the run-level total so the breadth-metric SLO event
-                # has aggregated counts.
-                if topic_result.phase72_stats is not None:
-                    for (
-                        src,
-                        count,
-                    ) in topic_result.phase72_stats.source_breakdown.items():
-                        result.source_breakdown[src] = (
-                            result.source_breakdown.get(src, 0) + count
-                        )
-                # Store in context for extraction phase
-                self.context.add_discovered_papers(
-                    topic_result.topic_slug, topic_result.papers
-                )
-            else:
-                result.topics_failed += 1
-                if topic_result.error:
-                    self.context.add_error(
-                        self.name, topic_result.error, topic=topic.query
-                    )
+        # Topics are discovered concurrently (bounded) but recorded, and
+        # streamed to extraction, in configuration order
+        topics = self.context.config.research_topics
+        semaphore = asyncio.Semaphore(self._topic_concurrency())
+
+        async def discover(topic: ResearchTopic) -> TopicDiscoveryResult:
+            async with semaphore:
+                return await self._discover_topic(topic)
+
+        tasks = [asyncio.create_task(discover(topic)) for topic in topics]
+        try:
+            for topic, task in zip(topics, tasks):
+                topic_result = await task
+                self._record_topic(result, topic_result)
+
+                if self.topic_queue is not None:
+                    # Blocks while extraction is topic_queue.maxsize topics behind
+                    await self.topic_queue.put(topic)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if self.topic_queue is not None:
+            await self.topic_queue.put(None)
 
         self.logger.info(
             "discovery_completed",
@@ -207,6 +210,39 @@ class DiscoveryPhase(PipelinePhase[DiscoveryResult]):
 
         return result
 
+    def _record_topic(
+        self, result: DiscoveryResult, topic_result: TopicDiscoveryResult
+    ) -> None:
+        """Add one topic's outcome to the phase result and the context.
+
+        Args:
+            result: Phase result to update
+            topic_result: Finished topic
+        """
+        result.topic_results.append(topic_result)
+
+        if topic_result.success:
+            result.topics_processed += 1
+            result.total_papers += len(topic_result.papers)
+            # Phase 9.5 REQ-9.5.2.4: roll up per-topic source breakdowns
+            # into the run-level total so the breadth-metric SLO event
+            # has aggregated counts.
+            if topic_result.phase72_stats is not None:
+                for src, count in topic_result.phase72_stats.source_breakdown.items():
+                    result.source_breakdown[src] = (
+                        result.source_breakdown.get(src, 0) + count
+                    )
+            # Store in context for extraction phase
+            self.context.add_discovered_papers(
+                topic_result.topic_slug, topic_result.papers
+            )
+        else:
+            result.topics_failed += 1
+            if topic_result.error:
+                self.context.add_error(
+                    self.name, topic_result.error, topic=topic_result.topic.query
+                )
+
     async def _discover_topic(self, topic: ResearchTopic) -> TopicDiscoveryResult:
         """Discover papers for a single topic.
 
@@ -3,15 +3,17 @@
 Phase 5.2: Extracted from research_pipeline.py.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from src.models.config import ResearchTopic
 from src.models.paper import PaperMetadata
 from src.models.synthesis import ProcessingResult, ProcessingStatus
+from src.orchestration.context import PipelineContext
 from src.orchestration.phases.base import PipelinePhase
 from src.output.enhanced_generator import EnhancedMarkdownGenerator
 
@@ -64,8 +66,25 @@ class ExtractionPhase(PipelinePhase[ExtractionResult]):
     - Handle extraction failures gracefully
     - Generate markdown output files
     - Store extraction results in context
+    - Streaming mode: extract each topic as soon as the discovery phase
+      puts it on ``topic_queue``, instead of after all discovery
     """
 
+    def __init__(
+        self,
+        context: PipelineContext,
+        topic_queue: Optional["asyncio.Queue[Optional[ResearchTopic]]"] = None,
+    ) -> None:
+        """Initialize ExtractionPhase.
+
+        Args:
+            context: Pipeline context
+            topic_queue: Queue of discovered topics, ended by ``None``
+                (streaming mode; default: all configured topics)
+        """
+        super().__init__(context)
+        self.topic_queue = topic_queue
+
     @property
     def name(self) -> str:
         """Phase name."""
@@ -88,57 +107,52 @@ class ExtractionPhase(PipelinePhase[ExtractionResult]):
         """
         result = ExtractionResult()
 
-        # Type assertions
-        assert self.context.config is not None
-
-        for topic in self.context.config.research_topics:
-            # Get catalog topic info
-            assert self.context.catalog_service is not None
-            catalog_topic = self.context.catalog_service.get_or_create_topic(
-                topic.query
-            )
-            topic_slug = catalog_topic.topic_slug
+        # Topics are extracted concurrently (bounded); downloads and LLM
+        # calls share the extraction service's semaphores across topics.
+        # Results are recorded in discovery order.
+        semaphore = asyncio.Semaphore(self._topic_concurrency())
 
-            # Get discovered papers from context
-            papers = self.context.discovered_papers.get(topic_slug, [])
+        async def extract(**kwargs: Any) -> TopicExtractionResult:
+            async with semaphore:
+                return await self._extract_topic(**kwargs)
 
-            if not papers:
-                self.logger.info(
-                    "extraction_skipped",
-                    topic=topic.query,
-                    reason="no papers discovered",
+        tasks: List["asyncio.Task[TopicExtractionResult]"] = []
+        try:
+            async for topic in self._topics():
+                # Get catalog topic info
+                assert self.context.catalog_service is not None
+                catalog_topic = self.context.catalog_service.get_or_create_topic(
+                    topic.query
                 )
-                continue
+                topic_slug = catalog_topic.topic_slug
 
-            topic_result = await self._extract_topic(
-                topic=topic,
-                papers=papers,
-                topic_slug=topic_slug,
-                catalog_topic=catalog_topic,
-            )
-            result.topic_results.append(topic_result)
+                # Get discovered papers from context
+                papers = self.context.discovered_papers.get(topic_slug, [])
 
-            if topic_result.success:
-                result.topics_processed += 1
-                result.total_papers_processed += topic_result.papers_processed
-                result.total_papers_with_extraction += (
-                    topic_result.papers_with_extraction
-                )
-                # Phase 9.5 REQ-9.5.1.4: roll up provenance counts.
-                result.total_papers_with_pdf += topic_result.papers_with_pdf
-                result.total_papers_with_abstract_fallback += (
-                    topic_result.papers_with_abstract_fallback
-                )
-                result.total_tokens_used += topic_result.tokens_used
-                result.total_cost_usd += topic_result.cost_usd
-                if topic_result.output_file:
-                    result.output_files.append(topic_result.output_file)
-            else:
-                result.topics_failed += 1
-                if topic_result.error:
-                    self.context.add_error(
-                        self.name, topic_result.error, topic=topic.query
+                if not papers:
+                    self.logger.info(
+                        "extraction_skipped",
+                        topic=topic.query,
+                        reason="no papers discovered",
+                    )
+                    continue
+
+                tasks.append(
+                    asyncio.create_task(
+                        extract(
+                            topic=topic,
+                            papers=papers,
+                            topic_slug=topic_slug,
+                            catalog_topic=catalog_topic,
+                        )
                     )
+                )
+
+            for task in tasks:
+                self._record_topic(result, await task)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         self.logger.info(
             "extraction_completed",
@@ -151,6 +165,53 @@ class ExtractionPhase(PipelinePhase[ExtractionResult]):
 
         return result
 
+    def _record_topic(
+        self, result: ExtractionResult, topic_result: TopicExtractionResult
+    ) -> None:
+        """Add one topic's outcome to the phase result.
+
+        Args:
+            result: Phase result to update
+            topic_result: Finished topic
+        """
+        result.topic_results.append(topic_result)
+
+        if topic_result.success:
+            result.topics_processed += 1
+            result.total_papers_processed += topic_result.papers_processed
+            result.total_papers_with_extraction += topic_result.papers_with_extraction
+            # Phase 9.5 REQ-9.5.1.4: roll up provenance counts.
+            result.total_papers_with_pdf += topic_result.papers_with_pdf
+            result.total_papers_with_abstract_fallback += (
+                topic_result.papers_with_abstract_fallback
+            )
+            result.total_tokens_used += topic_result.tokens_used
+            result.total_cost_usd += topic_result.cost_usd
+            if topic_result.output_file:
+                result.output_files.append(topic_result.output_file)
+        else:
+            result.topics_failed += 1
+            if topic_result.error:
+                self.context.add_error(
+                    self.name, topic_result.error, topic=topic_result.topic.query
+                )
+
+    async def _topics(self) -> AsyncIterator[ResearchTopic]:
+        """Topics to extract, in discovery order.
+
+        Yields:
+            Each configured topic, or in streaming mode each topic as the
+            discovery phase finishes it
+        """
+        if self.topic_queue is None:
+            assert self.context.config is not None
+            for topic in self.context.config.research_topics:
+                yield topic
+            return
+
+        while (topic := await self.topic_queue.get()) is not None:
+            yield topic
+
     async def _extract_topic(
         self,
         topic: ResearchTopic,
@@ -295,10 +356,12 @@ class ExtractionPhase(PipelinePhase[ExtractionResult]):
             targets_count=len(topic.extraction_targets),
         )
 
+        # Checkpoints are keyed by run id; topics extracted at the same
+        # time share the timestamp, so scope it to the topic
         extracted_papers = await self.context.extraction_service.process_papers(
             papers=papers,
             targets=topic.extraction_targets,
-            run_id=run_id,
+            run_id=f"{run_id}-{topic_slug}",
             query=topic.query,
             topic_slug=topic_slug,
         )
@@ -10,17 +10,20 @@ Usage:
     results = await pipeline.run()
 """
 
+import asyncio
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import structlog
 
-from src.models.config import ResearchConfig
+from src.models.config import ResearchConfig, ResearchTopic
 from src.orchestration.context import PipelineContext
 from src.orchestration.phases import (
     CrossSynthesisPhase,
     DiscoveryPhase,
+    DiscoveryResult,
     ExtractionPhase,
+    ExtractionResult,
     SynthesisPhase,
 )
 from src.orchestration.phases.discovery import partition_source_breakdown
@@ -30,6 +33,10 @@ from src.output.markdown_generator import MarkdownGenerator
 
 logger = structlog.get_logger()
 
+# Discovered topics waiting for extraction in streaming mode; discovery
+# pauses when extraction falls this far behind
+STREAM_QUEUE_SIZE = 2
+
 
 class ResearchPipeline:
     """Orchestrates the complete research pipeline.
@@ -42,6 +49,8 @@ class ResearchPipeline:
         enable_phase2: Whether to enable Phase 2 features (PDF/LLM extraction)
         enable_synthesis: Whether to enable Phase 3.6 synthesis
         enable_cross_synthesis: Whether to enable Phase 3.7 cross-topic synthesis
+        stream_extraction: Whether to extract each topic as soon as it is
+            discovered instead of after discovery of all topics
     """
 
     def __init__(
@@ -50,6 +59,7 @@ class ResearchPipeline:
         enable_phase2: bool = True,
         enable_synthesis: bool = True,
         enable_cross_synthesis: bool = True,
+        stream_extraction: bool = False,
     ) -> None:
         """Initialize the research pipeline.
 
@@ -58,11 +68,13 @@ class ResearchPipeline:
             enable_phase2: Enable Phase 2 PDF/LLM extraction (default: True)
             enable_synthesis: Enable Phase 3.6 synthesis (default: True)
             enable_cross_synthesis: Enable Phase 3.7 cross-topic synthesis
+            stream_extraction: Overlap discovery and extraction (default: False)
         """
         self.config_path = config_path or Path("config/research_config.yaml")
         self.enable_phase2 = enable_phase2
         self.enable_synthesis = enable_synthesis
         self.enable_cross_synthesis = enable_cross_synthesis
+        self.stream_extraction = stream_extraction
 
         # Context (initialized on run)
         self._context: Optional[PipelineContext] = None
@@ -98,12 +110,20 @@ class ResearchPipeline:
                 phase2_enabled=self.enable_phase2,
                 synthesis_enabled=self.enable_synthesis,
                 cross_synthesis_enabled=self.enable_cross_synthesis,
+                stream_extraction=self.stream_extraction,
                 topics_count=len(self._context.config.research_topics),
             )
 
             # Phase 1: Discovery (with Phase 7.2 multi-source if configured)
-            discovery_phase = self._create_discovery_phase()
-            discovery_result = await discovery_phase.run()
+            # and Phase 2: Extraction, one after the other or streamed
+            if self.stream_extraction:
+                discovery_result, extraction_result = await self._run_streaming()
+            else:
+                discovery_phase = self._create_discovery_phase()
+                discovery_result = await discovery_phase.run()
+                extraction_phase = ExtractionPhase(self._context)
+                extraction_result = await extraction_phase.run()
+
             result.topics_processed += discovery_result.topics_processed
             result.topics_failed += discovery_result.topics_failed
             result.papers_discovered = discovery_result.total_papers
@@ -118,9 +138,6 @@ class ResearchPipeline:
                 result.papers_from_citations,
             ) = partition_source_breakdown(result.source_breakdown)
 
-            # Phase 2: Extraction
-            extraction_phase = ExtractionPhase(self._context)
-            extraction_result = await extraction_phase.run()
             result.papers_processed = extraction_result.total_papers_processed
             result.papers_with_extraction = (
                 extraction_result.total_papers_with_extraction
@@ -195,6 +212,36 @@ class ResearchPipeline:
 
         return result
 
+    async def _run_streaming(self) -> Tuple[DiscoveryResult, ExtractionResult]:
+        """Run discovery and extraction concurrently over a bounded topic queue.
+
+        Each topic is extracted as soon as discovery has stored its papers,
+        so slow provider queries for later topics overlap PDF and LLM work
+        for earlier ones. Topics are extracted in discovery order with the
+        same per-topic outputs, catalog runs and checkpoints as when the
+        phases run one after the other.
+
+        Returns:
+            Tuple of (discovery result, extraction result)
+        """
+        assert self._context is not None
+
+        topic_queue: asyncio.Queue[Optional[ResearchTopic]] = asyncio.Queue(
+            maxsize=STREAM_QUEUE_SIZE
+        )
+        discovery_phase = self._create_discovery_phase(topic_queue=topic_queue)
+        extraction_phase = ExtractionPhase(self._context, topic_queue=topic_queue)
+
+        try:
+            # A failing phase cancels the other one
+            async with asyncio.TaskGroup() as group:
+                discovery = group.create_task(discovery_phase.run())
+                extraction = group.create_task(extraction_phase.run())
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+
+        return discovery.result(), extraction.result()
+
     async def _create_context(self) -> PipelineContext:
         """Create and initialize pipeline context with all services.
 
@@ -291,7 +338,7 @@ class ResearchPipeline:
         from src.models.dedup import DedupConfig
         from src.models.filters import FilterConfig
         from src.models.checkpoint import CheckpointConfig
-        from src.models.llm import LLMConfig, CostLimits
+        from src.models.llm import BatchConfig, LLMConfig, CostLimits
 
         pdf_settings = config.settings.pdf_settings
         llm_settings = config.settings.llm_settings
@@ -316,6 +363,16 @@ class ResearchPipeline:
             api_key=llm_settings.api_key or "",
             temperature=llm_settings.temperature,
             max_tokens=llm_settings.max_tokens,
+            section_token_threshold=llm_settings.section_token_threshold,
+            max_concurrent_sections=llm_settings.max_concurrent_sections,
+            batch=(
+                BatchConfig(
+                    max_batch_size=llm_settings.batch_size,
+                    poll_interval_seconds=llm_settings.batch_poll_seconds,
+                )
+                if llm_settings.batch_mode
+                else None
+            ),
         )
 
         cost_limits = CostLimits(
@@ -362,9 +419,15 @@ class ResearchPipeline:
 
         logger.info("phase2_services_initialized")
 
-    def _create_discovery_phase(self) -> DiscoveryPhase:
+    def _create_discovery_phase(
+        self,
+        topic_queue: Optional["asyncio.Queue[Optional[ResearchTopic]]"] = None,
+    ) -> DiscoveryPhase:
         """Create discovery phase with Phase 7.2 configuration if available.
 
+        Args:
+            topic_queue: Queue to stream discovered topics to (streaming mode)
+
         Returns:
             DiscoveryPhase configured with multi-source settings if present
         """
@@ -405,6 +468,7 @@ class ResearchPipeline:
             query_expansion_config=query_expansion,
             citation_config=citation_config,
             aggregation_config=aggregation_config,
+            topic_queue=topic_queue,
         )
 
     # Backward compatibility properties
@@ -4,14 +4,29 @@ Provides the core synthesis logic for generating:
 - Knowledge_Base.md: Cumulative, quality-ranked master document
 - User note preservation via anchor tags
 - Atomic file operations with backup support
+- Incremental rendering from a single-file section store, with changed
+  papers found through the registry change journal
+
+Rendered paper sections are kept in a single ``.kb_sections`` store per
+topic: a one-line JSON index followed by the concatenated UTF-8 section
+bytes. The index records the registry change-journal sequence the store
+was written at and, per paper, the byte range of its section, the user
+note it was rendered with and a stamp of its registry entry. A run
+re-renders only the papers the registry journal reports as changed since
+then (or, when the journal no longer reaches back that far, whose stamp
+differs) and those whose user note was edited. Every other section is
+sliced out of the store as bytes, so nothing is hashed, decoded or
+opened per paper, and Knowledge_Base.md is assembled from the slices and
+replaced with an atomic rename.
 """
 
+import json
 import os
 import re
 import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import structlog
 
 from src.models.synthesis import (
@@ -29,6 +44,15 @@ logger = structlog.get_logger()
 # File names
 KNOWLEDGE_BASE_FILENAME = "Knowledge_Base.md"
 BACKUP_SUFFIX = ".bak"
+SECTION_STORE_FILENAME = ".kb_sections"
+
+# Bump whenever _render_paper_section output or the store layout changes,
+# so sections stored by the old code are not reused.
+SECTION_FORMAT_VERSION = 2
+
+# Every rendered paper section ends with this separator; a stored section
+# without it was cut short and is rendered again.
+SECTION_TERMINATOR = b"---\n"
 
 # Anchor pattern for extracting user notes
 # Paper IDs can be alphanumeric with hyphens/underscores (UUIDs, arxiv IDs, etc.)
@@ -283,6 +307,153 @@ class SynthesisEngine:
 
         return "\n".join(lines)
 
+    def _section_stamp(self, entry: KnowledgeBaseEntry) -> str:
+        """Stamp the registry state a paper section is rendered from.
+
+        ``processed_at`` moves whenever the registry re-processes a
+        paper; topic affiliations are added without touching it.
+
+        Args:
+            entry: Knowledge Base entry the section is rendered from.
+
+        Returns:
+            Stamp compared against the stored one to detect changes.
+        """
+        affiliations = ",".join(entry.topic_affiliations)
+        return f"{entry.last_updated.isoformat()}|{affiliations}"
+
+    def _load_section_store(
+        self, topic_dir: Path
+    ) -> Tuple[Optional[int], Dict[str, List[Any]], bytes]:
+        """Load the section store written by the last successful synthesis.
+
+        Args:
+            topic_dir: Topic output directory.
+
+        Returns:
+            Tuple of (registry change sequence the store was written at,
+            index mapping paper_id to ``[stamp, note, offset, length]``,
+            concatenated section bytes). The sequence is None and the
+            index empty if there is no usable store.
+        """
+        path = topic_dir / SECTION_STORE_FILENAME
+        try:
+            header, _, body = path.read_bytes().partition(b"\n")
+            index = json.loads(header)
+            if index["version"] != SECTION_FORMAT_VERSION:
+                return None, {}, b""
+            return int(index["change_sequence"]), dict(index["sections"]), body
+        except FileNotFoundError:
+            return None, {}, b""
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("kb_section_store_unreadable", path=str(path), error=str(e))
+            return None, {}, b""
+
+    def _changed_paper_ids(self, sequence: Optional[int]) -> Optional[Set[str]]:
+        """Get the papers the registry journal reports as changed.
+
+        Args:
+            sequence: Change sequence the section store was written at.
+
+        Returns:
+            Paper IDs changed after ``sequence``, or None if the journal
+            does not cover it and stamps must be compared instead.
+        """
+        if sequence is None:
+            return None
+        changes = self.registry_service.get_changes_since(sequence)
+        if changes is None:
+            return None
+        return {change.paper_id for change in changes}
+
+    def _render_sections(
+        self,
+        entries: List[KnowledgeBaseEntry],
+        user_notes: Dict[str, UserNoteAnchor],
+        store_index: Dict[str, List[Any]],
+        store_body: bytes,
+        changed: Optional[Set[str]],
+    ) -> Tuple[List[bytes], Dict[str, List[Any]], int]:
+        """Render paper sections, reusing stored ones whose inputs are unchanged.
+
+        A stored section is reused when its user note is unchanged and
+        the paper is not in ``changed``; without a journal (``changed``
+        is None) its stamp must match instead.
+
+        Args:
+            entries: Sorted list of KB entries.
+            user_notes: Preserved user notes by paper_id.
+            store_index: Index of the previous section store.
+            store_body: Section bytes of the previous section store.
+            changed: Paper IDs changed since the store was written, or
+                None to compare stamps.
+
+        Returns:
+            Tuple of (UTF-8 sections in entry order, index for the new
+            store, number of sections rendered).
+        """
+        sections: List[bytes] = []
+        index: Dict[str, List[Any]] = {}
+        offset = 0
+        rendered = 0
+        for entry in entries:
+            user_note = user_notes.get(entry.paper_id)
+            note = user_note.content if user_note else None
+            section = None
+            stored = store_index.get(entry.paper_id)
+            if stored is not None and stored[1] == note:
+                if changed is None:
+                    stamp = self._section_stamp(entry)
+                    reusable = stored[0] == stamp
+                else:
+                    stamp = stored[0]
+                    reusable = entry.paper_id not in changed
+                if reusable:
+                    section = store_body[stored[2] : stored[2] + stored[3]]
+                    # A slice that does not end a section means the store
+                    # does not match its index; render the section instead.
+                    if not section.endswith(SECTION_TERMINATOR):
+                        section = None
+            if section is None:
+                stamp = self._section_stamp(entry)
+                section = self._render_paper_section(entry, user_note).encode("utf-8")
+                rendered += 1
+            sections.append(section)
+            index[entry.paper_id] = [stamp, note, offset, len(section)]
+            offset += len(section)
+
+        return sections, index, rendered
+
+    def _write_section_store(
+        self,
+        topic_dir: Path,
+        change_sequence: int,
+        index: Dict[str, List[Any]],
+        sections: List[bytes],
+    ) -> bool:
+        """Write the section store as one file with one atomic rename.
+
+        Args:
+            topic_dir: Topic output directory.
+            change_sequence: Registry change sequence the sections reflect.
+            index: Section index from :meth:`_render_sections`.
+            sections: Sections in the order the index offsets refer to.
+
+        Returns:
+            True if the store was written.
+        """
+        header = json.dumps(
+            {
+                "version": SECTION_FORMAT_VERSION,
+                "change_sequence": change_sequence,
+                "sections": index,
+            }
+        )
+        return self._atomic_write(
+            topic_dir / SECTION_STORE_FILENAME,
+            header.encode("utf-8") + b"\n" + b"".join(sections),
+        )
+
     def _render_knowledge_base(
         self,
         topic_slug: str,
@@ -299,6 +470,24 @@ class SynthesisEngine:
         Returns:
             Complete markdown document.
         """
+        lines = [self._render_header(topic_slug, entries)]
+        for entry in entries:
+            lines.append(
+                self._render_paper_section(entry, user_notes.get(entry.paper_id))
+            )
+
+        return "\n".join(lines)
+
+    def _render_header(self, topic_slug: str, entries: List[KnowledgeBaseEntry]) -> str:
+        """Render the Knowledge Base up to the paper sections.
+
+        Args:
+            topic_slug: Topic slug for the header.
+            entries: Sorted list of KB entries.
+
+        Returns:
+            Markdown for the title, overview and table of contents.
+        """
         lines = []
 
         # Header
@@ -336,10 +525,6 @@ class SynthesisEngine:
         lines.append("## All Papers")
         lines.append("")
 
-        for entry in entries:
-            user_note = user_notes.get(entry.paper_id)
-            lines.append(self._render_paper_section(entry, user_note))
-
         return "\n".join(lines)
 
     def _create_backup(self, file_path: Path) -> Optional[Path]:
@@ -375,14 +560,14 @@ class SynthesisEngine:
             )
             return None
 
-    def _atomic_write(self, file_path: Path, content: str) -> bool:
+    def _atomic_write(self, file_path: Path, content: Union[str, bytes]) -> bool:
         """Atomically write content to file.
 
         Uses temp file + rename pattern for safety.
 
         Args:
             file_path: Destination file path.
-            content: Content to write.
+            content: Content to write (str is encoded as UTF-8).
 
         Returns:
             True if write succeeded.
@@ -398,7 +583,9 @@ class SynthesisEngine:
             )
 
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if isinstance(content, str):
+                    content = content.encode("utf-8")
+                with os.fdopen(fd, "wb") as f:
                     f.write(content)
                     f.flush()
                     os.fsync(f.fileno())
@@ -429,6 +616,8 @@ class SynthesisEngine:
 
         Aggregates all papers from the registry, sorts by quality,
         preserves user notes, and generates the Knowledge_Base.md file.
+        Only paper sections whose inputs changed since they were last
+        stored are rendered; the rest are reused from the section store.
 
         Args:
             topic_slug: Topic to synthesize.
@@ -447,6 +636,10 @@ class SynthesisEngine:
         # Extract existing user notes
         user_notes = self._extract_user_notes(kb_path)
 
+        # Capture the journal position before reading entries, so a change
+        # made while synthesizing is picked up again by the next run.
+        change_sequence = self.registry_service.get_change_sequence()
+
         # Get all entries for topic
         registry_entries = self._get_entries_for_topic(topic_slug)
 
@@ -466,8 +659,18 @@ class SynthesisEngine:
         # Create backup
         self._create_backup(kb_path)
 
-        # Render Knowledge Base
-        content = self._render_knowledge_base(topic_slug, kb_entries, user_notes)
+        # Render changed sections, then assemble the Knowledge Base as
+        # bytes, as _render_knowledge_base would lay it out
+        store_sequence, store_index, store_body = self._load_section_store(topic_dir)
+        sections, index, sections_rendered = self._render_sections(
+            kb_entries,
+            user_notes,
+            store_index,
+            store_body,
+            self._changed_paper_ids(store_sequence),
+        )
+        header = self._render_header(topic_slug, kb_entries).encode("utf-8")
+        content = b"\n".join([header, *sections])
 
         # Atomic write
         success = self._atomic_write(kb_path, content)
@@ -479,6 +682,12 @@ class SynthesisEngine:
                 synthesis_duration_ms=int((time.time() - start_time) * 1000),
             )
 
+        # Store the sections only once the document that uses them is in
+        # place. An unchanged store is left alone: the journal read from
+        # its older sequence still reports every change since.
+        if sections_rendered or index.keys() != store_index.keys():
+            self._write_section_store(topic_dir, change_sequence, index, sections)
+
         # Calculate stats
         duration_ms = int((time.time() - start_time) * 1000)
         total_papers = len(kb_entries)
@@ -499,6 +708,8 @@ class SynthesisEngine:
             average_quality=avg_quality,
             top_quality_score=top_quality,
             user_notes_preserved=len(user_notes),
+            sections_rendered=sections_rendered,
+            sections_reused=total_papers - sections_rendered,
             synthesis_duration_ms=duration_ms,
         )
 
@@ -506,6 +717,7 @@ class SynthesisEngine:
             "synthesis_completed",
             topic=topic_slug,
             total_papers=total_papers,
+            sections_rendered=sections_rendered,
             duration_ms=duration_ms,
         )
 
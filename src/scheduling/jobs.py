@@ -815,6 +815,23 @@ class MonitoringCheckJob(BaseJob):
             # build_tier1_extras so the wiring logic is not duplicated.
             extra_providers, query_expander = build_tier1_extras(llm_svc)
 
+            # Embedding prefilter for the scorer: clear misses are dropped
+            # locally before any LLM batch. Only useful with a scorer.
+            embedding_svc = None
+            if llm_svc is not None:
+                try:
+                    from src.services.embeddings.embedding_service import (
+                        EmbeddingService,
+                    )
+
+                    embedding_svc = EmbeddingService()
+                except Exception as exc:
+                    logger.warning(
+                        "monitoring_check_job_embedding_init_failed",
+                        error_type=type(exc).__name__,
+                        reason="prefilter_will_be_skipped",
+                    )
+
             self._runner = MonitoringRunner.from_paths(
                 db_path=self._db_path,
                 registry=registry or RegistryService(),
@@ -822,6 +839,7 @@ class MonitoringCheckJob(BaseJob):
                 llm_service=llm_svc,
                 extra_providers=extra_providers,
                 query_expander=query_expander,
+                embedding_service=embedding_svc,
             )
         self._digest_generator = digest_generator or DigestGenerator(
             output_root=digest_output_root,
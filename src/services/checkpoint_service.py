@@ -7,7 +7,7 @@ Uses atomic file writes to prevent corruption.
 
 import json
 from pathlib import Path
-from typing import Set, Optional, List
+from typing import Dict, Set, Optional, List
 import structlog
 
 from src.models.checkpoint import CheckpointConfig, Checkpoint
@@ -108,16 +108,7 @@ class CheckpointService:
                 completed=completed,
             )
 
-            checkpoint_file = self._get_checkpoint_path(run_id)
-
-            # Atomic write: write to temp file, then rename
-            temp_file = checkpoint_file.with_suffix(".tmp")
-
-            with open(temp_file, "w") as f:
-                json.dump(checkpoint.model_dump(mode="json"), f, indent=2, default=str)
-
-            # Atomic rename
-            temp_file.rename(checkpoint_file)
+            self._write_checkpoint(checkpoint)
 
             logger.debug(
                 "checkpoint_saved",
@@ -132,6 +123,46 @@ class CheckpointService:
             logger.error("checkpoint_save_error", run_id=run_id, error=str(e))
             return False
 
+    def save_batches(self, run_id: str, batches: Dict[str, List[str]]) -> bool:
+        """
+        Save the provider batch jobs awaiting collection, atomically.
+
+        Args:
+            run_id: Unique run identifier
+            batches: Batch ID -> paper IDs, in request order
+
+        Returns:
+            True if saved successfully
+        """
+        if not self.config.enabled:
+            return True
+
+        try:
+            self._write_checkpoint(Checkpoint(run_id=run_id, batches=batches))
+            logger.debug("batch_checkpoint_saved", run_id=run_id, batches=len(batches))
+            return True
+
+        except Exception as e:
+            logger.error("checkpoint_save_error", run_id=run_id, error=str(e))
+            return False
+
+    def get_batches(self, run_id: str) -> Dict[str, List[str]]:
+        """
+        Get the provider batch jobs a run left awaiting collection.
+
+        Args:
+            run_id: Unique run identifier
+
+        Returns:
+            Batch ID -> paper IDs, in request order
+        """
+        checkpoint = self.load_checkpoint(run_id)
+
+        if checkpoint is None:
+            return {}
+
+        return checkpoint.batches
+
     def get_processed_ids(self, run_id: str) -> Set[str]:
         """
         Get set of processed paper IDs for a run.
@@ -214,6 +245,17 @@ class CheckpointService:
             logger.error("checkpoint_list_error", error=str(e))
             return []
 
+    def _write_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Write a checkpoint atomically: temp file, then rename"""
+        checkpoint_file = self._get_checkpoint_path(checkpoint.run_id)
+        temp_file = checkpoint_file.with_suffix(".tmp")
+
+        with open(temp_file, "w") as f:
+            json.dump(checkpoint.model_dump(mode="json"), f, indent=2, default=str)
+
+        # Atomic rename
+        temp_file.rename(checkpoint_file)
+
     def _get_checkpoint_path(self, run_id: str) -> Path:
         """Get checkpoint file path for a run"""
         return self.checkpoint_dir / f"{run_id}.json"
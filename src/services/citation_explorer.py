@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from src.models.config import CitationExplorationConfig
 from src.models.paper import PaperMetadata, Author
+from src.services.providers.rate_limits import semantic_scholar_rate_limiter
 from src.utils.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
@@ -75,7 +76,9 @@ class CitationExplorer:
         self.api_key = api_key
         self.registry = registry_service
         self.config = config or CitationExplorationConfig()
-        self.rate_limiter = rate_limiter or RateLimiter(requests_per_minute=100)
+        self.rate_limiter = rate_limiter or semantic_scholar_rate_limiter(
+            bool(api_key)
+        )
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -276,6 +279,7 @@ class CitationExplorer:
         ) as response:
             if response.status == 429:
                 logger.warning(f"{error_prefix}_rate_limit", paper_id=paper_id)
+                await self.rate_limiter.record_throttled()
                 return []
             if response.status != 200:
                 logger.warning(
@@ -1,16 +1,19 @@
 """Deep Research Agent with ReAct loop and self-improvement.
 
 This module provides:
-- ReAct-style agent loop (Reasoning + Acting)
+- ReAct-style agent loop (Reasoning + Acting), sync and async
+- Concurrent multi-question sessions over one shared corpus
 - Resource limit enforcement
 - Trajectory recording
 - Recursive summarization for context management (SR-8.2)
 - Prompt injection protection with XML tagging (SR-8.4)
 """
 
+import asyncio
+import inspect
 import time
 from datetime import UTC, datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Sequence
 
 import structlog
 from pydantic import BaseModel, Field
@@ -18,16 +21,84 @@ from pydantic import BaseModel, Field
 from src.models.dra import (
     AgentLimits,
     ResearchResult,
+    ResearchSessionOutcome,
     ToolCall,
     ToolCallType,
     Turn,
 )
-from src.services.dra.browser import CitationCheck, ResearchBrowser
+from src.services.dra.browser import (
+    DEFAULT_DOCUMENT_CACHE_SIZE,
+    CitationCheck,
+    OpenedDocument,
+    ResearchBrowser,
+)
+from src.services.dra.corpus_manager import CorpusManager
+from src.services.dra.utils import LRUCache
 from src.services.llm.service import LLMService
 
 logger = structlog.get_logger()
 
 
+async def _call_complete(llm_service: Any, kwargs: dict[str, Any]) -> Any:
+    """Call ``llm_service.complete`` and await the result if it is awaitable.
+
+    ``LLMService.complete`` is a coroutine; plain synchronous clients
+    (and test doubles) return the response directly.
+    """
+    response = llm_service.complete(**kwargs)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+class LLMGate:
+    """LLM concurrency and token budget shared by concurrent sessions.
+
+    Every session's LLM calls go through one gate, so the number of
+    in-flight calls and the total tokens spent are bounded for the
+    whole batch rather than per session. The budget is checked before
+    each turn; calls already in flight when it runs out still complete,
+    so the final total may overshoot by at most one call per session.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_calls: int = 4,
+        max_total_tokens: Optional[int] = None,
+    ):
+        """Initialize the gate.
+
+        Args:
+            max_concurrent_calls: Maximum LLM calls in flight at once
+            max_total_tokens: Token budget for all sessions (None = unbounded)
+        """
+        if max_concurrent_calls < 1:
+            raise ValueError("max_concurrent_calls must be >= 1")
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_total_tokens = max_total_tokens
+        self.tokens_used = 0
+        self.calls = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent_calls)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the shared token budget has been spent."""
+        return (
+            self.max_total_tokens is not None
+            and self.tokens_used >= self.max_total_tokens
+        )
+
+    async def complete(self, llm_service: Any, **kwargs: Any) -> Any:
+        """Run one completion under the concurrency limit and charge it."""
+        async with self._semaphore:
+            response = await _call_complete(llm_service, kwargs)
+        self.calls += 1
+        tokens = getattr(response, "total_tokens", None)
+        if isinstance(tokens, int):
+            self.tokens_used += tokens
+        return response
+
+
 class WorkingMemory(BaseModel):
     """Compressed summary of agent's trajectory.
 
@@ -67,6 +138,7 @@ class DeepResearchAgent:
         browser: ResearchBrowser,
         llm_service: LLMService,
         limits: Optional[AgentLimits] = None,
+        llm_gate: Optional[LLMGate] = None,
     ):
         """Initialize deep research agent.
 
@@ -74,10 +146,13 @@ class DeepResearchAgent:
             browser: Research browser instance
             llm_service: LLM service for reasoning generation
             limits: Resource limits (uses defaults if not provided)
+            llm_gate: Shared LLM concurrency/budget gate for
+                ``research_async`` (None = call the service directly)
         """
         self.browser = browser
         self.llm_service = llm_service
         self.limits = limits or AgentLimits()
+        self.llm_gate = llm_gate
 
         # Working memory for context management (SR-8.2)
         self.working_memory = WorkingMemory()
@@ -97,32 +172,12 @@ class DeepResearchAgent:
         Returns:
             ResearchResult with answer and trajectory
         """
-        logger.info("research_session_starting", question=question[:200])
-
-        start_time = time.time()
+        start_time = self._begin_session(question)
         answer: Optional[str] = None
         exhausted = False
 
-        # Check corpus freshness before starting
-        # Note: Caller should have called corpus_manager.ensure_fresh()
-        # but we log a warning if corpus seems stale
-        papers_count = self.browser.corpus_manager.paper_count
-        if papers_count < 10:
-            logger.warning(
-                "corpus_may_be_stale",
-                paper_count=papers_count,
-                recommendation="Run ensure_fresh() before agent sessions",
-            )
-
         for turn_number in range(1, self.limits.max_turns + 1):
-            # Check time limit
-            elapsed = time.time() - start_time
-            if elapsed > self.limits.max_session_duration_seconds:
-                logger.warning(
-                    "session_timeout",
-                    elapsed=elapsed,
-                    limit=self.limits.max_session_duration_seconds,
-                )
+            if self._session_timed_out(start_time):
                 exhausted = True
                 break
 
@@ -141,13 +196,7 @@ class DeepResearchAgent:
                 if turn_number % 10 == 0:
                     self._summarize_trajectory(up_to_turn=turn_number)
 
-                # Check context limit
-                if self.context_tokens > self.limits.max_context_tokens:
-                    logger.warning(
-                        "context_limit_exceeded",
-                        tokens=self.context_tokens,
-                        limit=self.limits.max_context_tokens,
-                    )
+                if self._context_exceeded():
                     exhausted = True
                     break
 
@@ -164,6 +213,119 @@ class DeepResearchAgent:
         if turn_number >= self.limits.max_turns and not answer:
             exhausted = True
 
+        return self._finish_session(question, answer, exhausted, start_time)
+
+    async def research_async(self, question: str) -> ResearchResult:
+        """Execute a research session without blocking the event loop.
+
+        Same ReAct loop as :meth:`research`, but LLM calls are awaited
+        (through ``llm_gate`` when set) and tool calls run in a worker
+        thread, so many sessions can share one event loop, corpus and
+        LLM service.
+
+        Args:
+            question: Research question to investigate
+
+        Returns:
+            ResearchResult with answer and trajectory
+        """
+        start_time = self._begin_session(question)
+        answer: Optional[str] = None
+        exhausted = False
+
+        for turn_number in range(1, self.limits.max_turns + 1):
+            if self._session_timed_out(start_time):
+                exhausted = True
+                break
+
+            if self.llm_gate is not None and self.llm_gate.exhausted:
+                logger.warning(
+                    "research_budget_exhausted",
+                    tokens_used=self.llm_gate.tokens_used,
+                    limit=self.llm_gate.max_total_tokens,
+                )
+                exhausted = True
+                break
+
+            try:
+                turn = await self._execute_turn_async(turn_number, question)
+                self.trajectory.append(turn)
+
+                if turn.action.tool == ToolCallType.ANSWER:
+                    answer = turn.action.arguments.get("answer", "")
+                    logger.info("answer_produced", turn=turn_number)
+                    break
+
+                # SR-8.2: Trigger summarization every 10 turns
+                if turn_number % 10 == 0:
+                    await self._summarize_trajectory_async(up_to_turn=turn_number)
+
+                if self._context_exceeded():
+                    exhausted = True
+                    break
+
+            except Exception as e:
+                logger.error(
+                    "turn_execution_failed",
+                    turn=turn_number,
+                    error=str(e),
+                )
+                exhausted = True
+                break
+
+        if turn_number >= self.limits.max_turns and not answer:
+            exhausted = True
+
+        return self._finish_session(question, answer, exhausted, start_time)
+
+    def _begin_session(self, question: str) -> float:
+        """Log the session start and check the corpus; return start time."""
+        logger.info("research_session_starting", question=question[:200])
+
+        # Check corpus freshness before starting
+        # Note: Caller should have called corpus_manager.ensure_fresh()
+        # but we log a warning if corpus seems stale
+        papers_count = self.browser.corpus_manager.paper_count
+        if papers_count < 10:
+            logger.warning(
+                "corpus_may_be_stale",
+                paper_count=papers_count,
+                recommendation="Run ensure_fresh() before agent sessions",
+            )
+
+        return time.time()
+
+    def _session_timed_out(self, start_time: float) -> bool:
+        """Check the session time limit."""
+        elapsed = time.time() - start_time
+        if elapsed > self.limits.max_session_duration_seconds:
+            logger.warning(
+                "session_timeout",
+                elapsed=elapsed,
+                limit=self.limits.max_session_duration_seconds,
+            )
+            return True
+        return False
+
+    def _context_exceeded(self) -> bool:
+        """Check the context token limit."""
+        if self.context_tokens > self.limits.max_context_tokens:
+            logger.warning(
+                "context_limit_exceeded",
+                tokens=self.context_tokens,
+                limit=self.limits.max_context_tokens,
+            )
+            return True
+        return False
+
+    def _finish_session(
+        self,
+        question: str,
+        answer: Optional[str],
+        exhausted: bool,
+        start_time: float,
+    ) -> ResearchResult:
+        """Build the session result and log completion."""
         duration = time.time() - start_time
 
         result = ResearchResult(
@@ -201,15 +363,9 @@ class DeepResearchAgent:
         """
         logger.debug("executing_turn", turn=turn_number)
 
-        # Build prompt with working memory (SR-8.2)
-        system_prompt = self._build_system_prompt()
-        user_prompt = self._build_user_prompt(turn_number, question)
-
         # Generate reasoning + action
         response = self.llm_service.complete(  # type: ignore[attr-defined]
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            max_tokens=2000,  # Limit reasoning length
+            **self._turn_request(turn_number, question)
         )
 
         # Parse response (type: ignore for async coroutine access)
@@ -219,6 +375,57 @@ class DeepResearchAgent:
         # Execute tool call
         observation, obs_tokens = self._execute_tool(tool_call)
 
+        return self._record_turn(
+            turn_number, reasoning, tool_call, observation, obs_tokens
+        )
+
+    async def _execute_turn_async(self, turn_number: int, question: str) -> Turn:
+        """Async counterpart of :meth:`_execute_turn`.
+
+        Args:
+            turn_number: Current turn number
+            question: Research question
+
+        Returns:
+            Turn record
+        """
+        logger.debug("executing_turn", turn=turn_number)
+
+        response = await self._complete(**self._turn_request(turn_number, question))
+        reasoning, tool_call = self._parse_llm_response(response.content)
+
+        # Browser tools are synchronous (index lookups, disk reads); run
+        # them in a worker thread so other sessions keep making progress.
+        observation, obs_tokens = await asyncio.to_thread(self._execute_tool, tool_call)
+
+        return self._record_turn(
+            turn_number, reasoning, tool_call, observation, obs_tokens
+        )
+
+    async def _complete(self, **kwargs: Any) -> Any:
+        """Await one LLM completion, through the shared gate if any."""
+        if self.llm_gate is not None:
+            return await self.llm_gate.complete(self.llm_service, **kwargs)
+        return await _call_complete(self.llm_service, kwargs)
+
+    def _turn_request(self, turn_number: int, question: str) -> dict[str, Any]:
+        """Build the LLM request for a turn (prompts + length limit)."""
+        # Build prompt with working memory (SR-8.2)
+        return {
+            "prompt": self._build_user_prompt(turn_number, question),
+            "system_prompt": self._build_system_prompt(),
+            "max_tokens": 2000,  # Limit reasoning length
+        }
+
+    def _record_turn(
+        self,
+        turn_number: int,
+        reasoning: str,
+        tool_call: ToolCall,
+        observation: str,
+        obs_tokens: int,
+    ) -> Turn:
+        """Account a finished turn's tokens and build its record."""
         # Update context token count
         self.context_tokens += len(reasoning) // 4  # Rough tokenization
         self.context_tokens += obs_tokens
@@ -439,6 +646,54 @@ Begin your research systematically. Good luck!
         """
         logger.info("summarizing_trajectory", up_to_turn=up_to_turn)
 
+        request = self._summary_request(up_to_turn)
+        if request is None:
+            return
+        summary_prompt, turns_compressed = request
+
+        # Generate summary using LLM
+        try:
+            response = self.llm_service.complete(  # type: ignore[attr-defined]
+                prompt=summary_prompt,
+                max_tokens=1000,
+            )
+            self._store_summary(
+                response.content,  # type: ignore[attr-defined]
+                up_to_turn,
+                turns_compressed,
+            )
+
+        except Exception as e:
+            logger.error("summarization_failed", error=str(e))
+
+    async def _summarize_trajectory_async(self, up_to_turn: int) -> None:
+        """Async counterpart of :meth:`_summarize_trajectory`.
+
+        Args:
+            up_to_turn: Turn number to summarize up to
+        """
+        logger.info("summarizing_trajectory", up_to_turn=up_to_turn)
+
+        request = self._summary_request(up_to_turn)
+        if request is None:
+            return
+        summary_prompt, turns_compressed = request
+
+        try:
+            response = await self._complete(prompt=summary_prompt, max_tokens=1000)
+            self._store_summary(response.content, up_to_turn, turns_compressed)
+        except Exception as e:
+            logger.error("summarization_failed", error=str(e))
+
+    def _summary_request(self, up_to_turn: int) -> Optional[tuple[str, int]]:
+        """Build the summarization prompt for turns not yet summarized.
+
+        Args:
+            up_to_turn: Turn number to summarize up to
+
+        Returns:
+            ``(prompt, turns_compressed)``, or None if there is nothing new
+        """
         # Get turns since last summarization
         start_turn = self.working_memory.last_summarized_turn
         turns_to_summarize = [
@@ -446,7 +701,7 @@ Begin your research systematically. Good luck!
         ]
 
         if not turns_to_summarize:
-            return
+            return None
 
         # Build summary prompt
         summary_parts = []
@@ -470,28 +725,24 @@ Previous summary:
 
 Compressed summary:"""
 
-        # Generate summary using LLM
-        try:
-            response = self.llm_service.complete(  # type: ignore[attr-defined]
-                prompt=summary_prompt,
-                max_tokens=1000,
-            )
+        return summary_prompt, len(turns_to_summarize)
 
-            new_summary = response.content.strip()  # type: ignore[attr-defined]
+    def _store_summary(
+        self, content: str, up_to_turn: int, turns_compressed: int
+    ) -> None:
+        """Replace the working memory summary with a new LLM summary."""
+        new_summary = content.strip()
 
-            # Update working memory
-            self.working_memory.summary = new_summary
-            self.working_memory.last_summarized_turn = up_to_turn
-            self.working_memory.token_count = len(new_summary) // 4
+        # Update working memory
+        self.working_memory.summary = new_summary
+        self.working_memory.last_summarized_turn = up_to_turn
+        self.working_memory.token_count = len(new_summary) // 4
 
-            logger.info(
-                "trajectory_summarized",
-                turns_compressed=len(turns_to_summarize),
-                summary_tokens=self.working_memory.token_count,
-            )
-
-        except Exception as e:
-            logger.error("summarization_failed", error=str(e))
+        logger.info(
+            "trajectory_summarized",
+            turns_compressed=turns_compressed,
+            summary_tokens=self.working_memory.token_count,
+        )
 
     def validate_citations_in_answer(self, answer: str) -> list[CitationCheck]:
         """Validate all citations in the final answer.
@@ -517,15 +768,11 @@ Compressed summary:"""
             logger.warning("no_citations_found_in_answer")
             return []
 
-        # Validate each citation
-        results: list[CitationCheck] = []
-        for paper_id, claim in citations:
-            check = self.browser.validate_citation(
-                claim=claim.strip(),
-                cited_paper_id=paper_id,
-                fuzzy_threshold=0.7,
-            )
-            results.append(check)
+        # Validate all citations in one batch (each paper opened once)
+        results = self.browser.validate_citations(
+            [(claim.strip(), paper_id) for paper_id, claim in citations],
+            fuzzy_threshold=0.7,
+        )
 
         # Log validation summary
         valid_count = sum(1 for c in results if c.found)
@@ -537,3 +784,122 @@ Compressed summary:"""
         )
 
         return results
+
+
+class ResearchSessionRunner:
+    """Run many research sessions concurrently over one shared corpus.
+
+    The corpus manager (and with it the search engine, its indexes and
+    embedding model) is loaded once and shared read-only. Each session
+    gets its own :class:`ResearchBrowser` (open documents) and agent
+    (trajectory, working memory), so sessions never see each other's
+    state. The browsers share one document cache, so a paper opened by
+    several sessions is assembled once. All sessions share one
+    :class:`LLMGate`, which bounds LLM calls in flight and the tokens
+    spent by the whole batch.
+    """
+
+    def __init__(
+        self,
+        corpus_manager: CorpusManager,
+        llm_service: LLMService,
+        limits: Optional[AgentLimits] = None,
+        max_concurrent_sessions: int = 4,
+        max_concurrent_llm_calls: int = 4,
+        max_total_tokens: Optional[int] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            corpus_manager: Shared corpus manager (search engine loaded)
+            llm_service: Shared LLM service
+            limits: Per-session resource limits
+            max_concurrent_sessions: Sessions running at once
+            max_concurrent_llm_calls: LLM calls in flight across sessions
+            max_total_tokens: Token budget for the batch (None = unbounded)
+        """
+        if max_concurrent_sessions < 1:
+            raise ValueError("max_concurrent_sessions must be >= 1")
+        self.corpus_manager = corpus_manager
+        self.llm_service = llm_service
+        self.limits = limits or AgentLimits()
+        self.max_concurrent_sessions = max_concurrent_sessions
+        self.gate = LLMGate(
+            max_concurrent_calls=max_concurrent_llm_calls,
+            max_total_tokens=max_total_tokens,
+        )
+        self.document_cache: LRUCache[tuple, OpenedDocument] = LRUCache(
+            DEFAULT_DOCUMENT_CACHE_SIZE
+        )
+
+    def new_agent(self) -> DeepResearchAgent:
+        """Build an agent with its own browser over the shared corpus."""
+        browser = ResearchBrowser(
+            self.corpus_manager,
+            max_open_documents=self.limits.max_open_documents,
+            document_cache=self.document_cache,
+        )
+        return DeepResearchAgent(
+            browser=browser,
+            llm_service=self.llm_service,
+            limits=self.limits,
+            llm_gate=self.gate,
+        )
+
+    async def run(
+        self, questions: Sequence[str]
+    ) -> AsyncIterator[ResearchSessionOutcome]:
+        """Research ``questions`` concurrently, yielding outcomes as they finish.
+
+        Outcomes arrive in completion order; use ``outcome.index`` to
+        restore question order. A failing session yields an outcome with
+        ``error`` set instead of aborting the batch. Sessions still
+        running when the consumer stops iterating are cancelled.
+
+        Args:
+            questions: Research questions
+
+        Yields:
+            One ResearchSessionOutcome per question
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_sessions)
+
+        async def _session(index: int, question: str) -> ResearchSessionOutcome:
+            async with semaphore:
+                try:
+                    result = await self.new_agent().research_async(question)
+                except Exception as e:
+                    logger.error(
+                        "research_session_failed",
+                        index=index,
+                        error=str(e),
+                    )
+                    return ResearchSessionOutcome(
+                        index=index, question=question, error=str(e)
+                    )
+                return ResearchSessionOutcome(
+                    index=index, question=question, result=result
+                )
+
+        logger.info(
+            "research_batch_starting",
+            questions=len(questions),
+            max_concurrent_sessions=self.max_concurrent_sessions,
+        )
+        tasks = [
+            asyncio.ensure_future(_session(index, question))
+            for index, question in enumerate(questions)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info(
+            "research_batch_complete",
+            questions=len(questions),
+            llm_calls=self.gate.calls,
+            tokens_used=self.gate.tokens_used,
+        )
@@ -4,24 +4,31 @@ This module provides:
 - search() primitive for corpus queries
 - open() primitive for document retrieval
 - find() primitive for in-document search
-- Citation validation for synthesis phase
+- Citation validation for synthesis phase (single and batched)
+- Document cache shareable between concurrent browsers
 """
 
 import re
 import structlog
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.models.dra import (
     ChunkType,
     FindResult,
     SearchResult,
 )
-from src.services.dra.corpus_manager import CorpusManager
+from src.services.dra.corpus_manager import CorpusManager, PaperRecord
+from src.services.dra.utils import LRUCache, SentenceIndex
 
 logger = structlog.get_logger()
 
+# Assembled documents kept per browser unless a shared cache is passed in
+DEFAULT_DOCUMENT_CACHE_SIZE = 64
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
 
 class OpenedDocument(BaseModel):
     """An opened document in the browser session.
@@ -40,6 +47,31 @@ class OpenedDocument(BaseModel):
     section: Optional[ChunkType] = Field(default=None, description="Section scope")
     token_count: int = Field(..., ge=0, description="Token count")
 
+    _sentences: Optional[list[str]] = PrivateAttr(default=None)
+    _sentences_lower: Optional[list[str]] = PrivateAttr(default=None)
+    _sentence_index: Optional[SentenceIndex] = PrivateAttr(default=None)
+
+    @property
+    def sentences(self) -> list[str]:
+        """Content split into sentences (computed once per document)."""
+        if self._sentences is None:
+            self._sentences = _SENTENCE_SPLIT.split(self.content)
+        return self._sentences
+
+    @property
+    def sentences_lower(self) -> list[str]:
+        """Lower-cased :attr:`sentences`."""
+        if self._sentences_lower is None:
+            self._sentences_lower = [s.lower() for s in self.sentences]
+        return self._sentences_lower
+
+    @property
+    def sentence_index(self) -> SentenceIndex:
+        """Word → sentence inverted index over :attr:`sentences_lower`."""
+        if self._sentence_index is None:
+            self._sentence_index = SentenceIndex(self.sentences_lower)
+        return self._sentence_index
+
 
 class CitationCheck(BaseModel):
     """Result of citation validation.
@@ -64,22 +96,33 @@ class ResearchBrowser:
 
     Provides search, open, find operations over the offline corpus.
     Tracks all operations in trajectory for learning.
+
+    Assembled documents (with their sentence split) are cached keyed on
+    the search engine's corpus version. Browsers of concurrent sessions
+    can pass one ``document_cache`` so a paper is assembled once for all.
     """
 
     def __init__(
         self,
         corpus_manager: CorpusManager,
         max_open_documents: int = 20,
+        document_cache: Optional[LRUCache[tuple, "OpenedDocument"]] = None,
     ):
         """Initialize research browser.
 
         Args:
             corpus_manager: Corpus manager instance
             max_open_documents: Maximum simultaneously open documents
+            document_cache: Shared document cache (private one if None)
         """
         self.corpus_manager = corpus_manager
         self.search_engine = corpus_manager.search_engine
         self.max_open_documents = max_open_documents
+        self.document_cache: LRUCache[tuple, OpenedDocument] = (
+            document_cache
+            if document_cache is not None
+            else LRUCache(DEFAULT_DOCUMENT_CACHE_SIZE)
+        )
 
         # Track opened documents
         self._opened_docs: dict[str, OpenedDocument] = {}
@@ -97,6 +140,9 @@ class ResearchBrowser:
         query: str,
         top_k: int = 10,
         section_filter: Optional[ChunkType] = None,
+        paper_ids: Optional[Iterable[str]] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
     ) -> list[SearchResult]:
         """Search the corpus using hybrid retrieval.
 
@@ -107,6 +153,9 @@ class ResearchBrowser:
             query: Search query
             top_k: Number of results to return
             section_filter: Optional section type filter
+            paper_ids: Optional paper IDs to search within
+            min_year: Optional earliest publication year (inclusive)
+            max_year: Optional latest publication year (inclusive)
 
         Returns:
             List of search results sorted by relevance
@@ -122,6 +171,9 @@ class ResearchBrowser:
             query=query,
             top_k=top_k,
             section_filter=section_filter,
+            paper_ids=paper_ids,
+            min_year=min_year,
+            max_year=max_year,
         )
 
     def open(
@@ -159,6 +211,36 @@ class ResearchBrowser:
         if not paper_record:
             raise ValueError(f"Paper not found: {paper_id}")
 
+        cache_key = (paper_id, section, self.search_engine.version)
+        doc = self.document_cache.get(cache_key)
+        if doc is None:
+            doc = self._assemble_document(paper_id, paper_record, section)
+            self.document_cache.put(cache_key, doc)
+
+        # Track opened document
+        self._opened_docs[paper_id] = doc
+        self._current_doc = doc
+
+        logger.info(
+            "document_opened",
+            paper_id=paper_id,
+            section=section.value if section else "full",
+            tokens=doc.token_count,
+        )
+
+        return doc
+
+    def _assemble_document(
+        self,
+        paper_id: str,
+        paper_record: PaperRecord,
+        section: Optional[ChunkType],
+    ) -> OpenedDocument:
+        """Concatenate a paper's chunks (optionally one section) into a document.
+
+        Raises:
+            ValueError: If the paper has no content (in that section)
+        """
         # Collect content from chunks
         content_parts: list[str] = []
         total_tokens = 0
@@ -183,8 +265,7 @@ class ResearchBrowser:
                 + (f" section {section.value}" if section else "")
             )
 
-        # Create opened document
-        doc = OpenedDocument(
+        return OpenedDocument(
             paper_id=paper_id,
             title=paper_record.title,
             content="\n\n".join(content_parts),
@@ -192,19 +273,6 @@ class ResearchBrowser:
             token_count=total_tokens,
         )
 
-        # Track opened document
-        self._opened_docs[paper_id] = doc
-        self._current_doc = doc
-
-        logger.info(
-            "document_opened",
-            paper_id=paper_id,
-            section=section.value if section else "full",
-            tokens=total_tokens,
-        )
-
-        return doc
-
     def find(
         self,
         pattern: str,
@@ -243,8 +311,8 @@ class ResearchBrowser:
             raise ValueError(f"Invalid regex pattern: {e}") from e
 
         for doc in docs_to_search:
-            # Split into sentences for context extraction
-            sentences = re.split(r"(?<=[.!?])\s+", doc.content)
+            # Sentences for context extraction
+            sentences = doc.sentences
 
             for i, sentence in enumerate(sentences):
                 matches = list(regex.finditer(sentence))
@@ -304,77 +372,103 @@ class ResearchBrowser:
             paper_id=cited_paper_id,
         )
 
+        doc = self._citation_document(cited_paper_id)
+        if doc is None:
+            return _citation_not_found(claim, cited_paper_id)
+
+        check = self._check_claim(doc, claim, cited_paper_id, fuzzy_threshold)
+
+        logger.info(
+            "citation_validated",
+            paper_id=cited_paper_id,
+            found=check.found,
+            confidence=check.confidence,
+        )
+
+        return check
+
+    def validate_citations(
+        self,
+        citations: Sequence[tuple[str, str]],
+        fuzzy_threshold: float = 0.7,
+    ) -> list[CitationCheck]:
+        """Validate many citations, opening each cited paper once.
+
+        Same checks as :meth:`validate_citation`, for a whole answer.
+
+        Args:
+            citations: ``(claim, cited_paper_id)`` pairs
+            fuzzy_threshold: Minimum similarity threshold (0.0-1.0)
+
+        Returns:
+            One CitationCheck per citation, in input order
+        """
+        docs: dict[str, Optional[OpenedDocument]] = {}
+        results: list[CitationCheck] = []
+
+        for claim, paper_id in citations:
+            if paper_id not in docs:
+                docs[paper_id] = self._citation_document(paper_id)
+            doc = docs[paper_id]
+            if doc is None:
+                results.append(_citation_not_found(claim, paper_id))
+            else:
+                results.append(self._check_claim(doc, claim, paper_id, fuzzy_threshold))
+
+        logger.info(
+            "citations_validated",
+            total=len(results),
+            papers=len(docs),
+            found=sum(1 for c in results if c.found),
+        )
+
+        return results
+
+    def _citation_document(self, paper_id: str) -> Optional[OpenedDocument]:
+        """Return the cited paper, opening it if needed (None if unavailable)."""
         # Try to open the paper if not already open
         try:
-            if cited_paper_id not in self._opened_docs:
-                doc = self.open(cited_paper_id)
-            else:
-                doc = self._opened_docs[cited_paper_id]
+            if paper_id not in self._opened_docs:
+                return self.open(paper_id)
+            return self._opened_docs[paper_id]
         except ValueError as e:
             logger.warning(
-                "citation_check_paper_not_found", paper_id=cited_paper_id, error=str(e)
-            )
-            return CitationCheck(
-                claim=claim,
-                cited_paper_id=cited_paper_id,
-                found=False,
-                evidence="",
-                confidence=0.0,
+                "citation_check_paper_not_found", paper_id=paper_id, error=str(e)
             )
+            return None
 
-        # Search for the claim in the paper content
-        # Simple approach: check if claim keywords appear in paper
-        claim_lower = claim.lower()
-        content_lower = doc.content.lower()
+    @staticmethod
+    def _check_claim(
+        doc: OpenedDocument,
+        claim: str,
+        cited_paper_id: str,
+        fuzzy_threshold: float,
+    ) -> CitationCheck:
+        """Check a claim against an opened document.
 
+        The claim's key terms (words of 4+ characters) are looked up in
+        the document's sentence index: the fraction found anywhere in
+        the paper is the confidence, and the sentence containing the
+        most of them is the evidence.
+        """
         # Extract key terms from claim (remove stopwords, punctuation)
-        key_terms = re.findall(r"\b\w{4,}\b", claim_lower)  # Words 4+ chars
+        key_terms = re.findall(r"\b\w{4,}\b", claim.lower())  # Words 4+ chars
         if not key_terms:
-            return CitationCheck(
-                claim=claim,
-                cited_paper_id=cited_paper_id,
-                found=False,
-                evidence="",
-                confidence=0.0,
-            )
+            return _citation_not_found(claim, cited_paper_id)
 
-        # Check how many key terms appear in the paper
-        terms_found = sum(1 for term in key_terms if term in content_lower)
+        terms_found, _, best_id = doc.sentence_index.match(key_terms)
         match_ratio = terms_found / len(key_terms)
-
-        # Find best matching sentence as evidence
-        best_sentence = ""
-        best_score = 0.0
-
-        sentences = re.split(r"(?<=[.!?])\s+", doc.content)
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            sentence_terms_found = sum(
-                1 for term in key_terms if term in sentence_lower
-            )
-            sentence_score = sentence_terms_found / len(key_terms)
-
-            if sentence_score > best_score:
-                best_score = sentence_score
-                best_sentence = sentence
+        best_sentence = doc.sentences[best_id] if best_id is not None else ""
 
         # Determine if citation is valid
         found = match_ratio >= fuzzy_threshold
-        confidence = round(match_ratio, 4)
-
-        logger.info(
-            "citation_validated",
-            paper_id=cited_paper_id,
-            found=found,
-            confidence=confidence,
-        )
 
         return CitationCheck(
             claim=claim,
             cited_paper_id=cited_paper_id,
             found=found,
             evidence=best_sentence[:5000] if found else "",
-            confidence=confidence,
+            confidence=round(match_ratio, 4),
         )
 
     def close(self, paper_id: str) -> bool:
@@ -420,3 +514,14 @@ class ResearchBrowser:
             List of paper IDs
         """
         return list(self._opened_docs.keys())
+
+
+def _citation_not_found(claim: str, cited_paper_id: str) -> CitationCheck:
+    """Negative citation check (paper unavailable or nothing to match)."""
+    return CitationCheck(
+        claim=claim,
+        cited_paper_id=cited_paper_id,
+        found=False,
+        evidence="",
+        confidence=0.0,
+    )
@@ -0,0 +1,349 @@
+"""Compact on-disk chunk store with lazily materialized content.
+
+``HybridSearchEngine`` used to persist every chunk in one
+``chunks.json`` and parse it back into ``CorpusChunk`` objects on load,
+so load time and resident memory grew with the total corpus text.
+``ChunkStore`` splits a saved corpus into:
+
+- ``chunk_content.<generation>.bin``: the UTF-8 content of every chunk,
+  concatenated, memory-mapped read-only on load;
+- ``chunk_index.npz``: compact per-chunk arrays (content byte offsets,
+  token counts, section codes, paper and metadata rows) plus a JSON
+  header with the chunk IDs, checksums and the de-duplicated paper
+  titles and metadata dicts.
+
+Loading reads only the index; a chunk's content is sliced out of the
+mapping and a ``CorpusChunk`` is built when it is looked up. The index
+is written last and names the content file it belongs to, so a crash
+mid-save leaves the previous (index, content) pair intact.
+
+Chunks added in memory (``index_chunks`` or direct assignment) are kept
+as ``CorpusChunk`` objects and shadow persisted rows with the same ID.
+"""
+
+import io
+import json
+import mmap
+import secrets
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import structlog
+
+from src.models.dra import ChunkType, CorpusChunk
+from src.services.dra.utils import atomic_write_bytes
+
+logger = structlog.get_logger()
+
+INDEX_FILE_NAME = "chunk_index.npz"
+CONTENT_FILE_PREFIX = "chunk_content."
+CONTENT_FILE_SUFFIX = ".bin"
+LEGACY_FILE_NAME = "chunks.json"
+FORMAT_VERSION = 1
+
+
+def metadata_year(metadata: dict[str, Any]) -> Optional[int]:
+    """Publication year from paper metadata, if it records one.
+
+    Uses ``year`` when present, else the leading year of
+    ``publication_date`` (ISO format, as written by the registry).
+    """
+    year = metadata.get("year")
+    if isinstance(year, int) and not isinstance(year, bool):
+        return year
+    if isinstance(year, str) and year[:4].isdigit():
+        return int(year[:4])
+    published = metadata.get("publication_date")
+    if isinstance(published, str) and published[:4].isdigit():
+        return int(published[:4])
+    return None
+
+
+class ChunkStore(MutableMapping[str, CorpusChunk]):
+    """Mapping of chunk ID to ``CorpusChunk`` backed by a memory-mapped file.
+
+    Besides the mapping interface, :meth:`section_type` and
+    :meth:`paper_id` answer filter queries from the index arrays without
+    materializing the chunk.
+    """
+
+    def __init__(self, chunks: Optional[dict[str, CorpusChunk]] = None):
+        """Initialize an in-memory store.
+
+        Args:
+            chunks: Initial chunks keyed by chunk ID
+        """
+        self._memory: dict[str, CorpusChunk] = dict(chunks or {})
+
+        # Persisted rows (populated by open())
+        self._rows: dict[str, int] = {}
+        self._chunk_ids: list[str] = []
+        self._content: bytes | mmap.mmap = b""
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._token_counts = np.zeros(0, dtype=np.int32)
+        self._sections = np.zeros(0, dtype=np.uint8)
+        self._paper_rows = np.zeros(0, dtype=np.int32)
+        self._metadata_rows = np.zeros(0, dtype=np.int32)
+        self._section_types: list[ChunkType] = []
+        self._checksums: list[Optional[str]] = []
+        self._papers: list[tuple[str, str]] = []
+        self._metadata: list[dict[str, Any]] = []
+
+    @classmethod
+    def exists(cls, directory: Path) -> bool:
+        """Check whether ``directory`` holds a saved store."""
+        return (directory / INDEX_FILE_NAME).exists()
+
+    @classmethod
+    def open(cls, directory: Path) -> "ChunkStore":
+        """Open a saved store; only the index is read into memory.
+
+        Args:
+            directory: Directory the store was saved to
+
+        Returns:
+            ChunkStore serving content from the memory-mapped content file
+
+        Raises:
+            FileNotFoundError: If the index or its content file is missing
+            ValueError: If the index is malformed or doesn't match the
+                content file
+        """
+        with np.load(directory / INDEX_FILE_NAME, allow_pickle=False) as index:
+            header = json.loads(index["header"].tobytes().decode("utf-8"))
+            arrays = {
+                name: index[name]
+                for name in (
+                    "offsets",
+                    "token_counts",
+                    "sections",
+                    "paper_rows",
+                    "metadata_rows",
+                )
+            }
+
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported chunk store format: {header.get('format')}")
+
+        chunk_ids: list[str] = header["chunk_ids"]
+        offsets = arrays["offsets"]
+        if len(offsets) != len(chunk_ids) + 1 or any(
+            len(arrays[name]) != len(chunk_ids)
+            for name in ("token_counts", "sections", "paper_rows", "metadata_rows")
+        ):
+            raise ValueError("Chunk store index arrays have inconsistent lengths")
+
+        store = cls()
+        content_path = directory / header["content_file"]
+        with open(content_path, "rb") as f:
+            size = content_path.stat().st_size
+            if size != int(offsets[-1]):
+                raise ValueError(
+                    f"Chunk content file size {size} does not match index "
+                    f"({int(offsets[-1])} bytes)"
+                )
+            if size:
+                store._content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        store._rows = {cid: row for row, cid in enumerate(chunk_ids)}
+        store._chunk_ids = chunk_ids
+        store._offsets = offsets
+        store._token_counts = arrays["token_counts"]
+        store._sections = arrays["sections"]
+        store._paper_rows = arrays["paper_rows"]
+        store._metadata_rows = arrays["metadata_rows"]
+        store._section_types = [ChunkType(value) for value in header["sections"]]
+        store._checksums = header["checksums"]
+        store._papers = [(p, t) for p, t in header["papers"]]
+        store._metadata = header["metadata"]
+
+        logger.debug("chunk_store_opened", path=str(directory), chunks=len(store))
+        return store
+
+    @classmethod
+    def from_legacy_json(cls, path: Path) -> "ChunkStore":
+        """Load a corpus saved as ``chunks.json`` by earlier versions.
+
+        Args:
+            path: Path to ``chunks.json``
+
+        Returns:
+            In-memory ChunkStore holding every chunk
+        """
+        with open(path) as f:
+            chunks_data = json.load(f)
+
+        return cls(
+            {
+                cid: CorpusChunk(
+                    chunk_id=data["chunk_id"],
+                    paper_id=data["paper_id"],
+                    section_type=ChunkType(data["section_type"]),
+                    title=data["title"],
+                    content=data["content"],
+                    token_count=data["token_count"],
+                    checksum=data.get("checksum"),
+                    metadata=data.get("metadata", {}),
+                )
+                for cid, data in chunks_data.items()
+            }
+        )
+
+    def __getitem__(self, chunk_id: str) -> CorpusChunk:
+        chunk = self._memory.get(chunk_id)
+        if chunk is not None:
+            return chunk
+        return self._materialize(self._rows[chunk_id])
+
+    def __setitem__(self, chunk_id: str, chunk: CorpusChunk) -> None:
+        self._rows.pop(chunk_id, None)
+        self._memory[chunk_id] = chunk
+
+    def __delitem__(self, chunk_id: str) -> None:
+        if self._memory.pop(chunk_id, None) is None:
+            del self._rows[chunk_id]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._memory
+        yield from self._rows
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._rows)
+
+    def __contains__(self, chunk_id: object) -> bool:
+        return chunk_id in self._memory or chunk_id in self._rows
+
+    def section_type(self, chunk_id: str) -> Optional[ChunkType]:
+        """Section type of a chunk, without loading its content."""
+        chunk = self._memory.get(chunk_id)
+        if chunk is not None:
+            return chunk.section_type
+        row = self._rows.get(chunk_id)
+        if row is None:
+            return None
+        return self._section_types[self._sections[row]]
+
+    def paper_id(self, chunk_id: str) -> Optional[str]:
+        """Paper ID of a chunk, without loading its content."""
+        chunk = self._memory.get(chunk_id)
+        if chunk is not None:
+            return chunk.paper_id
+        row = self._rows.get(chunk_id)
+        if row is None:
+            return None
+        return self._papers[self._paper_rows[row]][0]
+
+    def year(self, chunk_id: str) -> Optional[int]:
+        """Publication year of a chunk's paper (see :func:`metadata_year`)."""
+        chunk = self._memory.get(chunk_id)
+        if chunk is not None:
+            return metadata_year(chunk.metadata)
+        row = self._rows.get(chunk_id)
+        if row is None:
+            return None
+        return metadata_year(self._metadata[self._metadata_rows[row]])
+
+    def _content_bytes(self, row: int) -> bytes:
+        return self._content[int(self._offsets[row]) : int(self._offsets[row + 1])]
+
+    def _materialize(self, row: int) -> CorpusChunk:
+        paper_id, title = self._papers[self._paper_rows[row]]
+        return CorpusChunk(
+            chunk_id=self._chunk_ids[row],
+            paper_id=paper_id,
+            section_type=self._section_types[self._sections[row]],
+            title=title,
+            content=self._content_bytes(row).decode("utf-8"),
+            token_count=int(self._token_counts[row]),
+            checksum=self._checksums[row],
+            metadata=dict(self._metadata[self._metadata_rows[row]]),
+        )
+
+    def save(self, directory: Path, file_mode: int = 0o600) -> None:
+        """Write the store to ``directory`` (content file first, index last).
+
+        Persisted rows are copied byte-for-byte from the current content
+        file; in-memory chunks are encoded. Content files of earlier
+        generations are removed once the new index is in place.
+
+        Args:
+            directory: Target directory (must exist)
+            file_mode: Permission mode for the written files
+        """
+        chunk_ids = list(self)
+        section_types = list(ChunkType)
+        section_codes = {section: code for code, section in enumerate(section_types)}
+        papers: dict[tuple[str, str], int] = {}
+        metadata: dict[str, int] = {}
+
+        offsets = np.zeros(len(chunk_ids) + 1, dtype=np.int64)
+        token_counts = np.zeros(len(chunk_ids), dtype=np.int32)
+        sections = np.zeros(len(chunk_ids), dtype=np.uint8)
+        paper_rows = np.zeros(len(chunk_ids), dtype=np.int32)
+        metadata_rows = np.zeros(len(chunk_ids), dtype=np.int32)
+        checksums: list[Optional[str]] = []
+
+        def content_blocks() -> Iterator[bytes]:
+            for i, cid in enumerate(chunk_ids):
+                row = self._rows.get(cid)
+                if row is not None:
+                    paper = self._papers[self._paper_rows[row]]
+                    meta = self._metadata[self._metadata_rows[row]]
+                    section = self._section_types[self._sections[row]]
+                    token_counts[i] = self._token_counts[row]
+                    checksums.append(self._checksums[row])
+                    data = self._content_bytes(row)
+                else:
+                    chunk = self._memory[cid]
+                    paper = (chunk.paper_id, chunk.title)
+                    meta = chunk.metadata
+                    section = chunk.section_type
+                    token_counts[i] = chunk.token_count
+                    checksums.append(chunk.checksum)
+                    data = chunk.content.encode("utf-8")
+                paper_rows[i] = papers.setdefault(paper, len(papers))
+                meta_key = json.dumps(meta, sort_keys=True)
+                metadata_rows[i] = metadata.setdefault(meta_key, len(metadata))
+                sections[i] = section_codes[section]
+                offsets[i + 1] = offsets[i] + len(data)
+                yield data
+
+        content_name = (
+            f"{CONTENT_FILE_PREFIX}{secrets.token_hex(8)}{CONTENT_FILE_SUFFIX}"
+        )
+        atomic_write_bytes(directory / content_name, content_blocks(), file_mode)
+
+        header = {
+            "format": FORMAT_VERSION,
+            "content_file": content_name,
+            "chunk_ids": chunk_ids,
+            "checksums": checksums,
+            "sections": [section.value for section in section_types],
+            "papers": [list(paper) for paper in papers],
+            "metadata": [json.loads(key) for key in metadata],
+        }
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+            offsets=offsets,
+            token_counts=token_counts,
+            sections=sections,
+            paper_rows=paper_rows,
+            metadata_rows=metadata_rows,
+        )
+        atomic_write_bytes(directory / INDEX_FILE_NAME, [buffer.getvalue()], file_mode)
+
+        for stale in directory.glob(f"{CONTENT_FILE_PREFIX}*{CONTENT_FILE_SUFFIX}"):
+            if stale.name != content_name:
+                stale.unlink(missing_ok=True)
+        (directory / LEGACY_FILE_NAME).unlink(missing_ok=True)
+
+        logger.debug(
+            "chunk_store_saved",
+            path=str(directory),
+            chunks=len(chunk_ids),
+            content_bytes=int(offsets[-1]),
+        )
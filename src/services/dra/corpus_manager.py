@@ -7,13 +7,14 @@ This module provides:
 - Corpus statistics and health checks
 """
 
+import io
 import json
 import os
 import re
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional, TextIO
 
 import structlog
 
@@ -29,6 +30,7 @@ from src.services.dra.utils import (
     TokenCounter,
     atomic_write_json,
     compute_checksum,
+    scan_text_file,
     set_secure_permissions,
 )
 
@@ -226,9 +228,75 @@ class CorpusManager:
             logger.warning("ingest_paper_empty_content", paper_id=paper_id)
             return []
 
-        # Check if paper needs update
-        content_checksum = compute_checksum(markdown_content)
+        return self._ingest(
+            paper_id=paper_id,
+            title=title,
+            content_checksum=compute_checksum(markdown_content),
+            open_content=lambda: io.StringIO(markdown_content),
+            metadata=metadata,
+            force=force,
+        )
+
+    def ingest_paper_file(
+        self,
+        paper_id: str,
+        title: str,
+        content_path: Path,
+        metadata: Optional[dict] = None,
+        force: bool = False,
+    ) -> list[CorpusChunk]:
+        """Ingest a paper from a markdown file without reading it whole.
+
+        The checksum is computed over the file in blocks, and chunks are
+        built while the file is read line by line, so large documents
+        (theses, appendix-heavy papers) never exist as one string.
+
+        Args:
+            paper_id: Registry paper ID
+            title: Paper title
+            content_path: Markdown file to ingest
+            metadata: Additional metadata
+            force: Force re-ingestion even if unchanged
+
+        Returns:
+            List of created chunks
+        """
+        content_checksum, has_content = scan_text_file(content_path)
+        if not has_content:
+            logger.warning("ingest_paper_empty_content", paper_id=paper_id)
+            return []
+
+        return self._ingest(
+            paper_id=paper_id,
+            title=title,
+            content_checksum=content_checksum,
+            open_content=lambda: open(content_path, encoding="utf-8"),
+            metadata=metadata,
+            force=force,
+        )
+
+    def _ingest(
+        self,
+        paper_id: str,
+        title: str,
+        content_checksum: str,
+        open_content: Callable[[], TextIO],
+        metadata: Optional[dict],
+        force: bool,
+    ) -> list[CorpusChunk]:
+        """Chunk, index and record a paper's (non-empty) content.
+
+        Args:
+            paper_id: Registry paper ID
+            title: Paper title
+            content_checksum: Checksum of the content
+            open_content: Opens the content as a text stream
+            metadata: Additional metadata
+            force: Force re-ingestion even if unchanged
 
+        Returns:
+            List of created chunks
+        """
         if not force and paper_id in self._papers:
             existing = self._papers[paper_id]
             if existing.checksum == content_checksum:
@@ -247,20 +315,28 @@ class CorpusManager:
 
         logger.info("ingesting_paper", paper_id=paper_id, title=title[:50])
 
-        # Parse sections
-        sections = self._section_parser.parse(markdown_content)
-
-        if not sections:
-            # If no sections found, treat entire content as OTHER
-            sections = [(ChunkType.OTHER, "", markdown_content)]
+        # Parse sections and build chunks as the content streams in
+        with open_content() as lines:
+            chunks = list(
+                self._chunk_builder.iter_chunks(
+                    paper_id=paper_id,
+                    title=title,
+                    lines=lines,
+                    metadata=metadata,
+                    section_parser=self._section_parser,
+                )
+            )
 
-        # Build chunks
-        chunks = self._chunk_builder.build_chunks(
-            paper_id=paper_id,
-            title=title,
-            sections=sections,
-            metadata=metadata,
-        )
+        if not chunks:
+            # If no sections found (headers only), treat entire content as OTHER
+            with open_content() as f:
+                content = f.read()
+            chunks = self._chunk_builder.build_chunks(
+                paper_id=paper_id,
+                title=title,
+                sections=[(ChunkType.OTHER, "", content)],
+                metadata=metadata,
+            )
 
         if not chunks:
             logger.warning("ingest_paper_no_chunks", paper_id=paper_id)
@@ -423,13 +499,10 @@ class CorpusManager:
                 )
                 return []
 
-        with open(content_path, encoding="utf-8") as f:
-            content = f.read()
-
-        return self.ingest_paper(
+        return self.ingest_paper_file(
             paper_id=paper_id,
             title=title,
-            markdown_content=content,
+            content_path=content_path,
             metadata=metadata,
             force=force,
         )
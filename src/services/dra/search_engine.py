@@ -5,12 +5,15 @@ This module provides:
 - BM25-based sparse keyword search
 - Reciprocal Rank Fusion (RRF) for result combination
 - Configurable weighting between dense and sparse results
+- LRU caches for query embeddings and fused results
+- Compact chunk persistence with lazily loaded content (see chunk_store)
 """
 
 import json
 import os
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
 import numpy as np
 import structlog
@@ -25,9 +28,10 @@ from src.models.dra import (
     SearchConfig,
     SearchResult,
 )
+from src.services.dra.chunk_store import LEGACY_FILE_NAME, ChunkStore
 from src.services.dra.utils import (
+    LRUCache,
     TextNormalizer,
-    atomic_write_json,
     set_secure_permissions,
 )
 
@@ -86,6 +90,9 @@ class EmbeddingModel:
         self._model = None
         self._tokenizer = None
         self._dimension: Optional[int] = None
+        # Concurrent research sessions search from worker threads; only
+        # one of them may load the model.
+        self._load_lock = threading.Lock()
 
     @property
     def dimension(self) -> int:
@@ -95,10 +102,15 @@ class EmbeddingModel:
         return self._dimension  # type: ignore[return-value]
 
     def _load_model(self) -> None:
-        """Lazy load the transformer model."""
+        """Lazy load the transformer model (thread-safe)."""
         if self._model is not None:
             return
+        with self._load_lock:
+            if self._model is None:
+                self._load_model_locked()
 
+    def _load_model_locked(self) -> None:
+        """Load the model; caller holds ``_load_lock``."""
         try:
             from transformers import AutoModel, AutoTokenizer
         except (
@@ -225,6 +237,11 @@ class BM25Index:
         """Get number of indexed documents."""
         return len(self._chunk_ids)
 
+    @property
+    def chunk_ids(self) -> list[str]:
+        """Chunk IDs in index position order."""
+        return self._chunk_ids
+
     def build(self, chunks: list[CorpusChunk]) -> None:
         """Build BM25 index from chunks.
 
@@ -254,12 +271,20 @@ class BM25Index:
 
         logger.info("bm25_index_built", document_count=len(chunks))
 
-    def search(self, query: str, top_k: int = 10) -> list[tuple[str, float]]:
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        positions: Optional[np.ndarray] = None,
+    ) -> list[tuple[str, float]]:
         """Search the BM25 index.
 
         Args:
             query: Search query
             top_k: Number of results to return
+            positions: Optional document positions to restrict scoring to
+                (see :class:`FilterPostings`); other documents are never
+                scored
 
         Returns:
             List of (chunk_id, score) tuples sorted by score descending
@@ -271,7 +296,18 @@ class BM25Index:
         if not tokenized_query:
             return []
 
-        scores = self._index.get_scores(tokenized_query)  # type: ignore[attr-defined]
+        if positions is None:
+            scores = self._index.get_scores(  # type: ignore[attr-defined]
+                tokenized_query
+            )
+        elif len(positions) == 0:
+            return []
+        else:
+            scores = np.asarray(
+                self._index.get_batch_scores(  # type: ignore[attr-defined]
+                    tokenized_query, positions.tolist()
+                )
+            )
 
         # Get top-k indices
         top_indices = np.argsort(scores)[::-1][:top_k]
@@ -279,7 +315,8 @@ class BM25Index:
         results = []
         for idx in top_indices:
             if scores[idx] > 0:
-                results.append((self._chunk_ids[idx], float(scores[idx])))
+                position = idx if positions is None else positions[idx]
+                results.append((self._chunk_ids[position], float(scores[idx])))
 
         return results
 
@@ -357,6 +394,11 @@ class DenseIndex:
         """Get number of indexed vectors."""
         return len(self._chunk_ids)
 
+    @property
+    def chunk_ids(self) -> list[str]:
+        """Chunk IDs in index position order."""
+        return self._chunk_ids
+
     def build(self, chunk_ids: list[str], embeddings: np.ndarray) -> None:
         """Build FAISS index from embeddings.
 
@@ -400,13 +442,19 @@ class DenseIndex:
         )
 
     def search(
-        self, query_embedding: np.ndarray, top_k: int = 10
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        positions: Optional[np.ndarray] = None,
     ) -> list[tuple[str, float]]:
         """Search the FAISS index.
 
         Args:
             query_embedding: Query vector of shape (dimension,)
             top_k: Number of results to return
+            positions: Optional vector positions to restrict the search to;
+                passed to FAISS as an ID selector, so vectors outside it
+                are skipped before the inner product is computed
 
         Returns:
             List of (chunk_id, score) tuples sorted by score descending
@@ -428,9 +476,20 @@ class DenseIndex:
         faiss.normalize_L2(query)
 
         # Search
-        scores, indices = self._index.search(  # type: ignore[attr-defined]
-            query, min(top_k, self.size)
-        )
+        if positions is None:
+            scores, indices = self._index.search(  # type: ignore[attr-defined]
+                query, min(top_k, self.size)
+            )
+        elif len(positions) == 0:
+            return []
+        else:
+            ids = np.ascontiguousarray(positions, dtype=np.int64)
+            selector = faiss.IDSelectorBatch(len(ids), faiss.swig_ptr(ids))
+            scores, indices = self._index.search(  # type: ignore[attr-defined]
+                query,
+                min(top_k, len(ids)),
+                params=faiss.SearchParameters(sel=selector),
+            )
 
         results = []
         for score, idx in zip(scores[0], indices[0]):
@@ -504,6 +563,77 @@ class DenseIndex:
         logger.debug("dense_index_loaded", path=str(path), size=self.size)
 
 
+class FilterPostings:
+    """Posting lists over one index's positions, for metadata pre-filtering.
+
+    Holds the positions of every section type and paper plus a compact
+    year array, so :meth:`select` resolves a filter to the (sorted)
+    positions the indexes should score, without touching chunk content.
+    """
+
+    def __init__(self, chunk_ids: Sequence[str], chunks: ChunkStore):
+        """Build postings for ``chunk_ids`` (index position order).
+
+        Args:
+            chunk_ids: Chunk IDs in index position order
+            chunks: Store providing section, paper and year per chunk
+        """
+        sections: dict[ChunkType, list[int]] = {}
+        papers: dict[str, list[int]] = {}
+        self._years = np.zeros(len(chunk_ids), dtype=np.int32)
+        for position, chunk_id in enumerate(chunk_ids):
+            section = chunks.section_type(chunk_id)
+            paper_id = chunks.paper_id(chunk_id)
+            if section is None or paper_id is None:
+                continue  # indexed but no longer stored: never matches
+            sections.setdefault(section, []).append(position)
+            papers.setdefault(paper_id, []).append(position)
+            self._years[position] = chunks.year(chunk_id) or 0
+
+        self.size = len(chunk_ids)
+        self._sections = {k: np.array(v, dtype=np.int64) for k, v in sections.items()}
+        self._papers = {k: np.array(v, dtype=np.int64) for k, v in papers.items()}
+
+    def select(
+        self,
+        section: Optional[ChunkType] = None,
+        paper_ids: Optional[frozenset[str]] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+    ) -> np.ndarray:
+        """Positions matching every given filter, in ascending order.
+
+        Chunks whose paper records no year never match a year filter.
+        """
+        candidates: Optional[np.ndarray] = None
+        if paper_ids is not None:
+            postings = [self._papers[p] for p in paper_ids if p in self._papers]
+            candidates = (
+                np.sort(np.concatenate(postings))
+                if postings
+                else np.zeros(0, dtype=np.int64)
+            )
+        if section is not None:
+            posting = self._sections.get(section, np.zeros(0, dtype=np.int64))
+            candidates = (
+                posting
+                if candidates is None
+                else np.intersect1d(candidates, posting, assume_unique=True)
+            )
+        if candidates is None:
+            candidates = np.arange(self.size, dtype=np.int64)
+        if min_year is None and max_year is None:
+            return candidates
+
+        years = self._years[candidates]
+        keep = years > 0
+        if min_year is not None:
+            keep &= years >= min_year
+        if max_year is not None:
+            keep &= years <= max_year
+        return candidates[keep]
+
+
 class HybridSearchEngine:
     """Hybrid search engine combining dense and sparse retrieval.
 
@@ -512,6 +642,11 @@ class HybridSearchEngine:
     - BM25 sparse keyword search (lexical matching)
 
     SR-8.7: Supports rate limiting for hosted embedding APIs.
+
+    Query embeddings and fused result lists are kept in LRU caches, so
+    agents repeating a search (within or across sessions) skip both the
+    encoder and the index scans. Result entries are keyed on
+    :attr:`version`, which changes whenever the indexed corpus does.
     """
 
     def __init__(
@@ -534,7 +669,16 @@ class HybridSearchEngine:
         self._embedding_model: Optional[EmbeddingModel] = None
         self._dense_index = DenseIndex()
         self._bm25_index = BM25Index()
-        self._chunks: dict[str, CorpusChunk] = {}
+        self._chunks = ChunkStore()
+        self._postings: Optional[tuple[FilterPostings, FilterPostings]] = None
+
+        self._version = 0
+        self._query_embeddings: LRUCache[str, np.ndarray] = LRUCache(
+            self.search_config.query_cache_size
+        )
+        self._result_cache: LRUCache[tuple, list[SearchResult]] = LRUCache(
+            self.search_config.result_cache_size
+        )
 
     @property
     def is_ready(self) -> bool:
@@ -546,6 +690,17 @@ class HybridSearchEngine:
         """Get number of indexed chunks."""
         return len(self._chunks)
 
+    @property
+    def version(self) -> int:
+        """Corpus version; bumped whenever chunks are indexed or loaded."""
+        return self._version
+
+    def _corpus_changed(self) -> None:
+        """Invalidate cached results after the indexed corpus changed."""
+        self._version += 1
+        self._result_cache.clear()
+        self._postings = None
+
     def _get_embedding_model(self) -> EmbeddingModel:
         """Get or create embedding model (lazy initialization).
 
@@ -560,6 +715,14 @@ class HybridSearchEngine:
             )
         return self._embedding_model
 
+    def warm_up(self) -> None:
+        """Load the embedding model now rather than on the first search.
+
+        Used by long-lived processes (the research server) so no request
+        pays the model load.
+        """
+        self._get_embedding_model()._load_model()
+
     def index_chunks(self, chunks: list[CorpusChunk]) -> None:
         """Index a list of chunks for search.
 
@@ -586,6 +749,7 @@ class HybridSearchEngine:
 
         chunk_ids = [c.chunk_id for c in chunks]
         self._dense_index.build(chunk_ids, embeddings)
+        self._corpus_changed()
 
         logger.info(
             "chunks_indexed",
@@ -599,13 +763,24 @@ class HybridSearchEngine:
         query: str,
         top_k: Optional[int] = None,
         section_filter: Optional[ChunkType] = None,
+        paper_ids: Optional[Iterable[str]] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
     ) -> list[SearchResult]:
         """Search the corpus with hybrid retrieval.
 
+        Filters are resolved to index positions before retrieval: BM25
+        scores only the matching documents and FAISS skips the other
+        vectors, so a selective filter still yields up to ``top_k``
+        results and costs less than an unfiltered query.
+
         Args:
             query: Search query
             top_k: Number of results (default from config)
             section_filter: Optional section type filter
+            paper_ids: Optional set of paper IDs to search within
+            min_year: Optional earliest publication year (inclusive)
+            max_year: Optional latest publication year (inclusive)
 
         Returns:
             List of SearchResult objects sorted by relevance
@@ -616,17 +791,54 @@ class HybridSearchEngine:
 
         top_k = top_k or self.search_config.default_top_k
         top_k = min(top_k, self.search_config.max_top_k)
+        papers = frozenset(paper_ids) if paper_ids is not None else None
+
+        normalized_query = " ".join(query.split())
+        cache_key = (
+            normalized_query,
+            top_k,
+            section_filter,
+            papers,
+            min_year,
+            max_year,
+            self._version,
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("search_cache_hit", query=query[:50])
+            return list(cached)
+
+        sparse_positions: Optional[np.ndarray] = None
+        dense_positions: Optional[np.ndarray] = None
+        candidate_pool = self.corpus_size
+        if any(f is not None for f in (section_filter, papers, min_year, max_year)):
+            sparse_postings, dense_postings = self._filter_postings()
+            sparse_positions = sparse_postings.select(
+                section_filter, papers, min_year, max_year
+            )
+            dense_positions = (
+                sparse_positions
+                if dense_postings is sparse_postings
+                else dense_postings.select(section_filter, papers, min_year, max_year)
+            )
+            candidate_pool = max(len(sparse_positions), len(dense_positions))
+
+        # Get more candidates for fusion
+        candidate_k = min(top_k * 3, candidate_pool)
+
+        dense_results: list[tuple[str, float]] = []
+        sparse_results: list[tuple[str, float]] = []
+        if candidate_k > 0:
+            # Dense search
+            query_embedding = self._embed_query(normalized_query)
+            dense_results = self._dense_index.search(
+                query_embedding, candidate_k, positions=dense_positions
+            )
 
-        # Get more candidates for filtering and fusion
-        candidate_k = min(top_k * 3, self.corpus_size)
-
-        # Dense search
-        embedding_model = self._get_embedding_model()
-        query_embedding = embedding_model.encode_single(query)
-        dense_results = self._dense_index.search(query_embedding, candidate_k)
-
-        # Sparse search
-        sparse_results = self._bm25_index.search(query, candidate_k)
+            # Sparse search
+            sparse_results = self._bm25_index.search(
+                query, candidate_k, positions=sparse_positions
+            )
 
         # Reciprocal Rank Fusion
         fused_scores = self._reciprocal_rank_fusion(
@@ -636,15 +848,6 @@ class HybridSearchEngine:
             sparse_weight=self.search_config.sparse_weight,
         )
 
-        # Apply section filter if specified
-        if section_filter:
-            fused_scores = {
-                cid: score
-                for cid, score in fused_scores.items()
-                if (chunk := self._chunks.get(cid)) is not None
-                and chunk.section_type == section_filter
-            }
-
         # Sort by score and take top_k
         sorted_results = sorted(fused_scores.items(), key=lambda x: x[1], reverse=True)[
             :top_k
@@ -675,7 +878,35 @@ class HybridSearchEngine:
             results=len(search_results),
         )
 
-        return search_results
+        self._result_cache.put(cache_key, search_results)
+        return list(search_results)
+
+    def _filter_postings(self) -> tuple[FilterPostings, FilterPostings]:
+        """Postings for the BM25 and dense indexes, built once per version.
+
+        Both indexes are normally built from the same chunk list, in
+        which case a single posting set serves both.
+        """
+        postings = self._postings
+        if postings is None:
+            sparse_ids = self._bm25_index.chunk_ids
+            dense_ids = self._dense_index.chunk_ids
+            sparse = FilterPostings(sparse_ids, self._chunks)
+            dense = (
+                sparse
+                if dense_ids == sparse_ids
+                else FilterPostings(dense_ids, self._chunks)
+            )
+            postings = self._postings = (sparse, dense)
+        return postings
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Encode a (normalized) query, reusing cached embeddings."""
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            embedding = self._get_embedding_model().encode_single(query)
+            self._query_embeddings.put(query, embedding)
+        return embedding
 
     def _reciprocal_rank_fusion(
         self,
@@ -716,6 +947,9 @@ class HybridSearchEngine:
     def get_chunk(self, chunk_id: str) -> Optional[CorpusChunk]:
         """Get a chunk by ID.
 
+        Chunks of a loaded corpus are materialized from the memory-mapped
+        content file on each call.
+
         Args:
             chunk_id: Chunk identifier
 
@@ -751,21 +985,8 @@ class HybridSearchEngine:
         self._dense_index.save(save_path / "dense")
         self._bm25_index.save(save_path / "bm25")
 
-        # Save chunks with atomic write and file permissions
-        chunks_data = {
-            cid: {
-                "chunk_id": c.chunk_id,
-                "paper_id": c.paper_id,
-                "section_type": c.section_type.value,
-                "title": c.title,
-                "content": c.content,
-                "token_count": c.token_count,
-                "checksum": c.checksum,
-                "metadata": c.metadata,
-            }
-            for cid, c in self._chunks.items()
-        }
-        atomic_write_json(save_path / "chunks.json", chunks_data, file_mode=0o600)
+        # Save chunks: content file first, then the index naming it
+        self._chunks.save(save_path, file_mode=0o600)
 
         logger.info("search_engine_saved", path=str(save_path))
 
@@ -780,25 +1001,11 @@ class HybridSearchEngine:
         if not load_path.exists():
             raise FileNotFoundError(f"Corpus directory not found: {load_path}")
 
-        # Load chunks
-        chunks_path = load_path / "chunks.json"
-        if chunks_path.exists():
-            with open(chunks_path) as f:
-                chunks_data = json.load(f)
-
-            self._chunks = {
-                cid: CorpusChunk(
-                    chunk_id=data["chunk_id"],
-                    paper_id=data["paper_id"],
-                    section_type=ChunkType(data["section_type"]),
-                    title=data["title"],
-                    content=data["content"],
-                    token_count=data["token_count"],
-                    checksum=data.get("checksum"),
-                    metadata=data.get("metadata", {}),
-                )
-                for cid, data in chunks_data.items()
-            }
+        # Load chunks: the index now, content on demand
+        if ChunkStore.exists(load_path):
+            self._chunks = ChunkStore.open(load_path)
+        elif (load_path / LEGACY_FILE_NAME).exists():
+            self._chunks = ChunkStore.from_legacy_json(load_path / LEGACY_FILE_NAME)
 
         # Load indices
         dense_path = load_path / "dense"
@@ -809,6 +1016,8 @@ class HybridSearchEngine:
         if bm25_path.exists():
             self._bm25_index.load(bm25_path)
 
+        self._corpus_changed()
+
         logger.info(
             "search_engine_loaded",
             path=str(load_path),
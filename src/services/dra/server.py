@@ -0,0 +1,288 @@
+"""Long-lived research server for the Deep Research Agent.
+
+Every ``arisp research`` run otherwise pays a fixed start-up cost before
+its first turn: loading the corpus, rebuilding BM25 from the saved
+tokens, reading the FAISS index and loading the embedding model on the
+first search. ``arisp research serve`` pays it once: the server keeps
+the loaded :class:`CorpusManager` (indexes and a warmed-up embedding
+model) and the LLM service in memory and answers research requests over
+an owner-only Unix domain socket. The CLI dispatches to it whenever it
+is running (see :mod:`src.cli.research_client`).
+
+The app is the health API (``/health``, ``/live``, ``/metrics``) plus:
+
+- ``GET /research/status``: corpus size, corpus version, reload count;
+- ``POST /research``: run a batch of questions; one NDJSON line per
+  session outcome as it finishes, then a ``tokens_used`` trailer;
+- ``POST /research/reload``: reload the corpus now.
+
+Hot reload: :meth:`ResearchServer.watch` polls for a saved corpus that
+changed on disk or, given a registry path, a registry that
+:meth:`CorpusManager.check_freshness` reports as updated. A replacement
+corpus manager is built in a worker thread (loaded, refreshed from the
+registry and saved, warmed up) and swapped in; sessions already running
+finish on the manager they started with.
+"""
+
+import asyncio
+import json
+import os
+import socket
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.health.server import create_health_app
+from src.models.dra import AgentLimits, CorpusConfig
+from src.services.dra.agent import ResearchSessionRunner
+from src.services.dra.chunk_store import INDEX_FILE_NAME
+from src.services.dra.corpus_manager import CorpusManager
+from src.services.dra.utils import set_secure_permissions
+from src.services.llm.service import LLMService
+
+logger = structlog.get_logger()
+
+# Files whose change on disk means the saved corpus was rewritten
+CORPUS_STATE_FILES = ("papers.json", "stats.json", INDEX_FILE_NAME)
+
+
+class ResearchRequest(BaseModel):
+    """A batch of questions submitted to the research server.
+
+    Attributes:
+        questions: Research questions
+        max_turns: Maximum turns per session
+        concurrency: Sessions running at once
+        llm_concurrency: LLM calls in flight across the batch
+        token_budget: Token budget for the batch (None = unbounded)
+    """
+
+    questions: list[str] = Field(..., min_length=1, description="Questions")
+    max_turns: int = Field(50, ge=1, description="Maximum turns per session")
+    concurrency: int = Field(4, ge=1, description="Concurrent sessions")
+    llm_concurrency: int = Field(4, ge=1, description="Concurrent LLM calls")
+    token_budget: Optional[int] = Field(None, ge=1, description="Token budget")
+
+
+class ResearchServer:
+    """Warm corpus and LLM service shared by every research request."""
+
+    def __init__(
+        self,
+        corpus_config: CorpusConfig,
+        llm_service: LLMService,
+        registry_path: Optional[Path] = None,
+    ):
+        """Load the corpus and warm up the search engine.
+
+        Args:
+            corpus_config: Corpus configuration (``corpus_dir`` is loaded)
+            llm_service: LLM service shared by all sessions
+            registry_path: Registry to refresh the corpus from (optional)
+        """
+        self.corpus_config = corpus_config
+        self.llm_service = llm_service
+        self.registry_path = registry_path
+        self.reloads = 0
+        self._reload_lock = asyncio.Lock()
+        self.corpus_manager, self._signature, self._registry_seen = self._load_corpus()
+
+    def _corpus_signature(self) -> tuple:
+        """(name, mtime, size) of the saved corpus state files."""
+        corpus_dir = Path(self.corpus_config.corpus_dir)
+        signature: list[tuple[str, Optional[int], Optional[int]]] = []
+        for name in CORPUS_STATE_FILES:
+            try:
+                stat = (corpus_dir / name).stat()
+            except FileNotFoundError:
+                signature.append((name, None, None))
+            else:
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load_corpus(self) -> tuple[CorpusManager, tuple, Optional[datetime]]:
+        """Build a ready corpus manager (blocking; run off the event loop).
+
+        Returns:
+            The manager, the corpus signature it was loaded at, and the
+            registry update time it was refreshed against
+        """
+        manager = CorpusManager(config=self.corpus_config)
+        manager.load()
+
+        registry_seen = None
+        if self.registry_path is not None:
+            freshness = manager.check_freshness(self.registry_path)
+            if not freshness.is_fresh and manager.ingest_from_registry(
+                self.registry_path
+            ):
+                manager.save()
+            registry_seen = freshness.registry_updated
+
+        manager.search_engine.warm_up()
+        return manager, self._corpus_signature(), registry_seen
+
+    def needs_reload(self) -> bool:
+        """Whether the saved corpus or the registry changed since the last load."""
+        if self._corpus_signature() != self._signature:
+            return True
+        if self.registry_path is None:
+            return False
+        freshness = self.corpus_manager.check_freshness(self.registry_path)
+        return not freshness.is_fresh and (
+            freshness.registry_updated != self._registry_seen
+        )
+
+    async def reload(self, force: bool = False) -> bool:
+        """Swap in a freshly loaded corpus manager if anything changed.
+
+        Args:
+            force: Reload even if no change was detected
+
+        Returns:
+            True if a new corpus manager was swapped in
+        """
+        async with self._reload_lock:
+            if not force and not await asyncio.to_thread(self.needs_reload):
+                return False
+            try:
+                loaded = await asyncio.to_thread(self._load_corpus)
+            except Exception as e:
+                # Keep serving the corpus we have
+                logger.error("research_server_reload_failed", error=str(e))
+                return False
+            self.corpus_manager, self._signature, self._registry_seen = loaded
+            self.reloads += 1
+            logger.info(
+                "research_server_reloaded",
+                papers=self.corpus_manager.paper_count,
+                chunks=self.corpus_manager.search_engine.corpus_size,
+            )
+            return True
+
+    async def watch(self, interval: float) -> None:
+        """Check for corpus or registry changes every ``interval`` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.reload()
+
+    def new_runner(self, request: ResearchRequest) -> ResearchSessionRunner:
+        """Session runner for one request over the current corpus."""
+        return ResearchSessionRunner(
+            corpus_manager=self.corpus_manager,
+            llm_service=self.llm_service,
+            limits=AgentLimits(max_turns=request.max_turns),
+            max_concurrent_sessions=request.concurrency,
+            max_concurrent_llm_calls=request.llm_concurrency,
+            max_total_tokens=request.token_budget,
+        )
+
+    def status(self) -> dict[str, Any]:
+        """Summary of the loaded corpus."""
+        engine = self.corpus_manager.search_engine
+        return {
+            "papers": self.corpus_manager.paper_count,
+            "chunks": engine.corpus_size,
+            "corpus_version": engine.version,
+            "search_ready": engine.is_ready,
+            "reloads": self.reloads,
+        }
+
+
+def create_research_app(server: ResearchServer) -> FastAPI:
+    """Create the research server app (health endpoints included).
+
+    Args:
+        server: Research server holding the warm corpus
+
+    Returns:
+        Configured FastAPI application
+    """
+    app = create_health_app(title="ARISP Research Server")
+
+    @app.get("/research/status", summary="Loaded corpus summary")
+    async def research_status() -> dict[str, Any]:
+        return server.status()
+
+    @app.post("/research", summary="Run research sessions")
+    async def research(request: ResearchRequest) -> StreamingResponse:
+        runner = server.new_runner(request)
+
+        async def _lines() -> AsyncIterator[str]:
+            async for outcome in runner.run(request.questions):
+                yield json.dumps({"outcome": outcome.model_dump(mode="json")}) + "\n"
+            yield json.dumps({"tokens_used": runner.gate.tokens_used}) + "\n"
+
+        return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+    @app.post("/research/reload", summary="Reload the corpus")
+    async def research_reload(force: bool = True) -> dict[str, Any]:
+        reloaded = await server.reload(force=force)
+        return {"reloaded": reloaded, **server.status()}
+
+    return app
+
+
+def bind_socket(path: Path) -> socket.socket:
+    """Bind an owner-only (0600) Unix domain socket at ``path``.
+
+    Args:
+        path: Socket path (must not exist)
+
+    Returns:
+        Bound socket, ready to be served
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)  # no window with a world-accessible socket
+    try:
+        sock.bind(str(path))
+    except OSError:
+        sock.close()
+        raise
+    finally:
+        os.umask(old_umask)
+    set_secure_permissions(path, 0o600)
+    return sock
+
+
+async def serve_research(  # pragma: no cover
+    server: ResearchServer,
+    socket_path: Path,
+    reload_interval: float = 30.0,
+    log_level: str = "warning",
+) -> None:
+    """Serve ``server`` on ``socket_path`` until interrupted.
+
+    Args:
+        server: Research server holding the warm corpus
+        socket_path: Unix domain socket to listen on
+        reload_interval: Seconds between change checks (0 disables)
+        log_level: Uvicorn logging level
+    """
+    import uvicorn
+
+    app = create_research_app(server)
+    sock = bind_socket(socket_path)
+    uvicorn_server = uvicorn.Server(
+        uvicorn.Config(app, log_level=log_level, access_log=False)
+    )
+    watcher = (
+        asyncio.create_task(server.watch(reload_interval))
+        if reload_interval > 0
+        else None
+    )
+
+    logger.info("research_server_starting", socket=str(socket_path))
+    try:
+        await uvicorn_server.serve(sockets=[sock])
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        sock.close()
+        socket_path.unlink(missing_ok=True)
+        logger.info("research_server_stopped", socket=str(socket_path))
@@ -5,10 +5,17 @@ This module provides:
 - Pattern analysis and insight extraction
 - Expert seed trajectory management (SR-8.3)
 - Contextual learning tips generation
+
+Trajectories are stored as one JSON file each; a
+:class:`~src.services.dra.trajectory_store.TrajectoryStore` index next
+to them answers quality filters, listings and pattern analysis without
+re-parsing every file.
 """
 
 import json
+import sqlite3
 import uuid
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Optional
@@ -22,8 +29,17 @@ from src.models.dra import (
     ToolCallType,
     TrajectoryInsights,
     TrajectoryRecord,
+    TrajectorySummary,
     Turn,
 )
+from src.services.dra.trajectory_store import (
+    PATTERN_KINDS,
+    PATTERN_SECTION,
+    PATTERN_SEQUENCE,
+    PATTERN_TERM,
+    TrajectoryStore,
+    extract_patterns,
+)
 from src.services.dra.utils import atomic_write_json
 
 logger = structlog.get_logger()
@@ -119,6 +135,7 @@ class TrajectoryCollector:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.store = TrajectoryStore(self.storage_dir)
 
         # Load expert seeds (SR-8.3)
         self.expert_seeds = expert_seeds or []
@@ -304,33 +321,24 @@ class TrajectoryCollector:
         Returns:
             List of quality trajectories
         """
-        # Load all saved trajectories
-        trajectories = self._load_all_trajectories()
+        # Select matching headers from the index; only their files are
+        # parsed.
+        self.store.sync()
+        trajectories = []
+        for file_path in self.store.file_paths(
+            min_turns, require_answer, min_quality_score
+        ):
+            record = self._load_trajectory_file(file_path)
+            if record is not None:
+                trajectories.append(record)
 
         # Add expert seeds (SR-8.3)
-        expert_records = [seed.to_trajectory_record() for seed in self.expert_seeds]
-        all_trajectories = trajectories + expert_records
-
-        # Apply filters
-        filtered = []
-        for traj in all_trajectories:
-            # Check minimum turns
-            if len(traj.turns) < min_turns:
-                continue
-
-            # Check answer requirement
-            if require_answer and not traj.answer:
-                continue
-
-            # Check quality score
-            if traj.quality_score < min_quality_score:
-                continue
-
-            filtered.append(traj)
+        seeds = self._expert_records(min_turns, require_answer, min_quality_score)
+        filtered = trajectories + seeds
 
         logger.info(
             "quality_filter_applied",
-            total=len(all_trajectories),
+            total=self.store.count() + len(self.expert_seeds),
             filtered=len(filtered),
             criteria={
                 "min_turns": min_turns,
@@ -341,80 +349,111 @@ class TrajectoryCollector:
 
         return filtered
 
+    def summaries(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> list[TrajectorySummary]:
+        """List recorded trajectory headers without loading their turns.
+
+        Args:
+            min_turns: Minimum turn count
+            require_answer: Whether answer is required
+            min_quality_score: Minimum quality score
+            limit: Maximum number of headers (newest first)
+
+        Returns:
+            Trajectory summaries, newest first
+        """
+        self.store.sync()
+        return self.store.summaries(
+            min_turns, require_answer, min_quality_score, limit=limit
+        )
+
+    def load_trajectory(self, trajectory_id: str) -> Optional[TrajectoryRecord]:
+        """Load one recorded trajectory, including its turns.
+
+        Args:
+            trajectory_id: Trajectory to load
+
+        Returns:
+            Trajectory record, or None if it is not recorded
+        """
+        file_path = self.store.file_path(trajectory_id)
+        if file_path is None:
+            self.store.sync()
+            file_path = self.store.file_path(trajectory_id)
+        return self._load_trajectory_file(file_path) if file_path else None
+
     def analyze_patterns(
         self,
         trajectories: Optional[list[TrajectoryRecord]] = None,
+        min_turns: int = 3,
+        require_answer: bool = True,
+        min_quality_score: float = 0.5,
     ) -> TrajectoryInsights:
         """Analyze trajectory patterns to extract insights.
 
+        Without ``trajectories`` the recorded ones matching the quality
+        criteria are analysed from the pattern counts kept in the
+        index, so no trajectory file is read.
+
         Args:
-            trajectories: Trajectories to analyze (loads all if None)
+            trajectories: Trajectories to analyze (recorded ones if None)
+            min_turns: Minimum turn count (recorded trajectories only)
+            require_answer: Whether answer is required (recorded only)
+            min_quality_score: Minimum quality score (recorded only)
 
         Returns:
             Extracted insights
         """
         if trajectories is None:
-            trajectories = self.filter_quality()
-
-        if not trajectories:
+            self.store.sync()
+            in_memory = self._expert_records(
+                min_turns, require_answer, min_quality_score
+            )
+            count = self.store.count(min_turns, require_answer, min_quality_score)
+            count += len(in_memory)
+            counts = self.store.pattern_counts(
+                min_turns, require_answer, min_quality_score
+            )
+            answered, answered_turns = self.store.answered_turn_stats(
+                min_turns, require_answer, min_quality_score
+            )
+        else:
+            in_memory = trajectories
+            count = len(trajectories)
+            counts = {kind: Counter() for kind in PATTERN_KINDS}
+            answered = answered_turns = 0
+
+        for traj in in_memory:
+            for kind, kind_counts in extract_patterns(traj.turns).items():
+                counts[kind].update(kind_counts)
+            if traj.answer:
+                answered += 1
+                answered_turns += len(traj.turns)
+
+        if not count:
             logger.warning("no_trajectories_for_analysis")
             return TrajectoryInsights()
 
-        logger.info("analyzing_trajectory_patterns", count=len(trajectories))
-
-        # Extract query patterns
-        query_patterns: dict[str, int] = {}
-        for traj in trajectories:
-            for turn in traj.turns:
-                if turn.action.tool == ToolCallType.SEARCH:
-                    query = turn.action.arguments.get("query", "")
-                    # Extract key terms
-                    terms = query.lower().split()
-                    for term in terms:
-                        if len(term) > 3:  # Ignore short words
-                            query_patterns[term] = query_patterns.get(term, 0) + 1
-
-        # Get top query patterns
-        effective_patterns = sorted(
-            query_patterns.items(), key=lambda x: x[1], reverse=True
-        )[:10]
-        effective_query_patterns = [term for term, _ in effective_patterns]
-
-        # Extract successful sequences (most common 3-action sequences)
-        sequence_counts: dict[str, int] = {}
-        for traj in trajectories:
-            actions = [t.action.tool.value for t in traj.turns]
-            for i in range(len(actions) - 2):
-                seq = " -> ".join(actions[i : i + 3])
-                sequence_counts[seq] = sequence_counts.get(seq, 0) + 1
-
-        successful_sequences = sorted(
-            sequence_counts.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-        successful_seqs = [seq for seq, _ in successful_sequences]
+        logger.info("analyzing_trajectory_patterns", count=count)
 
-        # Compute average turns to success
-        successful_trajs = [t for t in trajectories if t.answer]
-        avg_turns = (
-            sum(len(t.turns) for t in successful_trajs) / len(successful_trajs)
-            if successful_trajs
-            else 0.0
-        )
+        # Top query terms and most common 3-action sequences
+        effective_query_patterns = _most_common(counts[PATTERN_TERM], 10)
+        successful_seqs = _most_common(counts[PATTERN_SEQUENCE], 5)
 
-        # Extract paper consultation patterns
-        section_counts: dict[str, int] = {}
-        for traj in trajectories:
-            for turn in traj.turns:
-                if turn.action.tool == ToolCallType.OPEN:
-                    section = turn.action.arguments.get("section", "full_paper")
-                    section_counts[section] = section_counts.get(section, 0) + 1
+        # Compute average turns to success
+        avg_turns = answered_turns / answered if answered else 0.0
 
         insights = TrajectoryInsights(
             effective_query_patterns=effective_query_patterns,
             successful_sequences=successful_seqs,
             failure_modes={},  # TODO: Implement failure mode detection
             average_turns_to_success=round(avg_turns, 2),
-            paper_consultation_patterns=section_counts,
+            paper_consultation_patterns=dict(counts[PATTERN_SECTION]),
         )
 
         logger.info(
@@ -513,8 +552,48 @@ class TrajectoryCollector:
         # SR-8.1: Use atomic write for crash durability
         atomic_write_json(file_path, data, file_mode=0o600)
 
+        # The JSON file is the durable record: if indexing fails here the
+        # next sync picks the file up.
+        try:
+            self.store.add(record, file_path)
+        except sqlite3.Error as e:
+            logger.warning(
+                "trajectory_index_failed",
+                trajectory_id=record.trajectory_id,
+                error=str(e),
+            )
+
         logger.debug("trajectory_saved", file=str(file_path))
 
+    def _expert_records(
+        self,
+        min_turns: int,
+        require_answer: bool,
+        min_quality_score: float,
+    ) -> list[TrajectoryRecord]:
+        """Expert seed trajectories (SR-8.3) passing the quality criteria."""
+        records = [seed.to_trajectory_record() for seed in self.expert_seeds]
+        return [
+            r
+            for r in records
+            if len(r.turns) >= min_turns
+            and (r.answer or not require_answer)
+            and r.quality_score >= min_quality_score
+        ]
+
+    def _load_trajectory_file(self, file_path: Path) -> Optional[TrajectoryRecord]:
+        """Load one saved trajectory, or None if it can't be read."""
+        try:
+            with open(file_path) as f:
+                return TrajectoryRecord.model_validate(json.load(f))
+        except Exception as e:
+            logger.warning(
+                "trajectory_load_failed",
+                file=str(file_path),
+                error=str(e),
+            )
+            return None
+
     def _load_all_trajectories(self) -> list[TrajectoryRecord]:
         """Load all saved trajectories from disk.
 
@@ -524,27 +603,21 @@ class TrajectoryCollector:
         trajectories: list[TrajectoryRecord] = []
 
         for file_path in self.storage_dir.glob("*.json"):
-            try:
-                with open(file_path) as f:
-                    data = json.load(f)
-
-                # Reconstruct TrajectoryRecord
-                # (Simplified - in production, use proper deserialization)
-                record = TrajectoryRecord.model_validate(data)
+            record = self._load_trajectory_file(file_path)
+            if record is not None:
                 trajectories.append(record)
 
-            except Exception as e:
-                logger.warning(
-                    "trajectory_load_failed",
-                    file=str(file_path),
-                    error=str(e),
-                )
-
         logger.debug("trajectories_loaded", count=len(trajectories))
 
         return trajectories
 
 
+def _most_common(counts: Counter[str], n: int) -> list[str]:
+    """Top ``n`` keys by count; ties broken alphabetically."""
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [key for key, _ in ranked[:n]]
+
+
 # SR-8.3: Predefined expert seed trajectories
 DEFAULT_EXPERT_SEEDS = [
     {
@@ -0,0 +1,384 @@
+"""SQLite index over recorded DRA trajectories.
+
+``TrajectoryCollector`` keeps one JSON file per trajectory; those files
+stay the durable record. ``TrajectoryStore`` maintains a small SQLite
+database next to them (``trajectory_index.db``) holding:
+
+- a **header row** per trajectory (quality score, answer status, turn
+  count, creation date, ...) with indexes on the columns the quality
+  filter and listings select and sort on, so filtering never parses a
+  trajectory file and turns are only loaded for the rows that match;
+- **pattern counts** per trajectory (query terms, action 3-grams,
+  opened sections), written once when the trajectory is recorded, so
+  pattern analysis is a ``SUM ... GROUP BY`` instead of a re-count over
+  every turn of every session.
+
+Files written by another process, or before the index existed, are
+picked up by :meth:`TrajectoryStore.sync`, which compares the directory
+listing against the indexed file names and modification times and only
+parses what changed. Rows whose file disappeared (``trajectories
+clear``) are dropped by the same pass.
+"""
+
+import json
+import os
+import sqlite3
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import structlog
+
+from src.models.dra import ToolCallType, TrajectoryRecord, TrajectorySummary, Turn
+
+logger = structlog.get_logger()
+
+INDEX_FILE_NAME = "trajectory_index.db"
+
+PATTERN_TERM = "term"
+PATTERN_SEQUENCE = "sequence"
+PATTERN_SECTION = "section"
+PATTERN_KINDS = (PATTERN_TERM, PATTERN_SEQUENCE, PATTERN_SECTION)
+
+_DB_TIMEOUT_SECONDS = 30.0
+_ANSWER_PREVIEW_CHARS = 100
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS trajectories (
+        trajectory_id TEXT PRIMARY KEY,
+        file_name TEXT NOT NULL UNIQUE,
+        file_mtime_ns INTEGER NOT NULL,
+        question TEXT NOT NULL,
+        has_answer INTEGER NOT NULL,
+        answer_preview TEXT,
+        quality_score REAL NOT NULL,
+        turn_count INTEGER NOT NULL,
+        papers_opened INTEGER NOT NULL,
+        unique_searches INTEGER NOT NULL,
+        find_operations INTEGER NOT NULL,
+        context_length_tokens INTEGER NOT NULL,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_trajectories_quality
+        ON trajectories(quality_score);
+    CREATE INDEX IF NOT EXISTS idx_trajectories_created
+        ON trajectories(created_at);
+    CREATE INDEX IF NOT EXISTS idx_trajectories_answer
+        ON trajectories(has_answer);
+    CREATE TABLE IF NOT EXISTS trajectory_patterns (
+        trajectory_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        pattern TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (trajectory_id, kind, pattern)
+    );
+"""
+
+_SUMMARY_COLUMNS = (
+    "trajectory_id, question, has_answer, answer_preview, quality_score, "
+    "turn_count, papers_opened, unique_searches, find_operations, "
+    "context_length_tokens, created_at"
+)
+
+
+def extract_patterns(turns: Iterable[Turn]) -> dict[str, Counter[str]]:
+    """Count the analysable patterns of one trajectory.
+
+    Args:
+        turns: Turns of the trajectory
+
+    Returns:
+        Counts keyed by pattern kind: search query terms longer than
+        three characters, 3-action sequences (``"search -> open ->
+        find"``) and opened sections (``"full_paper"`` when none given).
+    """
+    counts: dict[str, Counter[str]] = {kind: Counter() for kind in PATTERN_KINDS}
+    actions: list[str] = []
+    for turn in turns:
+        actions.append(turn.action.tool.value)
+        if turn.action.tool == ToolCallType.SEARCH:
+            query = turn.action.arguments.get("query") or ""
+            counts[PATTERN_TERM].update(
+                term for term in str(query).lower().split() if len(term) > 3
+            )
+        elif turn.action.tool == ToolCallType.OPEN:
+            section = turn.action.arguments.get("section") or "full_paper"
+            counts[PATTERN_SECTION][str(section)] += 1
+    counts[PATTERN_SEQUENCE].update(
+        " -> ".join(actions[i : i + 3]) for i in range(len(actions) - 2)
+    )
+    return counts
+
+
+def _utc_iso(value: datetime) -> str:
+    """Render a timestamp as a UTC ISO string that sorts chronologically."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+class TrajectoryStore:
+    """Header and pattern index for a trajectory storage directory."""
+
+    def __init__(self, storage_dir: Path):
+        """Open (creating if needed) the index of ``storage_dir``.
+
+        Args:
+            storage_dir: Directory holding the trajectory JSON files
+        """
+        self.storage_dir = Path(storage_dir)
+        self.db_path = self.storage_dir / INDEX_FILE_NAME
+        # Files that failed to parse, by modification time, so an
+        # unreadable file is reported once rather than on every sync.
+        self._unreadable: dict[str, int] = {}
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA_SQL)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=_DB_TIMEOUT_SECONDS)
+
+    def add(self, record: TrajectoryRecord, file_path: Path) -> None:
+        """Index a trajectory that was just written to ``file_path``.
+
+        Args:
+            record: The trajectory record
+            file_path: JSON file the record was saved to
+        """
+        mtime_ns = file_path.stat().st_mtime_ns
+        conn = self._connect()
+        try:
+            with conn:
+                self._upsert(conn, record, file_path.name, mtime_ns)
+        finally:
+            conn.close()
+
+    def sync(self) -> None:
+        """Bring the index in line with the JSON files on disk.
+
+        Only files that are new or were modified since they were
+        indexed are parsed; rows of deleted files are removed.
+        """
+        on_disk: dict[str, int] = {}
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+                on_disk[entry.name] = entry.stat().st_mtime_ns
+
+        conn = self._connect()
+        try:
+            indexed = dict(
+                conn.execute("SELECT file_name, file_mtime_ns FROM trajectories")
+            )
+            removed = [name for name in indexed if name not in on_disk]
+            changed = [
+                name
+                for name, mtime_ns in on_disk.items()
+                if indexed.get(name) != mtime_ns
+                and self._unreadable.get(name) != mtime_ns
+            ]
+            if not removed and not changed:
+                return
+
+            with conn:
+                for name in removed:
+                    self._delete(conn, "file_name", name)
+                for name in changed:
+                    record = self._read(name, on_disk[name])
+                    if record is None:
+                        self._delete(conn, "file_name", name)
+                    else:
+                        self._upsert(conn, record, name, on_disk[name])
+            logger.debug(
+                "trajectory_index_synced",
+                indexed=len(changed),
+                removed=len(removed),
+            )
+        finally:
+            conn.close()
+
+    def _read(self, file_name: str, mtime_ns: int) -> Optional[TrajectoryRecord]:
+        file_path = self.storage_dir / file_name
+        try:
+            with open(file_path) as f:
+                return TrajectoryRecord.model_validate(json.load(f))
+        except Exception as e:
+            self._unreadable[file_name] = mtime_ns
+            logger.warning(
+                "trajectory_load_failed",
+                file=str(file_path),
+                error=str(e),
+            )
+            return None
+
+    def _upsert(
+        self,
+        conn: sqlite3.Connection,
+        record: TrajectoryRecord,
+        file_name: str,
+        mtime_ns: int,
+    ) -> None:
+        self._delete(conn, "trajectory_id", record.trajectory_id)
+        self._delete(conn, "file_name", file_name)
+        answer_preview = None
+        if record.answer:
+            answer_preview = record.answer[:_ANSWER_PREVIEW_CHARS]
+            if len(record.answer) > _ANSWER_PREVIEW_CHARS:
+                answer_preview += "..."
+        conn.execute(
+            "INSERT INTO trajectories (file_name, file_mtime_ns, "
+            f"{_SUMMARY_COLUMNS}) VALUES ({', '.join('?' * 13)})",
+            (
+                file_name,
+                mtime_ns,
+                record.trajectory_id,
+                record.question,
+                int(bool(record.answer)),
+                answer_preview,
+                record.quality_score,
+                len(record.turns),
+                record.papers_opened,
+                record.unique_searches,
+                record.find_operations,
+                record.context_length_tokens,
+                _utc_iso(record.created_at),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO trajectory_patterns (trajectory_id, kind, pattern, count) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (record.trajectory_id, kind, pattern, count)
+                for kind, counts in extract_patterns(record.turns).items()
+                for pattern, count in counts.items()
+            ),
+        )
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, column: str, value: str) -> None:
+        conn.execute(
+            "DELETE FROM trajectory_patterns WHERE trajectory_id IN "
+            f"(SELECT trajectory_id FROM trajectories WHERE {column} = ?)",
+            (value,),
+        )
+        conn.execute(f"DELETE FROM trajectories WHERE {column} = ?", (value,))
+
+    @staticmethod
+    def _where(
+        min_turns: int, require_answer: bool, min_quality_score: float
+    ) -> tuple[str, tuple]:
+        clause = "turn_count >= ? AND quality_score >= ?"
+        if require_answer:
+            clause += " AND has_answer = 1"
+        return clause, (min_turns, min_quality_score)
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def count(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+    ) -> int:
+        """Count indexed trajectories matching the quality criteria."""
+        where, params = self._where(min_turns, require_answer, min_quality_score)
+        sql = f"SELECT COUNT(*) FROM trajectories WHERE {where}"
+        return self._query(sql, params)[0][0]
+
+    def summaries(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> list[TrajectorySummary]:
+        """Headers of matching trajectories, newest first.
+
+        Args:
+            min_turns: Minimum turn count
+            require_answer: Whether answer is required
+            min_quality_score: Minimum quality score
+            limit: Maximum number of headers to return (all if None)
+
+        Returns:
+            Trajectory summaries (no turns loaded)
+        """
+        where, params = self._where(min_turns, require_answer, min_quality_score)
+        sql = (
+            f"SELECT {_SUMMARY_COLUMNS} FROM trajectories WHERE {where} "
+            "ORDER BY created_at DESC, trajectory_id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        names = _SUMMARY_COLUMNS.split(", ")
+        return [
+            TrajectorySummary.model_validate(dict(zip(names, row)))
+            for row in self._query(sql, params)
+        ]
+
+    def file_paths(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+    ) -> list[Path]:
+        """JSON files of matching trajectories, newest first."""
+        where, params = self._where(min_turns, require_answer, min_quality_score)
+        sql = (
+            f"SELECT file_name FROM trajectories WHERE {where} "
+            "ORDER BY created_at DESC, trajectory_id"
+        )
+        return [self.storage_dir / name for (name,) in self._query(sql, params)]
+
+    def file_path(self, trajectory_id: str) -> Optional[Path]:
+        """JSON file of one trajectory, or None if it is not indexed."""
+        sql = "SELECT file_name FROM trajectories WHERE trajectory_id = ?"
+        rows = self._query(sql, (trajectory_id,))
+        return self.storage_dir / rows[0][0] if rows else None
+
+    def pattern_counts(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+    ) -> dict[str, Counter[str]]:
+        """Pattern counts summed over the matching trajectories.
+
+        Returns:
+            Counts keyed by pattern kind, as :func:`extract_patterns`
+        """
+        where, params = self._where(min_turns, require_answer, min_quality_score)
+        sql = (
+            "SELECT p.kind, p.pattern, SUM(p.count) FROM trajectory_patterns p "
+            "JOIN trajectories USING (trajectory_id) "
+            f"WHERE {where} GROUP BY p.kind, p.pattern"
+        )
+        counts: dict[str, Counter[str]] = {kind: Counter() for kind in PATTERN_KINDS}
+        for kind, pattern, total in self._query(sql, params):
+            counts.setdefault(kind, Counter())[pattern] = total
+        return counts
+
+    def answered_turn_stats(
+        self,
+        min_turns: int = 0,
+        require_answer: bool = False,
+        min_quality_score: float = 0.0,
+    ) -> tuple[int, int]:
+        """Number of answered matching trajectories and their total turns."""
+        where, params = self._where(min_turns, require_answer, min_quality_score)
+        sql = (
+            "SELECT COUNT(*), COALESCE(SUM(turn_count), 0) FROM trajectories "
+            f"WHERE {where} AND has_answer = 1"
+        )
+        answered, turns = self._query(sql, params)[0]
+        return answered, turns
@@ -2,19 +2,34 @@
 
 This module provides:
 - Section parsing from markdown
-- Chunk building with overlap
-- Token counting
+- Chunk building with overlap, streamed line by line
+- Token counting (whole-text and running)
 - Text normalization for BM25
+- Thread-safe LRU caching for the search/browse path
+- Sentence-level inverted index for citation evidence lookup
 - Atomic file operations (SR-8.1)
 """
 
+import bisect
 import hashlib
+import itertools
 import json
 import os
 import re
 import tempfile
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import (
+    Any,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 import structlog
 
@@ -112,6 +127,59 @@ class TokenCounter:
         word_count = len(text.split())
         return max(int(char_estimate), word_count)
 
+    def running(self) -> "RunningTokenCount":
+        """Start a token count that is fed one line at a time.
+
+        Returns:
+            Running count whose ``tokens`` always equals
+            ``count("\\n".join(lines).strip())`` for the lines added so far
+        """
+        return RunningTokenCount(self.chars_per_token)
+
+
+class RunningTokenCount:
+    """Incremental :meth:`TokenCounter.count` over a growing list of lines.
+
+    Tracks the length the joined, stripped text would have and its word
+    count, so the token count of a section is known while it streams in
+    without ever joining it.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0):
+        """Initialize an empty count.
+
+        Args:
+            chars_per_token: Average characters per token
+        """
+        self.chars_per_token = chars_per_token
+        self._lines = 0
+        self._length = 0  # first through last non-whitespace character
+        self._trailing = 0  # whitespace after the last non-whitespace char
+        self._words = 0
+
+    def add_line(self, line: str) -> None:
+        """Account for one more line (without its newline)."""
+        separator = 1 if self._lines else 0
+        self._lines += 1
+        self._words += len(line.split())
+        body = line.rstrip()
+        if not body:
+            if self._length:
+                self._trailing += separator + len(line)
+            return
+        if self._length:
+            self._length += self._trailing + separator + len(body)
+        else:
+            self._length = len(body.lstrip())
+        self._trailing = len(line) - len(body)
+
+    @property
+    def tokens(self) -> int:
+        """Token count of the lines added so far."""
+        if not self._length:
+            return 0
+        return max(int(self._length / self.chars_per_token), self._words)
+
 
 class TextNormalizer:
     """Normalize text for BM25 indexing."""
@@ -194,9 +262,9 @@ class SectionParser:
         current_content: list[str] = []
 
         for line in lines:
-            header_match = self._header_pattern.match(line)
+            header = self.match_header(line)
 
-            if header_match:
+            if header:
                 # Save previous section if it has content
                 if current_content:
                     content = "\n".join(current_content).strip()
@@ -204,9 +272,7 @@ class SectionParser:
                         sections.append((current_type, current_header, content))
 
                 # Determine section type from header
-                header_text = header_match.group(2).strip()
-                current_header = header_text
-                current_type = self._classify_header(header_text)
+                current_type, current_header = header
                 current_content = []
             else:
                 current_content.append(line)
@@ -219,6 +285,21 @@ class SectionParser:
 
         return sections
 
+    def match_header(self, line: str) -> Optional[tuple[ChunkType, str]]:
+        """Recognise a markdown header line.
+
+        Args:
+            line: A single line (without its newline)
+
+        Returns:
+            (section_type, header_text) if the line is a header, else None
+        """
+        header_match = self._header_pattern.match(line)
+        if not header_match:
+            return None
+        header_text = header_match.group(2).strip()
+        return self._classify_header(header_text), header_text
+
     def _classify_header(self, header: str) -> ChunkType:
         """Classify a header into a section type.
 
@@ -276,19 +357,15 @@ class ChunkBuilder:
             List of CorpusChunk objects
         """
         chunks: list[CorpusChunk] = []
-        chunk_index = 0
-
-        for section_type, header, content in sections:
-            section_chunks = self._chunk_section(
-                paper_id=paper_id,
-                title=title,
-                section_type=section_type,
-                content=content,
-                start_index=chunk_index,
-                metadata=metadata or {},
+        indices = itertools.count()
+
+        for section_type, _header, content in sections:
+            section = _SectionChunker(
+                self, paper_id, title, section_type, metadata or {}, indices
             )
-            chunks.extend(section_chunks)
-            chunk_index += len(section_chunks)
+            for line in content.split("\n"):
+                chunks.extend(section.add_line(line))
+            chunks.extend(section.finish())
 
         logger.debug(
             "chunks_built",
@@ -299,53 +376,52 @@ class ChunkBuilder:
 
         return chunks
 
-    def _chunk_section(
+    def iter_chunks(
         self,
         paper_id: str,
         title: str,
-        section_type: ChunkType,
-        content: str,
-        start_index: int,
-        metadata: dict,
-    ) -> list[CorpusChunk]:
-        """Chunk a single section, splitting if needed.
+        lines: Iterable[str],
+        metadata: Optional[dict] = None,
+        section_parser: Optional[SectionParser] = None,
+    ) -> Iterator[CorpusChunk]:
+        """Parse and chunk markdown streamed line by line.
+
+        Produces the same chunks as ``build_chunks(...,
+        SectionParser().parse(markdown))`` but only holds the section
+        currently being chunked: small sections until they are known to
+        fit, and at most one chunk's worth of paragraphs after that. Pass
+        an open text file to chunk a document without reading it whole.
 
         Args:
-            paper_id: Paper ID
+            paper_id: Registry paper ID
             title: Paper title
-            section_type: Section type
-            content: Section content
-            start_index: Starting chunk index
-            metadata: Metadata dict
+            lines: Markdown lines (trailing newlines are ignored)
+            metadata: Additional metadata for chunks
+            section_parser: Parser used to recognise section headers
 
-        Returns:
-            List of chunks for this section
+        Yields:
+            CorpusChunk objects, in document order
         """
-        token_count = self.token_counter.count(content)
-
-        # If section fits in one chunk, return it directly
-        if token_count <= self.max_tokens:
-            chunk = self._create_chunk(
-                paper_id=paper_id,
-                title=title,
-                section_type=section_type,
-                content=content,
-                token_count=token_count,
-                index=start_index,
-                metadata=metadata,
-            )
-            return [chunk]
-
-        # Split at paragraph boundaries
-        return self._split_at_paragraphs(
-            paper_id=paper_id,
-            title=title,
-            section_type=section_type,
-            content=content,
-            start_index=start_index,
-            metadata=metadata,
+        parser = section_parser or SectionParser()
+        metadata = metadata or {}
+        indices = itertools.count()
+        section = _SectionChunker(
+            self, paper_id, title, ChunkType.OTHER, metadata, indices
         )
 
+        for line in lines:
+            line = line.rstrip("\n")
+            header = parser.match_header(line)
+            if header:
+                yield from section.finish()
+                section = _SectionChunker(
+                    self, paper_id, title, header[0], metadata, indices
+                )
+            else:
+                yield from section.add_line(line)
+
+        yield from section.finish()
+
     def _split_at_paragraphs(
         self,
         paper_id: str,
@@ -368,90 +444,16 @@ class ChunkBuilder:
         Returns:
             List of chunks
         """
-        # Split by double newlines (paragraphs)
-        paragraphs = re.split(r"\n\n+", content)
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
-
-        if not paragraphs:
-            return []
-
+        section = _SectionChunker(
+            self, paper_id, title, section_type, metadata, itertools.count(start_index)
+        )
+        section.start_splitting()
         chunks: list[CorpusChunk] = []
-        current_paragraphs: list[str] = []
-        current_tokens = 0
-        overlap_buffer: list[str] = []
-        chunk_index = start_index
-
-        for para in paragraphs:
-            para_tokens = self.token_counter.count(para)
-
-            # Check if adding this paragraph exceeds limit
-            if current_tokens + para_tokens > self.max_tokens and current_paragraphs:
-                # Create chunk from current paragraphs
-                chunk_content = "\n\n".join(current_paragraphs)
-                chunk = self._create_chunk(
-                    paper_id=paper_id,
-                    title=title,
-                    section_type=section_type,
-                    content=chunk_content,
-                    token_count=current_tokens,
-                    index=chunk_index,
-                    metadata=metadata,
-                )
-                chunks.append(chunk)
-                chunk_index += 1
-
-                # Build overlap buffer from end of current chunk
-                overlap_buffer = self._build_overlap_buffer(
-                    current_paragraphs, self.overlap_tokens
-                )
-                current_paragraphs = overlap_buffer.copy()
-                current_tokens = sum(
-                    self.token_counter.count(p) for p in current_paragraphs
-                )
-
-            current_paragraphs.append(para)
-            current_tokens += para_tokens
-
-        # Don't forget the last chunk
-        if current_paragraphs:
-            chunk_content = "\n\n".join(current_paragraphs)
-            chunk = self._create_chunk(
-                paper_id=paper_id,
-                title=title,
-                section_type=section_type,
-                content=chunk_content,
-                token_count=self.token_counter.count(chunk_content),
-                index=chunk_index,
-                metadata=metadata,
-            )
-            chunks.append(chunk)
-
+        for line in content.split("\n"):
+            chunks.extend(section.add_line(line))
+        chunks.extend(section.finish())
         return chunks
 
-    def _build_overlap_buffer(
-        self, paragraphs: list[str], target_tokens: int
-    ) -> list[str]:
-        """Build overlap buffer from end of paragraph list.
-
-        Args:
-            paragraphs: List of paragraphs
-            target_tokens: Target token count for overlap
-
-        Returns:
-            List of paragraphs for overlap
-        """
-        buffer: list[str] = []
-        token_count = 0
-
-        for para in reversed(paragraphs):
-            para_tokens = self.token_counter.count(para)
-            if token_count + para_tokens > target_tokens and buffer:
-                break
-            buffer.insert(0, para)
-            token_count += para_tokens
-
-        return buffer
-
     def _create_chunk(
         self,
         paper_id: str,
@@ -491,6 +493,256 @@ class ChunkBuilder:
         )
 
 
+class _SectionChunker:
+    """Chunking state for one section while its lines stream in.
+
+    Lines are buffered, with a running token count, until the section
+    exceeds ``max_tokens``. A section that never does becomes a single
+    chunk. Otherwise it is split at paragraph boundaries (blank lines):
+    paragraphs are packed greedily into chunks of at most ``max_tokens``,
+    each new chunk starting with the trailing paragraphs (up to
+    ``overlap_tokens``) of the previous one.
+    """
+
+    def __init__(
+        self,
+        builder: "ChunkBuilder",
+        paper_id: str,
+        title: str,
+        section_type: ChunkType,
+        metadata: dict,
+        indices: Iterator[int],
+    ):
+        self._builder = builder
+        self._paper_id = paper_id
+        self._title = title
+        self._section_type = section_type
+        self._metadata = metadata
+        self._indices = indices
+        self._lines: list[str] = []
+        self._tokens = builder.token_counter.running()
+        self._splitting = False
+        self._paragraph: list[str] = []
+        self._packed: list[tuple[str, int]] = []  # (paragraph, tokens)
+        self._packed_tokens = 0
+
+    def add_line(self, line: str) -> Iterator[CorpusChunk]:
+        """Add a line of the section, yielding any chunk it completes."""
+        if self._splitting:
+            return self._add_paragraph_line(line)
+        self._lines.append(line)
+        self._tokens.add_line(line)
+        if self._tokens.tokens <= self._builder.max_tokens:
+            return iter(())
+        return self._start_splitting_buffered()
+
+    def start_splitting(self) -> None:
+        """Split at paragraphs even if the section would fit one chunk."""
+        self._splitting = True
+
+    def finish(self) -> Iterator[CorpusChunk]:
+        """Yield the remaining chunk(s) of the section."""
+        if not self._splitting:
+            content = "\n".join(self._lines).strip()
+            self._lines = []
+            if content:
+                yield self._chunk(content, self._tokens.tokens)
+            return
+        yield from self._end_paragraph()
+        if self._packed:
+            content = "\n\n".join(p for p, _ in self._packed)
+            self._packed = []
+            yield self._chunk(content, self._builder.token_counter.count(content))
+
+    def _start_splitting_buffered(self) -> Iterator[CorpusChunk]:
+        self._splitting = True
+        lines, self._lines = self._lines, []
+        for line in lines:
+            yield from self._add_paragraph_line(line)
+
+    def _add_paragraph_line(self, line: str) -> Iterator[CorpusChunk]:
+        if line:
+            self._paragraph.append(line)
+            return iter(())
+        return self._end_paragraph()
+
+    def _end_paragraph(self) -> Iterator[CorpusChunk]:
+        paragraph = "\n".join(self._paragraph).strip()
+        self._paragraph = []
+        if not paragraph:
+            return
+        tokens = self._builder.token_counter.count(paragraph)
+
+        # Emit the packed paragraphs if this one doesn't fit with them
+        if self._packed_tokens + tokens > self._builder.max_tokens and self._packed:
+            content = "\n\n".join(p for p, _ in self._packed)
+            yield self._chunk(content, self._packed_tokens)
+
+            # Carry the trailing paragraphs over as overlap
+            overlap_tokens = 0
+            start = len(self._packed)
+            while start > 0:
+                para_tokens = self._packed[start - 1][1]
+                if overlap_tokens + para_tokens > self._builder.overlap_tokens and (
+                    start < len(self._packed)
+                ):
+                    break
+                overlap_tokens += para_tokens
+                start -= 1
+            self._packed = self._packed[start:]
+            self._packed_tokens = overlap_tokens
+
+        self._packed.append((paragraph, tokens))
+        self._packed_tokens += tokens
+
+    def _chunk(self, content: str, token_count: int) -> CorpusChunk:
+        return self._builder._create_chunk(
+            paper_id=self._paper_id,
+            title=self._title,
+            section_type=self._section_type,
+            content=content,
+            token_count=token_count,
+            index=next(self._indices),
+            metadata=self._metadata,
+        )
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded, thread-safe LRU map.
+
+    Research sessions run browser tools in worker threads against one
+    shared search engine, so every operation takes a lock.
+    ``max_entries=0`` disables the cache (every ``get`` misses).
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum entries kept before evicting the oldest
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value (marking it recently used) or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entries."""
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class SentenceIndex:
+    """Inverted index from words to the sentences of one document.
+
+    Scores every sentence of a document against a set of key terms in
+    a single pass over the terms' postings, instead of testing each
+    term against each sentence. A term matches a sentence when it is a
+    substring of one of the sentence's words -- the same result as
+    ``term in sentence`` for word-character terms. Substring lookups go
+    through a sorted array of every word's suffixes: the words
+    containing a term are those with a suffix starting with it, which
+    form one contiguous run found by binary search.
+    """
+
+    def __init__(self, sentences_lower: Sequence[str]):
+        """Build the index.
+
+        Args:
+            sentences_lower: Lower-cased sentences of the document
+        """
+        postings: dict[str, list[int]] = {}
+        for sentence_id, sentence in enumerate(sentences_lower):
+            for word in set(_WORD_PATTERN.findall(sentence)):
+                postings.setdefault(word, []).append(sentence_id)
+        self._postings = list(postings.values())
+        suffixes = sorted(
+            (word[start:], word_id)
+            for word_id, word in enumerate(postings)
+            for start in range(len(word))
+        )
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_words = [word_id for _, word_id in suffixes]
+        self._term_sentences: dict[str, frozenset[int]] = {}
+
+    def sentences_containing(self, term: str) -> frozenset[int]:
+        """Ids of sentences with a word containing ``term`` (lower-case)."""
+        cached = self._term_sentences.get(term)
+        if cached is not None:
+            return cached
+        word_ids: set[int] = set()
+        suffixes = self._suffixes
+        position = bisect.bisect_left(suffixes, term)
+        while position < len(suffixes) and suffixes[position].startswith(term):
+            word_ids.add(self._suffix_words[position])
+            position += 1
+        ids: set[int] = set()
+        for word_id in word_ids:
+            ids.update(self._postings[word_id])
+        result = frozenset(ids)
+        self._term_sentences[term] = result
+        return result
+
+    def match(self, key_terms: Sequence[str]) -> tuple[int, int, Optional[int]]:
+        """Score sentences by how many key terms they contain.
+
+        Args:
+            key_terms: Lower-cased terms (repeats count repeatedly)
+
+        Returns:
+            ``(terms_found, best_score, best_sentence_id)``: terms found
+            anywhere in the document, the key terms found in the best
+            sentence, and that sentence (the earliest on ties; None if
+            no sentence contains any term)
+        """
+        terms_found = 0
+        scores: Counter[int] = Counter()
+        for term, count in Counter(key_terms).items():
+            sentence_ids = self.sentences_containing(term)
+            if sentence_ids:
+                terms_found += count
+                for sentence_id in sentence_ids:
+                    scores[sentence_id] += count
+        if not scores:
+            return terms_found, 0, None
+        best_id = min(scores, key=lambda sid: (-scores[sid], sid))
+        return terms_found, scores[best_id], best_id
+
+
 def compute_checksum(content: str) -> str:
     """Compute SHA-256 checksum for content.
 
@@ -503,6 +755,29 @@ def compute_checksum(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
+def scan_text_file(path: Path, block_chars: int = 1 << 16) -> tuple[str, bool]:
+    """Checksum a UTF-8 text file without reading it into memory at once.
+
+    Reads with universal newlines, like ``open(path).read()``, so the
+    checksum equals ``compute_checksum`` of the file's text.
+
+    Args:
+        path: File to scan
+        block_chars: Characters read per block
+
+    Returns:
+        (hex-encoded SHA-256 checksum, whether the file has any
+        non-whitespace content)
+    """
+    digest = hashlib.sha256()
+    has_content = False
+    with open(path, encoding="utf-8") as f:
+        while block := f.read(block_chars):
+            digest.update(block.encode("utf-8"))
+            has_content = has_content or not block.isspace()
+    return digest.hexdigest(), has_content
+
+
 def validate_chunk_integrity(chunk: CorpusChunk) -> bool:
     """Validate chunk integrity by checking checksum.
 
@@ -573,6 +848,53 @@ def atomic_write_json(
         raise
 
 
+def atomic_write_bytes(
+    target_path: Path,
+    blocks: Iterable[bytes],
+    file_mode: Optional[int] = None,
+) -> int:
+    """Stream binary blocks to a file atomically (temp file + fsync + rename).
+
+    SR-8.1: Same durability guarantees as :func:`atomic_write_json`, for
+    binary corpus files too large to build in memory first.
+
+    Args:
+        target_path: Final destination path
+        blocks: Byte blocks written in order
+        file_mode: File permission mode (e.g., 0o600 for owner rw only)
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        OSError: If write or rename fails
+    """
+    temp_fd, temp_path_str = tempfile.mkstemp(
+        dir=target_path.parent,
+        prefix=f".{target_path.name}.",
+        suffix=".tmp",
+    )
+    written = 0
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            for block in blocks:
+                f.write(block)
+                written += len(block)
+            f.flush()
+            os.fsync(f.fileno())
+        Path(temp_path_str).rename(target_path)
+        if file_mode is not None:
+            set_secure_permissions(target_path, file_mode)
+    except OSError as e:
+        logger.warning("atomic_write_failed", path=str(target_path), error=str(e))
+        try:
+            Path(temp_path_str).unlink()
+        except OSError:
+            pass
+        raise
+    return written
+
+
 def set_secure_permissions(path: Path, mode: int = 0o700) -> None:
     """Set secure permissions on a path.
 
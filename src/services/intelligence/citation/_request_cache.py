@@ -0,0 +1,121 @@
+"""In-process request sharing for the citation provider clients.
+
+Both :class:`SemanticScholarCitationClient` and
+:class:`OpenAlexCitationClient` need the same two primitives, so they
+live here once instead of being duplicated per client:
+
+``PayloadLRU``
+    Bounded, in-memory LRU of raw provider paper payloads keyed by
+    provider id. Sits in front of the optional ``diskcache`` layer so a
+    paper hydrated once (as a seed, as a neighbour on a relationship
+    page, or through a batch lookup) is not re-requested for the life
+    of the client — independently of the ``max_results`` a relationship
+    call happened to use.
+
+``RequestCoalescer``
+    Shares one in-flight request among concurrent callers that ask for
+    the same key. Concurrent crawls over overlapping neighbourhoods
+    then issue each provider call once instead of once per caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PayloadLRU:
+    """Bounded LRU mapping provider paper id → raw payload dict.
+
+    ``max_entries=0`` disables the cache (every ``get`` misses).
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RequestCoalescer:
+    """Deduplicate concurrent requests that share a key.
+
+    Two entry points:
+
+    - :meth:`run` wraps a whole coroutine: the first caller starts it,
+      later callers with the same key await the same task.
+    - :meth:`claim` hands out per-key futures for batch requests: the
+      caller that *owns* a future must resolve it; everyone else awaits
+      it. This lets a batch of ids overlap partially with another batch
+      already in flight.
+
+    Keys are forgotten as soon as their request settles, so results are
+    never served stale from here — persistence is the caches' job.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()``, sharing it with concurrent same-key callers.
+
+        The shared task is shielded: cancelling one waiter does not
+        cancel the request for the others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._track(key, future)
+        result: T = await asyncio.shield(future)
+        return result
+
+    def claim(self, key: str) -> tuple[asyncio.Future[Any], bool]:
+        """Return ``(future, owned)`` for ``key``.
+
+        ``owned=True`` means the caller created the future and must
+        settle it with ``set_result`` / ``set_exception``.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            return future, False
+        future = asyncio.get_running_loop().create_future()
+        self._track(key, future)
+        return future, True
+
+    def in_flight(self) -> int:
+        """Number of keys with a request currently outstanding."""
+        return len(self._inflight)
+
+    def _track(self, key: str, future: asyncio.Future[Any]) -> None:
+        self._inflight[key] = future
+
+        def _forget(done: asyncio.Future[Any]) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            # Mark any exception as retrieved: waiters re-raise it, and a
+            # request nobody ended up awaiting must not log "exception
+            # was never retrieved" at shutdown.
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(_forget)
@@ -17,17 +17,25 @@ Computed pairs are cached in the ``citation_coupling`` table introduced by
 :class:`CitationCouplingRepository` so the analyzer never touches the
 DB schema directly.  ``analyze_pair`` checks the cache first; a cache
 miss computes Jaccard and upserts the result via the repository.
-``analyze_for_paper`` uses the cache indirectly — each underlying
-``analyze_pair`` call checks the cache and writes the result if a repo
-is wired in.
+``analyze_for_paper`` reads every cached pair in one batched lookup and
+writes every freshly computed pair in one transaction.
+
+Batch engine
+------------
+``analyze_for_paper`` and ``analyze_all_pairs`` do not walk pairs one
+by one (two reference fetches, two inbound counts and one co-citer
+count per pair — ~800 SQLite round-trips for 200 candidates).  They
+load the ``CITES`` adjacency of the whole paper set once (three bulk
+queries) into binary CSR matrices ``R`` (paper × reference) and ``C``
+(paper × citer) and read every count off sparse products: ``R·Rᵀ``
+gives shared references, ``C·Cᵀ`` gives co-citers.  ``analyze_pair``
+keeps the per-pair path.
 
 Async safety
 ------------
-Both public methods are ``async def`` wrapping sync DB/graph work via
+All public methods are ``async def`` wrapping sync DB/graph work via
 ``asyncio.to_thread`` — the canonical pattern from CLAUDE.md "SQLite
 write retry" and mirroring :meth:`InfluenceScorer.compute_for_paper`.
-``analyze_for_paper`` fans out concurrent pair evaluations using
-``asyncio.gather`` with a bounded semaphore (concurrency 10).
 
 Failure semantics
 -----------------
@@ -42,8 +50,9 @@ Failure semantics
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
+import numpy as np
 import structlog
 
 from src.services.intelligence.citation._id_validation import (
@@ -72,9 +81,6 @@ MAX_CANDIDATES: int = 10_000
 # DoS guard: maximum top_k that may be requested.
 MAX_TOP_K: int = 1_000
 
-# Bounded concurrency for analyze_for_paper fan-out (mirrors MultiProviderMonitor).
-_ANALYZE_FOR_PAPER_CONCURRENCY: int = 10
-
 # DoS guard: cap on the number of outgoing CITES edges fetched per paper.
 # Reference sets larger than this are truncated after emitting an audit log.
 _MAX_REFERENCES: int = 50_000
@@ -87,6 +93,48 @@ _MAX_REFERENCES: int = 50_000
 MAX_INBOUND_CITERS_FOR_CO_CITATION: int = 50_000
 
 
+class _Adjacency(NamedTuple):
+    """``CITES`` neighbourhood of a paper set as binary CSR matrices.
+
+    Row ``i`` of both matrices belongs to the ``i``-th input paper.
+    ``citers`` rows are empty for papers over the co-citation DoS cap.
+    """
+
+    refs: Any  # scipy.sparse.csr_matrix, papers × reference vocabulary
+    ref_ids: list[str]
+    ref_degrees: Any  # np.ndarray of per-paper reference counts
+    citers: Any  # scipy.sparse.csr_matrix, papers × citer vocabulary
+
+
+def _binary_csr(rows: list[list[str]]) -> tuple[Any, list[str]]:
+    """Build a 0/1 CSR matrix from per-row column labels.
+
+    Duplicate labels within a row collapse to a single 1, matching the
+    set semantics of the per-pair path.
+
+    Returns:
+        ``(matrix, vocabulary)`` where ``vocabulary[k]`` labels column k.
+    """
+    from scipy import sparse
+
+    vocab: dict[str, int] = {}
+    indices: list[int] = []
+    indptr: list[int] = [0]
+    for labels in rows:
+        for label in dict.fromkeys(labels):
+            indices.append(vocab.setdefault(label, len(vocab)))
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (
+            np.ones(len(indices), dtype=np.int32),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(rows), len(vocab)),
+    )
+    return matrix, list(vocab)
+
+
 def _validate_paper_id(paper_id: str) -> None:
     """Validate a canonical node id at the analyzer boundary.
 
@@ -212,11 +260,12 @@ class CouplingAnalyzer:
     ) -> list[CouplingResult]:
         """Find the top-K most coupled papers from a candidate list.
 
-        Computes ``analyze_pair(paper_id, candidate)`` for each entry in
-        ``candidates`` concurrently (bounded to
-        :data:`_ANALYZE_FOR_PAPER_CONCURRENCY` simultaneous tasks via a
-        semaphore), then returns the ``top_k`` results sorted descending
-        by ``coupling_strength``.
+        Equivalent to ``analyze_pair(paper_id, candidate)`` for each entry
+        in ``candidates``, but batched: cached pairs are read in one
+        lookup, the rest are computed together by the sparse-matrix
+        engine (see module docstring) and cached in one transaction.
+        Returns the ``top_k`` results sorted descending by
+        ``coupling_strength``.
 
         Papers whose coupling strength is 0.0 are included in the sort
         so the caller has full visibility; it is their responsibility to
@@ -237,7 +286,8 @@ class CouplingAnalyzer:
             ascending for a stable tie-break.
 
         Raises:
-            ValueError: If ``paper_id`` is malformed, ``top_k < 1``, or
+            ValueError: If ``paper_id`` or any candidate is malformed,
+                a candidate equals ``paper_id``, ``top_k < 1``, or
                 ``len(candidates)`` exceeds :data:`MAX_CANDIDATES`.
         """
         _validate_paper_id(paper_id)
@@ -249,24 +299,238 @@ class CouplingAnalyzer:
                 f"({MAX_CANDIDATES})"
             )
         top_k = min(top_k, MAX_TOP_K)
+        for candidate in candidates:
+            _validate_paper_id(candidate)
+            if candidate == paper_id:
+                raise ValueError(
+                    "paper_a_id and paper_b_id must differ; "
+                    f"got {paper_id!r} for both."
+                )
 
-        sem = asyncio.Semaphore(_ANALYZE_FOR_PAPER_CONCURRENCY)
+        unique = list(dict.fromkeys(candidates))
+        by_candidate: dict[str, CouplingResult] = {}
+        if self._repo is not None and unique:
+            cached = await asyncio.to_thread(
+                self._repo.get_many, [(paper_id, c) for c in unique]
+            )
+            for candidate in unique:
+                hit = cached.get((min(paper_id, candidate), max(paper_id, candidate)))
+                if hit is not None:
+                    by_candidate[candidate] = hit
+
+        misses = [c for c in unique if c not in by_candidate]
+        if misses:
+            computed = await asyncio.to_thread(self._compute_for_seed, paper_id, misses)
+            by_candidate.update(computed)
+            await self._record_batch(list(computed.values()), paper_id=paper_id)
+
+        results = [by_candidate[c] for c in candidates]
+        results.sort(key=lambda r: (-r.coupling_strength, r.paper_b_id))
+        return results[:top_k]
 
-        async def _bounded(candidate: str) -> CouplingResult:
-            async with sem:
-                return await self.analyze_pair(paper_id, candidate)
+    async def analyze_all_pairs(self, paper_ids: list[str]) -> list[CouplingResult]:
+        """Compute coupling for every pair within ``paper_ids`` in one pass.
 
-        results: list[CouplingResult] = list(
-            await asyncio.gather(*[_bounded(c) for c in candidates])
-        )
+        Loads the ``CITES`` adjacency of the set once, reads shared-
+        reference and co-citer counts for all pairs off two sparse
+        products, and writes the results to the cache in a single
+        transaction when a repo is wired in.  The cache is not read —
+        this is the bulk (re)compute path.
 
-        results.sort(key=lambda r: (-r.coupling_strength, r.paper_b_id))
-        return results[:top_k]
+        Only pairs with at least one shared reference or one co-citer
+        are returned (and cached).  Every other pair has
+        ``coupling_strength == 0.0`` and ``co_citation_count == 0``;
+        materializing them would make the output quadratic in the input.
+
+        Args:
+            paper_ids: Canonical node ids. Duplicates are collapsed. Must
+                not exceed :data:`MAX_CANDIDATES`.
+
+        Returns:
+            Results in canonical ``(min_id, max_id)`` pair order, sorted
+            by ``coupling_strength`` descending, then by the pair ids.
+
+        Raises:
+            ValueError: If any id is malformed or there are more than
+                :data:`MAX_CANDIDATES` distinct ids.
+        """
+        unique = sorted(set(paper_ids))
+        if len(unique) > MAX_CANDIDATES:
+            raise ValueError(
+                f"paper_ids length {len(unique)} exceeds MAX_CANDIDATES "
+                f"({MAX_CANDIDATES})"
+            )
+        for pid in unique:
+            _validate_paper_id(pid)
+
+        results = await asyncio.to_thread(self._compute_all_pairs, unique)
+        await self._record_batch(results)
+        return results
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    async def _record_batch(
+        self, results: list[CouplingResult], **log_fields: str
+    ) -> None:
+        """Cache ``results`` in one transaction; failures are logged only."""
+        if self._repo is None or not results:
+            return
+        try:
+            await asyncio.to_thread(self._repo.record_many, results)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(
+                "coupling_analyzer_cache_write_failed",
+                pairs=len(results),
+                error=_trunc(exc),
+                **log_fields,
+            )
+
+    def _load_adjacency(self, paper_ids: list[str]) -> _Adjacency:
+        """Load the ``CITES`` neighbourhood of ``paper_ids`` in bulk.
+
+        Three queries regardless of set size: outgoing edges (references),
+        inbound counts (for the co-citation DoS cap) and inbound edges
+        (citers) for the papers under the cap.  The per-pair guards carry
+        over: reference lists above :data:`_MAX_REFERENCES` are truncated
+        and papers above :data:`MAX_INBOUND_CITERS_FOR_CO_CITATION` get an
+        empty citer row, so every pair involving them reports the ``0``
+        sentinel — without their citer rows ever being loaded.
+        """
+        cites = [EdgeType.CITES.value]
+        outgoing = self.store._list_outgoing_edges_for_nodes(paper_ids, cites)
+        ref_rows: list[list[str]] = []
+        for pid in paper_ids:
+            refs = outgoing.get(pid, [])
+            if len(refs) > _MAX_REFERENCES:
+                logger.warning(
+                    "coupling_references_truncated",
+                    paper_id=pid,
+                    fetched=len(refs),
+                    cap=_MAX_REFERENCES,
+                )
+                refs = refs[:_MAX_REFERENCES]
+            ref_rows.append(refs)
+
+        inbound_counts = self.store._count_incoming_edges_for_nodes(paper_ids, cites)
+        loadable: list[str] = []
+        for pid in paper_ids:
+            count = inbound_counts.get(pid, 0)
+            if count > MAX_INBOUND_CITERS_FOR_CO_CITATION:
+                logger.warning(
+                    "coupling_co_citation_truncated",
+                    paper_id=pid,
+                    inbound_count=count,
+                    cap=MAX_INBOUND_CITERS_FOR_CO_CITATION,
+                )
+            elif count:
+                loadable.append(pid)
+        incoming = self.store._list_incoming_edges_for_nodes(loadable, cites)
+        # Self-citations are dropped: a paper never co-cites itself with
+        # another paper (mirrors ``source_id NOT IN (a, b)`` in the store).
+        citer_rows = [
+            [src for src in incoming.get(pid, []) if src != pid] for pid in paper_ids
+        ]
+
+        refs_matrix, ref_ids = _binary_csr(ref_rows)
+        citers_matrix, _ = _binary_csr(citer_rows)
+        return _Adjacency(
+            refs=refs_matrix,
+            ref_ids=ref_ids,
+            ref_degrees=np.diff(refs_matrix.indptr),
+            citers=citers_matrix,
+        )
+
+    @staticmethod
+    def _result_from_counts(
+        adj: _Adjacency,
+        paper_ids: list[str],
+        i: int,
+        j: int,
+        shared_count: int,
+        co_citation_count: int,
+    ) -> CouplingResult:
+        """Assemble the :class:`CouplingResult` for rows ``i`` and ``j``."""
+        union = int(adj.ref_degrees[i]) + int(adj.ref_degrees[j]) - shared_count
+        shared: list[str] = []
+        if shared_count:
+            refs = adj.refs
+            cols = np.intersect1d(
+                refs.indices[refs.indptr[i] : refs.indptr[i + 1]],
+                refs.indices[refs.indptr[j] : refs.indptr[j + 1]],
+                assume_unique=True,
+            )
+            shared = sorted(adj.ref_ids[k] for k in cols)
+        return CouplingResult(
+            paper_a_id=paper_ids[i],
+            paper_b_id=paper_ids[j],
+            shared_references=shared,
+            coupling_strength=shared_count / union if union else 0.0,
+            co_citation_count=co_citation_count,
+        )
+
+    def _compute_for_seed(
+        self, paper_id: str, candidates: list[str]
+    ) -> dict[str, CouplingResult]:
+        """Batch-compute ``(paper_id, candidate)`` for every candidate.
+
+        Only the seed's row of each product is needed, so this is two
+        sparse vector-matrix products rather than full ``R·Rᵀ``.
+        """
+        ids = [paper_id, *candidates]
+        adj = self._load_adjacency(ids)
+        shared = (adj.refs[0] @ adj.refs.T).toarray().ravel()
+        co_cited = (adj.citers[0] @ adj.citers.T).toarray().ravel()
+
+        results = {
+            candidate: self._result_from_counts(
+                adj, ids, 0, j, int(shared[j]), int(co_cited[j])
+            )
+            for j, candidate in enumerate(candidates, start=1)
+        }
+        logger.info(
+            "coupling_analyzer_batch_computed",
+            paper_id=paper_id,
+            papers=len(ids),
+            pairs=len(results),
+            reference_edges=int(adj.refs.nnz),
+            citer_edges=int(adj.citers.nnz),
+        )
+        return results
+
+    def _compute_all_pairs(self, paper_ids: list[str]) -> list[CouplingResult]:
+        """Batch-compute every non-zero pair within sorted ``paper_ids``.
+
+        ``paper_ids`` must be sorted so the upper triangle (``i < j``) is
+        exactly the canonical ``(min_id, max_id)`` orientation.
+        """
+        from scipy import sparse
+
+        adj = self._load_adjacency(paper_ids)
+        shared = sparse.triu(adj.refs @ adj.refs.T, k=1).tocoo()
+        co_cited = sparse.triu(adj.citers @ adj.citers.T, k=1).tocoo()
+
+        counts: dict[tuple[int, int], list[int]] = {}
+        for i, j, v in zip(shared.row, shared.col, shared.data):
+            counts[(int(i), int(j))] = [int(v), 0]
+        for i, j, v in zip(co_cited.row, co_cited.col, co_cited.data):
+            counts.setdefault((int(i), int(j)), [0, 0])[1] = int(v)
+
+        results = [
+            self._result_from_counts(adj, paper_ids, i, j, s, c)
+            for (i, j), (s, c) in counts.items()
+        ]
+        results.sort(key=lambda r: (-r.coupling_strength, r.paper_a_id, r.paper_b_id))
+        logger.info(
+            "coupling_analyzer_all_pairs_computed",
+            papers=len(paper_ids),
+            pairs=len(results),
+            reference_edges=int(adj.refs.nnz),
+            citer_edges=int(adj.citers.nnz),
+        )
+        return results
+
     def _compute_co_citation_count(
         self,
         paper_a_id: str,
@@ -85,6 +85,24 @@ _T = TypeVar("_T")
 # Default freshness window for ``get``.  Mirrors spec REQ-9.2.3 (30 days).
 DEFAULT_MAX_AGE_DAYS: int = 30
 
+# Pairs per ``get_many`` SELECT: two bound parameters each, kept well under
+# SQLite's historical 999-variable limit.
+_GET_MANY_CHUNK_PAIRS: int = 400
+
+_UPSERT_SQL = """
+    INSERT INTO citation_coupling (
+        paper_a_id, paper_b_id,
+        coupling_strength, shared_references_json,
+        co_citation_count, computed_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(paper_a_id, paper_b_id) DO UPDATE SET
+        coupling_strength      = excluded.coupling_strength,
+        shared_references_json = excluded.shared_references_json,
+        co_citation_count      = excluded.co_citation_count,
+        computed_at            = excluded.computed_at
+"""
+
 
 class CitationCouplingRepository:
     """Owns the V6 ``citation_coupling`` SQLite table.
@@ -92,7 +110,9 @@ class CitationCouplingRepository:
     Provides:
 
     - :meth:`record` upsert one :class:`CouplingResult` row.
+    - :meth:`record_many` upsert many rows in one transaction.
     - :meth:`get` fetch by ``(paper_a_id, paper_b_id)`` honouring a TTL.
+    - :meth:`get_many` batched :meth:`get` for many pairs.
     - :meth:`delete_stale` bulk delete rows older than a cutoff.
 
     Async safety:
@@ -228,44 +248,68 @@ class CitationCouplingRepository:
 
     def _record_once(self, result: CouplingResult) -> None:
         """Single-attempt upsert of one row."""
-        # Canonical ordering: always store (min, max) so (A,B) and (B,A)
-        # land on the same row — the DB's CHECK constraint enforces this.
-        canon_a = min(result.paper_a_id, result.paper_b_id)
-        canon_b = max(result.paper_a_id, result.paper_b_id)
-        refs_json = json.dumps(result.shared_references)
-        now_iso = datetime.now(timezone.utc).isoformat()
+        row = self._result_to_row(result, datetime.now(timezone.utc).isoformat())
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(_UPSERT_SQL, row)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def record_many(self, results: list[CouplingResult]) -> None:
+        """Upsert many :class:`CouplingResult` rows in one transaction.
+
+        Batch twin of :meth:`record` used by the analyzer's all-pairs
+        engine: one ``BEGIN IMMEDIATE`` / ``executemany`` / ``COMMIT``
+        instead of one transaction per pair.  Same canonicalization,
+        retry and failure semantics as :meth:`record`; the batch is
+        all-or-nothing.
 
+        Args:
+            results: Rows to upsert.  Empty input is a no-op.
+
+        Raises:
+            sqlite3.Error: If the upsert fails after all retry attempts.
+        """
+        if not results:
+            return
+        self._retry(
+            lambda: self._record_many_once(results),
+            operation_name="coupling_record_many",
+            rows=len(results),
+        )
+
+    def _record_many_once(self, results: list[CouplingResult]) -> None:
+        """Single-attempt upsert of ``results`` inside one transaction."""
+        now_iso = datetime.now(timezone.utc).isoformat()
+        rows = [self._result_to_row(result, now_iso) for result in results]
         with self._connect() as conn:
             conn.execute("BEGIN IMMEDIATE")
             try:
-                conn.execute(
-                    """
-                    INSERT INTO citation_coupling (
-                        paper_a_id, paper_b_id,
-                        coupling_strength, shared_references_json,
-                        co_citation_count, computed_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(paper_a_id, paper_b_id) DO UPDATE SET
-                        coupling_strength      = excluded.coupling_strength,
-                        shared_references_json = excluded.shared_references_json,
-                        co_citation_count      = excluded.co_citation_count,
-                        computed_at            = excluded.computed_at
-                    """,
-                    (
-                        canon_a,
-                        canon_b,
-                        result.coupling_strength,
-                        refs_json,
-                        result.co_citation_count,
-                        now_iso,
-                    ),
-                )
+                conn.executemany(_UPSERT_SQL, rows)
                 conn.commit()
             except Exception:
                 conn.rollback()
                 raise
 
+    @staticmethod
+    def _result_to_row(
+        result: CouplingResult, now_iso: str
+    ) -> tuple[str, str, float, str, int, str]:
+        """Build the upsert parameters for one result."""
+        # Canonical ordering: always store (min, max) so (A,B) and (B,A)
+        # land on the same row — the DB's CHECK constraint enforces this.
+        return (
+            min(result.paper_a_id, result.paper_b_id),
+            max(result.paper_a_id, result.paper_b_id),
+            result.coupling_strength,
+            json.dumps(result.shared_references),
+            result.co_citation_count,
+            now_iso,
+        )
+
     def delete_stale(self, older_than: datetime) -> int:
         """Bulk delete rows whose ``computed_at`` predates ``older_than``.
 
@@ -360,21 +404,7 @@ class CitationCouplingRepository:
                 row = cursor.fetchone()
             if row is None:
                 return None
-            computed_at = datetime.fromisoformat(row["computed_at"])
-            if computed_at.tzinfo is None:
-                computed_at = computed_at.replace(tzinfo=timezone.utc)
-            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-            if computed_at < cutoff:
-                return None
-
-            shared: list[str] = json.loads(row["shared_references_json"])
-            return CouplingResult(
-                paper_a_id=row["paper_a_id"],
-                paper_b_id=row["paper_b_id"],
-                shared_references=shared,
-                coupling_strength=row["coupling_strength"],
-                co_citation_count=row["co_citation_count"],
-            )
+            return self._row_to_result(row, max_age_days)
 
         return self._retry(
             _get_once,
@@ -382,3 +412,79 @@ class CitationCouplingRepository:
             paper_a_id=paper_a_id,
             paper_b_id=paper_b_id,
         )
+
+    def get_many(
+        self,
+        pairs: list[tuple[str, str]],
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    ) -> dict[tuple[str, str], CouplingResult]:
+        """Batched :meth:`get`: fetch fresh rows for many pairs at once.
+
+        Issues one ``SELECT`` per :data:`_GET_MANY_CHUNK_PAIRS` pairs
+        instead of one per pair.  TTL semantics match :meth:`get`.
+
+        Args:
+            pairs: ``(paper_a_id, paper_b_id)`` pairs in any order.
+            max_age_days: Freshness window. Must be > 0.
+
+        Returns:
+            Mapping of **canonical** ``(min_id, max_id)`` pair →
+            :class:`CouplingResult` for every pair with a fresh row.
+            Misses are absent.
+
+        Raises:
+            ValueError: If ``max_age_days`` is not positive.
+        """
+        if max_age_days <= 0:
+            raise ValueError("max_age_days must be positive")
+        canonical = list(dict.fromkeys((min(a, b), max(a, b)) for a, b in pairs))
+        if not canonical:
+            return {}
+
+        def _get_many_once() -> dict[tuple[str, str], CouplingResult]:
+            found: dict[tuple[str, str], CouplingResult] = {}
+            with self._connect() as conn:
+                for start in range(0, len(canonical), _GET_MANY_CHUNK_PAIRS):
+                    chunk = canonical[start : start + _GET_MANY_CHUNK_PAIRS]
+                    # Placeholders are built from a count, never from data.
+                    placeholders = ",".join(["(?, ?)"] * len(chunk))
+                    cursor = conn.execute(
+                        f"""
+                        SELECT paper_a_id, paper_b_id,
+                               coupling_strength, shared_references_json,
+                               co_citation_count, computed_at
+                        FROM citation_coupling
+                        WHERE (paper_a_id, paper_b_id) IN (VALUES {placeholders})
+                        """,
+                        tuple(pid for pair in chunk for pid in pair),
+                    )
+                    for row in cursor.fetchall():
+                        result = self._row_to_result(row, max_age_days)
+                        if result is not None:
+                            found[(result.paper_a_id, result.paper_b_id)] = result
+            return found
+
+        return self._retry(
+            _get_many_once,
+            operation_name="coupling_get_many",
+            pairs=len(canonical),
+        )
+
+    @staticmethod
+    def _row_to_result(row: sqlite3.Row, max_age_days: int) -> Optional[CouplingResult]:
+        """Parse one row, or ``None`` when it is older than the TTL."""
+        computed_at = datetime.fromisoformat(row["computed_at"])
+        if computed_at.tzinfo is None:
+            computed_at = computed_at.replace(tzinfo=timezone.utc)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        if computed_at < cutoff:
+            return None
+
+        shared: list[str] = json.loads(row["shared_references_json"])
+        return CouplingResult(
+            paper_a_id=row["paper_a_id"],
+            paper_b_id=row["paper_b_id"],
+            shared_references=shared,
+            coupling_strength=row["coupling_strength"],
+            co_citation_count=row["co_citation_count"],
+        )
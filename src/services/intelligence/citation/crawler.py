@@ -14,6 +14,10 @@ at a time. Per spec Section 5.2:
   emit a single ``citation_crawl_budget_exhausted`` event and stop.
 - Concurrency cap: ``asyncio.Semaphore(10)`` so a single crawl cannot
   open more than ten in-flight provider requests at once.
+- Layer-parallel mode (``CrawlConfig.layer_parallel``): the whole
+  frontier of a BFS level is expanded concurrently (bounded by the
+  semaphore and the API budget) and the level is persisted with a
+  single node batch + edge batch.
 
 Failure semantics — codified from PR #124's silent-data-loss incident
 (see CLAUDE.md "Orchestration Patterns"):
@@ -101,6 +105,12 @@ MAX_API_CALLS_PER_CRAWL = 1000
 # enough to not overwhelm the provider's rate limiter.
 _MAX_CONCURRENT_REQUESTS = 10
 
+# Largest single ``add_nodes_batch`` / ``add_edges_batch`` call a
+# layer-parallel crawl issues. Matches the SQLite store's DoS guard
+# (``_MAX_BULK_BATCH_SIZE``); a level only spans several calls when it
+# is wider than that.
+_LAYER_BATCH_SIZE = 10_000
+
 
 # Strict allow-list and length cap imported from the canonical single
 # source of truth in _id_validation.py (H-A1).  The aliases above
@@ -128,6 +138,16 @@ class CrawlConfig(BaseModel):
     # (up to 10_000 for one-off batch jobs) the budget without changing
     # the module-level constant. (H-A4/H-A5)
     max_api_calls: int = Field(default=MAX_API_CALLS_PER_CRAWL, ge=1, le=10_000)
+    # Layer-parallel mode: expand the whole BFS frontier concurrently and
+    # persist each layer with one ``add_nodes_batch`` / ``add_edges_batch``
+    # pair. Off by default so the one-paper-at-a-time path stays the
+    # reference behaviour for existing callers.
+    layer_parallel: bool = Field(default=False)
+    # Per-crawl override of ``_MAX_CONCURRENT_REQUESTS``. Layer-parallel
+    # crawls with wide frontiers can raise it so a level completes in
+    # about one provider round-trip; the provider client's
+    # ``RateLimiter`` still bounds the actual request rate.
+    max_concurrent_requests: int = Field(default=_MAX_CONCURRENT_REQUESTS, ge=1, le=100)
 
 
 class CrawlResult(BaseModel):
@@ -254,6 +274,12 @@ class CitationCrawler:
             openalex_client=openalex_client,
         )
 
+    async def aclose(self) -> None:
+        """Release the provider clients' HTTP sessions and disk caches."""
+        for client in (self.s2_client, self.openalex_client):
+            if client is not None:
+                await client.aclose()
+
     async def crawl(self, seed_paper_id: str, config: CrawlConfig) -> CrawlResult:
         """Walk the citation graph breadth-first from ``seed_paper_id``.
 
@@ -285,7 +311,7 @@ class CitationCrawler:
         # depth 0; its neighbours land at depth 1.
         queue: deque[tuple[str, int]] = deque([(seed_paper_id, 0)])
 
-        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        semaphore = asyncio.Semaphore(config.max_concurrent_requests)
         # Per-filter drop counters are surfaced in the result so ops can
         # tell at a glance whether the filter was too aggressive. We
         # track separately for each direction so the ops team can see
@@ -297,6 +323,18 @@ class CitationCrawler:
             "year_min_forward": 0,
         }
 
+        if config.layer_parallel:
+            await self._crawl_layers(
+                seed_paper_id=seed_paper_id,
+                config=config,
+                result=result,
+                dropped=dropped,
+                visited=visited,
+                persisted_node_ids=persisted_node_ids,
+                semaphore=semaphore,
+            )
+            return self._finish_crawl(seed_paper_id, result, dropped)
+
         while queue:
             paper_id, depth = queue.popleft()
             # Per spec: process only nodes whose depth is strictly less
@@ -353,48 +391,7 @@ class CitationCrawler:
                 continue
 
             parent_node = expanded.parent_node
-
-            # Apply filters + rank + cap INDEPENDENTLY per direction
-            # (spec REQ-9.2.2 §574-592, C-3 fix). Doing it on the union
-            # would let a direction with many candidates starve the other.
-            top_k: list[CitationNode] = []
-            top_k_edges: list[CitationEdge] = []
-
-            if expanded.backward_nodes:
-                bw_kept, bw_kept_edges = self._apply_filters_directional(
-                    expanded.backward_nodes,
-                    expanded.backward_edges,
-                    config,
-                    dropped,
-                    prefix="backward",
-                )
-                bw_ranked = sort_by_influence(bw_kept)
-                bw_top = bw_ranked[: config.max_papers_per_level]
-                bw_ids = {n.paper_id for n in bw_top}
-                top_k.extend(bw_top)
-                top_k_edges.extend(
-                    e
-                    for e in bw_kept_edges
-                    if e.citing_paper_id in bw_ids or e.cited_paper_id in bw_ids
-                )
-
-            if expanded.forward_nodes:
-                fw_kept, fw_kept_edges = self._apply_filters_directional(
-                    expanded.forward_nodes,
-                    expanded.forward_edges,
-                    config,
-                    dropped,
-                    prefix="forward",
-                )
-                fw_ranked = sort_by_influence(fw_kept)
-                fw_top = fw_ranked[: config.max_papers_per_level]
-                fw_ids = {n.paper_id for n in fw_top}
-                top_k.extend(fw_top)
-                top_k_edges.extend(
-                    e
-                    for e in fw_kept_edges
-                    if e.citing_paper_id in fw_ids or e.cited_paper_id in fw_ids
-                )
+            top_k, top_k_edges = self._select_top_k(expanded, config, dropped)
 
             # Persist this layer. CHECKED SUCCESS: if persistence fails
             # we MUST abort the whole crawl, not just skip the layer —
@@ -433,6 +430,13 @@ class CitationCrawler:
             result.levels_reached = max(result.levels_reached, depth + 1)
             result.edges_added += len(top_k_edges)
 
+        return self._finish_crawl(seed_paper_id, result, dropped)
+
+    @staticmethod
+    def _finish_crawl(
+        seed_paper_id: str, result: CrawlResult, dropped: dict[str, int]
+    ) -> CrawlResult:
+        """Attach the drop counters and emit the completion event."""
         result.dropped_by_filter = dropped
         logger.info(
             "citation_crawl_complete",
@@ -540,6 +544,207 @@ class CitationCrawler:
             forward_edges=forward_edges,
         )
 
+    async def _crawl_layers(
+        self,
+        *,
+        seed_paper_id: str,
+        config: CrawlConfig,
+        result: CrawlResult,
+        dropped: dict[str, int],
+        visited: set[str],
+        persisted_node_ids: set[str],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Layer-parallel BFS: expand each frontier concurrently.
+
+        Every paper in the current frontier is expanded at once (bounded
+        by ``semaphore``), the expansions are filtered / ranked in
+        frontier order so results stay deterministic, and the whole
+        level is written with one node batch + one edge batch.
+
+        Budget: each paper's provider calls (1, or 2 for BOTH) are
+        reserved *before* dispatch, in frontier order. When the budget
+        runs out mid-layer the rest of the frontier is never dispatched,
+        the papers already reserved are expanded and persisted, and the
+        crawl stops with ``budget_exhausted=True``. A paper is never
+        half-expanded, so no partial neighbourhood reaches the graph.
+
+        Failure semantics match the sequential path: ``APIError`` on one
+        paper is fail-soft, a ``GraphStoreError`` aborts the crawl.
+        """
+        calls_per_paper = 2 if config.direction == CrawlDirection.BOTH else 1
+        # Edge ids are deterministic (citing, cited), so the same edge
+        # surfaces when both endpoints sit in one frontier. Track what
+        # we have written to keep the batch free of UNIQUE collisions.
+        persisted_edge_ids: set[str] = set()
+        frontier: list[str] = [seed_paper_id]
+        depth = 0
+
+        while frontier and depth < config.max_depth:
+            remaining = config.max_api_calls - result.api_calls_made
+            affordable = max(0, remaining // calls_per_paper)
+            dispatch = frontier[:affordable]
+            if len(dispatch) < len(frontier):
+                result.budget_exhausted = True
+            result.api_calls_made += len(dispatch) * calls_per_paper
+
+            expansions = await self._expand_frontier(
+                dispatch,
+                direction=config.direction,
+                semaphore=semaphore,
+                seed_paper_id=seed_paper_id,
+            )
+
+            layer_nodes: list[CitationNode] = []
+            layer_edges: list[CitationEdge] = []
+            next_frontier: list[str] = []
+            for expanded in expansions:
+                if expanded is None:
+                    continue
+                top_k, top_k_edges = self._select_top_k(expanded, config, dropped)
+                if expanded.parent_node is not None:
+                    layer_nodes.append(expanded.parent_node)
+                layer_nodes.extend(top_k)
+                layer_edges.extend(top_k_edges)
+                for node in top_k:
+                    if node.paper_id in visited:
+                        continue
+                    visited.add(node.paper_id)
+                    next_frontier.append(node.paper_id)
+
+            if any(e is not None for e in expansions):
+                edges_written = self._persist_frontier(
+                    depth=depth,
+                    nodes=layer_nodes,
+                    edges=layer_edges,
+                    seed_paper_id=seed_paper_id,
+                    persisted_node_ids=persisted_node_ids,
+                    persisted_edge_ids=persisted_edge_ids,
+                )
+                if edges_written is None:
+                    result.persistence_aborted = True
+                    return
+                result.papers_visited += len(next_frontier)
+                result.levels_reached = max(result.levels_reached, depth + 1)
+                result.edges_added += edges_written
+
+            if result.budget_exhausted:
+                logger.warning(
+                    "citation_crawl_budget_exhausted",
+                    seed_paper_id=seed_paper_id,
+                    api_calls_made=result.api_calls_made,
+                    budget=config.max_api_calls,
+                )
+                return
+
+            frontier = next_frontier
+            depth += 1
+
+    async def _expand_frontier(
+        self,
+        paper_ids: list[str],
+        *,
+        direction: CrawlDirection,
+        semaphore: asyncio.Semaphore,
+        seed_paper_id: str,
+    ) -> list[Optional[_ExpandResult]]:
+        """Expand every paper in ``paper_ids`` concurrently.
+
+        Returns one entry per input id, in input order; ``None`` marks a
+        paper whose provider call failed (fail-soft, logged). Every
+        expansion runs to completion before outcomes are inspected, so
+        the first non-provider exception is re-raised only after the
+        whole layer has settled. Cancelling the crawl itself cancels the
+        still-running expansions and propagates.
+        """
+        tasks = [
+            asyncio.ensure_future(
+                self._expand_paper_concurrently(paper_id, direction, semaphore)
+            )
+            for paper_id in paper_ids
+        ]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        expansions: list[Optional[_ExpandResult]] = []
+        for paper_id, outcome in zip(paper_ids, outcomes):
+            if isinstance(outcome, APIError):
+                logger.warning(
+                    "citation_crawl_provider_failed_skipping_node",
+                    seed_paper_id=seed_paper_id,
+                    paper_id=paper_id,
+                    error=repr(str(outcome)[:512]),
+                )
+                expansions.append(None)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                expansions.append(outcome)
+        return expansions
+
+    async def _expand_paper_concurrently(
+        self,
+        paper_id: str,
+        direction: CrawlDirection,
+        semaphore: asyncio.Semaphore,
+    ) -> _ExpandResult:
+        """Layer-parallel variant of :meth:`_expand_paper`.
+
+        Budget accounting is done by the caller before dispatch, and the
+        BACKWARD / FORWARD calls for BOTH run concurrently instead of
+        back to back. Each call still holds ``semaphore``.
+        """
+
+        async def _bounded_references() -> (
+            tuple[CitationNode, list[CitationNode], list[CitationEdge]]
+        ):
+            async with semaphore:
+                return await self._call_references(paper_id)
+
+        async def _bounded_citations() -> (
+            tuple[CitationNode, list[CitationNode], list[CitationEdge]]
+        ):
+            async with semaphore:
+                return await self._call_citations(paper_id)
+
+        want_refs = direction in (CrawlDirection.BACKWARD, CrawlDirection.BOTH)
+        want_cites = direction in (CrawlDirection.FORWARD, CrawlDirection.BOTH)
+        calls = []
+        if want_refs:
+            calls.append(_bounded_references())
+        if want_cites:
+            calls.append(_bounded_citations())
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        parent: Optional[CitationNode] = None
+        result = _ExpandResult(
+            parent_node=None,
+            backward_nodes=[],
+            backward_edges=[],
+            forward_nodes=[],
+            forward_edges=[],
+        )
+        remaining = list(outcomes)
+        if want_refs:
+            parent, refs, ref_edges = remaining.pop(0)
+            result.backward_nodes.extend(refs)
+            result.backward_edges.extend(ref_edges)
+        if want_cites:
+            seed, cites, cite_edges = remaining.pop(0)
+            if parent is None:
+                parent = seed
+            result.forward_nodes.extend(cites)
+            result.forward_edges.extend(cite_edges)
+        result.parent_node = parent
+        return result
+
     async def _call_references(
         self, paper_id: str
     ) -> tuple[CitationNode, list[CitationNode], list[CitationEdge]]:
@@ -557,6 +762,59 @@ class CitationCrawler:
         assert client is not None
         return await client.get_citations(paper_id)
 
+    def _select_top_k(
+        self,
+        expanded: _ExpandResult,
+        config: CrawlConfig,
+        dropped: dict[str, int],
+    ) -> tuple[list[CitationNode], list[CitationEdge]]:
+        """Filter, rank and cap one expansion's candidates per direction.
+
+        Filters + rank + cap are applied INDEPENDENTLY per direction
+        (spec REQ-9.2.2 §574-592, C-3 fix). Doing it on the union would
+        let a direction with many candidates starve the other.
+        """
+        top_k: list[CitationNode] = []
+        top_k_edges: list[CitationEdge] = []
+
+        if expanded.backward_nodes:
+            bw_kept, bw_kept_edges = self._apply_filters_directional(
+                expanded.backward_nodes,
+                expanded.backward_edges,
+                config,
+                dropped,
+                prefix="backward",
+            )
+            bw_ranked = sort_by_influence(bw_kept)
+            bw_top = bw_ranked[: config.max_papers_per_level]
+            bw_ids = {n.paper_id for n in bw_top}
+            top_k.extend(bw_top)
+            top_k_edges.extend(
+                e
+                for e in bw_kept_edges
+                if e.citing_paper_id in bw_ids or e.cited_paper_id in bw_ids
+            )
+
+        if expanded.forward_nodes:
+            fw_kept, fw_kept_edges = self._apply_filters_directional(
+                expanded.forward_nodes,
+                expanded.forward_edges,
+                config,
+                dropped,
+                prefix="forward",
+            )
+            fw_ranked = sort_by_influence(fw_kept)
+            fw_top = fw_ranked[: config.max_papers_per_level]
+            fw_ids = {n.paper_id for n in fw_top}
+            top_k.extend(fw_top)
+            top_k_edges.extend(
+                e
+                for e in fw_kept_edges
+                if e.citing_paper_id in fw_ids or e.cited_paper_id in fw_ids
+            )
+
+        return top_k, top_k_edges
+
     @staticmethod
     def _apply_filters_directional(
         nodes: list[CitationNode],
@@ -700,6 +958,66 @@ class CitationCrawler:
             persisted_node_ids.add(n.paper_id)
         return True
 
+    def _persist_frontier(
+        self,
+        *,
+        depth: int,
+        nodes: list[CitationNode],
+        edges: list[CitationEdge],
+        seed_paper_id: str,
+        persisted_node_ids: set[str],
+        persisted_edge_ids: set[str],
+    ) -> Optional[int]:
+        """Bulk-insert one whole BFS level. Return edges written, or None.
+
+        Nodes and edges are deduplicated against earlier levels and
+        within the level, then written as one ``add_nodes_batch`` and one
+        ``add_edges_batch`` call (chunked only above the
+        ``_LAYER_BATCH_SIZE`` cap). Nodes go first so every edge has its
+        FK targets. ``None`` is the CHECKED SUCCESS failure signal: the
+        caller must abort the crawl.
+        """
+        batch_node_ids: set[str] = set()
+        batch_nodes: list[CitationNode] = []
+        for n in nodes:
+            if n.paper_id in persisted_node_ids or n.paper_id in batch_node_ids:
+                continue
+            batch_node_ids.add(n.paper_id)
+            batch_nodes.append(n)
+
+        graph_nodes = [n.to_graph_node() for n in batch_nodes]
+        graph_edges = []
+        batch_edge_ids: set[str] = set()
+        for e in edges:
+            graph_edge = e.to_graph_edge()
+            if (
+                graph_edge.edge_id in persisted_edge_ids
+                or graph_edge.edge_id in batch_edge_ids
+            ):
+                continue
+            batch_edge_ids.add(graph_edge.edge_id)
+            graph_edges.append(graph_edge)
+
+        try:
+            for i in range(0, len(graph_nodes), _LAYER_BATCH_SIZE):
+                self.store.add_nodes_batch(graph_nodes[i : i + _LAYER_BATCH_SIZE])
+            for i in range(0, len(graph_edges), _LAYER_BATCH_SIZE):
+                self.store.add_edges_batch(graph_edges[i : i + _LAYER_BATCH_SIZE])
+        except GraphStoreError as exc:
+            logger.error(
+                "citation_crawl_persistence_failed_aborting",
+                seed_paper_id=seed_paper_id,
+                depth=depth,
+                node_count=len(graph_nodes),
+                edge_count=len(graph_edges),
+                error=str(exc),
+            )
+            return None
+
+        persisted_node_ids.update(batch_node_ids)
+        persisted_edge_ids.update(batch_edge_ids)
+        return len(graph_edges)
+
 
 class _BudgetExhausted(Exception):
     """Internal signal: the crawl hit ``MAX_API_CALLS_PER_CRAWL``.
@@ -98,6 +98,33 @@ _T = TypeVar("_T")
 # supply ``max_age_days`` explicitly.
 DEFAULT_MAX_AGE_DAYS: int = 7
 
+# ``get_many`` binds one parameter per paper id; chunking keeps each
+# ``IN (...)`` list well under SQLite's bind-parameter limit.
+_GET_MANY_CHUNK_SIZE: int = 500
+
+_UPSERT_SQL = """
+    INSERT INTO citation_influence_metrics (
+        paper_id, citation_count, citation_velocity,
+        pagerank_score, hub_score, authority_score,
+        computed_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(paper_id) DO UPDATE SET
+        citation_count = excluded.citation_count,
+        citation_velocity = excluded.citation_velocity,
+        pagerank_score = excluded.pagerank_score,
+        hub_score = excluded.hub_score,
+        authority_score = excluded.authority_score,
+        computed_at = excluded.computed_at
+"""
+
+_SELECT_COLUMNS = """
+    SELECT paper_id, citation_count, citation_velocity,
+           pagerank_score, hub_score, authority_score,
+           computed_at
+    FROM citation_influence_metrics
+"""
+
 
 class CitationInfluenceRepository:
     """Owns the V4 ``citation_influence_metrics`` SQLite table.
@@ -105,7 +132,10 @@ class CitationInfluenceRepository:
     Provides a small, repository-shaped surface for callers:
 
     - :meth:`record_metrics` upsert one :class:`InfluenceMetrics` row.
+    - :meth:`record_many` upsert many rows in one transaction.
     - :meth:`get_metrics` fetch by ``paper_id`` honouring a TTL.
+    - :meth:`get_many` batched :meth:`get_metrics`.
+    - :meth:`list_computed_at` ``computed_at`` of every cached row.
     - :meth:`delete_stale` bulk delete rows older than a cutoff.
 
     Async safety:
@@ -301,36 +331,69 @@ class CitationInfluenceRepository:
             conn.execute("BEGIN IMMEDIATE")
             try:
                 conn.execute(
-                    """
-                    INSERT INTO citation_influence_metrics (
-                        paper_id, citation_count, citation_velocity,
-                        pagerank_score, hub_score, authority_score,
-                        computed_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(paper_id) DO UPDATE SET
-                        citation_count = excluded.citation_count,
-                        citation_velocity = excluded.citation_velocity,
-                        pagerank_score = excluded.pagerank_score,
-                        hub_score = excluded.hub_score,
-                        authority_score = excluded.authority_score,
-                        computed_at = excluded.computed_at
-                    """,
-                    (
-                        metrics.paper_id,
-                        metrics.citation_count,
-                        metrics.citation_velocity,
-                        metrics.pagerank_score,
-                        metrics.hub_score,
-                        metrics.authority_score,
-                        metrics.computed_at.isoformat(),
-                    ),
+                    _UPSERT_SQL,
+                    self._metrics_to_row(metrics),
                 )
                 conn.commit()
             except Exception:
                 conn.rollback()
                 raise
 
+    def record_many(self, metrics_list: list["InfluenceMetrics"]) -> None:
+        """Upsert many ``InfluenceMetrics`` rows in one transaction.
+
+        Batch twin of :meth:`record_metrics` used by the scorer's bulk
+        paths: one ``BEGIN IMMEDIATE`` / ``executemany`` / ``COMMIT``
+        instead of one transaction per paper. Same retry and failure
+        semantics as :meth:`record_metrics` -- the batch is
+        all-or-nothing, and a non-contention ``sqlite3.Error`` is logged
+        via ``citation_influence_repo_write_failed`` and swallowed.
+
+        Args:
+            metrics_list: Rows to upsert. Empty input is a no-op.
+        """
+        if not metrics_list:
+            return
+        try:
+            self._retry(
+                lambda: self._record_many_once(metrics_list),
+                operation_name="influence_record_many",
+                rows=len(metrics_list),
+            )
+        except sqlite3.Error as exc:
+            logger.error(
+                "citation_influence_repo_write_failed",
+                rows=len(metrics_list),
+                error=_trunc(exc),
+            )
+
+    def _record_many_once(self, metrics_list: list["InfluenceMetrics"]) -> None:
+        """Single-attempt upsert of ``metrics_list`` inside one transaction."""
+        rows = [self._metrics_to_row(metrics) for metrics in metrics_list]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_UPSERT_SQL, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @staticmethod
+    def _metrics_to_row(
+        metrics: "InfluenceMetrics",
+    ) -> tuple[str, int, float, float, float, float, str]:
+        """Build the upsert parameters for one row."""
+        return (
+            metrics.paper_id,
+            metrics.citation_count,
+            metrics.citation_velocity,
+            metrics.pagerank_score,
+            metrics.hub_score,
+            metrics.authority_score,
+            metrics.computed_at.isoformat(),
+        )
+
     def delete_stale(self, older_than: datetime) -> int:
         """Bulk delete rows whose ``computed_at`` predates ``older_than``.
 
@@ -405,57 +468,129 @@ class CitationInfluenceRepository:
         Raises:
             ValueError: If ``max_age_days`` is not positive.
         """
-        # Local import to avoid a circular import between
-        # influence_scorer (which imports the repository) and
-        # influence_repository (which would otherwise import the
-        # metrics model from the scorer at module load time).
-        from src.services.intelligence.citation.influence_scorer import (
-            InfluenceMetrics,
-        )
-
         if max_age_days <= 0:
             raise ValueError("max_age_days must be positive")
 
         def _get_once() -> Optional["InfluenceMetrics"]:
             with self._connect() as conn:
                 cursor = conn.execute(
-                    """
-                    SELECT paper_id, citation_count, citation_velocity,
-                           pagerank_score, hub_score, authority_score,
-                           computed_at
-                    FROM citation_influence_metrics
-                    WHERE paper_id = ?
-                    """,
+                    _SELECT_COLUMNS + " WHERE paper_id = ?",
                     (paper_id,),
                 )
                 row = cursor.fetchone()
             if row is None:
                 return None
-            computed_at = datetime.fromisoformat(row["computed_at"])
-            # H-1: ensure both sides of the comparison are timezone-aware
-            # UTC datetimes. ``computed_at`` is stored via
-            # ``.isoformat()`` from a ``datetime.now(timezone.utc)`` so
-            # it carries the "+00:00" suffix on Python 3.11+. Force UTC
-            # if the parsed value is somehow naive (older SQLite rows,
-            # test fixtures without tz suffix) so the comparison is
-            # always apples-to-apples.
-            if computed_at.tzinfo is None:
-                computed_at = computed_at.replace(tzinfo=timezone.utc)
-            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-            if computed_at < cutoff:
-                return None
-            return InfluenceMetrics(
-                paper_id=row["paper_id"],
-                citation_count=row["citation_count"],
-                citation_velocity=row["citation_velocity"],
-                pagerank_score=row["pagerank_score"],
-                hub_score=row["hub_score"],
-                authority_score=row["authority_score"],
-                computed_at=computed_at,
-            )
+            return self._row_to_metrics(row, max_age_days)
 
         return self._retry(
             _get_once,
             operation_name="influence_get_metrics",
             paper_id=paper_id,
         )
+
+    def get_many(
+        self,
+        paper_ids: list[str],
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    ) -> dict[str, "InfluenceMetrics"]:
+        """Batched :meth:`get_metrics`: fetch fresh rows for many papers.
+
+        Issues one ``SELECT`` per :data:`_GET_MANY_CHUNK_SIZE` ids
+        instead of one per paper. TTL semantics match
+        :meth:`get_metrics`.
+
+        Returns:
+            Mapping of ``paper_id`` → ``InfluenceMetrics`` for every id
+            with a fresh row. Misses and stale rows are absent.
+
+        Raises:
+            ValueError: If ``max_age_days`` is not positive.
+        """
+        if max_age_days <= 0:
+            raise ValueError("max_age_days must be positive")
+        unique_ids = list(dict.fromkeys(paper_ids))
+        if not unique_ids:
+            return {}
+
+        def _get_many_once() -> dict[str, "InfluenceMetrics"]:
+            found: dict[str, "InfluenceMetrics"] = {}
+            with self._connect() as conn:
+                for start in range(0, len(unique_ids), _GET_MANY_CHUNK_SIZE):
+                    chunk = unique_ids[start : start + _GET_MANY_CHUNK_SIZE]
+                    # Placeholders are built from a count, never from data.
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        _SELECT_COLUMNS + f" WHERE paper_id IN ({placeholders})",
+                        tuple(chunk),
+                    )
+                    for row in cursor.fetchall():
+                        metrics = self._row_to_metrics(row, max_age_days)
+                        if metrics is not None:
+                            found[metrics.paper_id] = metrics
+            return found
+
+        return self._retry(
+            _get_many_once,
+            operation_name="influence_get_many",
+            papers=len(unique_ids),
+        )
+
+    def list_computed_at(self) -> dict[str, datetime]:
+        """Return ``computed_at`` for every cached row, keyed by paper id.
+
+        Read by :meth:`InfluenceScorer.recompute_changed` to decide which
+        rows predate a change in their paper's neighbourhood. No TTL is
+        applied -- staleness is the caller's decision.
+        """
+
+        def _list_once() -> dict[str, datetime]:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "SELECT paper_id, computed_at FROM citation_influence_metrics"
+                )
+                rows = cursor.fetchall()
+            return {row["paper_id"]: _parse_utc(row["computed_at"]) for row in rows}
+
+        return self._retry(_list_once, operation_name="influence_list_computed_at")
+
+    @staticmethod
+    def _row_to_metrics(
+        row: sqlite3.Row, max_age_days: int
+    ) -> Optional["InfluenceMetrics"]:
+        """Parse one row, or ``None`` when it is older than the TTL."""
+        # Local import to avoid a circular import between
+        # influence_scorer (which imports the repository) and
+        # influence_repository (which would otherwise import the
+        # metrics model from the scorer at module load time).
+        from src.services.intelligence.citation.influence_scorer import (
+            InfluenceMetrics,
+        )
+
+        computed_at = _parse_utc(row["computed_at"])
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        if computed_at < cutoff:
+            return None
+        return InfluenceMetrics(
+            paper_id=row["paper_id"],
+            citation_count=row["citation_count"],
+            citation_velocity=row["citation_velocity"],
+            pagerank_score=row["pagerank_score"],
+            hub_score=row["hub_score"],
+            authority_score=row["authority_score"],
+            computed_at=computed_at,
+        )
+
+
+def _parse_utc(value: str) -> datetime:
+    """Parse a stored ``computed_at`` as a timezone-aware UTC datetime.
+
+    H-1: ``computed_at`` is stored via ``.isoformat()`` from a
+    ``datetime.now(timezone.utc)`` so it carries the "+00:00" suffix on
+    Python 3.11+. Force UTC if the parsed value is somehow naive (older
+    SQLite rows, test fixtures without tz suffix) so comparisons are
+    always apples-to-apples.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
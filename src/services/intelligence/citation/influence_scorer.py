@@ -7,8 +7,9 @@ Computes per-paper influence metrics over the citation graph:
 - ``pagerank_score`` — delegated to
   :func:`GraphAlgorithms.pagerank` (the single source of truth for
   PageRank in this codebase). We never reimplement PageRank here.
-- ``hub_score`` / ``authority_score`` — HITS power iteration on the
-  citation adjacency matrix. Skipped (zeros) when the graph exceeds
+- ``hub_score`` / ``authority_score`` — delegated to
+  :func:`GraphAlgorithms.hits`, which shares its sparse adjacency
+  matrix with the PageRank call. Skipped (zeros) when the graph exceeds
   ``MAX_GRAPH_NODES_FOR_HITS`` to bound CPU.
 
 Persistence
@@ -20,9 +21,12 @@ scorer no longer reaches around :class:`SQLiteGraphStore` to manage
 schemas the graph store does not own. ``compute_for_paper`` checks
 the cache first; if the row's ``computed_at`` is within ``CACHE_TTL``
 (7 days), the cached row is returned and the expensive PageRank /
-HITS work is skipped. ``compute_for_graph`` is the bulk variant: a
-single PageRank invocation covers all requested nodes, then each row
-is upserted via the repository.
+HITS work is skipped. ``compute_for_graph`` is the bulk variant: one
+batched cache read, a single PageRank / HITS invocation covering all
+misses, and one batched upsert via the repository.
+``recompute_changed`` is the incremental variant: it runs only once a
+paper's neighbourhood changed after its ``computed_at``, and then
+rewrites every row whose metrics the graph-global pass moved.
 
 Async safety
 ------------
@@ -51,6 +55,7 @@ Failure semantics
 from __future__ import annotations
 
 import asyncio
+import math
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -66,7 +71,11 @@ from src.services.intelligence.citation.influence_repository import (
     CitationInfluenceRepository,
 )
 from src.services.intelligence.models import EdgeType, NodeType
-from src.storage.intelligence_graph import GraphAlgorithms, SQLiteGraphStore
+from src.storage.intelligence_graph import (
+    GraphAdjacency,
+    GraphAlgorithms,
+    SQLiteGraphStore,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -102,6 +111,17 @@ DEFAULT_CACHE_TTL = timedelta(days=7)
 _HITS_MAX_ITERATIONS = 100
 _HITS_EPSILON = 1e-6
 
+# ``recompute_changed`` rewrites a cached row whose scores moved by more
+# than this (relative, or absolute near zero) -- the HITS precision
+# above, which downstream consumers cannot tell apart.
+_RECOMPUTE_SCORE_TOLERANCE = _HITS_EPSILON
+_RECOMPUTE_SCORE_FIELDS = (
+    "citation_velocity",
+    "pagerank_score",
+    "hub_score",
+    "authority_score",
+)
+
 # Strict allow-list imported from the canonical single source of truth
 # in _id_validation.py (H-A1). The scorer validates the post-normalization
 # canonical node-id pattern (no slashes — those were scrubbed by
@@ -268,10 +288,13 @@ class InfluenceScorer:
         the PageRank / HITS computation. Cached hits are returned
         directly without triggering a new graph-global computation.
 
-        One PageRank invocation covers all cache-miss ids; one HITS
-        invocation likewise. Each new row is written via
-        ``asyncio.to_thread`` so the event loop is never blocked.
-        Returns metrics in the same order as ``node_ids``.
+        The cache is read with one batched query; one PageRank
+        invocation covers all cache-miss ids, one HITS invocation
+        likewise, and every new row is written in a single
+        :meth:`CitationInfluenceRepository.record_many` transaction. All
+        repository calls go through ``asyncio.to_thread`` so the event
+        loop is never blocked. Returns metrics in the same order as
+        ``node_ids``.
 
         Raises:
             ValueError: If any ``node_id`` is malformed.
@@ -281,29 +304,24 @@ class InfluenceScorer:
         if not node_ids:
             return []
 
-        # Phase 1: consult cache for all requested ids.
-        max_age = self._max_age_days()
-        cache_hits: dict[str, InfluenceMetrics] = {}
-        cache_miss_ids: list[str] = []
-        for nid in node_ids:
-            cached = await asyncio.to_thread(
-                self._repo.get_metrics,
-                nid,
-                max_age,
-            )
-            if cached is not None:
-                cache_hits[nid] = cached
-            else:
-                cache_miss_ids.append(nid)
+        # Phase 1: consult cache for all requested ids in one batched read.
+        cache_hits = await asyncio.to_thread(
+            self._repo.get_many,
+            node_ids,
+            self._max_age_days(),
+        )
+        cache_miss_ids = [nid for nid in node_ids if nid not in cache_hits]
 
-        # Phase 2: compute PageRank + HITS only for cache misses.
+        # Phase 2: compute PageRank + HITS only for cache misses, then
+        # persist every new row in one transaction.
         newly_computed: dict[str, InfluenceMetrics] = {}
         if cache_miss_ids:
             newly_computed = await self._compute_metrics_for_graph(
                 target_ids=set(cache_miss_ids)
             )
-            for metrics in newly_computed.values():
-                await asyncio.to_thread(self._repo.record_metrics, metrics)
+            await asyncio.to_thread(
+                self._repo.record_many, list(newly_computed.values())
+            )
 
         # Phase 3: assemble results in original order.
         out: list[InfluenceMetrics] = []
@@ -318,6 +336,75 @@ class InfluenceScorer:
                 out.append(metrics)
         return out
 
+    async def recompute_changed(self) -> list[InfluenceMetrics]:
+        """Refresh cached metrics after the citation graph changed.
+
+        The refresh runs when a paper has no cached row, or when its node
+        row was updated or an incident CITES edge was added after the
+        row's ``computed_at``
+        (:meth:`SQLiteGraphStore._list_neighbourhood_changes`). PageRank
+        and HITS are graph-global, so one edge moves the scores of every
+        paper: the single PageRank + HITS pass covers all papers, and
+        every row that is missing, past its TTL, or whose metrics moved
+        beyond ``_RECOMPUTE_SCORE_TOLERANCE`` is written in one
+        ``record_many`` transaction.
+
+        Edge deletions leave no timestamp behind, so they are only picked
+        up by the next refresh or once cached rows go stale.
+
+        Returns:
+            The rewritten metrics, sorted by ``paper_id``. Empty when
+            nothing changed.
+        """
+        changed_at = await asyncio.to_thread(
+            self.store._list_neighbourhood_changes,
+            [EdgeType.CITES.value],
+            NodeType.PAPER,
+        )
+        computed_at = await asyncio.to_thread(self._repo.list_computed_at)
+        changed_ids = {
+            paper_id
+            for paper_id, changed in changed_at.items()
+            if paper_id not in computed_at or changed > computed_at[paper_id]
+        }
+        logger.info(
+            "influence_scorer_incremental_recompute",
+            changed=len(changed_ids),
+            total=len(changed_at),
+        )
+        if not changed_ids:
+            return []
+
+        computed = await self._compute_metrics_for_graph(target_ids=set(changed_at))
+        cached = await asyncio.to_thread(
+            self._repo.get_many, sorted(computed), self._max_age_days()
+        )
+        refreshed = [
+            computed[paper_id]
+            for paper_id in sorted(computed)
+            if paper_id in changed_ids
+            or not self._metrics_match(cached.get(paper_id), computed[paper_id])
+        ]
+        await asyncio.to_thread(self._repo.record_many, refreshed)
+        return refreshed
+
+    @staticmethod
+    def _metrics_match(
+        cached: Optional[InfluenceMetrics], fresh: InfluenceMetrics
+    ) -> bool:
+        """Whether a cached row still holds ``fresh``'s metrics."""
+        if cached is None or cached.citation_count != fresh.citation_count:
+            return False
+        return all(
+            math.isclose(
+                getattr(cached, field),
+                getattr(fresh, field),
+                rel_tol=_RECOMPUTE_SCORE_TOLERANCE,
+                abs_tol=_RECOMPUTE_SCORE_TOLERANCE,
+            )
+            for field in _RECOMPUTE_SCORE_FIELDS
+        )
+
     def _max_age_days(self) -> int:
         """Convert the scorer's ``cache_ttl`` to whole days for the repo.
 
@@ -361,18 +448,31 @@ class InfluenceScorer:
         graph-global computations cover every node, but we project to
         the requested subset to keep the cache write batch small.
 
-        PageRank delegates to ``GraphAlgorithms.pagerank`` (the single
-        source of truth for PageRank in this codebase). HITS is
-        implemented inline because no shared algorithm exists yet — and
-        is wrapped in ``asyncio.to_thread`` so its O(N*iter) inner loop
-        does not stall the event loop.
+        The CITES adjacency is loaded once into a sparse matrix
+        (:meth:`GraphAlgorithms.adjacency`) and shared by
+        ``GraphAlgorithms.pagerank`` and ``GraphAlgorithms.hits`` -- the
+        single source of truth for both algorithms in this codebase.
+        Loading and both power iterations run in ``asyncio.to_thread``
+        so they do not stall the event loop. Target nodes are hydrated
+        with one batched query.
         """
         # Query node count once; shared by both the PageRank and HITS gates
         # so we only pay for the COUNT(*) query once per invocation.
         node_count = self.store.get_node_count(node_type=NodeType.PAPER)
+        run_pagerank = node_count <= MAX_GRAPH_NODES_FOR_PAGERANK
+        run_hits = node_count <= MAX_GRAPH_NODES_FOR_HITS
+
+        adjacency: Optional[GraphAdjacency] = None
+        if run_pagerank or run_hits:
+            adjacency = await asyncio.to_thread(
+                GraphAlgorithms.adjacency,
+                self.store,
+                [EdgeType.CITES.value],
+                NodeType.PAPER,
+            )
 
         # PageRank gate (H-S2): skip on oversize graphs to bound CPU.
-        if node_count > MAX_GRAPH_NODES_FOR_PAGERANK:
+        if not run_pagerank:
             logger.warning(
                 "influence_scorer_pagerank_skipped_oversize_graph",
                 node_count=node_count,
@@ -387,10 +487,11 @@ class InfluenceScorer:
                 edge_types=[EdgeType.CITES.value],
                 damping=0.85,
                 node_type=NodeType.PAPER,
+                adjacency=adjacency,
             )
 
         # HITS — skipped on oversize graphs.
-        if node_count > MAX_GRAPH_NODES_FOR_HITS:
+        if not run_hits:
             logger.warning(
                 "influence_scorer_hits_skipped_oversize_graph",
                 node_count=node_count,
@@ -399,11 +500,17 @@ class InfluenceScorer:
             hub_scores: dict[str, float] = {}
             authority_scores: dict[str, float] = {}
         else:
-            hub_scores, authority_scores = await asyncio.to_thread(self._compute_hits)
+            hub_scores, authority_scores = await asyncio.to_thread(
+                self._compute_hits, adjacency
+            )
 
+        nodes = await asyncio.to_thread(
+            self.store._get_nodes_by_ids, sorted(target_ids)
+        )
+        computed_at = self._now()
         out: dict[str, InfluenceMetrics] = {}
         for paper_id in target_ids:
-            node = self.store.get_node(paper_id)
+            node = nodes.get(paper_id)
             citation_count = self._extract_citation_count(node)
             velocity = self._compute_velocity(node, paper_id)
             # PageRank scores from GraphAlgorithms can mathematically
@@ -419,70 +526,28 @@ class InfluenceScorer:
                 pagerank_score=pr,
                 hub_score=hub_scores.get(paper_id, 0.0),
                 authority_score=authority_scores.get(paper_id, 0.0),
-                computed_at=self._now(),
+                computed_at=computed_at,
             )
         return out
 
-    def _compute_hits(self) -> tuple[dict[str, float], dict[str, float]]:
-        """HITS power iteration on the CITES adjacency.
+    def _compute_hits(
+        self, adjacency: Optional[GraphAdjacency] = None
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """HITS over the CITES adjacency via :meth:`GraphAlgorithms.hits`.
 
         Convergence: max ``_HITS_MAX_ITERATIONS`` iterations or
         per-iteration delta below ``_HITS_EPSILON`` (whichever first).
+        Loads the adjacency from the store when none is supplied.
         Empty graphs return ({}, {}).
         """
-        node_ids = self.store._list_node_ids(node_type=NodeType.PAPER)
-        if not node_ids:
-            return {}, {}
-
-        edges = self.store._list_edges_by_types([EdgeType.CITES.value])
-        node_set = set(node_ids)
-        # incoming[v] = list of u where u -> v (citing -> cited)
-        # outgoing[u] = list of v where u -> v
-        incoming: dict[str, list[str]] = {nid: [] for nid in node_ids}
-        outgoing: dict[str, list[str]] = {nid: [] for nid in node_ids}
-        for source, target in edges:
-            if source in node_set and target in node_set:
-                outgoing[source].append(target)
-                incoming[target].append(source)
-
-        hubs: dict[str, float] = {nid: 1.0 for nid in node_ids}
-        authorities: dict[str, float] = {nid: 1.0 for nid in node_ids}
-
-        for _ in range(_HITS_MAX_ITERATIONS):
-            # Authority update: a(v) = sum of h(u) for all u -> v
-            new_authorities: dict[str, float] = {}
-            for nid in node_ids:
-                new_authorities[nid] = sum(hubs[u] for u in incoming[nid])
-            # Hub update: h(u) = sum of a(v) for all u -> v
-            new_hubs: dict[str, float] = {}
-            for nid in node_ids:
-                new_hubs[nid] = sum(new_authorities[v] for v in outgoing[nid])
-
-            # L2 normalize to prevent score blow-up.
-            auth_norm = self._l2_norm(new_authorities)
-            hub_norm = self._l2_norm(new_hubs)
-            if auth_norm > 0:
-                new_authorities = {k: v / auth_norm for k, v in new_authorities.items()}
-            if hub_norm > 0:
-                new_hubs = {k: v / hub_norm for k, v in new_hubs.items()}
-
-            # Convergence check on max delta across either vector.
-            delta = max(
-                max(abs(new_authorities[nid] - authorities[nid]) for nid in node_ids),
-                max(abs(new_hubs[nid] - hubs[nid]) for nid in node_ids),
-            )
-            authorities = new_authorities
-            hubs = new_hubs
-            if delta < _HITS_EPSILON:
-                break
-
-        return hubs, authorities
-
-    @staticmethod
-    def _l2_norm(scores: dict[str, float]) -> float:
-        """L2 norm of a score vector."""
-        total: float = sum(v * v for v in scores.values())
-        return float(total**0.5)
+        return GraphAlgorithms.hits(
+            self.store,
+            edge_types=[EdgeType.CITES.value],
+            max_iterations=_HITS_MAX_ITERATIONS,
+            epsilon=_HITS_EPSILON,
+            node_type=NodeType.PAPER,
+            adjacency=adjacency,
+        )
 
     def _compute_velocity(
         self, node, paper_id: str  # noqa: ANN001  - GraphNode | None
@@ -24,6 +24,11 @@ Spec mapping:
   aggressively, so we drop to 20 req/min when no email is configured.
 - Cost optimization (Section 11.3): citation lookups are cached on
   disk for 7 days (TTL configurable for tests).
+- Request efficiency: one keep-alive ``aiohttp`` session per client,
+  batched ``filter=openalex:W1|W2|...`` hydration for many works per
+  request (:meth:`OpenAlexCitationClient.get_papers`), a per-work
+  payload cache independent of relationship pagination, and in-flight
+  request coalescing so overlapping concurrent crawls share calls.
 """
 
 from __future__ import annotations
@@ -44,12 +49,17 @@ import aiohttp
 import diskcache
 import structlog
 
+from src.services.intelligence.citation._request_cache import (
+    PayloadLRU,
+    RequestCoalescer,
+)
 from src.services.intelligence.citation.models import (
     CitationEdge,
     CitationNode,
     make_paper_node_id,
 )
 from src.services.providers.base import APIError, RateLimitError
+from src.services.providers.rate_limits import openalex_rate_limiter
 from src.utils.rate_limiter import RateLimiter
 
 logger = structlog.get_logger(__name__)
@@ -75,6 +85,10 @@ _DEFAULT_MAX_RESULTS = 200
 # pipes) leaves ample headroom.
 _OPENALEX_ID_BATCH_SIZE = 50
 
+# Default size of the in-memory per-work payload LRU. Mirrors the S2
+# client: large enough to keep a whole depth-2 crawl resident.
+_DEFAULT_NODE_CACHE_SIZE = 10_000
+
 # Fields requested from OpenAlex for both endpoints. Matches the spec's
 # ``CitationNode`` schema; we also pull ``referenced_works`` so the
 # references path can resolve outgoing edges in a single hop.
@@ -180,7 +194,16 @@ class OpenAlexCitationClient:
     The ``polite_email_set`` bit segregates entries because the polite
     pool may return slightly fresher data; mixing them would let an
     anonymous call serve stale polite-pool results. Pass
-    ``cache_dir=None`` to disable caching entirely.
+    ``cache_dir=None`` to disable disk caching.
+
+    Work metadata is cached separately, per work: every payload the
+    client sees (seed lookups, hydrated references, citing-work pages)
+    lands in an in-memory LRU and, when enabled, the disk cache. All of
+    them use ``_OPENALEX_WORK_SELECT`` (including ``referenced_works``),
+    so a cached payload can serve a later seed lookup directly.
+
+    The client holds one keep-alive HTTP session; call :meth:`aclose`
+    (or use ``async with``) when done with it.
     """
 
     BASE_URL = "https://api.openalex.org"
@@ -192,6 +215,7 @@ class OpenAlexCitationClient:
         cache_dir: Optional[Path | str] = None,
         cache_ttl_seconds: int = _DEFAULT_CITATION_CACHE_TTL_SECONDS,
         request_timeout_seconds: float = 30.0,
+        node_cache_size: int = _DEFAULT_NODE_CACHE_SIZE,
     ) -> None:
         """Initialize the client.
 
@@ -217,6 +241,8 @@ class OpenAlexCitationClient:
                 is 7 days per spec Section 11.3; tests pass smaller
                 values to exercise expiration logic.
             request_timeout_seconds: Per-request HTTP timeout.
+            node_cache_size: Capacity of the in-memory per-work payload
+                LRU. ``0`` disables it (the disk layer still applies).
         """
         self.polite_email = (
             polite_email
@@ -237,11 +263,7 @@ class OpenAlexCitationClient:
                 _POLITE_EMAIL_WARNED = True
 
         if rate_limiter is None:
-            requests_per_minute = 60 if self.polite_email else 20
-            rate_limiter = RateLimiter(
-                requests_per_minute=requests_per_minute,
-                burst_size=10,
-            )
+            rate_limiter = openalex_rate_limiter(bool(self.polite_email))
         self.rate_limiter = rate_limiter
 
         self.request_timeout_seconds = request_timeout_seconds
@@ -259,6 +281,11 @@ class OpenAlexCitationClient:
             self._cache = diskcache.Cache(str(cache_path), timeout=cache_ttl_seconds)
             self._cache_ttl_seconds = cache_ttl_seconds
 
+        self._node_lru = PayloadLRU(node_cache_size)
+        self._coalescer = RequestCoalescer()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -308,6 +335,60 @@ class OpenAlexCitationClient:
             max_results=max_results,
         )
 
+    async def get_papers(self, paper_ids: list[str]) -> dict[str, CitationNode]:
+        """Hydrate many works' metadata in as few requests as possible.
+
+        Cached payloads are served locally; the rest are fetched with
+        ``filter=openalex:W1|W2|...`` in 50-id batches. Works already
+        being fetched by a concurrent call are awaited rather than
+        requested again.
+
+        Args:
+            paper_ids: OpenAlex work ids, bare or as full URLs.
+                Duplicates are collapsed.
+
+        Returns:
+            Mapping of requested id → :class:`CitationNode`. Works
+            OpenAlex does not return are omitted.
+
+        Raises:
+            ValueError: If any id fails validation. No request is made.
+        """
+        normalized = {pid: self._normalize_work_id(pid) for pid in paper_ids}
+        payloads = await self._get_work_payloads(
+            list(dict.fromkeys(normalized.values()))
+        )
+
+        nodes: dict[str, CitationNode] = {}
+        for requested_id, work_id in normalized.items():
+            payload = payloads.get(work_id)
+            if payload is None:
+                continue
+            try:
+                nodes[requested_id] = self._payload_to_node(payload)
+            except (ValueError, KeyError) as exc:
+                logger.warning(
+                    "openalex_citation_skip_invalid_node",
+                    endpoint="batch",
+                    seed_paper_id=work_id,
+                    error=str(exc),
+                )
+        return nodes
+
+    async def aclose(self) -> None:
+        """Close the keep-alive HTTP session and the disk cache."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self.close()
+
+    async def __aenter__(self) -> "OpenAlexCitationClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
@@ -338,7 +419,23 @@ class OpenAlexCitationClient:
             )
             return self._deserialize_payload(cached)
 
-        seed_payload = await self._fetch_work(normalized_id)
+        # Identical concurrent calls (overlapping crawls) share one fetch.
+        return await self._coalescer.run(
+            cache_key,
+            lambda: self._fetch_relationships_uncached(
+                endpoint, normalized_id, max_results, cache_key
+            ),
+        )
+
+    async def _fetch_relationships_uncached(
+        self,
+        endpoint: str,
+        normalized_id: str,
+        max_results: int,
+        cache_key: str,
+    ) -> tuple[CitationNode, list[CitationNode], list[CitationEdge]]:
+        """Relationship-cache miss path for :meth:`_fetch_relationships`."""
+        seed_payload = await self._get_work_payload(normalized_id)
         seed_node = self._payload_to_node(seed_payload)
 
         if endpoint == "references":
@@ -393,6 +490,96 @@ class OpenAlexCitationClient:
         )
         return result
 
+    async def _get_work_payload(self, work_id: str) -> dict[str, Any]:
+        """Return one work's payload, cache-first, coalesced per id."""
+        cached = self._node_payload_get(work_id)
+        if cached is not None:
+            return cached
+        future, owned = self._coalescer.claim(f"node|{work_id}")
+        if owned:
+            try:
+                payload = await self._fetch_work(work_id)
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            self._node_payloads_put([(work_id, payload)])
+            future.set_result(payload)
+        result: Optional[dict[str, Any]] = await future
+        if result is None:
+            # A concurrent batch lookup already learned the id is unknown.
+            raise APIError(f"Work not found on OpenAlex: {work_id}")
+        return result
+
+    async def _get_work_payloads(
+        self, work_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Resolve validated work ids to payloads.
+
+        Order of preference: payload cache, a concurrent in-flight fetch
+        of the same id, then batched ``filter=openalex:...`` requests for
+        whatever is left. Ids OpenAlex does not return are omitted.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        waiting: dict[str, asyncio.Future[Any]] = {}
+        owned: dict[str, asyncio.Future[Any]] = {}
+        for work_id in work_ids:
+            cached = self._node_payload_get(work_id)
+            if cached is not None:
+                found[work_id] = cached
+                continue
+            future, is_owner = self._coalescer.claim(f"node|{work_id}")
+            (owned if is_owner else waiting)[work_id] = future
+
+        owned_ids = list(owned)
+        try:
+            # Serial batches on purpose: OpenAlex's polite pool is tight
+            # enough that serial calls leave more headroom for retries,
+            # and the BFS crawler fans out concurrency at the layer above.
+            for i in range(0, len(owned_ids), _OPENALEX_ID_BATCH_SIZE):
+                chunk = owned_ids[i : i + _OPENALEX_ID_BATCH_SIZE]
+                # Each id was validated by ``_normalize_work_id`` so
+                # quoting is a no-op for legitimate inputs; we still
+                # quote each id individually as defense-in-depth (mirrors
+                # #C1 policy in ``_fetch_work`` / ``_fetch_citing_works``).
+                quoted_chunk = [quote(cid, safe="") for cid in chunk]
+                payload = await self._http_get(
+                    f"{self.BASE_URL}/works",
+                    params={
+                        "filter": "openalex:" + "|".join(quoted_chunk),
+                        "per-page": str(min(len(chunk), _OPENALEX_MAX_PER_PAGE)),
+                        "select": _OPENALEX_WORK_SELECT,
+                    },
+                )
+                # OpenAlex does not guarantee filter result order matches
+                # input, so map by id.
+                by_id: dict[str, dict[str, Any]] = {}
+                for row in payload.get("results") or []:
+                    row_id = self._extract_id(row)
+                    if row_id:
+                        by_id[row_id] = row
+                entries: list[tuple[str, dict[str, Any]]] = []
+                for work_id in chunk:
+                    row = by_id.get(work_id)
+                    if row is not None:
+                        found[work_id] = row
+                        entries.append((work_id, row))
+                        owned[work_id].set_result(row)
+                    else:
+                        # ``None`` = unknown id; waiters omit it.
+                        owned[work_id].set_result(None)
+                self._node_payloads_put(entries)
+        except BaseException as exc:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+
+        for work_id, future in waiting.items():
+            payload = await future
+            if payload is not None:
+                found[work_id] = payload
+        return found
+
     async def _fetch_work(self, work_id: str) -> dict[str, Any]:
         """Fetch a single work's metadata from OpenAlex.
 
@@ -417,7 +604,8 @@ class OpenAlexCitationClient:
         OpenAlex returns a list of work URLs (e.g.
         ``https://openalex.org/W12345``). To avoid one round-trip per
         reference we batch them in 50-id chunks via the
-        ``filter=openalex:W1|W2|...`` query.
+        ``filter=openalex:W1|W2|...`` query; works already in the payload
+        cache are not requested at all.
         """
         ref_urls = seed_payload.get("referenced_works") or []
         # ``_normalize_work_id`` now raises on hostile / malformed ids;
@@ -439,39 +627,9 @@ class OpenAlexCitationClient:
         if not ref_ids:
             return []
 
-        # Batch the ID list to keep the query string within reasonable
-        # bounds. ``asyncio.gather`` would cut latency further, but
-        # OpenAlex's polite pool is tight enough that serial calls
-        # leave more headroom for retries — and the BFS crawler in
-        # Week 2 will fan out concurrency at the layer above.
-        hydrated: list[dict[str, Any]] = []
-        for i in range(0, len(ref_ids), _OPENALEX_ID_BATCH_SIZE):
-            chunk = ref_ids[i : i + _OPENALEX_ID_BATCH_SIZE]
-            # Each id was validated by ``_normalize_work_id`` so quoting
-            # is a no-op for legitimate inputs; we still quote each id
-            # individually as defense-in-depth (mirrors #C1 policy in
-            # ``_fetch_work`` / ``_fetch_citing_works``).
-            quoted_chunk = [quote(cid, safe="") for cid in chunk]
-            payload = await self._http_get(
-                f"{self.BASE_URL}/works",
-                params={
-                    "filter": "openalex:" + "|".join(quoted_chunk),
-                    "per-page": str(min(len(chunk), _OPENALEX_MAX_PER_PAGE)),
-                    "select": _OPENALEX_WORK_SELECT,
-                },
-            )
-            hydrated.extend(payload.get("results") or [])
-
-        # Preserve the original ordering (OpenAlex does not guarantee
-        # filter result order matches input). We map by id then walk
-        # the original list.
-        by_id = {self._extract_id(p): p for p in hydrated if self._extract_id(p)}
-        ordered: list[dict[str, Any]] = []
-        for ref_id in ref_ids:
-            ref_payload = by_id.get(ref_id)
-            if ref_payload is not None:
-                ordered.append(ref_payload)
-        return ordered
+        payloads = await self._get_work_payloads(ref_ids)
+        # Preserve the original reference ordering.
+        return [payloads[ref_id] for ref_id in ref_ids if ref_id in payloads]
 
     async def _fetch_citing_works(
         self,
@@ -510,6 +668,9 @@ class OpenAlexCitationClient:
             if not results:
                 break
             collected.extend(results)
+            self._node_payloads_put(
+                [(rid, row) for row in results if (rid := self._extract_id(row))]
+            )
 
             meta = payload.get("meta") or {}
             total = meta.get("count")
@@ -522,6 +683,23 @@ class OpenAlexCitationClient:
 
         return collected[:max_results]
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client's keep-alive session, creating it lazily.
+
+        A session is bound to the event loop it was created on; callers
+        that drive the client from successive ``asyncio.run`` calls get
+        a fresh session per loop instead of a dead one.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
     async def _http_get(
         self,
         url: str,
@@ -529,6 +707,8 @@ class OpenAlexCitationClient:
     ) -> dict[str, Any]:
         """Issue a single GET to OpenAlex with rate limiting + error handling.
 
+        Reuses the client's keep-alive session.
+
         Distinguishes:
         - 200: returns the parsed JSON body (after a content-length cap
           check; oversized bodies raise ``APIError`` before parsing).
@@ -551,79 +731,78 @@ class OpenAlexCitationClient:
         if self.polite_email:
             request_params["mailto"] = self.polite_email
 
+        session = await self._get_session()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=request_params,
-                    timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
-                    # Disable automatic redirect-following: an upstream
-                    # 3xx pointing at an attacker-controlled host would
-                    # otherwise receive our ``mailto`` polite-pool
-                    # email plus any future auth header (#C2).
-                    allow_redirects=False,
-                ) as response:
-                    if response.status == 429:
-                        retry_after = self._parse_retry_after(
-                            response.headers.get("Retry-After")
-                        )
-                        raise RateLimitError(
-                            "OpenAlex rate limit exceeded",
-                            retry_after=retry_after,
-                        )
-                    # Explicit list of redirect statuses we reject:
-                    # 301/302/303/307/308 are the genuine redirects
-                    # that would otherwise leak our request to whatever
-                    # host the ``Location`` header names. 304 is *not*
-                    # a redirect (it's "Not Modified") so it must not
-                    # be treated as one.
-                    if response.status in (301, 302, 303, 307, 308):
-                        location = response.headers.get("Location", "<none>")
-                        # ``repr`` neutralises CRLF (renders ``\r\n``
-                        # as the literal escape) and the slice caps
-                        # length — a hostile upstream cannot inject
-                        # control characters or arbitrarily long
-                        # payloads into our exception message.
-                        safe_location = repr(location[:200])
-                        raise APIError(
-                            f"OpenAlex returned an unexpected redirect "
-                            f"({response.status} -> {safe_location}); "
-                            "redirects are disabled for SSRF protection."
-                        )
-                    if response.status == 404:
-                        text = await response.text()
-                        raise APIError(f"Work not found on OpenAlex (404): {text}")
-                    if response.status != 200:
-                        text = await response.text()
-                        raise APIError(f"OpenAlex error {response.status}: {text}")
-                    # Bound memory before parsing. First check the
-                    # advertised ``content_length`` — cheapest possible
-                    # rejection when the server tells us the size up
-                    # front (#C3).
-                    content_length = response.content_length
-                    if (
-                        content_length is not None
-                        and content_length > _MAX_RESPONSE_BYTES
-                    ):
-                        raise APIError(
-                            f"OpenAlex response too large: "
-                            f"{content_length} bytes > {_MAX_RESPONSE_BYTES} cap."
-                        )
-                    # Even when ``content_length`` is absent (chunked
-                    # transfer, gzip, etc.) we must enforce the cap —
-                    # ``response.json()`` would otherwise buffer
-                    # arbitrarily many bytes. Read at most one byte
-                    # over the cap so we can detect (and reject)
-                    # overruns without ever holding more than cap+1 in
-                    # memory.
-                    raw = await response.content.read(_MAX_RESPONSE_BYTES + 1)
-                    if len(raw) > _MAX_RESPONSE_BYTES:
-                        raise APIError(
-                            f"OpenAlex response exceeded "
-                            f"{_MAX_RESPONSE_BYTES} bytes (streaming/chunked)."
-                        )
-                    body: dict[str, Any] = json.loads(raw)
-                    return body
+            async with session.get(
+                url,
+                params=request_params,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+                # Disable automatic redirect-following: an upstream
+                # 3xx pointing at an attacker-controlled host would
+                # otherwise receive our ``mailto`` polite-pool
+                # email plus any future auth header (#C2).
+                allow_redirects=False,
+            ) as response:
+                if response.status == 429:
+                    retry_after = self._parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    error = RateLimitError(
+                        "OpenAlex rate limit exceeded",
+                        retry_after=retry_after,
+                    )
+                    await self.rate_limiter.record_throttled(retry_after)
+                    raise error
+                # Explicit list of redirect statuses we reject:
+                # 301/302/303/307/308 are the genuine redirects
+                # that would otherwise leak our request to whatever
+                # host the ``Location`` header names. 304 is *not*
+                # a redirect (it's "Not Modified") so it must not
+                # be treated as one.
+                if response.status in (301, 302, 303, 307, 308):
+                    location = response.headers.get("Location", "<none>")
+                    # ``repr`` neutralises CRLF (renders ``\r\n``
+                    # as the literal escape) and the slice caps
+                    # length — a hostile upstream cannot inject
+                    # control characters or arbitrarily long
+                    # payloads into our exception message.
+                    safe_location = repr(location[:200])
+                    raise APIError(
+                        f"OpenAlex returned an unexpected redirect "
+                        f"({response.status} -> {safe_location}); "
+                        "redirects are disabled for SSRF protection."
+                    )
+                if response.status == 404:
+                    text = await response.text()
+                    raise APIError(f"Work not found on OpenAlex (404): {text}")
+                if response.status != 200:
+                    text = await response.text()
+                    raise APIError(f"OpenAlex error {response.status}: {text}")
+                # Bound memory before parsing. First check the
+                # advertised ``content_length`` — cheapest possible
+                # rejection when the server tells us the size up
+                # front (#C3).
+                content_length = response.content_length
+                if content_length is not None and content_length > _MAX_RESPONSE_BYTES:
+                    raise APIError(
+                        f"OpenAlex response too large: "
+                        f"{content_length} bytes > {_MAX_RESPONSE_BYTES} cap."
+                    )
+                # Even when ``content_length`` is absent (chunked
+                # transfer, gzip, etc.) we must enforce the cap —
+                # ``response.json()`` would otherwise buffer
+                # arbitrarily many bytes. Read at most one byte
+                # over the cap so we can detect (and reject)
+                # overruns without ever holding more than cap+1 in
+                # memory.
+                raw = await response.content.read(_MAX_RESPONSE_BYTES + 1)
+                if len(raw) > _MAX_RESPONSE_BYTES:
+                    raise APIError(
+                        f"OpenAlex response exceeded "
+                        f"{_MAX_RESPONSE_BYTES} bytes (streaming/chunked)."
+                    )
+                body: dict[str, Any] = json.loads(raw)
+                return body
         except asyncio.TimeoutError as exc:
             raise APIError(
                 f"OpenAlex request timed out after " f"{self.request_timeout_seconds}s"
@@ -836,6 +1015,40 @@ class OpenAlexCitationClient:
         raw = f"{endpoint}|{paper_id}|{max_results}|polite={polite_bit}"
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+    def _node_cache_key(self, work_id: str) -> str:
+        """Disk key for one work's payload; segregated by polite pool like
+        :meth:`_cache_key` and independent of any ``max_results``."""
+        polite_bit = "1" if self.polite_email else "0"
+        raw = f"node|{work_id}|polite={polite_bit}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _node_payload_get(self, work_id: str) -> Optional[dict[str, Any]]:
+        """Look a work payload up in the LRU, then the disk cache."""
+        payload = self._node_lru.get(work_id)
+        if payload is not None:
+            return payload
+        raw = self._cache_get(self._node_cache_key(work_id))
+        if raw is None:
+            return None
+        payload = cast(dict[str, Any], json.loads(raw.decode("utf-8")))
+        self._node_lru.put(work_id, payload)
+        return payload
+
+    def _node_payloads_put(self, entries: list[tuple[str, dict[str, Any]]]) -> None:
+        """Store work payloads; disk writes share one transaction."""
+        if not entries:
+            return
+        for work_id, payload in entries:
+            self._node_lru.put(work_id, payload)
+        if self._cache is None:
+            return
+        with self._cache.transact():
+            for work_id, payload in entries:
+                self._cache_set(
+                    self._node_cache_key(work_id),
+                    json.dumps(payload).encode("utf-8"),
+                )
+
     def _cache_get(self, key: str) -> Optional[bytes]:
         if self._cache is None:
             return None
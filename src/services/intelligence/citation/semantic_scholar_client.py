@@ -20,6 +20,11 @@ Spec mapping:
   caller can override either value.
 - Cost optimization (Section 11.3): citation lookups are cached on
   disk for 7 days (TTL configurable for tests).
+- Request efficiency: one keep-alive ``aiohttp`` session per client,
+  ``POST /paper/batch`` hydration for many ids per request
+  (:meth:`SemanticScholarCitationClient.get_papers`), a per-paper
+  payload cache independent of relationship pagination, and in-flight
+  request coalescing so overlapping concurrent crawls share calls.
 """
 
 from __future__ import annotations
@@ -42,12 +47,17 @@ from src.services.intelligence.citation._id_validation import (
     PAPER_ID_MAX_LENGTH as _PAPER_ID_MAX_LENGTH,
     RAW_PROVIDER_ID_PATTERN as _PAPER_ID_PATTERN,
 )
+from src.services.intelligence.citation._request_cache import (
+    PayloadLRU,
+    RequestCoalescer,
+)
 from src.services.intelligence.citation.models import (
     CitationEdge,
     CitationNode,
     make_paper_node_id,
 )
 from src.services.providers.base import APIError, RateLimitError
+from src.services.providers.rate_limits import semantic_scholar_rate_limiter
 from src.utils.rate_limiter import RateLimiter
 
 logger = structlog.get_logger(__name__)
@@ -60,6 +70,14 @@ _DEFAULT_CITATION_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 # S2 hard cap on a single page of results.
 _S2_MAX_PAGE_LIMIT = 1000
 
+# S2 caps ``POST /paper/batch`` at 500 ids per request.
+_S2_BATCH_MAX_IDS = 500
+
+# Default size of the in-memory per-paper payload LRU. A depth-2 crawl
+# at the default level cap touches a few thousand papers; 10k payloads
+# (~1 KB each) keeps a whole crawl's neighbourhood resident.
+_DEFAULT_NODE_CACHE_SIZE = 10_000
+
 # Default per-call ceiling. Far below the spec's worst-case crawl-level
 # budget so a single ``get_references`` cannot pull thousands of pages.
 _DEFAULT_MAX_RESULTS = 200
@@ -129,8 +147,17 @@ class SemanticScholarCitationClient:
     Caching: each ``(endpoint, paper_id, max_results)`` triple is cached
     for ``cache_ttl_seconds`` (7 days by default). The cache is on disk
     via ``diskcache`` so it survives process restarts. Pass
-    ``cache_dir=None`` to disable caching entirely (used in tests that
+    ``cache_dir=None`` to disable disk caching (used in tests that
     need to assert HTTP behavior on each call).
+
+    Paper metadata is cached separately, per paper: every payload the
+    client sees (seed lookups, relationship rows, batch hydration) lands
+    in an in-memory LRU and, when enabled, the disk cache. A seed that
+    was already seen is therefore never re-fetched just because a
+    relationship call uses a different ``max_results``.
+
+    The client holds one keep-alive HTTP session; call :meth:`aclose`
+    (or use ``async with``) when done with it.
     """
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
@@ -142,6 +169,7 @@ class SemanticScholarCitationClient:
         cache_dir: Optional[Path | str] = None,
         cache_ttl_seconds: int = _DEFAULT_CITATION_CACHE_TTL_SECONDS,
         request_timeout_seconds: float = 30.0,
+        node_cache_size: int = _DEFAULT_NODE_CACHE_SIZE,
     ) -> None:
         """Initialize the client.
 
@@ -163,20 +191,15 @@ class SemanticScholarCitationClient:
                 is 7 days per spec Section 11.3; tests pass smaller
                 values to exercise expiration logic.
             request_timeout_seconds: Per-request HTTP timeout.
+            node_cache_size: Capacity of the in-memory per-paper payload
+                LRU. ``0`` disables it (the disk layer still applies).
         """
         self.api_key = (
             api_key if api_key is not None else os.getenv("SEMANTIC_SCHOLAR_API_KEY")
         )
 
         if rate_limiter is None:
-            # 100 req / 5min with an API key = 20 req/min effective.
-            # Without a key S2 enforces ~1 req/sec; we go a touch under
-            # at 12 req/min to leave headroom for retry storms.
-            requests_per_minute = 20 if self.api_key else 12
-            rate_limiter = RateLimiter(
-                requests_per_minute=requests_per_minute,
-                burst_size=5,
-            )
+            rate_limiter = semantic_scholar_rate_limiter(bool(self.api_key))
         self.rate_limiter = rate_limiter
 
         self.request_timeout_seconds = request_timeout_seconds
@@ -194,6 +217,11 @@ class SemanticScholarCitationClient:
             self._cache = diskcache.Cache(str(cache_path), timeout=cache_ttl_seconds)
             self._cache_ttl_seconds = cache_ttl_seconds
 
+        self._node_lru = PayloadLRU(node_cache_size)
+        self._coalescer = RequestCoalescer()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -241,17 +269,65 @@ class SemanticScholarCitationClient:
             max_results=max_results,
         )
 
+    async def get_papers(self, paper_ids: list[str]) -> dict[str, CitationNode]:
+        """Hydrate many papers' metadata in as few requests as possible.
+
+        Cached payloads are served locally; the rest go through S2's
+        ``POST /paper/batch`` endpoint in chunks of up to 500 ids. Ids
+        already being fetched by a concurrent call are awaited rather
+        than requested again.
+
+        Args:
+            paper_ids: S2-recognized ids (same forms as
+                :meth:`get_references`). Duplicates are collapsed.
+
+        Returns:
+            Mapping of requested id → :class:`CitationNode`. Ids S2 does
+            not know (or returns malformed) are omitted.
+
+        Raises:
+            ValueError: If any id fails validation. No request is made.
+        """
+        unique_ids = list(dict.fromkeys(paper_ids))
+        for paper_id in unique_ids:
+            self._validate_paper_id(paper_id)
+
+        payloads = await self._get_paper_payloads(unique_ids)
+
+        nodes: dict[str, CitationNode] = {}
+        for paper_id, payload in payloads.items():
+            try:
+                nodes[paper_id] = self._payload_to_node(payload)
+            except (ValueError, KeyError) as exc:
+                logger.warning(
+                    "s2_citation_skip_invalid_node",
+                    endpoint="batch",
+                    seed_paper_id=paper_id,
+                    error=str(exc),
+                )
+        return nodes
+
+    async def aclose(self) -> None:
+        """Close the keep-alive HTTP session and the disk cache."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self.close()
+
+    async def __aenter__(self) -> "SemanticScholarCitationClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
-    async def _fetch_relationships(
-        self,
-        endpoint: str,
-        paper_id: str,
-        max_results: int,
-    ) -> tuple[CitationNode, list[CitationNode], list[CitationEdge]]:
-        """Common path for ``get_references`` / ``get_citations``."""
+    @staticmethod
+    def _validate_paper_id(paper_id: str) -> None:
+        """Apply the strict id allow-list before any URL is built."""
         if not paper_id or not paper_id.strip():
             raise ValueError("paper_id must be a non-empty string")
         # Bound length before regex-matching: a multi-megabyte input
@@ -280,6 +356,15 @@ class SemanticScholarCitationClient:
                 f"Invalid paper_id format: {paper_id!r}. "
                 "Embedded URLs / path traversal sequences are not permitted."
             )
+
+    async def _fetch_relationships(
+        self,
+        endpoint: str,
+        paper_id: str,
+        max_results: int,
+    ) -> tuple[CitationNode, list[CitationNode], list[CitationEdge]]:
+        """Common path for ``get_references`` / ``get_citations``."""
+        self._validate_paper_id(paper_id)
         if max_results < 1:
             raise ValueError("max_results must be >= 1")
         if endpoint not in {"references", "citations"}:
@@ -297,11 +382,28 @@ class SemanticScholarCitationClient:
             )
             return self._deserialize_payload(cached)
 
-        # Cache miss — fetch the seed metadata and the related list in
-        # parallel. The seed metadata gives us authoritative title /
-        # year / citation_count to attach to the seed node, which the
-        # spec requires (REQ-9.2.1).
-        seed_task = asyncio.create_task(self._fetch_paper(paper_id))
+        # Identical concurrent calls (overlapping crawls) share one fetch.
+        return await self._coalescer.run(
+            cache_key,
+            lambda: self._fetch_relationships_uncached(
+                endpoint, paper_id, max_results, cache_key
+            ),
+        )
+
+    async def _fetch_relationships_uncached(
+        self,
+        endpoint: str,
+        paper_id: str,
+        max_results: int,
+        cache_key: str,
+    ) -> tuple[CitationNode, list[CitationNode], list[CitationEdge]]:
+        """Relationship-cache miss path for :meth:`_fetch_relationships`."""
+        # Fetch the seed metadata and the related list in parallel. The
+        # seed metadata gives us authoritative title / year /
+        # citation_count to attach to the seed node, which the spec
+        # requires (REQ-9.2.1). It usually comes from the per-paper
+        # cache, in which case only the relationship pages hit S2.
+        seed_task = asyncio.create_task(self._get_paper_payload(paper_id))
         rels_task = asyncio.create_task(
             self._fetch_relationship_pages(endpoint, paper_id, max_results)
         )
@@ -312,6 +414,7 @@ class SemanticScholarCitationClient:
 
         related_nodes: list[CitationNode] = []
         edges: list[CitationEdge] = []
+        seen_payloads: list[tuple[str, dict[str, Any]]] = []
         for entry in rel_payloads:
             related_payload = entry.get("citingPaper") or entry.get("citedPaper")
             if not related_payload:
@@ -319,6 +422,8 @@ class SemanticScholarCitationClient:
                 # body is missing (deleted record). Skip silently —
                 # there's nothing to add to the graph.
                 continue
+            if related_payload.get("paperId"):
+                seen_payloads.append((str(related_payload["paperId"]), related_payload))
 
             try:
                 related_node = self._payload_to_node(related_payload)
@@ -351,6 +456,9 @@ class SemanticScholarCitationClient:
 
         result = (seed_node, related_nodes, edges)
         self._cache_set(cache_key, self._serialize_payload(result))
+        # Neighbours carry the same fields as a seed lookup, so a later
+        # expansion of any of them starts with its metadata in hand.
+        self._node_payloads_put(seen_payloads)
         logger.info(
             "s2_citation_fetched",
             endpoint=endpoint,
@@ -359,6 +467,94 @@ class SemanticScholarCitationClient:
         )
         return result
 
+    async def _get_paper_payload(self, paper_id: str) -> dict[str, Any]:
+        """Return one paper's metadata payload, cache-first.
+
+        Misses are coalesced per id with :meth:`_get_paper_payloads`, so
+        a seed lookup and a concurrent batch hydration never request the
+        same paper twice.
+        """
+        cached = self._node_payload_get(paper_id)
+        if cached is not None:
+            return cached
+        future, owned = self._coalescer.claim(f"node|{paper_id}")
+        if owned:
+            try:
+                payload = await self._fetch_paper(paper_id)
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            self._node_payloads_put(self._payload_cache_entries(paper_id, payload))
+            future.set_result(payload)
+        result: Optional[dict[str, Any]] = await future
+        if result is None:
+            # A concurrent batch lookup already learned the id is unknown.
+            raise APIError(f"Paper not found on Semantic Scholar: {paper_id}")
+        return result
+
+    async def _get_paper_payloads(
+        self, paper_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Resolve many ids to payloads: cache, in-flight, then batch POST."""
+        found: dict[str, dict[str, Any]] = {}
+        waiting: dict[str, asyncio.Future[Any]] = {}
+        owned: dict[str, asyncio.Future[Any]] = {}
+        for paper_id in paper_ids:
+            cached = self._node_payload_get(paper_id)
+            if cached is not None:
+                found[paper_id] = cached
+                continue
+            future, is_owner = self._coalescer.claim(f"node|{paper_id}")
+            (owned if is_owner else waiting)[paper_id] = future
+
+        owned_ids = list(owned)
+        try:
+            for i in range(0, len(owned_ids), _S2_BATCH_MAX_IDS):
+                chunk = owned_ids[i : i + _S2_BATCH_MAX_IDS]
+                rows = await self._fetch_paper_batch(chunk)
+                entries: list[tuple[str, dict[str, Any]]] = []
+                for paper_id, row in zip(chunk, rows):
+                    if isinstance(row, dict) and row.get("paperId"):
+                        found[paper_id] = row
+                        entries.extend(self._payload_cache_entries(paper_id, row))
+                        owned[paper_id].set_result(row)
+                    else:
+                        # ``None`` = unknown id; waiters omit it.
+                        owned[paper_id].set_result(None)
+                self._node_payloads_put(entries)
+        except BaseException as exc:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+
+        for paper_id, future in waiting.items():
+            payload = await future
+            if payload is not None:
+                found[paper_id] = payload
+        return found
+
+    async def _fetch_paper_batch(
+        self, paper_ids: list[str]
+    ) -> list[Optional[dict[str, Any]]]:
+        """``POST /paper/batch`` for up to ``_S2_BATCH_MAX_IDS`` ids.
+
+        S2 answers with a list aligned to the input ids, holding
+        ``null`` for ids it cannot resolve. Ids travel in the JSON body,
+        never in the URL, so they need no quoting.
+        """
+        body = await self._http_post(
+            f"{self.BASE_URL}/paper/batch",
+            params={"fields": _S2_PAPER_FIELDS},
+            json_body={"ids": paper_ids},
+        )
+        if not isinstance(body, list) or len(body) != len(paper_ids):
+            raise APIError(
+                "Semantic Scholar batch response does not match the request "
+                f"({len(paper_ids)} ids)"
+            )
+        return body
+
     async def _fetch_paper(self, paper_id: str) -> dict[str, Any]:
         """Fetch the seed paper's own metadata."""
         # Quote the id so a DOI's ``/`` characters are treated as data
@@ -423,7 +619,46 @@ class SemanticScholarCitationClient:
         url: str,
         params: dict[str, str],
     ) -> dict[str, Any]:
-        """Issue a single GET to S2 with rate limiting + error handling.
+        """Issue a single GET to S2 (see :meth:`_http_request`)."""
+        body: dict[str, Any] = await self._http_request(url, params)
+        return body
+
+    async def _http_post(
+        self,
+        url: str,
+        params: dict[str, str],
+        json_body: dict[str, Any],
+    ) -> Any:
+        """Issue a single JSON POST to S2 (see :meth:`_http_request`)."""
+        return await self._http_request(url, params, json_body=json_body)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client's keep-alive session, creating it lazily.
+
+        A session is bound to the event loop it was created on; callers
+        that drive the client from successive ``asyncio.run`` calls get
+        a fresh session per loop instead of a dead one.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def _http_request(
+        self,
+        url: str,
+        params: dict[str, str],
+        json_body: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Issue a single request to S2 with rate limiting + error handling.
+
+        GET by default; POST with ``json_body`` when one is given. Both
+        reuse the client's keep-alive session.
 
         Distinguishes:
         - 200: returns the parsed JSON body (after a content-length cap
@@ -443,84 +678,82 @@ class SemanticScholarCitationClient:
         if self.api_key:
             headers["x-api-key"] = self.api_key
 
+        session = await self._get_session()
+        request_kwargs: dict[str, Any] = {
+            "params": params,
+            "headers": headers,
+            "timeout": aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+            # Disable automatic redirect-following: an upstream
+            # 3xx pointing at an attacker-controlled host would
+            # otherwise receive our ``x-api-key`` header.
+            "allow_redirects": False,
+        }
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
-                    # Disable automatic redirect-following: an upstream
-                    # 3xx pointing at an attacker-controlled host would
-                    # otherwise receive our ``x-api-key`` header.
-                    allow_redirects=False,
-                ) as response:
-                    if response.status == 429:
-                        retry_after = self._parse_retry_after(
-                            response.headers.get("Retry-After")
-                        )
-                        raise RateLimitError(
-                            "Semantic Scholar citation rate limit exceeded",
-                            retry_after=retry_after,
-                        )
-                    # Explicit list of redirect statuses we reject:
-                    # 301/302/303/307/308 are the genuine redirects that
-                    # would otherwise leak our ``x-api-key`` to whatever
-                    # host the ``Location`` header names. 304 is *not*
-                    # a redirect (it's "Not Modified" — caller's cached
-                    # copy is still good) so it must not be treated as
-                    # one (#S4).
-                    if response.status in (301, 302, 303, 307, 308):
-                        location = response.headers.get("Location", "<none>")
-                        # ``repr`` neutralises CRLF (renders ``\r\n`` as
-                        # the literal escape) and the slice caps length —
-                        # a hostile upstream cannot inject control
-                        # characters or arbitrarily long payloads into
-                        # our exception message (#S5).
-                        safe_location = repr(location[:200])
-                        raise APIError(
-                            f"Semantic Scholar returned an unexpected redirect "
-                            f"({response.status} -> {safe_location}); "
-                            "redirects are disabled for SSRF protection."
-                        )
-                    if response.status == 404:
-                        text = await response.text()
-                        raise APIError(
-                            f"Paper not found on Semantic Scholar (404): {text}"
-                        )
-                    if response.status != 200:
-                        text = await response.text()
-                        raise APIError(
-                            f"Semantic Scholar error {response.status}: {text}"
-                        )
-                    # Bound memory before parsing. First check the
-                    # advertised ``content_length`` — cheapest possible
-                    # rejection when the server tells us the size up
-                    # front.
-                    content_length = response.content_length
-                    if (
-                        content_length is not None
-                        and content_length > _MAX_RESPONSE_BYTES
-                    ):
-                        raise APIError(
-                            f"Semantic Scholar response too large: "
-                            f"{content_length} bytes > {_MAX_RESPONSE_BYTES} cap."
-                        )
-                    # Even when ``content_length`` is absent (chunked
-                    # transfer, gzip, etc.) we must enforce the cap —
-                    # ``response.json()`` would otherwise buffer
-                    # arbitrarily many bytes. Read at most one byte over
-                    # the cap so we can detect (and reject) overruns
-                    # without ever holding more than the cap+1 in
-                    # memory (#S6).
-                    raw = await response.content.read(_MAX_RESPONSE_BYTES + 1)
-                    if len(raw) > _MAX_RESPONSE_BYTES:
-                        raise APIError(
-                            f"Semantic Scholar response exceeded "
-                            f"{_MAX_RESPONSE_BYTES} bytes (streaming/chunked)."
-                        )
-                    body: dict[str, Any] = json.loads(raw)
-                    return body
+            if json_body is None:
+                request_cm = session.get(url, **request_kwargs)
+            else:
+                request_cm = session.post(url, json=json_body, **request_kwargs)
+            async with request_cm as response:
+                if response.status == 429:
+                    retry_after = self._parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    error = RateLimitError(
+                        "Semantic Scholar citation rate limit exceeded",
+                        retry_after=retry_after,
+                    )
+                    await self.rate_limiter.record_throttled(retry_after)
+                    raise error
+                # Explicit list of redirect statuses we reject:
+                # 301/302/303/307/308 are the genuine redirects that
+                # would otherwise leak our ``x-api-key`` to whatever
+                # host the ``Location`` header names. 304 is *not*
+                # a redirect (it's "Not Modified" — caller's cached
+                # copy is still good) so it must not be treated as
+                # one (#S4).
+                if response.status in (301, 302, 303, 307, 308):
+                    location = response.headers.get("Location", "<none>")
+                    # ``repr`` neutralises CRLF (renders ``\r\n`` as
+                    # the literal escape) and the slice caps length —
+                    # a hostile upstream cannot inject control
+                    # characters or arbitrarily long payloads into
+                    # our exception message (#S5).
+                    safe_location = repr(location[:200])
+                    raise APIError(
+                        f"Semantic Scholar returned an unexpected redirect "
+                        f"({response.status} -> {safe_location}); "
+                        "redirects are disabled for SSRF protection."
+                    )
+                if response.status == 404:
+                    text = await response.text()
+                    raise APIError(f"Paper not found on Semantic Scholar (404): {text}")
+                if response.status != 200:
+                    text = await response.text()
+                    raise APIError(f"Semantic Scholar error {response.status}: {text}")
+                # Bound memory before parsing. First check the
+                # advertised ``content_length`` — cheapest possible
+                # rejection when the server tells us the size up
+                # front.
+                content_length = response.content_length
+                if content_length is not None and content_length > _MAX_RESPONSE_BYTES:
+                    raise APIError(
+                        f"Semantic Scholar response too large: "
+                        f"{content_length} bytes > {_MAX_RESPONSE_BYTES} cap."
+                    )
+                # Even when ``content_length`` is absent (chunked
+                # transfer, gzip, etc.) we must enforce the cap —
+                # ``response.json()`` would otherwise buffer
+                # arbitrarily many bytes. Read at most one byte over
+                # the cap so we can detect (and reject) overruns
+                # without ever holding more than the cap+1 in
+                # memory (#S6).
+                raw = await response.content.read(_MAX_RESPONSE_BYTES + 1)
+                if len(raw) > _MAX_RESPONSE_BYTES:
+                    raise APIError(
+                        f"Semantic Scholar response exceeded "
+                        f"{_MAX_RESPONSE_BYTES} bytes (streaming/chunked)."
+                    )
+                return json.loads(raw)
         except asyncio.TimeoutError as exc:
             raise APIError(
                 f"Semantic Scholar request timed out after "
@@ -674,6 +907,54 @@ class SemanticScholarCitationClient:
         raw = f"{endpoint}|{paper_id}|{max_results}|auth={bool(self.api_key)}"
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+    def _node_cache_key(self, paper_id: str) -> str:
+        """Disk key for one paper's payload; segregated by auth like
+        :meth:`_cache_key` and independent of any ``max_results``."""
+        raw = f"node|{paper_id}|auth={bool(self.api_key)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _node_payload_get(self, paper_id: str) -> Optional[dict[str, Any]]:
+        """Look a paper payload up in the LRU, then the disk cache."""
+        payload = self._node_lru.get(paper_id)
+        if payload is not None:
+            return payload
+        raw = self._cache_get(self._node_cache_key(paper_id))
+        if raw is None:
+            return None
+        payload = cast(dict[str, Any], json.loads(raw.decode("utf-8")))
+        self._node_lru.put(paper_id, payload)
+        return payload
+
+    def _node_payloads_put(self, entries: list[tuple[str, dict[str, Any]]]) -> None:
+        """Store paper payloads; disk writes share one transaction."""
+        if not entries:
+            return
+        for paper_id, payload in entries:
+            self._node_lru.put(paper_id, payload)
+        if self._cache is None:
+            return
+        with self._cache.transact():
+            for paper_id, payload in entries:
+                self._cache_set(
+                    self._node_cache_key(paper_id),
+                    json.dumps(payload).encode("utf-8"),
+                )
+
+    @staticmethod
+    def _payload_cache_entries(
+        requested_id: str, payload: dict[str, Any]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Cache under the id the caller used *and* S2's canonical id.
+
+        A DOI- or arxiv-form lookup and a later lookup by S2 paperId
+        then hit the same entry.
+        """
+        entries = [(requested_id, payload)]
+        canonical = payload.get("paperId")
+        if canonical and str(canonical) != requested_id:
+            entries.append((str(canonical), payload))
+        return entries
+
     def _cache_get(self, key: str) -> Optional[bytes]:
         if self._cache is None:
             return None
@@ -69,6 +69,9 @@ from src.services.registry import RegistryService
 from src.storage.intelligence_graph.connection import _trunc
 
 if TYPE_CHECKING:
+    from src.services.intelligence.monitoring.search_coalescer import (
+        SearchCoalescer,
+    )
     from src.utils.query_expander import QueryExpander
 
 
@@ -173,6 +176,7 @@ class MultiProviderMonitor:
         max_calls: Optional[int] = None,
         time_window: Optional[tuple[date, date]] = None,
         max_papers: Optional[int] = None,
+        searches: Optional["SearchCoalescer"] = None,
     ) -> ArxivMonitorResult:
         """Run one expanded multi-provider monitoring cycle.
 
@@ -220,6 +224,11 @@ class MultiProviderMonitor:
                 ``ResearchTopic.max_papers`` for every provider call so
                 the provider never fetches more than the caller's budget
                 (H-2). When ``None`` the topic default (50) applies.
+            searches: Optional cycle-wide :class:`SearchCoalescer`.
+                When supplied, provider searches go through it so
+                equivalent searches from other subscriptions in the same
+                cycle share one fetch. When ``None``, every search calls
+                the provider directly.
 
         This method never raises — it always returns a result with a
         meaningful :class:`MonitoringRun` status.
@@ -287,7 +296,10 @@ class MultiProviderMonitor:
                         time_window=time_window,
                         max_papers=max_papers,
                     )
-                    results = await provider.search(topic)
+                    if searches is not None:
+                        results = await searches.search(source, provider, topic)
+                    else:
+                        results = await provider.search(topic)
                 except Exception as exc:
                     partial_failure = True
                     logger.warning(
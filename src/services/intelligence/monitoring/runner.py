@@ -19,14 +19,18 @@ Behavior contract
 1. Load active subscriptions through ``SubscriptionManager``
    (filtered by ``user_id`` when provided).
 2. For each subscription, call ``ArxivMonitor.check`` and capture the
-   resulting ``MonitoringRun``. **Failures on individual subs do not
-   abort the cycle** -- they're logged, captured as a ``FAILED`` run
-   record, and the loop continues.
-3. Score each paper via ``RelevanceScorer`` (LLM-based). Scorer
-   errors on individual papers are logged but do not abort the sub's
-   run. A scorer result of ``None`` (scored but skipped) is silently
-   dropped. Budget is capped at ``MAX_LLM_CALLS_PER_CYCLE`` total
-   calls across the whole cycle.
+   resulting ``MonitoringRun``. Subscriptions run concurrently (at most
+   ``max_concurrent_subscriptions`` at a time), and with a
+   ``MultiProviderMonitor`` their equivalent provider searches are
+   merged into one fetch per cycle via ``SearchCoalescer``. **Failures
+   on individual subs do not abort the cycle** -- they're logged,
+   captured as a ``FAILED`` run record, and the others continue.
+3. Score the papers via ``RelevanceScorer``: cached scores and
+   embedding-prefiltered clear misses cost nothing, the rest are scored
+   in multi-paper LLM batches. Scorer errors on individual papers or
+   batches are logged but do not abort the sub's run. Budget is capped
+   at ``MAX_LLM_CALLS_PER_CYCLE`` total calls (one per batch) across
+   the whole cycle.
 4. Persist every run (success + failure) through
    ``MonitoringRunRepository.record_run`` so the audit log is complete
    regardless of outcome.
@@ -70,17 +74,22 @@ from src.services.intelligence.monitoring.models import (
 )
 from src.storage.intelligence_graph.connection import _trunc
 from src.services.intelligence.monitoring.relevance_scorer import (
+    DEFAULT_PREFILTER_THRESHOLD,
     LLMResponseError,
     RelevanceScorer,
+    RelevanceScoreResult,
 )
 from src.services.intelligence.monitoring.run_repository import (
     MonitoringRunRepository,
 )
+from src.services.intelligence.monitoring.search_coalescer import SearchCoalescer
 from src.services.intelligence.monitoring.subscription_manager import (
     SubscriptionManager,
 )
 
 if TYPE_CHECKING:
+    from src.models.paper import PaperMetadata
+    from src.services.embeddings.embedding_service import EmbeddingService
     from src.services.llm.service import LLMService
     from src.services.providers.arxiv import ArxivProvider
     from src.services.providers.base import DiscoveryProvider
@@ -100,6 +109,12 @@ MAX_LLM_CALLS_PER_CYCLE = 5000
 # gives headroom for the ArXiv round-trips happening in parallel.
 _LLM_CONCURRENCY = 10
 
+# Subscriptions checked at the same time. Provider calls are the slow
+# part of a check; with searches coalesced across the cycle, a handful
+# in flight keeps the cycle time nearly flat as subscriptions grow
+# without multiplying the per-provider request rate.
+_SUBSCRIPTION_CONCURRENCY = 4
+
 # High-confidence low-reasoning sanity check: if a score is >= 0.95
 # but the reasoning is very short (< 30 chars), the LLM likely echoed
 # the prompt rather than producing a genuine assessment.
@@ -122,6 +137,7 @@ class MonitoringRunner:
         monitor: ArxivMonitor | MultiProviderMonitor,
         run_repo: MonitoringRunRepository,
         scorer: Optional[RelevanceScorer] = None,
+        max_concurrent_subscriptions: int = _SUBSCRIPTION_CONCURRENCY,
     ) -> None:
         """Initialize the runner.
 
@@ -139,11 +155,19 @@ class MonitoringRunner:
                 scoring. When ``None``, papers are returned unscored
                 (Week-1 compatible). Production callers should inject
                 a scorer built from the project-wide ``LLMService``.
+            max_concurrent_subscriptions: Upper bound on subscriptions
+                checked concurrently within one cycle.
+
+        Raises:
+            ValueError: If ``max_concurrent_subscriptions`` is not positive.
         """
+        if max_concurrent_subscriptions < 1:
+            raise ValueError("max_concurrent_subscriptions must be positive")
         self._subscriptions = subscription_manager
         self._monitor = monitor
         self._run_repo = run_repo
         self._scorer = scorer
+        self._max_concurrent_subscriptions = max_concurrent_subscriptions
 
     # ------------------------------------------------------------------
     # Public delegation methods (H-C1: encapsulate private attributes)
@@ -185,6 +209,8 @@ class MonitoringRunner:
         llm_service: Optional["LLMService"] = None,
         extra_providers: Optional["dict[PaperSource, DiscoveryProvider]"] = None,
         query_expander: Optional["QueryExpander"] = None,
+        embedding_service: Optional["EmbeddingService"] = None,
+        prefilter_threshold: float = DEFAULT_PREFILTER_THRESHOLD,
     ) -> "MonitoringRunner":
         """Convenience factory wiring the standard collaborators.
 
@@ -232,6 +258,13 @@ class MonitoringRunner:
                 coverage at ~1 cheap LLM call per subscription per
                 cycle. When ``None``, only the literal subscription
                 query is searched. (Tier 1.)
+            embedding_service: Optional ``EmbeddingService`` for the
+                scorer's cosine-similarity prefilter. Ignored without
+                ``llm_service``. When ``None``, every uncached paper is
+                sent to the LLM.
+            prefilter_threshold: Minimum paper/query cosine similarity
+                for a paper to be LLM-scored when ``embedding_service``
+                is supplied.
 
         Returns:
             A fully-wired, initialized ``MonitoringRunner`` ready for
@@ -289,7 +322,15 @@ class MonitoringRunner:
 
         repo = MonitoringRunRepository(db_path)
         repo.initialize()
-        scorer = RelevanceScorer(llm_service) if llm_service is not None else None
+        scorer = (
+            RelevanceScorer(
+                llm_service,
+                embedding_service=embedding_service,
+                prefilter_threshold=prefilter_threshold,
+            )
+            if llm_service is not None
+            else None
+        )
         return cls(
             subscription_manager=sub_mgr,
             monitor=monitor,
@@ -306,6 +347,11 @@ class MonitoringRunner:
                 every active subscription regardless of owner --
                 matching the Week-2 job's "global tick" behavior.
 
+        Subscriptions are checked concurrently under the
+        ``max_concurrent_subscriptions`` bound and share one
+        ``SearchCoalescer``, so overlapping provider searches within the
+        cycle are fetched once.
+
         Returns:
             The ``MonitoringRun`` for each subscription processed,
             in the same order they were loaded. Both successful and
@@ -327,10 +373,20 @@ class MonitoringRunner:
         sem = asyncio.Semaphore(_LLM_CONCURRENCY)
         llm_calls_used: list[int] = [0]  # mutable container for closure
 
-        runs: list[MonitoringRun] = []
-        for sub in active_subs:
-            run = await self._run_one(sub, sem=sem, llm_calls_used=llm_calls_used)
-            runs.append(run)
+        searches = SearchCoalescer()
+        sub_sem = asyncio.Semaphore(self._max_concurrent_subscriptions)
+
+        async def run_bounded(sub: ResearchSubscription) -> MonitoringRun:
+            async with sub_sem:
+                return await self._run_one(
+                    sub,
+                    sem=sem,
+                    llm_calls_used=llm_calls_used,
+                    searches=searches,
+                )
+
+        # gather preserves input order, so runs stay in subscription order
+        runs = list(await asyncio.gather(*(run_bounded(sub) for sub in active_subs)))
 
         succeeded = sum(1 for r in runs if r.status is not MonitoringRunStatus.FAILED)
         failed = sum(1 for r in runs if r.status is MonitoringRunStatus.FAILED)
@@ -340,27 +396,32 @@ class MonitoringRunner:
             succeeded=succeeded,
             failed=failed,
             user_id=user_id,
+            provider_fetches=searches.fetches,
+            searches_coalesced=searches.coalesced,
         )
         return runs
 
-    async def _score_paper(
+    async def _score_papers(
         self,
         subscription: ResearchSubscription,
-        paper: MonitoringPaperRecord,
+        papers: list[MonitoringPaperRecord],
         sem: asyncio.Semaphore,
         llm_calls_used: list[int],
     ) -> None:
-        """Score one paper in-place, respecting the budget cap + semaphore.
+        """Score a run's papers in-place: prefilter, then batched LLM calls.
 
-        On success, sets ``paper.relevance_score`` and
-        ``paper.relevance_reasoning``. On any error (LLM failure,
-        budget exhausted) the paper is left unscored -- the run is
-        not failed, only observability events are emitted.
+        ``RelevanceScorer.prefilter`` first resolves cached scores and
+        embedding-level clear misses at no LLM cost; the remaining papers
+        are scored ``scorer.batch_size`` at a time, each batch counting
+        as one call against the cycle budget. Papers that cannot be
+        scored (no URL, LLM failure, budget exhausted) are left
+        unscored -- the run is not failed, only observability events
+        are emitted.
 
         Args:
             subscription: The owning subscription (for prompt context).
-            paper: The ``MonitoringPaperRecord`` to score (mutated
-                in-place if successful).
+            papers: The run's ``MonitoringPaperRecord`` rows (mutated
+                in-place when scored).
             sem: Concurrency semaphore -- limits simultaneous LLM calls.
             llm_calls_used: Single-element list used as a mutable
                 counter shared across the cycle.
@@ -368,18 +429,6 @@ class MonitoringRunner:
         if self._scorer is None:
             return
 
-        # Budget guard: if we've hit the per-cycle cap, emit an audit
-        # event and bail rather than spending more.
-        if llm_calls_used[0] >= MAX_LLM_CALLS_PER_CYCLE:
-            logger.warning(
-                "monitoring_llm_budget_exhausted",
-                subscription_id=subscription.subscription_id,
-                paper_id=paper.paper_id,
-                max_calls=MAX_LLM_CALLS_PER_CYCLE,
-                calls_used=llm_calls_used[0],
-            )
-            return
-
         # We need a PaperMetadata-compatible object to pass to the scorer.
         # MonitoringPaperRecord carries title + url; reconstruct a minimal
         # PaperMetadata so the scorer can build its prompt. PaperMetadata
@@ -387,47 +436,123 @@ class MonitoringRunner:
         # URL for non-arXiv papers that have no provenance (C-2).
         from src.models.paper import PaperMetadata
 
-        if paper.url is None:
-            # Issue #141: include per-paper source so "why was this
-            # paper skipped?" queries can pivot on provider — non-arXiv
-            # papers more frequently land here because their feeds may
-            # not include URLs that pass PaperMetadata's HttpUrl
-            # validator.
-            logger.info(
-                "monitoring_relevance_score_skipped_no_url",
-                subscription_id=subscription.subscription_id,
-                paper_id=paper.paper_id,
-                source=paper.source.value,
-            )
+        records: dict[str, list[MonitoringPaperRecord]] = {}
+        candidates: list[PaperMetadata] = []
+        for paper in papers:
+            if paper.url is None:
+                # Issue #141: include per-paper source so "why was this
+                # paper skipped?" queries can pivot on provider — non-arXiv
+                # papers more frequently land here because their feeds may
+                # not include URLs that pass PaperMetadata's HttpUrl
+                # validator.
+                logger.info(
+                    "monitoring_relevance_score_skipped_no_url",
+                    subscription_id=subscription.subscription_id,
+                    paper_id=paper.paper_id,
+                    source=paper.source.value,
+                )
+                continue
+            if paper.paper_id not in records:
+                candidates.append(
+                    PaperMetadata(
+                        paper_id=paper.paper_id,
+                        title=paper.title,
+                        url=paper.url,  # type: ignore[arg-type]
+                    )
+                )
+            records.setdefault(paper.paper_id, []).append(paper)
+
+        if not candidates:
             return
 
-        paper_meta = PaperMetadata(
-            paper_id=paper.paper_id,
-            title=paper.title,
-            url=paper.url,  # type: ignore[arg-type]
+        resolved, pending = await self._scorer.prefilter(subscription, candidates)
+        for paper_id, score_result in resolved.items():
+            for record in records[paper_id]:
+                self._apply_score(subscription, record, score_result)
+
+        size = self._scorer.batch_size
+        await asyncio.gather(
+            *(
+                self._score_batch(
+                    subscription, pending[i : i + size], records, sem, llm_calls_used
+                )
+                for i in range(0, len(pending), size)
+            )
         )
 
+    async def _score_batch(
+        self,
+        subscription: ResearchSubscription,
+        batch: list["PaperMetadata"],
+        records: dict[str, list[MonitoringPaperRecord]],
+        sem: asyncio.Semaphore,
+        llm_calls_used: list[int],
+    ) -> None:
+        """Score one batch with a single LLM call, respecting the budget cap.
+
+        Args:
+            subscription: The owning subscription.
+            batch: Papers to score together (at most ``batch_size``).
+            records: Run records by ``paper_id`` to write scores into.
+            sem: Concurrency semaphore -- limits simultaneous LLM calls.
+            llm_calls_used: Shared cycle-wide LLM call counter.
+        """
+        assert self._scorer is not None  # checked by _score_papers
         async with sem:
-            llm_calls_used[0] += 1
-            try:
-                score_result = await self._scorer.score(subscription, paper_meta)
-            except LLMResponseError as exc:
+            # Budget guard: if we've hit the per-cycle cap, emit an audit
+            # event and bail rather than spending more. Checked under the
+            # semaphore so batches queued behind it see the final count.
+            if llm_calls_used[0] >= MAX_LLM_CALLS_PER_CYCLE:
                 logger.warning(
-                    "monitoring_relevance_score_failed",
+                    "monitoring_llm_budget_exhausted",
                     subscription_id=subscription.subscription_id,
-                    paper_id=paper.paper_id,
-                    error=_trunc(exc),
+                    paper_ids=[paper.paper_id for paper in batch],
+                    max_calls=MAX_LLM_CALLS_PER_CYCLE,
+                    calls_used=llm_calls_used[0],
                 )
                 return
+            llm_calls_used[0] += 1
+            try:
+                results = await self._scorer.score_batch(subscription, batch)
+            except LLMResponseError as exc:
+                for paper in batch:
+                    logger.warning(
+                        "monitoring_relevance_score_failed",
+                        subscription_id=subscription.subscription_id,
+                        paper_id=paper.paper_id,
+                        error=_trunc(exc),
+                    )
+                return
             except Exception as exc:
-                logger.error(
-                    "monitoring_relevance_score_unexpected_error",
+                for paper in batch:
+                    logger.error(
+                        "monitoring_relevance_score_unexpected_error",
+                        subscription_id=subscription.subscription_id,
+                        paper_id=paper.paper_id,
+                        error=_trunc(exc),
+                    )
+                return
+
+        for paper in batch:
+            score_result = results.get(paper.paper_id)
+            if score_result is None:
+                logger.warning(
+                    "monitoring_relevance_score_failed",
                     subscription_id=subscription.subscription_id,
                     paper_id=paper.paper_id,
-                    error=_trunc(exc),
+                    error="missing from batch response",
                 )
-                return
+                continue
+            for record in records[paper.paper_id]:
+                self._apply_score(subscription, record, score_result)
 
+    @staticmethod
+    def _apply_score(
+        subscription: ResearchSubscription,
+        paper: MonitoringPaperRecord,
+        score_result: RelevanceScoreResult,
+    ) -> None:
+        """Write ``score_result`` onto ``paper`` unless it fails the sanity guard."""
         # Sanity guard: reject suspiciously high scores with thin reasoning
         # (prompt-injection signal -- LLM echoed the prompt, H-S1).
         if (
@@ -452,6 +577,7 @@ class MonitoringRunner:
         *,
         sem: Optional[asyncio.Semaphore] = None,
         llm_calls_used: Optional[list[int]] = None,
+        searches: Optional[SearchCoalescer] = None,
     ) -> MonitoringRun:
         """Run one cycle for ``subscription``, persist + mark, return run.
 
@@ -461,10 +587,10 @@ class MonitoringRunner:
         ``MonitoringRun``; this layer additionally guards the persist
         + mark_checked steps so persistence outages don't propagate.
 
-        After the monitor returns, each paper is relevance-scored via
-        ``_score_paper`` (if a scorer is wired). Scoring errors on
-        individual papers are logged but never propagate to the run
-        level (Fail-Soft Boundary across independent peers).
+        After the monitor returns, the papers are relevance-scored via
+        ``_score_papers`` (if a scorer is wired). Scoring errors on
+        individual papers or batches are logged but never propagate to
+        the run level (Fail-Soft Boundary across independent peers).
         """
         try:
             # H-S1: pass budget counters to MultiProviderMonitor so the
@@ -476,6 +602,7 @@ class MonitoringRunner:
                     subscription,
                     llm_calls_used=llm_calls_used,
                     max_calls=MAX_LLM_CALLS_PER_CYCLE,
+                    searches=searches,
                 )
             else:
                 result = await self._monitor.check(subscription)
@@ -506,11 +633,7 @@ class MonitoringRunner:
             llm_calls_used = [0]
 
         if self._scorer is not None and run.status is not MonitoringRunStatus.FAILED:
-            scoring_tasks = [
-                self._score_paper(subscription, paper, sem, llm_calls_used)
-                for paper in run.papers
-            ]
-            await asyncio.gather(*scoring_tasks)
+            await self._score_papers(subscription, run.papers, sem, llm_calls_used)
 
         # C-1 fix: run the backfill step BEFORE record_run so the
         # real backfill_papers count is included in the persisted row.
@@ -538,6 +661,7 @@ class MonitoringRunner:
                     run,
                     papers_cap=backfill_cap,
                     llm_calls_used=llm_calls_used,
+                    searches=searches,
                 )
                 # backfill_papers is a first-class field on MonitoringRun
                 # (not a private attr hack). The field is persisted to
@@ -614,6 +738,7 @@ class MonitoringRunner:
         *,
         papers_cap: int = BACKFILL_MAX_PAPERS_PER_STEP,
         llm_calls_used: Optional[list[int]] = None,
+        searches: Optional[SearchCoalescer] = None,
     ) -> int:
         """Execute one backfill step for ``subscription``.
 
@@ -662,6 +787,9 @@ class MonitoringRunner:
                 expansion respects ``MAX_LLM_CALLS_PER_CYCLE``. ``None``
                 when the caller does not have a counter (e.g., direct
                 test calls).
+            searches: Cycle-wide ``SearchCoalescer`` threaded into
+                ``MultiProviderMonitor.check`` so subscriptions whose
+                backfill steps search the same window share fetches.
 
         Returns:
             Number of papers added from the backfill step (0 on skip or error).
@@ -710,6 +838,7 @@ class MonitoringRunner:
                     llm_calls_used=llm_calls_used,
                     max_calls=MAX_LLM_CALLS_PER_CYCLE,
                     max_papers=papers_cap,
+                    searches=searches,
                 )
             else:
                 backfill_result = await self._monitor.check(
@@ -0,0 +1,132 @@
+"""Cycle-scoped coalescing of provider searches across subscriptions.
+
+Why this module
+---------------
+Subscriptions with overlapping keywords send near-identical queries to
+the same providers: the literal queries often match once normalized, and
+query expansion tends to converge on the same variants. Run one after
+another, every subscription pays the full provider round-trip and every
+duplicate counts against the provider's rate limit.
+
+:class:`SearchCoalescer` lives for exactly one ``MonitoringRunner``
+cycle. ``MultiProviderMonitor.check`` routes each ``provider.search``
+through it, and searches that are equivalent within the cycle share one
+fetch:
+
+- **Key:** ``(source, normalized query, timeframe)``. Normalization
+  case-folds and collapses whitespace, which the providers ignore anyway.
+  Windows must match exactly: providers round windows differently, so a
+  wider fetch cannot be trimmed locally to a narrower window and still
+  give the same results.
+- **Caps:** a fetch capped at N papers serves any request for <= N
+  papers (first N results). It also serves larger requests when it came
+  back with fewer than N papers, because then it already holds every
+  match. Otherwise a larger fetch is issued and replaces the entry.
+- **Single flight:** concurrent requests wait for the in-flight fetch
+  instead of issuing their own. Failures are shared too -- every waiter
+  sees the provider error, just as if it had made the call itself.
+
+Each subscription then applies its own filters (source allowlist,
+per-cycle cap, registry identity resolution) to the shared results, so
+per-subscription outcomes are unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+import structlog
+
+from src.models.config.core import ResearchTopic
+from src.models.paper import PaperMetadata
+from src.services.intelligence.monitoring.models import PaperSource
+from src.services.providers.base import DiscoveryProvider
+
+__all__ = ["SearchCoalescer"]
+
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _Fetch:
+    """One provider call shared by every equivalent search in the cycle."""
+
+    max_papers: int
+    task: asyncio.Future[list[PaperMetadata]]
+
+    def covers(self, max_papers: int) -> bool:
+        """True if this fetch's results answer a request for ``max_papers``."""
+        if max_papers <= self.max_papers:
+            return True
+        if not self.task.done() or self.task.cancelled():
+            return False
+        if self.task.exception() is not None:
+            return False
+        return len(self.task.result()) < self.max_papers
+
+
+def _search_key(source: PaperSource, topic: ResearchTopic) -> tuple[str, str, str]:
+    """Key a search by provider, normalized query, and timeframe."""
+    return (
+        source.value,
+        " ".join(topic.query.lower().split()),
+        topic.timeframe.model_dump_json(),
+    )
+
+
+class SearchCoalescer:
+    """Merges equivalent provider searches issued during one cycle.
+
+    Attributes:
+        fetches: Provider calls actually made.
+        coalesced: Searches answered by another search's fetch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cycle."""
+        self._fetches: dict[tuple[str, str, str], _Fetch] = {}
+        self.fetches = 0
+        self.coalesced = 0
+
+    async def search(
+        self,
+        source: PaperSource,
+        provider: DiscoveryProvider,
+        topic: ResearchTopic,
+    ) -> list[PaperMetadata]:
+        """Search ``provider`` for ``topic``, sharing equivalent fetches.
+
+        Args:
+            source: The provider's source (part of the key).
+            provider: Provider to call if no equivalent fetch exists.
+            topic: The search; ``topic.max_papers`` caps the result.
+
+        Returns:
+            At most ``topic.max_papers`` papers, in provider order.
+
+        Raises:
+            Exception: Whatever the shared provider call raised.
+        """
+        key = _search_key(source, topic)
+        fetch = self._fetches.get(key)
+        if fetch is not None and fetch.covers(topic.max_papers):
+            self.coalesced += 1
+            logger.debug(
+                "monitor_search_coalesced",
+                source=source.value,
+                query=topic.query[:120],
+            )
+        else:
+            fetch = _Fetch(
+                max_papers=topic.max_papers,
+                task=asyncio.ensure_future(provider.search(topic)),
+            )
+            self._fetches[key] = fetch
+            self.fetches += 1
+
+        # Shield so a cancelled subscription does not cancel the fetch
+        # that other subscriptions are waiting on.
+        results = await asyncio.shield(fetch.task)
+        return results[: topic.max_papers]
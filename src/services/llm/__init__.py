@@ -7,6 +7,7 @@ This package provides:
 - Provider implementations (Anthropic, Google)
 - Cost tracking and budget enforcement
 - Prompt building and response parsing
+- Batch-submission mode (provider batch jobs)
 
 Usage:
     from src.services.llm import LLMService
@@ -18,10 +19,16 @@ Example:
 """
 
 from src.services.llm.service import LLMService
+from src.services.llm.batch import BatchExtractor, LocalBatchProvider
 from src.services.llm.cost_tracker import CostTracker
 from src.services.llm.prompt_builder import PromptBuilder
 from src.services.llm.response_parser import ResponseParser
-from src.services.llm.providers.base import LLMProvider, LLMResponse, ProviderHealth
+from src.services.llm.providers.base import (
+    BatchProvider,
+    LLMProvider,
+    LLMResponse,
+    ProviderHealth,
+)
 from src.services.llm.exceptions import (
     LLMProviderError,
     RateLimitError,
@@ -39,10 +46,13 @@ __all__ = [
     "CostTracker",
     "PromptBuilder",
     "ResponseParser",
+    "BatchExtractor",
+    "LocalBatchProvider",
     # Provider abstractions
     "LLMProvider",
     "LLMResponse",
     "ProviderHealth",
+    "BatchProvider",
     # Exceptions
     "LLMProviderError",
     "RateLimitError",
@@ -0,0 +1,460 @@
+"""Batch Extraction Module
+
+Submits extraction requests as provider batch jobs instead of one
+interactive call per paper. Batch jobs are billed at half the
+interactive price and are not subject to the interactive rate limits;
+their results arrive asynchronously, typically within minutes to hours,
+which suits nightly runs and backfills where nobody waits on a paper.
+
+This module handles (the BatchProvider interface lives with the other
+provider abstractions in providers.base):
+- LocalBatchProvider: file-backed stand-in that runs requests through
+  an ordinary provider, for offline runs and tests
+- BatchExtractor: collects a run's extractions into batch jobs,
+  checkpoints the submitted batch IDs and maps results back onto papers
+"""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from src.models.extraction import ExtractionTarget, PaperExtraction
+from src.models.llm import BatchConfig
+from src.models.paper import PaperMetadata
+from src.services.llm.exceptions import LLMProviderError
+from src.services.llm.map_reduce import estimate_tokens
+from src.services.llm.providers.base import (
+    BatchProvider,
+    BatchRequest,
+    BatchResult,
+    LLMProvider,
+    LLMResponse,
+)
+
+if TYPE_CHECKING:
+    from src.services.checkpoint_service import CheckpointService
+    from src.services.llm.service import LLMService
+
+logger = structlog.get_logger()
+
+# Consecutive failed polls before a batch's papers are failed; the batch
+# stays checkpointed, so the next run resumes polling it
+MAX_POLL_FAILURES = 5
+
+
+class LocalBatchProvider(BatchProvider):
+    """File-backed stand-in for a provider batch API.
+
+    ``submit`` writes the requests to ``<batch_dir>/<batch_id>.requests.jsonl``;
+    the batch ends on its first poll after ``ready_after_polls`` polls,
+    when every request is run through the wrapped provider and the results
+    are written to ``<batch_id>.results.jsonl``. Batches live on disk, so
+    another instance over the same directory (a resumed run) can poll them.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        batch_dir: Path,
+        ready_after_polls: int = 0,
+    ):
+        """Initialize local batch provider.
+
+        Args:
+            provider: Provider that answers the requests
+            batch_dir: Directory holding the batch files
+            ready_after_polls: Polls answered "still running" per batch
+        """
+        super().__init__(provider)
+        self.batch_dir = Path(batch_dir)
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        self.ready_after_polls = ready_after_polls
+        self._polls: Dict[str, int] = {}
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        """Write requests to a new batch file."""
+        batch_id = f"local-{uuid.uuid4().hex}"
+        self._write_lines(
+            self._path(batch_id, "requests"), [asdict(r) for r in requests]
+        )
+        logger.debug("local_batch_submitted", batch_id=batch_id, requests=len(requests))
+        return batch_id
+
+    async def poll(self, batch_id: str) -> Optional[List[BatchResult]]:
+        """Return the batch results, running the batch when it is due."""
+        results_path = self._path(batch_id, "results")
+        if results_path.exists():
+            return [self._load_result(line) for line in self._read_lines(results_path)]
+
+        requests_path = self._path(batch_id, "requests")
+        if not requests_path.exists():
+            raise LLMProviderError(f"Unknown batch: {batch_id}", provider=self.name)
+
+        self._polls[batch_id] = self._polls.get(batch_id, 0) + 1
+        if self._polls[batch_id] <= self.ready_after_polls:
+            return None
+
+        results = [
+            await self._run(BatchRequest(**data))
+            for data in self._read_lines(requests_path)
+        ]
+        self._write_lines(results_path, [self._dump_result(r) for r in results])
+        logger.debug("local_batch_ended", batch_id=batch_id, results=len(results))
+        return results
+
+    async def _run(self, request: BatchRequest) -> BatchResult:
+        try:
+            response = await self.provider.generate(
+                prompt=request.prompt,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature,
+                system_prompt=request.system,
+            )
+        except Exception as e:
+            return BatchResult(custom_id=request.custom_id, error=str(e))
+        return BatchResult(custom_id=request.custom_id, response=response)
+
+    def _path(self, batch_id: str, kind: str) -> Path:
+        return self.batch_dir / f"{batch_id}.{kind}.jsonl"
+
+    @staticmethod
+    def _write_lines(path: Path, records: List[dict]) -> None:
+        # Atomic write: a crash never leaves a half-written batch file
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(
+            "".join(json.dumps(r, default=str) + "\n" for r in records),
+            encoding="utf-8",
+        )
+        temp_path.rename(path)
+
+    @staticmethod
+    def _read_lines(path: Path) -> List[dict]:
+        return [
+            json.loads(line)
+            for line in path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+
+    @staticmethod
+    def _dump_result(result: BatchResult) -> dict:
+        response = None
+        if result.response is not None:
+            response = asdict(result.response)
+            response.pop("timestamp")
+        return {
+            "custom_id": result.custom_id,
+            "response": response,
+            "error": result.error,
+        }
+
+    @staticmethod
+    def _load_result(data: dict) -> BatchResult:
+        response = data.get("response")
+        return BatchResult(
+            custom_id=data["custom_id"],
+            response=LLMResponse(**response) if response else None,
+            error=data.get("error"),
+        )
+
+
+class BatchExtractor:
+    """Collects one run's extractions into provider batch jobs.
+
+    ``extract`` queues a paper and waits for the batch that carries it. A
+    batch is submitted once it holds ``max_batch_size`` requests, or
+    ``flush_interval_seconds`` after its first request, and is polled
+    every ``poll_interval_seconds``. Submitted batch IDs are checkpointed
+    under ``run_id`` until their results are collected: a run that
+    crashes resumes polling them (see ``start``) instead of paying for
+    the same extractions again. A resumed batch none of whose papers the
+    run asked for is dropped from the checkpoint on ``aclose``.
+
+    A batch's estimated cost is reserved with the LLM service when it is
+    submitted and released once its results are billed, so batches in
+    flight count against the spending limits.
+
+    Papers whose prompt exceeds the section token threshold are
+    extracted interactively, section by section (LLMService.extract),
+    holding a slot of ``llm_semaphore`` like any interactive extraction.
+    """
+
+    def __init__(
+        self,
+        llm_service: "LLMService",
+        batch_provider: BatchProvider,
+        checkpoint_service: "CheckpointService",
+        run_id: str,
+        targets: List[ExtractionTarget],
+        config: BatchConfig,
+        llm_semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        """Initialize batch extractor.
+
+        Args:
+            llm_service: Service that builds prompts and accounts for results
+            batch_provider: Provider to submit batch jobs to
+            checkpoint_service: Checkpoint store for submitted batch IDs
+            run_id: Checkpoint key; reuse it to resume a crashed run
+            targets: Extraction targets shared by every paper of the run
+            config: Batch sizing and timing
+            llm_semaphore: Bounds interactive extractions of long papers
+                (unbounded if None)
+        """
+        self.llm_service = llm_service
+        self.batch_provider = batch_provider
+        self.checkpoint_service = checkpoint_service
+        self.run_id = run_id
+        self.targets = targets
+        self.config = config
+        self.llm_semaphore = llm_semaphore
+
+        # Batches awaiting collection: batch id -> paper IDs, request order
+        self._batches: Dict[str, List[str]] = {}
+        self._resumed: Set[str] = set()
+        self._requested: Set[str] = set()
+        self._futures: Dict[str, "asyncio.Future[PaperExtraction]"] = {}
+        self._open: List[Tuple[PaperMetadata, str]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self) -> int:
+        """Resume polling the batches a previous run left checkpointed.
+
+        Must be called from a running event loop, before ``extract``.
+
+        Returns:
+            Number of resumed batches
+        """
+        self._batches = dict(self.checkpoint_service.get_batches(self.run_id))
+        self._resumed = set(self._batches)
+        for batch_id, paper_ids in self._batches.items():
+            for paper_id in paper_ids:
+                self._future(paper_id)
+            self._spawn(paper_ids, self._collect(batch_id))
+
+        if self._batches:
+            logger.info(
+                "batch_polling_resumed",
+                run_id=self.run_id,
+                batches=len(self._batches),
+                papers=sum(len(ids) for ids in self._batches.values()),
+            )
+        return len(self._batches)
+
+    async def extract(
+        self, markdown_content: str, paper_metadata: PaperMetadata
+    ) -> PaperExtraction:
+        """Extract from a paper through a batch job.
+
+        Args:
+            markdown_content: Full paper in markdown format
+            paper_metadata: Paper metadata for context
+
+        Returns:
+            PaperExtraction with results
+
+        Raises:
+            CostLimitExceeded: If cost limits were reached before submission
+            LLMAPIError: If the paper's request failed in its batch
+        """
+        paper_id = paper_metadata.paper_id
+        self._requested.add(paper_id)
+        future = self._futures.get(paper_id)
+        if future is None:
+            if self.llm_service.needs_sections(
+                markdown_content, self.targets, paper_metadata
+            ):
+                async with self.llm_semaphore or contextlib.nullcontext():
+                    return await self.llm_service.extract(
+                        markdown_content, self.targets, paper_metadata
+                    )
+
+            future = self._future(paper_id)
+            self._open.append((paper_metadata, markdown_content))
+            if len(self._open) >= self.config.max_batch_size:
+                self._flush()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_later())
+
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop flushing and polling; clear the checkpoint if nothing is pending.
+
+        Batches this run submitted, or resumed and still waits on, stay
+        checkpointed for the next run. A resumed batch none of whose
+        papers were requested is dropped: the run no longer needs those
+        papers, so nothing would ever collect it.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for future in self._futures.values():
+            if future.done() and not future.cancelled():
+                future.exception()  # resumed results nobody asked for
+            else:
+                future.cancel()
+
+        abandoned = [
+            batch_id
+            for batch_id in self._resumed & self._batches.keys()
+            if self._requested.isdisjoint(self._batches[batch_id])
+        ]
+        for batch_id in abandoned:
+            logger.info(
+                "batch_abandoned",
+                run_id=self.run_id,
+                batch_id=batch_id,
+                papers=len(self._batches.pop(batch_id)),
+            )
+
+        if not self._batches:
+            self.checkpoint_service.clear_checkpoint(self.run_id)
+        elif abandoned:
+            self.checkpoint_service.save_batches(self.run_id, self._batches)
+
+    def _future(self, paper_id: str) -> "asyncio.Future[PaperExtraction]":
+        if paper_id not in self._futures:
+            self._futures[paper_id] = asyncio.get_running_loop().create_future()
+        return self._futures[paper_id]
+
+    def _spawn(self, paper_ids: List[str], coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(self._guard(paper_ids, coro))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        # A task cancelled before it ran never awaited ``coro``
+        task.add_done_callback(lambda _: coro.close())
+
+    async def _guard(
+        self, paper_ids: List[str], coro: Coroutine[Any, Any, None]
+    ) -> None:
+        """Run ``coro``; if it fails, fail every paper still waiting on it."""
+        try:
+            await coro
+        except Exception as e:
+            for paper_id in paper_ids:
+                future = self._future(paper_id)
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.config.flush_interval_seconds)
+        self._flush_task = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Submit the open batch."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        papers, self._open = self._open, []
+        if papers:
+            self._spawn([paper.paper_id for paper, _ in papers], self._submit(papers))
+
+    async def _submit(self, papers: List[Tuple[PaperMetadata, str]]) -> None:
+        requests = [
+            self.llm_service.batch_request(
+                _custom_id(index), markdown, self.targets, paper
+            )
+            for index, (paper, markdown) in enumerate(papers)
+        ]
+        # Held until the batch's results are billed (or it stops being
+        # polled), so batches in flight count against the limits
+        reservation = self._estimate_cost(requests)
+        self.llm_service.reserve_cost(reservation)
+        try:
+            batch_id = await self.batch_provider.submit(requests)
+
+            self._batches[batch_id] = [paper.paper_id for paper, _ in papers]
+            self.checkpoint_service.save_batches(self.run_id, self._batches)
+            logger.info(
+                "batch_submitted",
+                run_id=self.run_id,
+                batch_id=batch_id,
+                provider=self.batch_provider.name,
+                requests=len(requests),
+                reserved_usd=reservation,
+            )
+
+            await self._collect(batch_id)
+        finally:
+            self.llm_service.release_cost(reservation)
+
+    def _estimate_cost(self, requests: List[BatchRequest]) -> float:
+        """Estimate a batch's cost, assuming every request uses max_tokens."""
+        provider = self.batch_provider.provider
+        cost = sum(
+            provider.calculate_cost(
+                estimate_tokens(request.system + request.prompt), request.max_tokens
+            )
+            for request in requests
+        )
+        return cost * self.batch_provider.price_factor
+
+    async def _collect(self, batch_id: str) -> None:
+        """Poll a batch until it ends and resolve its papers."""
+        paper_ids = self._batches[batch_id]
+        failures = 0
+        while True:
+            try:
+                results = await self.batch_provider.poll(batch_id)
+            except Exception as e:
+                failures += 1
+                logger.warning(
+                    "batch_poll_failed",
+                    batch_id=batch_id,
+                    failures=failures,
+                    error=str(e),
+                )
+                if failures >= MAX_POLL_FAILURES:
+                    raise
+                results = None
+            else:
+                failures = 0
+            if results is not None:
+                break
+            await asyncio.sleep(self.config.poll_interval_seconds)
+
+        by_id = {result.custom_id: result for result in results}
+        succeeded = 0
+        for index, paper_id in enumerate(paper_ids):
+            result = by_id.get(_custom_id(index)) or BatchResult(
+                custom_id=_custom_id(index), error="No result in batch"
+            )
+            future = self._future(paper_id)
+            try:
+                extraction = self.llm_service.batch_extraction(
+                    result, self.batch_provider, self.targets, paper_id
+                )
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            succeeded += 1
+            if not future.done():
+                future.set_result(extraction)
+
+        del self._batches[batch_id]
+        self.checkpoint_service.save_batches(self.run_id, self._batches)
+        logger.info(
+            "batch_collected",
+            run_id=self.run_id,
+            batch_id=batch_id,
+            papers=len(paper_ids),
+            succeeded=succeeded,
+        )
+
+
+def _custom_id(index: int) -> str:
+    # Paper IDs may contain characters batch APIs reject in custom IDs
+    return f"paper-{index}"
@@ -84,16 +84,22 @@ class ProviderUsage:
     failed_requests: int = 0
     retry_requests: int = 0
     fallback_requests: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     def record_success(
         self,
         tokens: int,
         cost: float,
         was_retry: bool = False,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
         """Record a successful request."""
         self.tokens += tokens
         self.cost_usd += cost
+        self.cache_read_tokens += cache_read_tokens
+        self.cache_write_tokens += cache_write_tokens
         self.requests += 1
         self.successful_requests += 1
         if was_retry:
@@ -122,12 +128,16 @@ class CostTracker:
         papers_processed: Number of papers processed
         last_reset: Timestamp of last daily reset
         by_provider: Per-provider usage statistics
+        cache_read_tokens: Input tokens served from provider prompt caches
+        cache_write_tokens: Input tokens written to provider prompt caches
     """
 
     limits: CostLimits
     total_tokens: int = 0
     total_cost_usd: float = 0.0
     papers_processed: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     last_reset: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     by_provider: Dict[str, ProviderUsage] = field(default_factory=dict)
 
@@ -149,26 +159,38 @@ class CostTracker:
         provider: str,
         was_retry: bool = False,
         is_fallback: bool = False,
+        count_paper: bool = True,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
         """Record token usage and cost.
 
         Args:
-            tokens: Number of tokens used
+            tokens: Number of tokens used (cached input included)
             cost: Cost in USD
             provider: Provider name (anthropic, google)
             was_retry: Whether this was a retry attempt
             is_fallback: Whether this used fallback provider
+            count_paper: Whether the request completed a paper (False for
+                the section-level requests of a map-reduce extraction)
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
         """
         self._check_daily_reset()
 
         self.total_tokens += tokens
         self.total_cost_usd += cost
-        self.papers_processed += 1
+        self.cache_read_tokens += cache_read_tokens
+        self.cache_write_tokens += cache_write_tokens
+        if count_paper:
+            self.papers_processed += 1
 
         # Update provider-specific stats
         if provider not in self.by_provider:
             self.by_provider[provider] = ProviderUsage(provider=provider)
-        self.by_provider[provider].record_success(tokens, cost, was_retry)
+        self.by_provider[provider].record_success(
+            tokens, cost, was_retry, cache_read_tokens, cache_write_tokens
+        )
         if is_fallback:
             self.by_provider[provider].fallback_requests += 1
 
@@ -180,9 +202,15 @@ class CostTracker:
             provider=provider,
             tokens=tokens,
             cost_usd=cost,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
             total_cost_usd=self.total_cost_usd,
         )
 
+    def record_paper(self) -> None:
+        """Count a paper whose requests were recorded with count_paper=False."""
+        self.papers_processed += 1
+
     def record_failure(self, provider: str) -> None:
         """Record a failed request.
 
@@ -261,6 +289,8 @@ class CostTracker:
             ),
             "total_retry_attempts": self.total_retry_attempts,
             "total_fallback_activations": self.total_fallback_activations,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
             "by_provider": {
                 name: {
                     "tokens": usage.tokens,
@@ -268,6 +298,8 @@ class CostTracker:
                     "requests": usage.requests,
                     "successful_requests": usage.successful_requests,
                     "failed_requests": usage.failed_requests,
+                    "cache_read_tokens": usage.cache_read_tokens,
+                    "cache_write_tokens": usage.cache_write_tokens,
                 }
                 for name, usage in self.by_provider.items()
             },
@@ -0,0 +1,200 @@
+"""Map-Reduce Extraction Module
+
+Splits long papers into token-bounded parts and merges the per-part
+extraction results, so LLMService can extract from papers whose single
+prompt would exceed the context window (see LLMService.extract).
+
+This module handles:
+- Estimating prompt tokens
+- Splitting markdown along its section structure
+- Merging partial extraction results deterministically
+"""
+
+import json
+import math
+import re
+from typing import Any, Callable, List, Optional
+
+from src.models.extraction import ExtractionResult, ExtractionTarget
+
+# Rough tokenization, matching the DRA token counter
+CHARS_PER_TOKEN = 4.0
+
+# Markdown headers, as emitted by the PDF extractors (marker, pandoc)
+HEADER_PATTERN = re.compile(r"^#{1,6}\s+\S")
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text``.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_sections(text: str) -> List[str]:
+    """Split markdown before every header line."""
+    sections: List[List[str]] = [[]]
+    for line in text.split("\n"):
+        if HEADER_PATTERN.match(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(lines) for lines in sections]
+
+
+class SectionSplitter:
+    """Splits paper markdown into parts of at most ``max_part_tokens``.
+
+    Parts follow the paper's structure: consecutive sections are packed
+    into a part until the budget is reached. A section that alone exceeds
+    the budget is split at paragraph boundaries, a paragraph at line
+    boundaries and, as a last resort, a line at a fixed width.
+    """
+
+    # (split, separator) from the coarsest to the finest boundary
+    _LEVELS: List[tuple[Callable[[str], List[str]], str]] = [
+        (_split_sections, "\n"),
+        (PARAGRAPH_BREAK.split, "\n\n"),
+        (lambda text: text.split("\n"), "\n"),
+    ]
+
+    def __init__(self, max_part_tokens: int):
+        """Initialize splitter.
+
+        Args:
+            max_part_tokens: Token budget for each part's content
+        """
+        if max_part_tokens < 1:
+            raise ValueError("max_part_tokens must be positive")
+        self.max_part_tokens = max_part_tokens
+
+    def split(self, markdown: str) -> List[str]:
+        """Split markdown into parts, in document order.
+
+        Args:
+            markdown: Full paper content in markdown format
+
+        Returns:
+            Non-empty parts, each within the token budget
+        """
+        return [part for part in self._split(markdown, 0) if part.strip()]
+
+    def _fits(self, text: str) -> bool:
+        return estimate_tokens(text) <= self.max_part_tokens
+
+    def _split(self, text: str, level: int) -> List[str]:
+        if self._fits(text):
+            return [text]
+        if level == len(self._LEVELS):
+            width = int(self.max_part_tokens * CHARS_PER_TOKEN)
+            return [text[i : i + width] for i in range(0, len(text), width)]
+
+        split, separator = self._LEVELS[level]
+        parts: List[str] = []
+        current: Optional[str] = None
+        for piece in split(text):
+            for sub in self._split(piece, level + 1):
+                candidate = sub if current is None else current + separator + sub
+                if self._fits(candidate):
+                    current = candidate
+                else:
+                    if current is not None:
+                        parts.append(current)
+                    current = sub
+        if current is not None:
+            parts.append(current)
+        return parts
+
+
+def _is_empty(content: Any) -> bool:
+    return content is None or content == "" or content == [] or content == {}
+
+
+def _dedupe(items: List[Any]) -> List[Any]:
+    """Drop repeated items (compared by value), keeping the first."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = json.dumps(item, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _merge_content(contents: List[Any], output_format: str) -> Any:
+    """Combine the non-empty contents found in several parts."""
+    if len(contents) == 1:
+        return contents[0]
+    if output_format == "json" and all(isinstance(c, dict) for c in contents):
+        merged: dict = {}
+        for content in contents:
+            for key, value in content.items():
+                merged.setdefault(key, value)
+        return merged
+    if output_format in ("list", "json"):
+        items: List[Any] = []
+        for content in contents:
+            items.extend(content if isinstance(content, list) else [content])
+        return _dedupe(items)
+    return "\n\n".join(_dedupe([str(c) for c in contents]))
+
+
+def merge_extraction_results(
+    targets: List[ExtractionTarget],
+    partials: List[List[ExtractionResult]],
+) -> List[ExtractionResult]:
+    """Merge per-part results into one result per target.
+
+    The merge depends only on part order, never on completion order:
+    contents are combined in document order (lists concatenated and
+    de-duplicated, JSON objects merged with the earliest part winning,
+    text joined), a target succeeds if any part found it, and its
+    confidence is the highest among the parts that did.
+
+    Args:
+        targets: Extraction targets
+        partials: Parsed results of each part, in document order
+
+    Returns:
+        One ExtractionResult per target, in target order
+    """
+    merged = []
+    for target in targets:
+        found = [r for part in partials for r in part if r.target_name == target.name]
+        successes = [r for r in found if r.success]
+        if not successes:
+            error = next(
+                (r.error for r in found if r.error),
+                f"Not found in any of {len(partials)} parts",
+            )
+            merged.append(
+                ExtractionResult(
+                    target_name=target.name,
+                    success=False,
+                    content=None,
+                    confidence=0.0,
+                    error=error,
+                )
+            )
+            continue
+
+        contents = [r.content for r in successes if not _is_empty(r.content)]
+        merged.append(
+            ExtractionResult(
+                target_name=target.name,
+                success=True,
+                content=(
+                    _merge_content(contents, target.output_format) if contents else None
+                ),
+                confidence=max(r.confidence for r in successes),
+                error=None,
+            )
+        )
+    return merged
@@ -6,10 +6,16 @@ This module handles:
 - Building structured extraction prompts
 - Formatting paper metadata for context
 - Generating JSON schema instructions
+
+Prompts are split at their cache boundary: the instructions, targets and
+output schema form an invariant prefix (identical for every paper
+extracted with the same targets) that providers can cache, and the
+per-paper metadata and content come last.
 """
 
 import json
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import structlog
 
 from src.models.extraction import ExtractionTarget
@@ -18,6 +24,25 @@ from src.models.paper import PaperMetadata
 logger = structlog.get_logger()
 
 
+@dataclass(frozen=True)
+class ExtractionPrompt:
+    """Extraction prompt split into its invariant prefix and per-paper part.
+
+    Attributes:
+        system: Instructions, targets and output schema; the same for
+            every paper extracted with the same targets
+        user: Paper metadata and content
+    """
+
+    system: str
+    user: str
+
+    @property
+    def text(self) -> str:
+        """The whole prompt as a single message."""
+        return f"{self.system}\n\n{self.user}"
+
+
 class PromptBuilder:
     """Builds structured extraction prompts for LLM.
 
@@ -35,36 +60,59 @@ class PromptBuilder:
         markdown_content: str,
         targets: List[ExtractionTarget],
         paper_metadata: PaperMetadata,
+        part: Optional[Tuple[int, int]] = None,
     ) -> str:
-        """Build extraction prompt for LLM.
+        """Build extraction prompt for LLM as a single message.
 
         Args:
             markdown_content: Full paper content in markdown format
+                (or one part of it)
             targets: List of extraction targets
             paper_metadata: Paper metadata for context
+            part: (index, count) when ``markdown_content`` is one part of
+                a paper split for map-reduce extraction
 
         Returns:
             Formatted prompt string
         """
-        # Format targets as JSON for clear specification
-        targets_json = self._format_targets(targets)
-
-        # Format author names
-        author_names = self._format_authors(paper_metadata)
-
-        # Build the complete prompt
-        prompt = self._build_prompt_template(
-            markdown=markdown_content,
-            targets_json=targets_json,
-            author_names=author_names,
-            metadata=paper_metadata,
+        return self.build_prompt(markdown_content, targets, paper_metadata, part).text
+
+    def build_prompt(
+        self,
+        markdown_content: str,
+        targets: List[ExtractionTarget],
+        paper_metadata: PaperMetadata,
+        part: Optional[Tuple[int, int]] = None,
+    ) -> ExtractionPrompt:
+        """Build extraction prompt split at its cache boundary.
+
+        Args:
+            markdown_content: Full paper content in markdown format
+                (or one part of it)
+            targets: List of extraction targets
+            paper_metadata: Paper metadata for context
+            part: (index, count) when ``markdown_content`` is one part of
+                a paper split for map-reduce extraction
+
+        Returns:
+            ExtractionPrompt whose ``system`` depends only on ``targets``
+        """
+        prompt = ExtractionPrompt(
+            system=self._build_system_prompt(self._format_targets(targets)),
+            user=self._build_paper_prompt(
+                markdown=markdown_content,
+                author_names=self._format_authors(paper_metadata),
+                metadata=paper_metadata,
+                part=part,
+            ),
         )
 
         logger.debug(
             "prompt_built",
             paper_id=paper_metadata.paper_id,
             targets_count=len(targets),
-            prompt_length=len(prompt),
+            part=part,
+            prompt_length=len(prompt.system) + len(prompt.user),
         )
 
         return prompt
@@ -103,34 +151,18 @@ class PromptBuilder:
             return "Unknown"
         return ", ".join(a.name for a in metadata.authors)
 
-    def _build_prompt_template(
-        self,
-        markdown: str,
-        targets_json: str,
-        author_names: str,
-        metadata: PaperMetadata,
-    ) -> str:
-        """Build the complete prompt from template.
+    def _build_system_prompt(self, targets_json: str) -> str:
+        """Build the invariant prefix: role, targets, instructions, schema.
 
         Args:
-            markdown: Paper content
             targets_json: Formatted targets
-            author_names: Formatted authors
-            metadata: Paper metadata
 
         Returns:
-            Complete prompt string
+            Prefix string (nothing paper-specific)
         """
-        # This template matches the original exactly for behavioral equivalence
-        prompt = f"""You are a research paper analyst specialized in
+        return f"""You are a research paper analyst specialized in
 extracting structured information from academic papers.
 
-**Paper Metadata:**
-- Title: {metadata.title}
-- Authors: {author_names}
-- Year: {metadata.year or 'Unknown'}
-- Paper ID: {metadata.paper_id}
-
 **Extraction Targets:**
 {targets_json}
 
@@ -154,12 +186,44 @@ extracting structured information from academic papers.
       "error": "string or null"
     }}
   ]
-}}
+}}"""
+
+    def _build_paper_prompt(
+        self,
+        markdown: str,
+        author_names: str,
+        metadata: PaperMetadata,
+        part: Optional[Tuple[int, int]] = None,
+    ) -> str:
+        """Build the per-paper part: metadata and content.
+
+        Args:
+            markdown: Paper content
+            author_names: Formatted authors
+            metadata: Paper metadata
+            part: (index, count) of the paper part being extracted
 
-**Paper Content:**
+        Returns:
+            Per-paper prompt string
+        """
+        content_heading = "**Paper Content:**"
+        if part is not None:
+            index, count = part
+            content_heading = (
+                f"The content below is part {index} of {count} of the paper: "
+                "extract only what appears in this part and set success=false "
+                "for targets it does not contain.\n\n"
+                f"**Paper Content (part {index} of {count}):**"
+            )
+
+        return f"""**Paper Metadata:**
+- Title: {metadata.title}
+- Authors: {author_names}
+- Year: {metadata.year or 'Unknown'}
+- Paper ID: {metadata.paper_id}
+
+{content_heading}
 
 {markdown}
 
 **Now extract the information and return ONLY the JSON response:**"""
-
-        return prompt
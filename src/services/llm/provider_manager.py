@@ -9,8 +9,15 @@ from typing import Dict, Optional
 import structlog
 
 from src.models.llm import LLMConfig
-from src.services.llm.providers.base import LLMProvider, ProviderHealth
-from src.services.llm.providers.anthropic import AnthropicProvider
+from src.services.llm.providers.base import (
+    BatchProvider,
+    LLMProvider,
+    ProviderHealth,
+)
+from src.services.llm.providers.anthropic import (
+    AnthropicBatchProvider,
+    AnthropicProvider,
+)
 from src.services.llm.providers.google import GoogleProvider
 from src.services.llm.exceptions import LLMProviderError
 from src.utils.exceptions import ExtractionError
@@ -183,6 +190,19 @@ class ProviderManager:
         """
         return self._provider_health.get(name)
 
+    def create_batch_provider(self) -> Optional[BatchProvider]:
+        """Create the batch-job provider for the primary provider.
+
+        Returns:
+            Batch provider, or None if the primary provider has no batch API
+        """
+        provider = self._providers.get(self.config.provider)
+        if isinstance(provider, AnthropicProvider):
+            return AnthropicBatchProvider(provider)
+
+        logger.warning("batch_mode_unsupported", provider=self.config.provider)
+        return None
+
     def get_all_providers(self) -> Dict[str, LLMProvider]:
         """Get all initialized providers."""
         return self._providers
@@ -5,15 +5,22 @@ This module provides the abstract provider interface and concrete implementation
 - LLMResponse: Standardized response from any provider
 - AnthropicProvider: Claude models (Claude 3.5 Sonnet, etc.)
 - GoogleProvider: Gemini models (Gemini 1.5 Pro, etc.)
+- BatchProvider: Abstract base class for batch-job providers
+- AnthropicBatchProvider: Anthropic Message Batches API
 """
 
-from src.services.llm.providers.base import LLMProvider, LLMResponse
-from src.services.llm.providers.anthropic import AnthropicProvider
+from src.services.llm.providers.base import BatchProvider, LLMProvider, LLMResponse
+from src.services.llm.providers.anthropic import (
+    AnthropicBatchProvider,
+    AnthropicProvider,
+)
 from src.services.llm.providers.google import GoogleProvider
 
 __all__ = [
     "LLMProvider",
     "LLMResponse",
+    "BatchProvider",
     "AnthropicProvider",
+    "AnthropicBatchProvider",
     "GoogleProvider",
 ]
@@ -5,11 +5,12 @@ Phase 5.1: Provider abstraction for LLM services.
 This module defines:
 - LLMResponse: Standardized response dataclass
 - LLMProvider: Abstract base class for all providers
+- BatchRequest, BatchResult, BatchProvider: batch-job interface
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional, Literal
+from typing import Any, List, Optional, Literal
 from datetime import datetime, timezone
 
 
@@ -29,6 +30,10 @@ class LLMResponse:
         latency_ms: Request latency in milliseconds
         finish_reason: Why generation stopped (stop, length, etc.)
         timestamp: When the response was received
+        cache_read_tokens: Input tokens served from the prompt cache
+            (not included in input_tokens)
+        cache_write_tokens: Input tokens written to the prompt cache
+            (not included in input_tokens)
     """
 
     content: str
@@ -39,11 +44,32 @@ class LLMResponse:
     latency_ms: float
     finish_reason: Optional[str] = None
     timestamp: Optional[datetime] = None
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     @property
     def total_tokens(self) -> int:
-        """Total tokens used (input + output)."""
-        return self.input_tokens + self.output_tokens
+        """Total tokens used (input, cached input and output)."""
+        return (
+            self.input_tokens
+            + self.cache_read_tokens
+            + self.cache_write_tokens
+            + self.output_tokens
+        )
+
+
+def usage_count(usage: Any, field: str) -> int:
+    """Read a token count from a provider usage object.
+
+    Args:
+        usage: Provider usage object (may be None)
+        field: Attribute name
+
+    Returns:
+        The count, or 0 if the provider did not report it
+    """
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
 
 
 @dataclass
@@ -140,6 +166,7 @@ class LLMProvider(ABC):
         prompt: str,
         max_tokens: int = 4096,
         temperature: float = 0.0,
+        system_prompt: Optional[str] = None,
     ) -> LLMResponse:
         """Generate text from prompt.
 
@@ -147,6 +174,8 @@ class LLMProvider(ABC):
             prompt: The input prompt
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 = deterministic)
+            system_prompt: Invariant instructions sent ahead of the prompt;
+                providers that support prompt caching cache it
 
         Returns:
             LLMResponse with generated content and metadata
@@ -177,6 +206,24 @@ class LLMProvider(ABC):
         """
         pass  # pragma: no cover - abstract method, always overridden
 
+    def calculate_cache_cost(
+        self,
+        cache_read_tokens: int,
+        cache_write_tokens: int,
+    ) -> float:
+        """Calculate cost in USD for prompt-cache reads and writes.
+
+        Override in providers that support prompt caching.
+
+        Args:
+            cache_read_tokens: Input tokens served from the cache
+            cache_write_tokens: Input tokens written to the cache
+
+        Returns:
+            Cost in USD (float)
+        """
+        return 0.0
+
     def get_health(self) -> ProviderHealth:
         """Get current provider health status.
 
@@ -184,3 +231,114 @@ class LLMProvider(ABC):
         Default returns a healthy status.
         """
         return ProviderHealth(provider=self.name, status="healthy")
+
+
+# Batch jobs cost half the interactive price (Anthropic Message Batches)
+BATCH_PRICE_FACTOR = 0.5
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """One extraction request inside a batch job.
+
+    Attributes:
+        custom_id: Caller-assigned ID, echoed by the matching result
+        system: Invariant instructions (cacheable system prompt)
+        prompt: Paper-specific prompt
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+    """
+
+    custom_id: str
+    system: str
+    prompt: str
+    max_tokens: int
+    temperature: float
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request of a batch job.
+
+    Attributes:
+        custom_id: ID of the request this result answers
+        response: Generated response (None if the request failed)
+        error: Why the request failed
+    """
+
+    custom_id: str
+    response: Optional[LLMResponse] = None
+    error: Optional[str] = None
+
+
+class BatchProvider(ABC):
+    """Abstract base class for batch-job providers.
+
+    A batch provider submits many requests as one job and later returns
+    all of their results. It wraps the interactive provider of the same
+    API, whose pricing it reuses (scaled by ``price_factor``).
+    """
+
+    price_factor: float = BATCH_PRICE_FACTOR
+
+    def __init__(self, provider: LLMProvider):
+        """Initialize batch provider.
+
+        Args:
+            provider: Interactive provider of the same API
+        """
+        self.provider = provider
+
+    @property
+    def name(self) -> str:
+        """Provider name (e.g., 'anthropic')."""
+        return self.provider.name
+
+    @abstractmethod
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        """Submit requests as one batch job.
+
+        Args:
+            requests: Requests with unique custom IDs
+
+        Returns:
+            Batch ID to poll
+
+        Raises:
+            LLMProviderError: If the batch cannot be submitted
+        """
+        pass  # pragma: no cover - abstract method, always overridden
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> Optional[List[BatchResult]]:
+        """Poll a batch job.
+
+        Args:
+            batch_id: ID returned by submit()
+
+        Returns:
+            One result per request once the job has ended, None while it
+            is still running
+
+        Raises:
+            LLMProviderError: If the batch cannot be polled
+        """
+        pass  # pragma: no cover - abstract method, always overridden
+
+    def calculate_cost(self, response: LLMResponse) -> float:
+        """Calculate cost in USD of one batched response.
+
+        Args:
+            response: Response delivered by a batch job
+
+        Returns:
+            Cost in USD
+        """
+        cost = self.provider.calculate_cost(
+            response.input_tokens, response.output_tokens
+        )
+        if response.cache_read_tokens or response.cache_write_tokens:
+            cost += self.provider.calculate_cache_cost(
+                response.cache_read_tokens, response.cache_write_tokens
+            )
+        return cost * self.price_factor
@@ -28,9 +28,20 @@ from src.services.llm.health_check import (  # Phase 9.5 REQ-9.5.1.3
     ProviderHealthChecker,
     ProviderHealthResult,
 )
-from src.services.llm.prompt_builder import PromptBuilder
+from src.services.llm.map_reduce import (
+    SectionSplitter,
+    estimate_tokens,
+    merge_extraction_results,
+)
+from src.services.llm.prompt_builder import ExtractionPrompt, PromptBuilder
 from src.services.llm.response_parser import ResponseParser
-from src.services.llm.providers.base import LLMResponse, ProviderHealth
+from src.services.llm.providers.base import (
+    BatchProvider,
+    BatchRequest,
+    BatchResult,
+    LLMResponse,
+    ProviderHealth,
+)
 from src.services.llm.provider_manager import ProviderManager
 from src.services.llm.exceptions import LLMProviderError, RateLimitError
 from src.utils.exceptions import (
@@ -56,6 +67,10 @@ from src.observability.metrics import (
 
 logger = structlog.get_logger()
 
+# Smallest content budget for a map-reduce part, however large the
+# prompt overhead (targets, metadata, instructions) is
+MIN_SECTION_PART_TOKENS = 500
+
 
 class LLMService:
     """Service for extracting information from papers using LLMs.
@@ -92,6 +107,8 @@ class LLMService:
 
         # Initialize components
         self._cost_tracker = CostTracker(limits=cost_limits)
+        # Estimated cost of submitted batch jobs not yet billed
+        self._reserved_cost_usd = 0.0
         self._prompt_builder = PromptBuilder()
         self._response_parser = ResponseParser()
 
@@ -110,6 +127,13 @@ class LLMService:
         self._provider_health = self._provider_manager.get_all_health()
         self.fallback_provider = self._provider_manager.fallback_provider
 
+        # Batch-submission mode: None extracts interactively
+        self.batch_provider: Optional[BatchProvider] = (
+            self._provider_manager.create_batch_provider()
+            if config.batch is not None
+            else None
+        )
+
         # Phase 9.5 REQ-9.5.1.3: lazy startup health check (runs once
         # per process on first extract()/complete() call). The lock
         # protects against the race where two concurrent first-callers
@@ -227,7 +251,15 @@ class LLMService:
         self._check_cost_limits()
 
         # Build extraction prompt
-        prompt = self._prompt_builder.build(markdown_content, targets, paper_metadata)
+        prompt = self._prompt_builder.build_prompt(
+            markdown_content, targets, paper_metadata
+        )
+
+        threshold = self.config.section_token_threshold
+        if threshold is not None and estimate_tokens(prompt.text) > threshold:
+            return await self._extract_sections(
+                markdown_content, targets, paper_metadata, threshold
+            )
 
         logger.info(
             "extraction_started",
@@ -236,6 +268,113 @@ class LLMService:
             provider=self.config.provider,
         )
 
+        return await self._extract_prompt(prompt, targets, paper_metadata)
+
+    async def _extract_sections(
+        self,
+        markdown_content: str,
+        targets: List[ExtractionTarget],
+        paper_metadata: PaperMetadata,
+        threshold: int,
+    ) -> PaperExtraction:
+        """Extract from a long paper section by section (map-reduce).
+
+        The paper is split along its section structure into parts whose
+        prompts stay within ``threshold`` tokens. Parts are extracted
+        concurrently (at most ``max_concurrent_sections`` at a time), each
+        through the same cost check, retry, circuit breaker and fallback
+        path as a single-prompt extraction, and their results are merged
+        in document order.
+
+        Args:
+            markdown_content: Full paper in markdown format
+            targets: List of extraction targets
+            paper_metadata: Paper metadata for context
+            threshold: Maximum prompt tokens per call
+
+        Returns:
+            PaperExtraction with the merged results
+        """
+        overhead = estimate_tokens(
+            self._prompt_builder.build("", targets, paper_metadata, part=(1, 1))
+        )
+        parts = SectionSplitter(
+            max(threshold - overhead, MIN_SECTION_PART_TOKENS)
+        ).split(markdown_content)
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_sections)
+
+        logger.info(
+            "section_extraction_started",
+            paper_id=paper_metadata.paper_id,
+            targets=len(targets),
+            parts=len(parts),
+            provider=self.config.provider,
+        )
+
+        async def extract_part(index: int, part: str) -> PaperExtraction:
+            async with semaphore:
+                # Stop issuing parts once the budget is spent
+                self._check_cost_limits()
+                prompt = self._prompt_builder.build_prompt(
+                    part, targets, paper_metadata, part=(index, len(parts))
+                )
+                return await self._extract_prompt(
+                    prompt, targets, paper_metadata, count_paper=False
+                )
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(extract_part(index, part))
+                    for index, part in enumerate(parts, start=1)
+                ]
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+
+        partials = [task.result() for task in tasks]
+        self._cost_tracker.record_paper()
+        self.usage_stats.papers_processed += 1
+
+        extraction = PaperExtraction(
+            paper_id=paper_metadata.paper_id,
+            extraction_results=merge_extraction_results(
+                targets, [p.extraction_results for p in partials]
+            ),
+            tokens_used=sum(p.tokens_used for p in partials),
+            cost_usd=sum(p.cost_usd for p in partials),
+            extraction_timestamp=datetime.now(timezone.utc),
+        )
+        logger.info(
+            "section_extraction_completed",
+            paper_id=paper_metadata.paper_id,
+            parts=len(parts),
+            tokens_used=extraction.tokens_used,
+            cost_usd=extraction.cost_usd,
+            successful_extractions=sum(
+                1 for r in extraction.extraction_results if r.success
+            ),
+        )
+        return extraction
+
+    async def _extract_prompt(
+        self,
+        prompt: ExtractionPrompt,
+        targets: List[ExtractionTarget],
+        paper_metadata: PaperMetadata,
+        count_paper: bool = True,
+    ) -> PaperExtraction:
+        """Extract from one prompt, trying the primary then the fallback provider.
+
+        Args:
+            prompt: Extraction prompt (invariant prefix and paper content)
+            targets: List of extraction targets
+            paper_metadata: Paper metadata for context
+            count_paper: Whether a success completes the paper (False for
+                the parts of a map-reduce extraction)
+
+        Returns:
+            PaperExtraction with results
+        """
         provider_errors: Dict[str, str] = {}
 
         # Try primary provider
@@ -245,6 +384,7 @@ class LLMService:
                 prompt=prompt,
                 targets=targets,
                 paper_metadata=paper_metadata,
+                count_paper=count_paper,
             )
         except (LLMAPIError, LLMProviderError) as e:
             provider_errors[self.config.provider] = str(e)
@@ -270,6 +410,7 @@ class LLMService:
                     targets=targets,
                     paper_metadata=paper_metadata,
                     is_fallback=True,
+                    count_paper=count_paper,
                 )
             except (LLMAPIError, LLMProviderError) as e:
                 provider_errors[self.fallback_provider] = str(e)
@@ -284,6 +425,174 @@ class LLMService:
             "All LLM providers failed", provider_errors=provider_errors
         )
 
+    def needs_sections(
+        self,
+        markdown_content: str,
+        targets: List[ExtractionTarget],
+        paper_metadata: PaperMetadata,
+    ) -> bool:
+        """Check whether extract() would split a paper into sections.
+
+        Uses the same full-prompt token estimate extract() routes on.
+
+        Args:
+            markdown_content: Full paper in markdown format
+            targets: List of extraction targets
+            paper_metadata: Paper metadata for context
+
+        Returns:
+            True if the paper's prompt exceeds section_token_threshold
+        """
+        threshold = self.config.section_token_threshold
+        if threshold is None:
+            return False
+        prompt = self._prompt_builder.build_prompt(
+            markdown_content, targets, paper_metadata
+        )
+        return estimate_tokens(prompt.text) > threshold
+
+    def reserve_cost(self, amount_usd: float) -> None:
+        """Reserve budget for spend that is committed but not yet recorded.
+
+        Batch jobs are billed when their results are collected, possibly
+        hours after submission. Reserving their estimated cost at submit
+        time keeps further submissions and interactive calls from
+        spending the same budget.
+
+        Args:
+            amount_usd: Estimated cost to reserve
+
+        Raises:
+            CostLimitExceeded: If recorded spend plus reservations would
+                exceed a spending limit
+        """
+        from src.utils.exceptions import CostLimitExceeded
+
+        committed = self.usage_stats.total_cost_usd + self._reserved_cost_usd
+        limit = min(
+            self.cost_limits.max_daily_spend_usd,
+            self.cost_limits.max_total_spend_usd,
+        )
+        if committed + amount_usd > limit:
+            raise CostLimitExceeded(
+                f"Reserving ${amount_usd:.2f} would exceed the spending limit: "
+                f"${committed:.2f} committed, limit ${limit:.2f}"
+            )
+        self._reserved_cost_usd += amount_usd
+
+    def release_cost(self, amount_usd: float) -> None:
+        """Release a reservation made with reserve_cost().
+
+        Args:
+            amount_usd: Amount reserved
+        """
+        self._reserved_cost_usd = max(0.0, self._reserved_cost_usd - amount_usd)
+
+    def batch_request(
+        self,
+        custom_id: str,
+        markdown_content: str,
+        targets: List[ExtractionTarget],
+        paper_metadata: PaperMetadata,
+    ) -> BatchRequest:
+        """Build the batch-job request for one paper's extraction.
+
+        Args:
+            custom_id: ID echoed by the request's result
+            markdown_content: Full paper in markdown format
+            targets: List of extraction targets
+            paper_metadata: Paper metadata for context
+
+        Returns:
+            BatchRequest carrying the same prompt as extract()
+
+        Raises:
+            CostLimitExceeded: If cost limits have been reached
+        """
+        self._check_cost_limits()
+        prompt = self._prompt_builder.build_prompt(
+            markdown_content, targets, paper_metadata
+        )
+        return BatchRequest(
+            custom_id=custom_id,
+            system=prompt.system,
+            prompt=prompt.user,
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+        )
+
+    def batch_extraction(
+        self,
+        result: BatchResult,
+        batch_provider: BatchProvider,
+        targets: List[ExtractionTarget],
+        paper_id: str,
+    ) -> PaperExtraction:
+        """Parse and account for one result of a batch job.
+
+        Args:
+            result: The paper's batch result
+            batch_provider: Provider that ran the batch (for pricing)
+            targets: List of extraction targets
+            paper_id: Paper the result belongs to
+
+        Returns:
+            PaperExtraction with results
+
+        Raises:
+            LLMAPIError: If the request failed in the batch
+            JSONParseError: If the response cannot be parsed
+        """
+        provider_name = batch_provider.name
+        response = result.response
+        if response is None:
+            self._cost_tracker.record_failure(provider_name)
+            LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="failed").inc()
+            EXTRACTION_ERRORS.labels(error_type="llm").inc()
+            logger.error(
+                "batch_request_failed",
+                paper_id=paper_id,
+                provider=provider_name,
+                error=result.error,
+            )
+            raise LLMAPIError(f"{provider_name} batch: {result.error}")
+
+        cost = batch_provider.calculate_cost(response)
+        LLM_TOKENS_TOTAL.labels(provider=provider_name, type="input").inc(
+            response.input_tokens
+        )
+        LLM_TOKENS_TOTAL.labels(provider=provider_name, type="output").inc(
+            response.output_tokens
+        )
+        LLM_COST_USD_TOTAL.labels(provider=provider_name).inc(cost)
+        LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
+
+        results = self._response_parser.parse(response, targets, provider_name)
+        for extraction_result in results:
+            if extraction_result.success and extraction_result.confidence is not None:
+                EXTRACTION_CONFIDENCE.observe(extraction_result.confidence)
+
+        self._record_extraction_usage(
+            response.total_tokens,
+            cost,
+            provider_name,
+            retry_attempts=0,
+            is_fallback=False,
+            cache_read_tokens=response.cache_read_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+        )
+        DAILY_COST_USD.labels(provider=provider_name).set(
+            self.usage_stats.total_cost_usd
+        )
+
+        return PaperExtraction(
+            paper_id=paper_id,
+            extraction_results=results,
+            tokens_used=response.total_tokens,
+            cost_usd=cost,
+            extraction_timestamp=datetime.now(timezone.utc),
+        )
+
     async def complete(
         self,
         prompt: str,
@@ -441,10 +750,11 @@ class LLMService:
     async def _extract_with_provider(
         self,
         provider_name: str,
-        prompt: str,
+        prompt: ExtractionPrompt,
         targets: List[ExtractionTarget],
         paper_metadata: PaperMetadata,
         is_fallback: bool = False,
+        count_paper: bool = True,
     ) -> PaperExtraction:
         """Extract using a specific provider with retry logic."""
         provider = self._providers[provider_name]
@@ -471,7 +781,9 @@ class LLMService:
                         raw_method, "assert_called"
                     ):
                         # It's a mock - use it and convert response
-                        raw_response = await raw_method(prompt, self.config.max_tokens)
+                        raw_response = await raw_method(
+                            prompt.text, self.config.max_tokens
+                        )
                         return LLMResponse(
                             content=raw_response.content[0].text,
                             input_tokens=raw_response.usage.input_tokens,
@@ -487,7 +799,9 @@ class LLMService:
                         raw_method, "assert_called"
                     ):
                         # It's a mock - use it and convert response
-                        raw_response = await raw_method(prompt, self.config.max_tokens)
+                        raw_response = await raw_method(
+                            prompt.text, self.config.max_tokens
+                        )
                         # Handle Google response format
                         content = getattr(raw_response, "text", "")
                         usage = getattr(raw_response, "usage_metadata", None)
@@ -502,11 +816,13 @@ class LLMService:
                             provider=provider_name,
                             latency_ms=0.0,
                         )
-                # Normal path: use provider directly
+                # Normal path: use provider directly, with the invariant
+                # prefix as a (cacheable) system prompt
                 return await provider.generate(
-                    prompt=prompt,
+                    prompt=prompt.user,
                     max_tokens=self.config.max_tokens,
                     temperature=self.config.temperature,
+                    system_prompt=prompt.system,
                 )
 
             def on_retry(attempt: int, error: Exception, delay: float) -> None:
@@ -543,6 +859,10 @@ class LLMService:
             cost = provider.calculate_cost(
                 response.input_tokens, response.output_tokens
             )
+            if response.cache_read_tokens or response.cache_write_tokens:
+                cost += provider.calculate_cache_cost(
+                    response.cache_read_tokens, response.cache_write_tokens
+                )
             LLM_COST_USD_TOTAL.labels(provider=provider_name).inc(cost)
             DAILY_COST_USD.labels(provider=provider_name).set(
                 self.usage_stats.total_cost_usd + cost
@@ -564,7 +884,14 @@ class LLMService:
 
             # Update usage stats
             self._record_extraction_usage(
-                response.total_tokens, cost, provider_name, retry_attempts, is_fallback
+                response.total_tokens,
+                cost,
+                provider_name,
+                retry_attempts,
+                is_fallback,
+                count_paper=count_paper,
+                cache_read_tokens=response.cache_read_tokens,
+                cache_write_tokens=response.cache_write_tokens,
             )
 
             logger.info(
@@ -572,6 +899,8 @@ class LLMService:
                 paper_id=paper_metadata.paper_id,
                 provider=provider_name,
                 tokens_used=response.total_tokens,
+                cache_read_tokens=response.cache_read_tokens,
+                cache_write_tokens=response.cache_write_tokens,
                 cost_usd=cost,
                 retry_attempts=retry_attempts,
                 is_fallback=is_fallback,
@@ -624,6 +953,9 @@ class LLMService:
         provider: str,
         retry_attempts: int,
         is_fallback: bool,
+        count_paper: bool = True,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
         """Update usage statistics (internal method for extract flow)."""
         # Update cost tracker
@@ -633,12 +965,16 @@ class LLMService:
             provider=provider,
             was_retry=retry_attempts > 0,
             is_fallback=is_fallback,
+            count_paper=count_paper,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
 
         # Update legacy usage stats
         self.usage_stats.total_tokens += tokens
         self.usage_stats.total_cost_usd += cost
-        self.usage_stats.papers_processed += 1
+        if count_paper:
+            self.usage_stats.papers_processed += 1
 
         # Update provider-specific stats
         if provider not in self.usage_stats.by_provider:
@@ -813,20 +1149,22 @@ class LLMService:
 
         This method provides backward compatibility by checking against
         the usage_stats object that tests may have modified directly.
+        Budget reserved for submitted batch jobs counts as spent.
         """
         from src.utils.exceptions import CostLimitExceeded
 
-        if self.usage_stats.total_cost_usd >= self.cost_limits.max_total_spend_usd:
+        committed = self.usage_stats.total_cost_usd + self._reserved_cost_usd
+        if committed >= self.cost_limits.max_total_spend_usd:
             raise CostLimitExceeded(
                 f"Total spending limit reached: "
-                f"${self.usage_stats.total_cost_usd:.2f} >= "
+                f"${committed:.2f} >= "
                 f"${self.cost_limits.max_total_spend_usd:.2f}"
             )
 
-        if self.usage_stats.total_cost_usd >= self.cost_limits.max_daily_spend_usd:
+        if committed >= self.cost_limits.max_daily_spend_usd:
             raise CostLimitExceeded(
                 f"Daily spending limit reached: "
-                f"${self.usage_stats.total_cost_usd:.2f} >= "
+                f"${committed:.2f} >= "
                 f"${self.cost_limits.max_daily_spend_usd:.2f}"
             )
 
@@ -45,7 +45,7 @@ class ArxivProvider(DiscoveryProvider):
     ):
         # ArXiv requires 3 seconds between requests
         self.rate_limiter = rate_limiter or RateLimiter(
-            requests_per_minute=20, burst_size=1  # 60/3 = 20
+            requests_per_minute=20, burst_size=1, name="arxiv"  # 60/3 = 20
         )
         self.settings = settings
         # Feature flag for structured query (Phase 7 Fix I1)
@@ -114,7 +114,9 @@ class ArxivProvider(DiscoveryProvider):
         # 5. Check Status
         if hasattr(feed, "status") and feed.status != 200:
             if feed.status == 403:  # Forbidden (often rate limit)
-                raise RateLimitError("ArXiv rate limit exceeded (403)")
+                error = RateLimitError("ArXiv rate limit exceeded (403)")
+                await self.rate_limiter.record_throttled()
+                raise error
             # ArXiv returns 301 for redirects but may still have valid data
             elif feed.status == 301 and len(feed.entries) > 0:
                 first_entry = feed.entries[0]
@@ -71,7 +71,7 @@ class HuggingFaceProvider(DiscoveryProvider):
         """
         # Conservative rate limiting for public API
         self.rate_limiter = rate_limiter or RateLimiter(
-            requests_per_minute=30, burst_size=5
+            requests_per_minute=30, burst_size=5, name="huggingface"
         )
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -162,7 +162,9 @@ class HuggingFaceProvider(DiscoveryProvider):
         try:
             async with session.get(self.BASE_URL, params=params) as response:
                 if response.status == 429:
-                    raise RateLimitError("HuggingFace rate limit exceeded (429)")
+                    error = RateLimitError("HuggingFace rate limit exceeded (429)")
+                    await self.rate_limiter.record_throttled()
+                    raise error
                 if response.status == 403:
                     raise RateLimitError("HuggingFace access forbidden (403)")
                 if response.status != 200:
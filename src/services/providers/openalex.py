@@ -37,6 +37,7 @@ from src.services.providers.base import (
     APIError,
     RateLimitError,
 )
+from src.services.providers.rate_limits import openalex_rate_limiter
 from src.utils.rate_limiter import RateLimiter
 
 logger = structlog.get_logger()
@@ -60,19 +61,23 @@ class OpenAlexProvider(DiscoveryProvider):
     def __init__(
         self,
         email: Optional[str] = None,
-        requests_per_minute: int = 100,
+        requests_per_minute: Optional[int] = None,
     ) -> None:
         """Initialize OpenAlex provider.
 
         Args:
             email: Email for polite pool (recommended for higher rate limits)
-            requests_per_minute: Maximum requests per minute
+            requests_per_minute: Maximum requests per minute. Defaults to
+                the OpenAlex bucket shared with the citation client; an
+                explicit rate gets a bucket of its own.
         """
         self.email = email or os.getenv("OPENALEX_EMAIL")
-        self.rate_limiter = RateLimiter(
-            requests_per_minute=requests_per_minute,
-            burst_size=10,
-        )
+        if requests_per_minute is None:
+            self.rate_limiter = openalex_rate_limiter(bool(self.email))
+        else:
+            self.rate_limiter = RateLimiter(
+                requests_per_minute=requests_per_minute, burst_size=10
+            )
         self._session: Optional[aiohttp.ClientSession] = None
 
     @property
@@ -156,7 +161,9 @@ class OpenAlexProvider(DiscoveryProvider):
 
             async with session.get(url) as response:
                 if response.status == 429:
-                    raise RateLimitError("OpenAlex rate limit exceeded")
+                    error = RateLimitError("OpenAlex rate limit exceeded")
+                    await self.rate_limiter.record_throttled()
+                    raise error
                 if response.status != 200:
                     text = await response.text()
                     raise APIError(f"OpenAlex API error {response.status}: {text}")
@@ -76,7 +76,7 @@ class PaperSearchMCPProvider(DiscoveryProvider):
         self._checked_availability = False
         # Conservative rate limiting for MCP aggregation
         self.rate_limiter = rate_limiter or RateLimiter(
-            requests_per_minute=30, burst_size=5
+            requests_per_minute=30, burst_size=5, name="paper_search_mcp"
         )
 
     @property
@@ -19,6 +19,7 @@ from src.models.config import (
     PDFStrategy,
 )
 from src.models.paper import PaperMetadata, Author
+from src.services.providers.rate_limits import semantic_scholar_rate_limiter
 from src.utils.rate_limiter import RateLimiter
 
 logger = structlog.get_logger()
@@ -31,7 +32,9 @@ class SemanticScholarProvider(DiscoveryProvider):
 
     def __init__(self, api_key: str, rate_limiter: Optional[RateLimiter] = None):
         self.api_key = api_key
-        self.rate_limiter = rate_limiter or RateLimiter(requests_per_minute=100)
+        self.rate_limiter = rate_limiter or semantic_scholar_rate_limiter(
+            bool(api_key)
+        )
 
     @property
     def name(self) -> str:
@@ -88,7 +91,9 @@ class SemanticScholarProvider(DiscoveryProvider):
                 ) as response:
 
                     if response.status == 429:
-                        raise RateLimitError("Semantic Scholar rate limit exceeded")
+                        error = RateLimitError("Semantic Scholar rate limit exceeded")
+                        await self.rate_limiter.record_throttled()
+                        raise error
 
                     if response.status >= 500:
                         raise aiohttp.ClientError(f"Server error: {response.status}")
@@ -16,6 +16,7 @@ from src.models.registry import (
     RegistryState,
     IdentityMatch,
     ProcessingAction,
+    RegistryChangeKind,
 )
 from src.models.paper import PaperMetadata
 from src.models.extraction import ExtractionTarget
@@ -257,9 +258,11 @@ class PaperRegistry:
             if match.matched and match.entry:
                 existing_entry = match.entry
 
+        changed = True
         if existing_entry:
             # Update existing entry (either passed in or found via identity)
             entry = existing_entry
+            before = entry.model_dump()
             # Only update extraction fields if not discovery_only
             if not discovery_only:
                 entry.extraction_target_hash = target_hash
@@ -272,6 +275,7 @@ class PaperRegistry:
                 entry.metadata_snapshot = paper.model_dump(mode="json")
 
             entry.add_topic_affiliation(topic_slug)
+            changed = entry.model_dump() != before
 
             logger.info(
                 "registry_entry_updated",
@@ -315,8 +319,8 @@ class PaperRegistry:
                 discovery_only=discovery_only,
             )
 
-        # Add to state
-        state.add_entry(entry)
+        # Add to state (journaled unless an update changed nothing)
+        state.add_entry(entry, record_change=changed)
 
         return entry
 
@@ -349,6 +353,7 @@ class PaperRegistry:
         added = existing.add_topic_affiliation(topic_slug)
 
         if added:
+            state.record_change(entry.paper_id, RegistryChangeKind.UPDATED)
             logger.debug(
                 "topic_affiliation_added",
                 paper_id=entry.paper_id,
@@ -10,6 +10,7 @@ from typing import Optional, List
 import structlog
 
 from src.models.registry import (
+    RegistryChange,
     RegistryEntry,
     RegistryState,
     IdentityMatch,
@@ -288,6 +289,28 @@ class RegistryService:
         state = self.load()
         return self._queries.get_recent_entries_for_topic(topic_slug, since, state)
 
+    def get_change_sequence(self) -> int:
+        """Get the sequence number of the latest registry change.
+
+        Returns:
+            Latest change-journal sequence number (0 if none recorded).
+        """
+        return self.load().change_sequence
+
+    def get_changes_since(self, sequence: int) -> Optional[List[RegistryChange]]:
+        """Get the registry changes recorded after ``sequence``.
+
+        See :meth:`RegistryState.changes_since`.
+
+        Args:
+            sequence: Last change-journal sequence number the caller saw.
+
+        Returns:
+            Changes oldest first, or None if the journal no longer covers
+            ``sequence`` and the caller must compare full state instead.
+        """
+        return self.load().changes_since(sequence)
+
     def get_stats(self) -> dict:
         """Get registry statistics.
 
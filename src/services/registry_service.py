@@ -11,6 +11,7 @@ from src.services.registry import RegistryService
 # Re-export models for backward compatibility
 # (these were previously imported alongside RegistryService)
 from src.models.registry import (
+    RegistryChange,
     RegistryEntry,
     RegistryState,
     IdentityMatch,
@@ -19,6 +20,7 @@ from src.models.registry import (
 
 __all__ = [
     "RegistryService",
+    "RegistryChange",
     "RegistryEntry",
     "RegistryState",
     "IdentityMatch",
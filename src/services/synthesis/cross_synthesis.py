@@ -4,9 +4,11 @@ Coordinates paper selection, prompt building, and LLM synthesis
 for cross-topic knowledge synthesis.
 """
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import structlog
 
 from src.models.cross_synthesis import (
@@ -28,6 +30,15 @@ from src.utils.exceptions import CostLimitExceeded
 logger = structlog.get_logger()
 
 
+@dataclass
+class _InFlightQuestion:
+    """A dispatched question and the budget reserved for it."""
+
+    index: int
+    question: SynthesisQuestion
+    reservation: float
+
+
 class CrossTopicSynthesisService:
     """Orchestrates cross-topic knowledge synthesis.
 
@@ -178,8 +189,7 @@ class CrossTopicSynthesisService:
         Returns:
             Tuple of (should_skip, new_papers_count).
         """
-        entries = self._paper_selector.get_all_entries()
-        return self._state_manager.should_skip_incremental(entries)
+        return self._state_manager.should_skip_incremental()
 
     async def synthesize_question(
         self,
@@ -199,26 +209,10 @@ class CrossTopicSynthesisService:
             CostLimitExceeded: If budget would be exceeded.
             ValueError: If LLM service not configured.
         """
-        # Select papers
-        papers = self.select_papers(question)
-
-        if not papers:
-            return SynthesisResult(
-                question_id=question.id,
-                question_name=question.name,
-                synthesis_text="No papers matched the criteria for this question.",
-                papers_used=[],
-                topics_covered=[],
-                tokens_used=0,
-                cost_usd=0.0,
-                model_used="none",
-                confidence=0.0,
-            )
-
-        # Build prompt with truncation if needed
-        prompt, papers = self._prompt_builder.truncate_for_token_limit(
-            question, papers, self.config.max_tokens_per_question
-        )
+        prepared = self._prepare_question(question)
+        if prepared is None:
+            return self._no_papers_result(question)
+        prompt, papers = prepared
 
         # Synthesize answer
         return await self._answer_synthesizer.synthesize(
@@ -228,6 +222,40 @@ class CrossTopicSynthesisService:
             budget_remaining=budget_remaining,
         )
 
+    def _prepare_question(
+        self, question: SynthesisQuestion
+    ) -> Optional[Tuple[str, List[PaperSummary]]]:
+        """Select a question's papers and build its (truncated) prompt.
+
+        Args:
+            question: Question to prepare.
+
+        Returns:
+            Tuple of (prompt, papers in the prompt), or None if no papers
+            matched the question.
+        """
+        papers = self.select_papers(question)
+        if not papers:
+            return None
+        return self._prompt_builder.truncate_for_token_limit(
+            question, papers, self.config.max_tokens_per_question
+        )
+
+    @staticmethod
+    def _no_papers_result(question: SynthesisQuestion) -> SynthesisResult:
+        """Result for a question no papers matched (no LLM call, no cost)."""
+        return SynthesisResult(
+            question_id=question.id,
+            question_name=question.name,
+            synthesis_text="No papers matched the criteria for this question.",
+            papers_used=[],
+            topics_covered=[],
+            tokens_used=0,
+            cost_usd=0.0,
+            model_used="none",
+            confidence=0.0,
+        )
+
     async def synthesize_all(
         self,
         force: bool = False,
@@ -246,6 +274,9 @@ class CrossTopicSynthesisService:
             force=force,
         )
 
+        # Changes recorded from here on are picked up by the next run
+        change_sequence = self._state_manager.current_change_sequence()
+
         # Check incremental mode
         should_skip, new_papers = self._should_skip_incremental()
         if should_skip and not force:
@@ -275,46 +306,10 @@ class CrossTopicSynthesisService:
                 new_papers_since_last=new_papers,
             )
 
-        # Track budget and results
-        budget_remaining = self.config.budget_per_synthesis_usd
-        results: List[SynthesisResult] = []
-        total_tokens = 0
-        total_cost = 0.0
-
-        # Process each question
-        for question in questions:
-            if budget_remaining <= 0:
-                logger.warning(
-                    "budget_exhausted",
-                    remaining_questions=len(questions) - len(results),
-                )
-                break
-
-            try:
-                result = await self.synthesize_question(
-                    question=question,
-                    budget_remaining=budget_remaining,
-                )
-
-                results.append(result)
-                total_tokens += result.tokens_used
-                total_cost += result.cost_usd
-                budget_remaining -= result.cost_usd
-
-            except CostLimitExceeded as e:
-                logger.warning(
-                    "question_skipped_budget",
-                    question_id=question.id,
-                    error=str(e),
-                )
-                break
-            except Exception as e:
-                logger.error(
-                    "question_failed",
-                    question_id=question.id,
-                    error=str(e),
-                )
-                # Continue with next question
+        # Process questions concurrently; results keep priority order
+        results = await self._synthesize_questions(questions)
+        total_tokens = sum(r.tokens_used for r in results)
+        total_cost = sum(r.cost_usd for r in results)
 
         # Generate report
         report = CrossTopicSynthesisReport(
@@ -327,10 +322,17 @@ class CrossTopicSynthesisService:
             new_papers_since_last=new_papers,
         )
 
+        # The registry hash (O(total) to compute) only backs the
+        # incremental check when the change journal cannot answer it
+        registry_hash = None
+        if self.config.incremental_mode and not self._state_manager.journal_answered:
+            registry_hash = self._calculate_registry_hash()
+
         # Update state for incremental mode
         self._state_manager.state = SynthesisState(
             last_synthesis_at=datetime.now(timezone.utc),
-            last_registry_hash=self._calculate_registry_hash(),
+            last_registry_hash=registry_hash,
+            last_change_sequence=change_sequence,
             last_report_id=report.report_id,
             questions_processed=[r.question_id for r in results],
         )
@@ -344,6 +346,106 @@ class CrossTopicSynthesisService:
 
         return report
 
+    async def _synthesize_questions(
+        self,
+        questions: List[SynthesisQuestion],
+    ) -> List[SynthesisResult]:
+        """Synthesize questions concurrently within the run budget.
+
+        Questions are dispatched in priority order, at most
+        ``max_concurrent_questions`` at a time. Each question's prompt is
+        built before dispatch and the question reserves that prompt's
+        estimated cost, which is also the budget it is given, so
+        in-flight questions can never be admitted beyond the budget cap.
+        When a question finishes, its reservation is released and its
+        actual cost charged. A question whose reservation does not fit
+        waits for in-flight ones to settle; if none are in flight it gets
+        whatever budget is left, as a sequential run would, and the run
+        stops if that is not enough.
+
+        Args:
+            questions: Enabled questions in priority order.
+
+        Returns:
+            Results of the questions that completed, in priority order.
+        """
+        budget = self.config.budget_per_synthesis_usd
+        outcomes: List[Optional[SynthesisResult]] = [None] * len(questions)
+        in_flight: Dict["asyncio.Task[SynthesisResult]", _InFlightQuestion] = {}
+        spent = 0.0
+        stopped = False
+
+        def available() -> float:
+            reserved = sum(q.reservation for q in in_flight.values())
+            return budget - spent - reserved
+
+        async def settle_one() -> None:
+            nonlocal spent, stopped
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            # Settle in priority order so logs do not depend on timing
+            for task in sorted(done, key=lambda t: in_flight[t].index):
+                flight = in_flight.pop(task)
+                try:
+                    result = task.result()
+                except CostLimitExceeded as e:
+                    logger.warning(
+                        "question_skipped_budget",
+                        question_id=flight.question.id,
+                        error=str(e),
+                    )
+                    stopped = True
+                except Exception as e:
+                    logger.error(
+                        "question_failed",
+                        question_id=flight.question.id,
+                        error=str(e),
+                    )
+                else:
+                    outcomes[flight.index] = result
+                    spent += result.cost_usd
+
+        for index, question in enumerate(questions):
+            prepared = self._prepare_question(question)
+            if prepared is None:
+                outcomes[index] = self._no_papers_result(question)
+                continue
+            prompt, papers = prepared
+            estimate = self._answer_synthesizer.estimate_cost(prompt)
+
+            while in_flight and (
+                len(in_flight) >= self.config.max_concurrent_questions
+                or available() < estimate
+            ):
+                await settle_one()
+                if stopped:
+                    break
+            if stopped:
+                break
+
+            remaining = available()
+            if remaining <= 0:
+                logger.warning(
+                    "budget_exhausted",
+                    remaining_questions=len(questions) - index,
+                )
+                break
+
+            reservation = min(estimate, remaining)
+            task = asyncio.ensure_future(
+                self._answer_synthesizer.synthesize(
+                    question=question,
+                    papers=papers,
+                    prompt=prompt,
+                    budget_remaining=reservation,
+                )
+            )
+            in_flight[task] = _InFlightQuestion(index, question, reservation)
+
+        while in_flight:
+            await settle_one()
+
+        return [r for r in outcomes if r is not None]
+
     def get_enabled_questions(self) -> List[SynthesisQuestion]:
         """Get list of enabled synthesis questions.
 
@@ -1,7 +1,9 @@
 """State management for cross-topic synthesis.
 
 Handles configuration loading, state tracking, and incremental
-synthesis detection.
+synthesis detection. Change detection reads the registry's change
+journal from the sequence seen at the last synthesis, and falls back
+to hashing every entry only when the journal cannot answer.
 """
 
 import hashlib
@@ -14,7 +16,7 @@ from src.models.cross_synthesis import (
     SynthesisConfig,
     SynthesisState,
 )
-from src.models.registry import RegistryEntry
+from src.models.registry import RegistryChange, RegistryEntry
 from src.services.registry_service import RegistryService
 
 logger = structlog.get_logger()
@@ -49,6 +51,9 @@ class SynthesisStateManager:
         self._config = config
         self._config_path = config_path or DEFAULT_CONFIG_PATH
         self._state: Optional[SynthesisState] = None
+        # Whether the last should_skip_incremental was answered by the
+        # change journal (so the run need not record a registry hash)
+        self.journal_answered = False
 
     @property
     def config(self) -> SynthesisConfig:
@@ -127,34 +132,72 @@ class SynthesisStateManager:
         combined = "|".join(entries_data)
         return hashlib.sha256(combined.encode()).hexdigest()
 
-    def should_skip_incremental(self, entries: List[RegistryEntry]) -> tuple[bool, int]:
+    def current_change_sequence(self) -> int:
+        """Get the registry's latest change-journal sequence number.
+
+        Returns:
+            Sequence number to record as seen by a synthesis run.
+        """
+        return self.registry.get_change_sequence()
+
+    def changes_since_last_synthesis(self) -> Optional[List[RegistryChange]]:
+        """Get registry changes recorded since the last synthesis.
+
+        Returns:
+            Changes oldest first, or None if there is no recorded
+            sequence or the journal no longer covers it.
+        """
+        if self._state is None or self._state.last_change_sequence is None:
+            return None
+        return self.registry.get_changes_since(self._state.last_change_sequence)
+
+    def should_skip_incremental(
+        self, entries: Optional[List[RegistryEntry]] = None
+    ) -> tuple[bool, int]:
         """Check if synthesis should be skipped in incremental mode.
 
+        Uses the registry change journal when it covers the last
+        synthesis, which costs O(changes) and counts changed papers
+        exactly; ``journal_answered`` records whether it did. Otherwise
+        compares a hash of every entry.
+
         Args:
-            entries: Current registry entries.
+            entries: Current registry entries for the hash fallback
+                (loaded from the registry if needed and None).
 
         Returns:
-            Tuple of (should_skip, new_papers_count).
+            Tuple of (should_skip, papers added or changed since last run).
         """
+        self.journal_answered = False
         if not self.config.incremental_mode:
             return False, 0
 
         if self._state is None:
             return False, 0
 
+        changes = self.changes_since_last_synthesis()
+        if changes is not None:
+            self.journal_answered = True
+            changed_papers = len({c.paper_id for c in changes})
+            if changed_papers == 0:
+                logger.info("incremental_skip_no_changes")
+                return True, 0
+            return False, changed_papers
+
         if self._state.last_registry_hash is None:
             return False, 0
 
+        if entries is None:
+            entries = list(self.registry.load().entries.values())
+
         current_hash = self.calculate_registry_hash(entries)
 
         if current_hash == self._state.last_registry_hash:
             logger.info("incremental_skip_no_changes")
             return True, 0
 
-        # Count new papers (simplified - just count difference)
+        # Without the journal, new papers can only be estimated
         current_count = len(entries)
-
-        # Estimate new papers (not perfectly accurate but useful)
         new_count = max(0, current_count - len(self._state.questions_processed) * 10)
 
         return False, new_count
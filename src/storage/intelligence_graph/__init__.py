@@ -5,13 +5,13 @@ Provides:
 - ``MigrationManager`` — versioned schema migrations
 - ``SQLiteGraphStore`` and the ``GraphStore`` Protocol
 - ``TimeSeriesStore`` — temporal data for trend analysis
-- ``GraphAlgorithms`` — algorithms (PageRank, ...) decoupled from the
+- ``GraphAlgorithms`` — algorithms (PageRank, HITS, ...) decoupled from the
   storage Protocol so the Protocol stays minimal.
 
 Re-exports the most-used surface for convenience.
 """
 
-from src.storage.intelligence_graph.algorithms import GraphAlgorithms
+from src.storage.intelligence_graph.algorithms import GraphAdjacency, GraphAlgorithms
 from src.storage.intelligence_graph.connection import open_connection
 from src.storage.intelligence_graph.migrations import (
     ALL_MIGRATIONS,
@@ -24,6 +24,7 @@ from src.storage.intelligence_graph.time_series import (
     TimeSeriesAggregate,
     TimeSeriesPoint,
     TimeSeriesStore,
+    TimeSeriesTrend,
 )
 from src.storage.intelligence_graph.unified_graph import (
     GraphStore,
@@ -34,6 +35,7 @@ __all__ = [
     "GraphStore",
     "SQLiteGraphStore",
     "GraphAlgorithms",
+    "GraphAdjacency",
     "MigrationManager",
     "Migration",
     "MIGRATION_V1_INITIAL",
@@ -41,6 +43,7 @@ __all__ = [
     "TimeSeriesStore",
     "TimeSeriesPoint",
     "TimeSeriesAggregate",
+    "TimeSeriesTrend",
     "AggregationPeriod",
     "open_connection",
 ]
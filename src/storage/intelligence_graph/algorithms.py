@@ -8,7 +8,16 @@ Keeping algorithms outside the ``GraphStore`` Protocol:
   (the original implementation hardcoded ``cites``).
 
 Currently exposes:
+- ``GraphAlgorithms.adjacency(store, edge_types, node_type)``
 - ``GraphAlgorithms.pagerank(store, edge_types, damping, iterations)``
+- ``GraphAlgorithms.hits(store, edge_types, max_iterations, epsilon)``
+
+Both scoring algorithms run as sparse matrix-vector products over a
+``scipy.sparse`` CSR adjacency matrix (one row per source node, one
+column per target node, entries counting parallel edges). Callers that
+need several algorithms over the same graph build the matrix once with
+:meth:`GraphAlgorithms.adjacency` and pass it via ``adjacency=`` so the
+node and edge tables are read a single time.
 
 The ``store`` argument is duck-typed against
 ``SQLiteGraphStore``-style read primitives (``_list_node_ids`` and
@@ -18,7 +27,9 @@ the same primitives (or a native PageRank wrapper).
 
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from typing import Any, NamedTuple, Optional, Protocol
+
+import numpy as np
 
 from src.services.intelligence.models import NodeType
 
@@ -35,9 +46,65 @@ class _PageRankReadable(Protocol):
     ) -> list[tuple[str, str]]: ...
 
 
+class GraphAdjacency(NamedTuple):
+    """Sparse adjacency of a graph projection.
+
+    ``matrix[i, j]`` counts the edges from ``node_ids[i]`` to
+    ``node_ids[j]``. Edges with an endpoint outside ``node_ids`` are
+    dropped when the matrix is built.
+    """
+
+    node_ids: list[str]
+    matrix: Any  # scipy.sparse.csr_matrix, len(node_ids) × len(node_ids)
+
+
 class GraphAlgorithms:
     """Stateless container for graph algorithms operating on a store."""
 
+    @staticmethod
+    def adjacency(
+        store: _PageRankReadable,
+        edge_types: list[str],
+        node_type: Optional[NodeType] = None,
+    ) -> GraphAdjacency:
+        """Load the node set and edges into a CSR adjacency matrix.
+
+        Args:
+            store: A graph store exposing ``_list_node_ids`` and
+                ``_list_edges_by_types``.
+            edge_types: REQUIRED list of edge-type string values to follow.
+            node_type: Optional NodeType filter for the node set.
+
+        Raises:
+            ValueError: If ``edge_types`` is empty.
+        """
+        from scipy import sparse
+
+        if not edge_types:
+            raise ValueError("GraphAlgorithms requires at least one edge type")
+
+        node_ids = store._list_node_ids(node_type=node_type)
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        rows: list[int] = []
+        cols: list[int] = []
+        for source, target in store._list_edges_by_types(edge_types):
+            i = index.get(source)
+            j = index.get(target)
+            if i is not None and j is not None:
+                rows.append(i)
+                cols.append(j)
+        n = len(node_ids)
+        # COO -> CSR sums duplicate (i, j) entries, so parallel edges keep
+        # the weight they had in the original adjacency-list walk.
+        matrix = sparse.coo_matrix(
+            (
+                np.ones(len(rows), dtype=np.float64),
+                (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)),
+            ),
+            shape=(n, n),
+        ).tocsr()
+        return GraphAdjacency(node_ids=node_ids, matrix=matrix)
+
     @staticmethod
     def pagerank(
         store: _PageRankReadable,
@@ -45,8 +112,13 @@ class GraphAlgorithms:
         damping: float = 0.85,
         iterations: int = 20,
         node_type: Optional[NodeType] = None,
+        adjacency: Optional[GraphAdjacency] = None,
     ) -> dict[str, float]:
-        """Iterative PageRank suitable for small/medium graphs.
+        """Iterative PageRank as sparse matrix-vector products.
+
+        Each iteration computes ``(1 - d) / n + d * Aᵀ (r / out_degree)``.
+        Dangling nodes (no outgoing edges) do not redistribute their
+        rank, matching the original adjacency-list implementation.
 
         Args:
             store: A graph store exposing ``_list_node_ids`` and
@@ -60,6 +132,8 @@ class GraphAlgorithms:
             iterations: Fixed iteration count (typical: 20).
             node_type: Optional NodeType filter; restricts the scoring set
                 to nodes of this type (e.g. only papers).
+            adjacency: Pre-built matrix from :meth:`adjacency`. When
+                given, the store is not read.
 
         Returns:
             ``{node_id: pagerank_score}``. Empty dict when no nodes match.
@@ -70,31 +144,94 @@ class GraphAlgorithms:
         if not edge_types:
             raise ValueError("GraphAlgorithms.pagerank requires at least one edge type")
 
-        node_ids = store._list_node_ids(node_type=node_type)
+        if adjacency is None:
+            adjacency = GraphAlgorithms.adjacency(store, edge_types, node_type)
+        node_ids, matrix = adjacency
         if not node_ids:
             return {}
 
         n = len(node_ids)
-        scores: dict[str, float] = {node_id: 1.0 / n for node_id in node_ids}
-        node_set = set(node_ids)
+        out_degree = np.asarray(matrix.sum(axis=1)).ravel()
+        inverse_degree = np.divide(
+            1.0, out_degree, out=np.zeros(n), where=out_degree > 0
+        )
+        incoming = matrix.T.tocsr()
+        scores = np.full(n, 1.0 / n)
+        for _ in range(iterations):
+            scores = (1 - damping) / n + damping * (
+                incoming @ (scores * inverse_degree)
+            )
 
-        outgoing: dict[str, list[str]] = {nid: [] for nid in node_ids}
-        incoming: dict[str, list[str]] = {nid: [] for nid in node_ids}
+        return dict(zip(node_ids, scores.tolist()))
 
-        for source, target in store._list_edges_by_types(edge_types):
-            if source in node_set and target in node_set:
-                outgoing[source].append(target)
-                incoming[target].append(source)
+    @staticmethod
+    def hits(
+        store: _PageRankReadable,
+        edge_types: list[str],
+        max_iterations: int = 100,
+        epsilon: float = 1e-6,
+        node_type: Optional[NodeType] = None,
+        adjacency: Optional[GraphAdjacency] = None,
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """HITS power iteration as sparse matrix-vector products.
 
-        for _ in range(iterations):
-            new_scores: dict[str, float] = {}
-            for node_id in node_ids:
-                rank = (1 - damping) / n
-                for source in incoming[node_id]:
-                    out_degree = len(outgoing[source])
-                    if out_degree > 0:
-                        rank += damping * scores[source] / out_degree
-                new_scores[node_id] = rank
-            scores = new_scores
-
-        return scores
+        Authorities are ``Aᵀ h`` and hubs are ``A a``; both vectors are
+        L2-normalised every iteration. Stops after ``max_iterations`` or
+        once the largest per-node change in either vector drops below
+        ``epsilon``.
+
+        Args:
+            store: A graph store exposing ``_list_node_ids`` and
+                ``_list_edges_by_types``.
+            edge_types: REQUIRED list of edge-type string values to follow.
+            max_iterations: Upper bound on power iterations.
+            epsilon: Convergence threshold on the max per-node delta.
+            node_type: Optional NodeType filter for the scoring set.
+            adjacency: Pre-built matrix from :meth:`adjacency`. When
+                given, the store is not read.
+
+        Returns:
+            ``(hubs, authorities)`` keyed by node id. Both empty when no
+            nodes match.
+
+        Raises:
+            ValueError: If ``edge_types`` is empty.
+        """
+        if not edge_types:
+            raise ValueError("GraphAlgorithms.hits requires at least one edge type")
+
+        if adjacency is None:
+            adjacency = GraphAlgorithms.adjacency(store, edge_types, node_type)
+        node_ids, matrix = adjacency
+        if not node_ids:
+            return {}, {}
+
+        n = len(node_ids)
+        incoming = matrix.T.tocsr()
+        hubs = np.ones(n)
+        authorities = np.ones(n)
+        for _ in range(max_iterations):
+            new_authorities = incoming @ hubs
+            # Hubs are computed from the un-normalised authorities; the
+            # scale cancels out in the hub normalisation below.
+            new_hubs = matrix @ new_authorities
+
+            auth_norm = float(np.linalg.norm(new_authorities))
+            hub_norm = float(np.linalg.norm(new_hubs))
+            if auth_norm > 0:
+                new_authorities = new_authorities / auth_norm
+            if hub_norm > 0:
+                new_hubs = new_hubs / hub_norm
+
+            delta = max(
+                float(np.max(np.abs(new_authorities - authorities))),
+                float(np.max(np.abs(new_hubs - hubs))),
+            )
+            authorities = new_authorities
+            hubs = new_hubs
+            if delta < epsilon:
+                break
+
+        return dict(zip(node_ids, hubs.tolist())), dict(
+            zip(node_ids, authorities.tolist())
+        )
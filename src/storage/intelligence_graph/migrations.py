@@ -672,6 +672,86 @@ MIGRATION_V8_BACKFILL_PAPERS = Migration(
 )
 
 
+# Schema version 9: Materialized time-series rollups.
+#
+# Background
+# ----------
+# ``TimeSeriesStore.aggregate`` used to pull every raw point in the
+# requested range into Python and bucket it there, so trend dashboards
+# slowed down linearly with history. V9 adds a rollup table holding
+# COUNT / SUM / MIN / MAX per (series, metric, bucket) for weekly and
+# monthly buckets. ``TimeSeriesStore`` keeps it in sync inside the same
+# transaction as every raw write.
+#
+# Daily buckets are not materialized: ``time_series`` is keyed on
+# (series_id, period, metric_name), so a daily bucket always holds
+# exactly one raw row and a daily rollup would duplicate the table.
+#
+# Bucket expressions mirror ``time_series._BUCKET_SQL``: weeks start on
+# Monday (``strftime('%w')`` is 0 for Sunday, so ``(w + 6) % 7`` is the
+# number of days since Monday); months start on day 1.
+#
+# The composite ``(series_id, metric_name, period)`` index serves the
+# per-series range scans that aggregation, rollup refresh and velocity
+# queries all issue; the V1 primary key puts ``period`` before
+# ``metric_name``, so a metric-filtered range scan reads every metric's
+# rows in the range.
+#
+# Existing raw points are backfilled by the migration itself.
+MIGRATION_V9_TIME_SERIES_ROLLUPS = Migration(
+    version=9,
+    name="time_series_rollups",
+    description=(
+        "Add time_series_rollups (weekly/monthly COUNT/SUM/MIN/MAX) and a "
+        "(series_id, metric_name, period) index; backfill from time_series."
+    ),
+    up="""
+    CREATE TABLE IF NOT EXISTS time_series_rollups (
+        series_id TEXT NOT NULL,
+        metric_name TEXT NOT NULL,
+        granularity TEXT NOT NULL
+            CHECK (granularity IN ('weekly', 'monthly')),
+        bucket_start TEXT NOT NULL,
+        bucket_end TEXT NOT NULL,
+        point_count INTEGER NOT NULL CHECK (point_count > 0),
+        sum_value REAL NOT NULL,
+        min_value REAL NOT NULL,
+        max_value REAL NOT NULL,
+        PRIMARY KEY (series_id, metric_name, granularity, bucket_start)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_time_series_series_metric_period
+        ON time_series(series_id, metric_name, period);
+
+    INSERT OR REPLACE INTO time_series_rollups (
+        series_id, metric_name, granularity, bucket_start, bucket_end,
+        point_count, sum_value, min_value, max_value
+    )
+    SELECT series_id, metric_name, 'weekly',
+        date(period, '-' || ((CAST(strftime('%w', period) AS INTEGER) + 6) % 7)
+            || ' days'),
+        date(period, '+' || (6 - (CAST(strftime('%w', period) AS INTEGER) + 6) % 7)
+            || ' days'),
+        COUNT(*), SUM(value), MIN(value), MAX(value)
+    FROM time_series
+    GROUP BY series_id, metric_name,
+        date(period, '-' || ((CAST(strftime('%w', period) AS INTEGER) + 6) % 7)
+            || ' days');
+
+    INSERT OR REPLACE INTO time_series_rollups (
+        series_id, metric_name, granularity, bucket_start, bucket_end,
+        point_count, sum_value, min_value, max_value
+    )
+    SELECT series_id, metric_name, 'monthly',
+        date(period, 'start of month'),
+        date(period, 'start of month', '+1 month', '-1 day'),
+        COUNT(*), SUM(value), MIN(value), MAX(value)
+    FROM time_series
+    GROUP BY series_id, metric_name, date(period, 'start of month');
+    """,
+)
+
+
 # All migrations in order
 ALL_MIGRATIONS: list[Migration] = [
     MIGRATION_V1_INITIAL,
@@ -682,6 +762,7 @@ ALL_MIGRATIONS: list[Migration] = [
     MIGRATION_V6_CITATION_COUPLING_CACHE,
     MIGRATION_V7_BACKFILL_COLUMNS,
     MIGRATION_V8_BACKFILL_PAPERS,
+    MIGRATION_V9_TIME_SERIES_ROLLUPS,
 ]
 
 
@@ -689,7 +770,7 @@ ALL_MIGRATIONS: list[Migration] = [
 # need to assert "we are on the canonical schema" import this rather
 # than counting ``ALL_MIGRATIONS`` so a future migration addition is
 # a single-line update.
-LATEST_MIGRATION_VERSION = 8
+LATEST_MIGRATION_VERSION = 9
 
 
 class MigrationManager:
@@ -3,7 +3,10 @@
 This module provides:
 - Temporal data storage for trend analysis (Milestone 9.4)
 - Time series CRUD operations
-- Aggregation queries (daily, weekly, monthly)
+- Aggregation queries (daily, weekly, monthly) computed in SQL
+- Materialized weekly / monthly rollups (``time_series_rollups``, V9)
+  kept in sync with every raw write
+- Bulk velocity / acceleration for many series in one query
 - Efficient querying by time range and metric
 
 Used for:
@@ -19,7 +22,7 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import structlog
 
@@ -37,6 +40,37 @@ class AggregationPeriod(str, Enum):
     MONTHLY = "monthly"
 
 
+# SQL expressions mapping the ISO ``period`` column to its bucket
+# (start, end). Weeks start on Monday: ``strftime('%w')`` is 0 for
+# Sunday, so ``(w + 6) % 7`` is the number of days since Monday. Must
+# agree with ``TimeSeriesStore._get_bucket`` and with the backfill in
+# ``MIGRATION_V9_TIME_SERIES_ROLLUPS``.
+_DAYS_SINCE_MONDAY_SQL = "((CAST(strftime('%w', period) AS INTEGER) + 6) % 7)"
+_BUCKET_SQL: dict[AggregationPeriod, tuple[str, str]] = {
+    AggregationPeriod.DAILY: ("period", "period"),
+    AggregationPeriod.WEEKLY: (
+        f"date(period, '-' || {_DAYS_SINCE_MONDAY_SQL} || ' days')",
+        f"date(period, '+' || (6 - {_DAYS_SINCE_MONDAY_SQL}) || ' days')",
+    ),
+    AggregationPeriod.MONTHLY: (
+        "date(period, 'start of month')",
+        "date(period, 'start of month', '+1 month', '-1 day')",
+    ),
+}
+
+# Granularities materialized in ``time_series_rollups``. Daily buckets
+# hold exactly one raw row (the raw table is keyed on the date), so
+# they are served straight from ``time_series``.
+_ROLLUP_PERIODS: tuple[AggregationPeriod, ...] = (
+    AggregationPeriod.WEEKLY,
+    AggregationPeriod.MONTHLY,
+)
+
+# ``compute_trends`` binds two parameters per requested series; chunking
+# keeps each ``IN (VALUES ...)`` list under SQLite's bind limit.
+_TRENDS_CHUNK_SERIES = 400
+
+
 @dataclass
 class TimeSeriesPoint:
     """A single point in a time series.
@@ -83,13 +117,33 @@ class TimeSeriesAggregate:
     max_value: float
 
 
+@dataclass
+class TimeSeriesTrend:
+    """Velocity and acceleration of one (series, metric) pair.
+
+    Attributes:
+        series_id: Identifier for the time series
+        metric_name: Name of the metric
+        velocity: Same value as ``compute_velocity``; None if insufficient data
+        acceleration: Same value as ``compute_acceleration``; None if
+            insufficient data
+    """
+
+    series_id: str
+    metric_name: str
+    velocity: Optional[float]
+    acceleration: Optional[float]
+
+
 class TimeSeriesStore:
     """Time series storage using SQLite.
 
     Features:
     - Store time-indexed metrics for trend analysis
     - Efficient range queries
-    - Aggregation support (daily, weekly, monthly)
+    - Aggregation support (daily, weekly, monthly), pushed into SQL and
+      served from materialized rollups where buckets are complete
+    - Bulk trend (velocity / acceleration) computation
     - Metadata storage for context
 
     Usage:
@@ -217,6 +271,7 @@ class TimeSeriesStore:
                 """,
                 (series_id, period_str, metric_name, value, metadata_json),
             )
+            self._refresh_rollups(conn, {(series_id, metric_name): (period, period)})
             conn.commit()
 
             logger.debug(
@@ -240,6 +295,10 @@ class TimeSeriesStore:
     def add_points_batch(self, points: list[TimeSeriesPoint]) -> int:
         """Add multiple data points efficiently.
 
+        The raw rows and the rollup buckets they touch are written in one
+        transaction, so readers never see rollups out of step with the
+        raw table.
+
         Args:
             points: List of TimeSeriesPoint objects
 
@@ -270,6 +329,12 @@ class TimeSeriesStore:
                 """,
                 data,
             )
+            spans: dict[tuple[str, str], tuple[date, date]] = {}
+            for p in points:
+                key = (p.series_id, p.metric_name)
+                lo, hi = spans.get(key, (p.period, p.period))
+                spans[key] = (min(lo, p.period), max(hi, p.period))
+            self._refresh_rollups(conn, spans)
             conn.commit()
 
             logger.debug("time_series_batch_added", count=len(points))
@@ -410,6 +475,11 @@ class TimeSeriesStore:
     ) -> list[TimeSeriesAggregate]:
         """Aggregate data points by time period.
 
+        Buckets lying entirely inside ``[start_date, end_date]`` are read
+        from the materialized ``time_series_rollups``; the partial
+        buckets at either edge (and every daily bucket) are grouped in
+        SQL over the raw rows. No raw point is loaded into Python.
+
         Args:
             series_id: Identifier for the time series
             metric_name: Name of the metric
@@ -418,47 +488,154 @@ class TimeSeriesStore:
             end_date: End of date range (inclusive)
 
         Returns:
-            List of TimeSeriesAggregate objects
+            List of TimeSeriesAggregate objects ordered by bucket start
         """
+        if start_date > end_date:
+            return []
+
+        raw_ranges: list[tuple[date, date]] = [(start_date, end_date)]
+        rollup_range: Optional[tuple[date, date]] = None
+        if period in _ROLLUP_PERIODS:
+            first_start, first_end = self._get_bucket(start_date, period)
+            last_start, last_end = self._get_bucket(end_date, period)
+            full_start = (
+                start_date
+                if first_start == start_date
+                else first_end + timedelta(days=1)
+            )
+            full_end = (
+                end_date if last_end == end_date else last_start - timedelta(days=1)
+            )
+            if full_start <= full_end:
+                rollup_range = (full_start, full_end)
+                raw_ranges = [
+                    (lo, hi)
+                    for lo, hi in (
+                        (start_date, full_start - timedelta(days=1)),
+                        (full_end + timedelta(days=1), end_date),
+                    )
+                    if lo <= hi
+                ]
+
         conn = self._get_connection()
         try:
-            # Get all points in range
-            points = self.get_range(series_id, metric_name, start_date, end_date)
-
-            if not points:
-                return []
-
-            # Group points by period
-            buckets: dict[tuple[date, date], list[float]] = {}
-
-            for point in points:
-                bucket_start, bucket_end = self._get_bucket(point.period, period)
-                key = (bucket_start, bucket_end)
-                if key not in buckets:
-                    buckets[key] = []
-                buckets[key].append(point.value)
-
-            # Compute aggregates
-            result = []
-            for (bucket_start, bucket_end), values in sorted(buckets.items()):
-                result.append(
-                    TimeSeriesAggregate(
-                        series_id=series_id,
-                        metric_name=metric_name,
-                        period_start=bucket_start,
-                        period_end=bucket_end,
-                        count=len(values),
-                        sum_value=sum(values),
-                        avg_value=sum(values) / len(values),
-                        min_value=min(values),
-                        max_value=max(values),
-                    )
+            rows: list[sqlite3.Row] = []
+            if rollup_range is not None:
+                cursor = conn.execute(
+                    """
+                    SELECT bucket_start, bucket_end, point_count,
+                           sum_value, min_value, max_value
+                    FROM time_series_rollups
+                    WHERE series_id = ? AND metric_name = ? AND granularity = ?
+                    AND bucket_start >= ? AND bucket_end <= ?
+                    """,
+                    (
+                        series_id,
+                        metric_name,
+                        period.value,
+                        rollup_range[0].isoformat(),
+                        rollup_range[1].isoformat(),
+                    ),
+                )
+                rows.extend(cursor.fetchall())
+            for lo, hi in raw_ranges:
+                rows.extend(
+                    self._aggregate_raw(conn, series_id, metric_name, period, lo, hi)
                 )
-
-            return result
         finally:
             conn.close()
 
+        return [
+            TimeSeriesAggregate(
+                series_id=series_id,
+                metric_name=metric_name,
+                period_start=date.fromisoformat(row["bucket_start"]),
+                period_end=date.fromisoformat(row["bucket_end"]),
+                count=row["point_count"],
+                sum_value=row["sum_value"],
+                avg_value=row["sum_value"] / row["point_count"],
+                min_value=row["min_value"],
+                max_value=row["max_value"],
+            )
+            for row in sorted(rows, key=lambda r: str(r["bucket_start"]))
+        ]
+
+    @staticmethod
+    def _aggregate_raw(
+        conn: sqlite3.Connection,
+        series_id: str,
+        metric_name: str,
+        period: AggregationPeriod,
+        start_date: date,
+        end_date: date,
+    ) -> list[sqlite3.Row]:
+        """Group raw points in ``[start_date, end_date]`` into buckets in SQL."""
+        bucket_start, bucket_end = _BUCKET_SQL[period]
+        cursor = conn.execute(
+            f"""
+            SELECT {bucket_start} AS bucket_start, {bucket_end} AS bucket_end,
+                   COUNT(*) AS point_count, SUM(value) AS sum_value,
+                   MIN(value) AS min_value, MAX(value) AS max_value
+            FROM time_series
+            WHERE series_id = ? AND metric_name = ?
+            AND period >= ? AND period <= ?
+            GROUP BY 1
+            """,
+            (series_id, metric_name, start_date.isoformat(), end_date.isoformat()),
+        )
+        return cursor.fetchall()
+
+    def _refresh_rollups(
+        self,
+        conn: sqlite3.Connection,
+        spans: dict[tuple[str, str], tuple[date, date]],
+    ) -> None:
+        """Recompute the rollup buckets overlapping each changed span.
+
+        ``spans`` maps ``(series_id, metric_name)`` to the inclusive date
+        range whose raw rows changed. Every weekly / monthly bucket
+        touching that range is deleted and rebuilt from the raw table,
+        which handles inserts, replaced values and deletions alike; a
+        bucket left without raw rows simply is not re-inserted. Runs on
+        the caller's connection so it commits with the raw write.
+        """
+        for period in _ROLLUP_PERIODS:
+            bucket_start, bucket_end = _BUCKET_SQL[period]
+            params: list[tuple[str, ...]] = []
+            for (series_id, metric_name), (lo, hi) in spans.items():
+                params.append(
+                    (
+                        series_id,
+                        metric_name,
+                        period.value,
+                        self._get_bucket(lo, period)[0].isoformat(),
+                        self._get_bucket(hi, period)[1].isoformat(),
+                    )
+                )
+            conn.executemany(
+                """
+                DELETE FROM time_series_rollups
+                WHERE series_id = ? AND metric_name = ? AND granularity = ?
+                AND bucket_start >= ? AND bucket_start <= ?
+                """,
+                params,
+            )
+            conn.executemany(
+                f"""
+                INSERT INTO time_series_rollups (
+                    series_id, metric_name, granularity, bucket_start,
+                    bucket_end, point_count, sum_value, min_value, max_value
+                )
+                SELECT series_id, metric_name, ?3, {bucket_start}, {bucket_end},
+                       COUNT(*), SUM(value), MIN(value), MAX(value)
+                FROM time_series
+                WHERE series_id = ?1 AND metric_name = ?2
+                AND period >= ?4 AND period <= ?5
+                GROUP BY {bucket_start}
+                """,
+                params,
+            )
+
     def _get_bucket(self, d: date, period: AggregationPeriod) -> tuple[date, date]:
         """Get the bucket (start, end) for a date and aggregation period.
 
@@ -496,6 +673,8 @@ class TimeSeriesStore:
         Velocity is calculated as (recent_avg - older_avg) / window_days,
         comparing the most recent window to the previous window.
 
+        Single-series form of :meth:`compute_trends`.
+
         Args:
             series_id: Identifier for the time series
             metric_name: Name of the metric
@@ -504,59 +683,10 @@ class TimeSeriesStore:
         Returns:
             Velocity value, or None if insufficient data
         """
-        conn = self._get_connection()
-        try:
-            today = date.today()
-            recent_start = today - timedelta(days=window_days)
-            older_start = recent_start - timedelta(days=window_days)
-
-            # Get recent window average
-            cursor = conn.execute(
-                """
-                SELECT AVG(value) as avg_value, COUNT(*) as count
-                FROM time_series
-                WHERE series_id = ? AND metric_name = ?
-                AND period >= ? AND period <= ?
-                """,
-                (series_id, metric_name, recent_start.isoformat(), today.isoformat()),
-            )
-            recent_row = cursor.fetchone()
-
-            # Get older window average
-            cursor = conn.execute(
-                """
-                SELECT AVG(value) as avg_value, COUNT(*) as count
-                FROM time_series
-                WHERE series_id = ? AND metric_name = ?
-                AND period >= ? AND period < ?
-                """,
-                (
-                    series_id,
-                    metric_name,
-                    older_start.isoformat(),
-                    recent_start.isoformat(),
-                ),
-            )
-            older_row = cursor.fetchone()
-
-            # Need data in both windows
-            if (
-                not recent_row
-                or not older_row
-                or recent_row["count"] == 0
-                or older_row["count"] == 0
-            ):
-                return None
-
-            recent_avg = float(recent_row["avg_value"])
-            older_avg = float(older_row["avg_value"])
-
-            # Velocity = change per day
-            velocity: float = (recent_avg - older_avg) / window_days
-
-            return velocity
-        finally:
-            conn.close()
+        trend = self.compute_trends([(series_id, metric_name)], window_days).get(
+            (series_id, metric_name)
+        )
+        return trend.velocity if trend else None
 
     def compute_acceleration(
         self,
@@ -568,6 +698,8 @@ class TimeSeriesStore:
 
         Acceleration measures how velocity is changing over time.
 
+        Single-series form of :meth:`compute_trends`.
+
         Args:
             series_id: Identifier for the time series
             metric_name: Name of the metric
@@ -576,48 +708,128 @@ class TimeSeriesStore:
         Returns:
             Acceleration value, or None if insufficient data
         """
-        # Compute velocity for two consecutive periods
-        # For acceleration, we need 3 windows of data
-        conn = self._get_connection()
-        try:
-            today = date.today()
-            w1_start = today - timedelta(days=window_days)
-            w2_start = w1_start - timedelta(days=window_days)
-            w3_start = w2_start - timedelta(days=window_days)
-
-            # Get averages for each window
-            windows = []
-            for start, end in [
-                (w3_start, w2_start),
-                (w2_start, w1_start),
-                (w1_start, today),
-            ]:
-                cursor = conn.execute(
-                    """
-                    SELECT AVG(value) as avg_value, COUNT(*) as count
-                    FROM time_series
-                    WHERE series_id = ? AND metric_name = ?
-                    AND period >= ? AND period < ?
-                    """,
-                    (series_id, metric_name, start.isoformat(), end.isoformat()),
-                )
-                row = cursor.fetchone()
-                if not row or row["count"] == 0:
-                    return None
-                windows.append(row["avg_value"])
+        trend = self.compute_trends([(series_id, metric_name)], window_days).get(
+            (series_id, metric_name)
+        )
+        return trend.acceleration if trend else None
+
+    def compute_trends(
+        self,
+        series: Optional[Sequence[tuple[str, str]]] = None,
+        window_days: int = 30,
+    ) -> dict[tuple[str, str], TimeSeriesTrend]:
+        """Compute velocity and acceleration for many series at once.
+
+        One grouped query (per :data:`_TRENDS_CHUNK_SERIES` requested
+        series) sums and counts the points of every series in each of
+        the three trailing windows, replacing the two-plus-three window
+        queries per series that :meth:`compute_velocity` and
+        :meth:`compute_acceleration` used to issue.
 
-            # Velocity in older period
-            v1: float = (windows[1] - windows[0]) / window_days
-            # Velocity in recent period
-            v2: float = (windows[2] - windows[1]) / window_days
+        Window semantics match the single-series methods exactly:
 
-            # Acceleration = change in velocity
-            acceleration: float = (v2 - v1) / window_days
+        - velocity compares ``[today - w, today]`` with
+          ``[today - 2w, today - w)``;
+        - acceleration compares the three half-open windows
+          ``[today - 3w, today - 2w)``, ``[today - 2w, today - w)`` and
+          ``[today - w, today)``.
+
+        Args:
+            series: ``(series_id, metric_name)`` pairs to evaluate, or
+                None for every pair with data in the last three windows.
+            window_days: Window size in days for comparison
+
+        Returns:
+            Mapping of ``(series_id, metric_name)`` to
+            :class:`TimeSeriesTrend`. Pairs with no points in the last
+            three windows are absent.
+        """
+        today = date.today()
+        w1_start = today - timedelta(days=window_days)
+        w2_start = w1_start - timedelta(days=window_days)
+        w3_start = w2_start - timedelta(days=window_days)
+        window_params = (
+            w1_start.isoformat(),
+            today.isoformat(),
+            w2_start.isoformat(),
+            w3_start.isoformat(),
+        )
+        # ?1 = w1_start, ?2 = today, ?3 = w2_start, ?4 = w3_start.
+        sql = """
+            SELECT series_id, metric_name,
+                SUM(CASE WHEN period >= ?1 AND period < ?2 THEN value END) AS s1,
+                COUNT(CASE WHEN period >= ?1 AND period < ?2 THEN 1 END) AS c1,
+                SUM(CASE WHEN period = ?2 THEN value END) AS s0,
+                COUNT(CASE WHEN period = ?2 THEN 1 END) AS c0,
+                SUM(CASE WHEN period >= ?3 AND period < ?1 THEN value END) AS s2,
+                COUNT(CASE WHEN period >= ?3 AND period < ?1 THEN 1 END) AS c2,
+                SUM(CASE WHEN period >= ?4 AND period < ?3 THEN value END) AS s3,
+                COUNT(CASE WHEN period >= ?4 AND period < ?3 THEN 1 END) AS c3
+            FROM time_series
+            WHERE period >= ?4 AND period <= ?2 {series_filter}
+            GROUP BY series_id, metric_name
+        """
 
-            return acceleration
+        conn = self._get_connection()
+        try:
+            rows: list[sqlite3.Row] = []
+            if series is None:
+                cursor = conn.execute(sql.format(series_filter=""), window_params)
+                rows.extend(cursor.fetchall())
+            else:
+                pairs = list(dict.fromkeys(series))
+                for start in range(0, len(pairs), _TRENDS_CHUNK_SERIES):
+                    chunk = pairs[start : start + _TRENDS_CHUNK_SERIES]
+                    # Placeholders are built from a count, never from data.
+                    values = ",".join(["(?, ?)"] * len(chunk))
+                    cursor = conn.execute(
+                        sql.format(
+                            series_filter=(
+                                "AND (series_id, metric_name) " f"IN (VALUES {values})"
+                            )
+                        ),
+                        window_params + tuple(v for pair in chunk for v in pair),
+                    )
+                    rows.extend(cursor.fetchall())
         finally:
             conn.close()
 
+        trends: dict[tuple[str, str], TimeSeriesTrend] = {}
+        for row in rows:
+            key = (row["series_id"], row["metric_name"])
+            trends[key] = TimeSeriesTrend(
+                series_id=key[0],
+                metric_name=key[1],
+                velocity=self._trend_velocity(row, window_days),
+                acceleration=self._trend_acceleration(row, window_days),
+            )
+        return trends
+
+    @staticmethod
+    def _trend_velocity(row: sqlite3.Row, window_days: int) -> Optional[float]:
+        """Velocity from one ``compute_trends`` row (today counts as recent)."""
+        recent_count = row["c1"] + row["c0"]
+        if recent_count == 0 or row["c2"] == 0:
+            return None
+        recent_avg = ((row["s1"] or 0.0) + (row["s0"] or 0.0)) / recent_count
+        older_avg = row["s2"] / row["c2"]
+        velocity: float = (recent_avg - older_avg) / window_days
+        return velocity
+
+    @staticmethod
+    def _trend_acceleration(row: sqlite3.Row, window_days: int) -> Optional[float]:
+        """Acceleration from one ``compute_trends`` row (today excluded)."""
+        if row["c1"] == 0 or row["c2"] == 0 or row["c3"] == 0:
+            return None
+        w1 = row["s1"] / row["c1"]
+        w2 = row["s2"] / row["c2"]
+        w3 = row["s3"] / row["c3"]
+        # Velocity in older period, then in recent period.
+        v1 = (w2 - w3) / window_days
+        v2 = (w1 - w2) / window_days
+        acceleration: float = (v2 - v1) / window_days
+        return acceleration
+
     def delete_range(
         self,
         series_id: str,
@@ -651,9 +863,13 @@ class TimeSeriesStore:
                     end_date.isoformat(),
                 ),
             )
+            deleted = cursor.rowcount
+            if deleted > 0:
+                self._refresh_rollups(
+                    conn, {(series_id, metric_name): (start_date, end_date)}
+                )
             conn.commit()
 
-            deleted = cursor.rowcount
             if deleted > 0:
                 logger.debug(
                     "time_series_range_deleted",
@@ -681,6 +897,10 @@ class TimeSeriesStore:
                 "DELETE FROM time_series WHERE series_id = ?",
                 (series_id,),
             )
+            conn.execute(
+                "DELETE FROM time_series_rollups WHERE series_id = ?",
+                (series_id,),
+            )
             conn.commit()
 
             deleted = cursor.rowcount
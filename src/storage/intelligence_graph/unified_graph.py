@@ -1248,6 +1248,150 @@ class SQLiteGraphStore:
         finally:
             conn.close()
 
+    def _list_incoming_edges_for_nodes(
+        self,
+        target_ids: list[str],
+        edge_type_values: list[str],
+    ) -> dict[str, list[str]]:
+        """Return incoming edge sources grouped by target, for the given nodes.
+
+        Reverse-direction twin of :meth:`_list_outgoing_edges_for_nodes`;
+        used by ``CouplingAnalyzer`` to load co-citation adjacency in one
+        query.  Not part of the GraphStore Protocol.
+
+        Args:
+            target_ids: Node ids whose incoming edges should be fetched.
+            edge_type_values: Edge-type string values to filter by.
+
+        Returns:
+            A dict mapping each target id to its list of source node ids.
+            Target ids with no incoming edges are absent from the dict.
+        """
+        if not target_ids or not edge_type_values:
+            return {}
+        conn = self._get_connection()
+        try:
+            tgt_placeholders = ",".join("?" * len(target_ids))
+            type_placeholders = ",".join("?" * len(edge_type_values))
+            cursor = conn.execute(
+                f"""
+                SELECT source_id, target_id FROM edges
+                WHERE target_id IN ({tgt_placeholders})
+                  AND edge_type IN ({type_placeholders})
+                """,
+                tuple(target_ids) + tuple(edge_type_values),
+            )
+            result: dict[str, list[str]] = {}
+            for row in cursor.fetchall():
+                tgt = row["target_id"]
+                result.setdefault(tgt, []).append(row["source_id"])
+            return result
+        finally:
+            conn.close()
+
+    def _count_incoming_edges_for_nodes(
+        self,
+        target_ids: list[str],
+        edge_type_values: list[str],
+    ) -> dict[str, int]:
+        """Return the incoming edge count per target, for the given nodes.
+
+        Bulk form of :meth:`get_inbound_citer_count`, used by
+        ``CouplingAnalyzer`` to apply its co-citation DoS cap *before*
+        loading any citer rows.  Not part of the GraphStore Protocol.
+
+        Returns:
+            A dict mapping target id to edge count.  Targets with no
+            incoming edges are absent from the dict.
+        """
+        if not target_ids or not edge_type_values:
+            return {}
+        conn = self._get_connection()
+        try:
+            tgt_placeholders = ",".join("?" * len(target_ids))
+            type_placeholders = ",".join("?" * len(edge_type_values))
+            cursor = conn.execute(
+                f"""
+                SELECT target_id, COUNT(*) AS cnt FROM edges
+                WHERE target_id IN ({tgt_placeholders})
+                  AND edge_type IN ({type_placeholders})
+                GROUP BY target_id
+                """,
+                tuple(target_ids) + tuple(edge_type_values),
+            )
+            return {row["target_id"]: row["cnt"] for row in cursor.fetchall()}
+        finally:
+            conn.close()
+
+    def _get_nodes_by_ids(self, node_ids: list[str]) -> dict[str, GraphNode]:
+        """Return the stored nodes for ``node_ids``, keyed by id.
+
+        Bulk form of :meth:`get_node` used by ``InfluenceScorer`` to
+        hydrate every scored paper in one chunked query.  Ids with no
+        stored node are absent from the dict.  Not part of the
+        GraphStore Protocol.
+        """
+        if not node_ids:
+            return {}
+        conn = self._get_connection()
+        try:
+            return self._fetch_nodes_by_ids(conn, node_ids)
+        finally:
+            conn.close()
+
+    def _list_neighbourhood_changes(
+        self,
+        edge_type_values: list[str],
+        node_type: Optional[NodeType] = None,
+    ) -> dict[str, datetime]:
+        """Return when each node's neighbourhood last changed.
+
+        A node's neighbourhood changes when its own row is updated or an
+        incident edge of one of ``edge_type_values`` is added.  The
+        result maps node id to the latest of ``nodes.updated_at`` and
+        the ``created_at`` of its incident edges, computed in a single
+        grouped query.  Used by ``InfluenceScorer`` for incremental
+        recomputation; not part of the GraphStore Protocol.
+
+        Edge deletions leave no timestamp behind and are therefore not
+        reported; callers rely on their own TTL to pick those up.
+        """
+        if not edge_type_values:
+            return {}
+        conn = self._get_connection()
+        try:
+            type_placeholders = ",".join("?" * len(edge_type_values))
+            node_filter = "AND n.node_type = ?" if node_type else ""
+            params: tuple[str, ...] = tuple(edge_type_values) * 2
+            if node_type:
+                params += (node_type.value,)
+            cursor = conn.execute(
+                f"""
+                SELECT c.node_id AS node_id, MAX(c.ts) AS changed_at
+                FROM (
+                    SELECT node_id, updated_at AS ts FROM nodes
+                    UNION ALL
+                    SELECT source_id, created_at FROM edges
+                    WHERE edge_type IN ({type_placeholders})
+                    UNION ALL
+                    SELECT target_id, created_at FROM edges
+                    WHERE edge_type IN ({type_placeholders})
+                ) AS c
+                JOIN nodes n ON n.node_id = c.node_id {node_filter}
+                GROUP BY c.node_id
+                """,
+                params,
+            )
+            result: dict[str, datetime] = {}
+            for row in cursor.fetchall():
+                changed_at = datetime.fromisoformat(row["changed_at"])
+                if changed_at.tzinfo is None:
+                    changed_at = changed_at.replace(tzinfo=timezone.utc)
+                result[row["node_id"]] = changed_at
+            return result
+        finally:
+            conn.close()
+
     def get_papers_citing_both(self, paper_a_id: str, paper_b_id: str) -> set[str]:
         """Return node ids that have outgoing CITES edges to BOTH target papers.
 
@@ -1,49 +1,305 @@
+"""Token bucket rate limiting for outbound API calls.
+
+``RateLimiter`` is shared by every provider and citation client:
+
+- **Fair.** ``acquire`` reserves the next free slot under an
+  ``asyncio.Lock`` and sleeps *outside* it until that slot. Concurrent
+  callers therefore leave in FIFO order, one ``1 / rate`` apart, instead
+  of all computing the same wait and firing together. A waiter cancelled
+  before its slot comes due hands the slot back. The lock is created per
+  event loop, so a module-level limiter survives ``asyncio.run`` calls.
+- **Adaptive.** ``record_throttled`` (called on a 429) halves the
+  effective rate and, when the caller passes the server's
+  ``Retry-After``, pauses the bucket until it expires. The rate
+  recovers step by step once the upstream stops pushing back.
+- **Optionally process-shared.** A limiter constructed with a ``name``
+  and a SQLite path (``shared_path`` or the ``ARISP_RATE_LIMIT_DB`` env
+  var) keeps its bucket in a row of that database keyed by name, so the
+  scheduler and a CLI run on the same host draw from one budget. Every
+  limiter of one name must use the same rate and burst size.
+"""
+
 import asyncio
+import os
+import sqlite3
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import List
+from pathlib import Path
+from typing import Callable, Deque, Optional, TypeVar, Union
+
 import structlog
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+_SHARED_DB_ENV_VAR = "ARISP_RATE_LIMIT_DB"
+_SHARED_DB_TIMEOUT_SECONDS = 30.0
+
+# Abuse detection: warn when more than this many requests leave the
+# bucket within the trailing window.
+_ABUSE_THRESHOLD = 500
+_ABUSE_WINDOW = timedelta(minutes=1)
+
+# Adaptive rate: each 429 multiplies the rate by _BACKOFF_FACTOR (never
+# below _MIN_RATE_FRACTION of the configured rate); every
+# _RECOVERY_INTERVAL_SECONDS without another 429 multiplies it back by
+# _RECOVERY_FACTOR until the configured rate is reached again.
+_BACKOFF_FACTOR = 0.5
+_MIN_RATE_FRACTION = 0.1
+_RECOVERY_FACTOR = 1.5
+_RECOVERY_INTERVAL_SECONDS = 60.0
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+        name TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        last_update REAL NOT NULL,
+        penalty REAL NOT NULL,
+        penalized_at REAL NOT NULL
+    )
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO rate_limit_buckets
+        (name, tokens, last_update, penalty, penalized_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        tokens = excluded.tokens,
+        last_update = excluded.last_update,
+        penalty = excluded.penalty,
+        penalized_at = excluded.penalized_at
+"""
+
 
 class RateLimiter:
-    """Token bucket rate limiter for API governance"""
+    """Fair, adaptive token bucket rate limiter for API governance.
+
+    Bucket state:
+
+    - ``tokens`` may go negative: each unit below zero is a slot already
+      promised to a caller that is sleeping until it comes due.
+    - ``last_update`` is the instant ``tokens`` was last refilled to. It
+      sits in the future while the bucket is paused after a 429, so no
+      tokens accrue until the pause ends.
+    - ``penalty`` scales the configured rate (``1.0`` = unthrottled);
+      ``rate`` is always ``base_rate * penalty``.
+    """
 
-    def __init__(self, requests_per_minute: int = 60, burst_size: int = 10):
-        self.rate = requests_per_minute / 60.0
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        burst_size: int = 10,
+        name: Optional[str] = None,
+        shared_path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Configured (unthrottled) request rate.
+            burst_size: Maximum tokens the bucket can hold.
+            name: Bucket name. Limiters with the same name and shared
+                path draw from one cross-process budget.
+            shared_path: SQLite file holding shared buckets. Defaults to
+                ``$ARISP_RATE_LIMIT_DB``; ignored when ``name`` is unset.
+        """
+        self.base_rate = requests_per_minute / 60.0
+        self.rate = self.base_rate
         self.burst_size = burst_size
         self.tokens = float(burst_size)
         self.last_update = time.time()
-        self.request_times: List[datetime] = []
+        self.penalty = 1.0
+        self.penalized_at = 0.0
+        self.request_times: Deque[datetime] = deque()
+
+        self.name = name
+        if shared_path is None and name is not None:
+            env_value = os.environ.get(_SHARED_DB_ENV_VAR)
+            shared_path = Path(env_value) if env_value else None
+        self.shared_path: Optional[Path] = (
+            Path(shared_path) if name is not None and shared_path else None
+        )
+        self._shared_table_ready = False
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def acquire(self, requester_id: str = "system") -> None:
-        """Acquire a token, waiting if necessary"""
-        # 1. Update tokens
-        now = time.time()
-        elapsed = now - self.last_update
-        self.tokens = min(self.burst_size, self.tokens + elapsed * self.rate)
-        self.last_update = now
-
-        # 2. Check tokens
-        if self.tokens < 1:
-            wait_time = (1 - self.tokens) / self.rate
-            await asyncio.sleep(wait_time)
-            self.tokens = 0
-        else:
-            self.tokens -= 1
-
-        # 3. Abuse detection (track last minute)
+        """Acquire a token, waiting (in FIFO order) if necessary."""
+        async with self._get_lock():
+            wait_time = await self._run_backend(self._reserve)
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                async with self._get_lock():
+                    await self._run_backend(self._refund)
+                raise
+        self._track_request(requester_id)
+
+    async def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Back off after the upstream rejected a request as rate-limited.
+
+        With a ``Retry-After`` hint the bucket is drained and paused until
+        it expires; without one only the rate drops, leaving the caller's
+        own retry backoff in charge of the immediate retry.
+
+        Args:
+            retry_after: Seconds from the server's ``Retry-After`` header,
+                if it sent one.
+        """
+        async with self._get_lock():
+            await self._run_backend(
+                lambda now: self._penalize(now, retry_after),
+            )
+        logger.warning(
+            "rate_limiter_backoff",
+            name=self.name,
+            requests_per_minute=round(self.rate * 60.0, 2),
+            retry_after=retry_after,
+        )
+
+    # ------------------------------------------------------------------
+    # Bucket arithmetic (pure in-memory; the shared backend loads and
+    # stores the row around these)
+    # ------------------------------------------------------------------
+
+    def _reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait."""
+        self._recover(now)
+        if now > self.last_update:
+            self.tokens = min(
+                float(self.burst_size),
+                self.tokens + (now - self.last_update) * self.rate,
+            )
+            self.last_update = now
+        self.tokens -= 1
+        due = self.last_update + max(0.0, -self.tokens) / self.rate
+        return max(0.0, due - now)
+
+    def _refund(self, now: float) -> None:
+        """Return the slot of a waiter cancelled before it came due."""
+        self.tokens = min(float(self.burst_size), self.tokens + 1)
+
+    def _penalize(self, now: float, retry_after: Optional[float]) -> None:
+        """Lower the rate and pause the bucket after a 429."""
+        self.penalty = max(_MIN_RATE_FRACTION, self.penalty * _BACKOFF_FACTOR)
+        self.penalized_at = now
+        self.rate = self.base_rate * self.penalty
+        if retry_after and retry_after > 0:
+            self.tokens = min(self.tokens, 0.0)
+            self.last_update = max(self.last_update, now + retry_after)
+
+    def _recover(self, now: float) -> None:
+        """Step the rate back toward ``base_rate`` after a quiet interval."""
+        if self.penalty < 1.0 and now - self.penalized_at >= _RECOVERY_INTERVAL_SECONDS:
+            self.penalty = min(1.0, self.penalty * _RECOVERY_FACTOR)
+            self.penalized_at = now
+        self.rate = self.base_rate * self.penalty
+
+    def _track_request(self, requester_id: str) -> None:
+        """Record a request and warn on obvious abuse.
+
+        ``request_times`` is a deque in arrival order, so expiring the
+        window is amortised O(1) per call.
+        """
         now_dt = datetime.now(timezone.utc)
         self.request_times.append(now_dt)
-        minute_ago = now_dt - timedelta(minutes=1)
-        self.request_times = [t for t in self.request_times if t > minute_ago]
+        minute_ago = now_dt - _ABUSE_WINDOW
+        while self.request_times and self.request_times[0] <= minute_ago:
+            self.request_times.popleft()
 
-        if (
-            len(self.request_times) > 500
-        ):  # Threshold for obvious abuse # pragma: no cover
+        if len(self.request_times) > _ABUSE_THRESHOLD:
             logger.warning(
                 "rate_limit_abuse_detected",
                 requester_id=requester_id,
                 requests_per_minute=len(self.request_times),
             )
+
+    def _get_lock(self) -> asyncio.Lock:
+        """The bucket lock for the running event loop.
+
+        An ``asyncio.Lock`` is bound to the loop it is first used on, so
+        a limiter shared at module level gets a fresh lock whenever it
+        is used from another loop (e.g. a later ``asyncio.run``).
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    # ------------------------------------------------------------------
+    # Backends
+    # ------------------------------------------------------------------
+
+    async def _run_backend(self, mutate: Callable[[float], T]) -> T:
+        """Apply ``mutate`` to the local or the shared bucket state.
+
+        Callers hold ``self._lock``. A failing shared database must not
+        take the providers down with it, so errors there are logged and
+        the local bucket is used for that call instead.
+        """
+        if self.shared_path is None:
+            return mutate(time.time())
+        try:
+            return await asyncio.to_thread(self._shared_transaction, mutate)
+        except sqlite3.Error as e:
+            logger.warning(
+                "rate_limiter_shared_backend_failed",
+                name=self.name,
+                path=str(self.shared_path),
+                error=str(e),
+            )
+            return mutate(time.time())
+
+    def _shared_transaction(self, mutate: Callable[[float], T]) -> T:
+        """Load the named bucket row, apply ``mutate``, store it back.
+
+        ``BEGIN IMMEDIATE`` serialises the read-modify-write against
+        every other process using the same database. A missing row
+        starts from this limiter's current (initially full) state.
+        """
+        assert self.shared_path is not None
+        conn = sqlite3.connect(
+            str(self.shared_path),
+            timeout=_SHARED_DB_TIMEOUT_SECONDS,
+            isolation_level=None,
+        )
+        try:
+            if not self._shared_table_ready:
+                conn.execute(_CREATE_TABLE_SQL)
+                self._shared_table_ready = True
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tokens, last_update, penalty, penalized_at "
+                    "FROM rate_limit_buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                if row is not None:
+                    (
+                        self.tokens,
+                        self.last_update,
+                        self.penalty,
+                        self.penalized_at,
+                    ) = row
+                    self.tokens = min(self.tokens, float(self.burst_size))
+                result = mutate(time.time())
+                conn.execute(
+                    _UPSERT_SQL,
+                    (
+                        self.name,
+                        self.tokens,
+                        self.last_update,
+                        self.penalty,
+                        self.penalized_at,
+                    ),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return result
+        finally:
+            conn.close()
@@ -390,6 +390,7 @@ class TestExpandCommand:
     ) -> None:
         crawl_result = _make_crawl_result()
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -403,6 +404,27 @@ class TestExpandCommand:
         assert "papers_visited" in result.output
         assert "10" in result.output
         mock_crawler.crawl.assert_called_once_with("paper:s2:abc123", config=ANY)
+        mock_crawler.aclose.assert_awaited_once()
+
+    def test_expand_layer_parallel_flag(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
+        mock_crawler.crawl = AsyncMock(return_value=_make_crawl_result())
+
+        import src.cli.citation as citation_module
+
+        monkeypatch.setattr(
+            citation_module, "_build_crawler", lambda **kw: mock_crawler
+        )
+
+        result = runner.invoke(
+            citation_app, ["expand", "paper:s2:abc123", "--layer-parallel"]
+        )
+        assert result.exit_code == 0, result.output
+        config = mock_crawler.crawl.call_args.kwargs["config"]
+        assert config.layer_parallel is True
 
     def test_expand_invalid_paper_id_exits_nonzero(self, runner: CliRunner) -> None:
         result = runner.invoke(citation_app, ["expand", "bad/id"])
@@ -412,6 +434,7 @@ class TestExpandCommand:
         self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(side_effect=RuntimeError("network error"))
 
         import src.cli.citation as citation_module
@@ -422,12 +445,15 @@ class TestExpandCommand:
 
         result = runner.invoke(citation_app, ["expand", "paper:s2:abc123"])
         assert result.exit_code != 0
+        # Clients are released even when the crawl fails.
+        mock_crawler.aclose.assert_awaited_once()
 
     def test_expand_json_flag(
         self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         crawl_result = _make_crawl_result(papers_visited=7, edges_added=5)
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -447,6 +473,7 @@ class TestExpandCommand:
     ) -> None:
         crawl_result = _make_crawl_result(budget_exhausted=True)
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -464,6 +491,7 @@ class TestExpandCommand:
     ) -> None:
         crawl_result = _make_crawl_result(persistence_aborted=True)
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -481,6 +509,7 @@ class TestExpandCommand:
     ) -> None:
         crawl_result = _make_crawl_result()
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -509,6 +538,7 @@ class TestExpandCommand:
     ) -> None:
         crawl_result = _make_crawl_result()
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         import src.cli.citation as citation_module
@@ -536,6 +566,7 @@ class TestExpandCommand:
         captured: dict = {}
         crawl_result = _make_crawl_result()
         mock_crawler = MagicMock()
+        mock_crawler.aclose = AsyncMock()
         mock_crawler.crawl = AsyncMock(return_value=crawl_result)
 
         def fake_build_crawler(*, db_path: Optional[Path] = None) -> MagicMock:
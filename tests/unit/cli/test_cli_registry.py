@@ -0,0 +1,145 @@
+"""Tests for the lazy CLI command registry and CLI cold-start budget.
+
+The CLI is invoked from cron and shell loops, so ``python -m src.cli
+<cmd>`` must only import the module of the command being run. The
+startup budget tests import commands in a fresh interpreter and compare
+the modules each import adds to ``sys.modules``, so they fail when a
+lightweight command starts pulling in the heavy service layer again.
+Module sets, unlike wall-clock import times, do not depend on machine
+load.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+import src.cli
+from src.cli import app
+from src.cli.registry import COMMANDS, LazyCommandGroup, load_command
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Modules no lightweight command may import at startup.
+HEAVY_MODULES = (
+    "numpy",
+    "scipy",
+    "aiohttp",
+    "src.storage.intelligence_graph",
+    "src.services.intelligence",
+    "src.services.llm",
+    "src.services.dra",
+    "src.orchestration",
+)
+
+# A lightweight command may import at most this fraction of the modules
+# the eager CLI (every command module imported) loads.
+LIGHTWEIGHT_IMPORT_BUDGET = 0.6
+
+runner = CliRunner()
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Run ``code`` in a fresh interpreter; return the modules it imported."""
+    script = (
+        "import json, sys; before = set(sys.modules); "
+        f"{code}; "
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestRegistry:
+    def test_help_lists_every_visible_command(self):
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name, spec in COMMANDS.items():
+            assert (name in result.stdout) is not spec.hidden
+
+    @pytest.mark.parametrize("name", list(COMMANDS))
+    def test_registry_help_matches_command(self, name):
+        command = load_command(name, COMMANDS[name])
+
+        assert command.name == name
+        assert command.hidden == COMMANDS[name].hidden
+        assert command.help.splitlines()[0] == COMMANDS[name].help
+
+    def test_subcommand_resolves_on_invocation(self):
+        result = runner.invoke(app, ["catalog", "--help"])
+
+        assert result.exit_code == 0
+        assert "Manage research catalog" in result.stdout
+
+    def test_unknown_command_is_rejected(self):
+        result = runner.invoke(app, ["no-such-command"])
+
+        assert result.exit_code != 0
+
+    def test_loaded_commands_are_cached(self):
+        group = typer.main.get_command(app)
+        assert isinstance(group, LazyCommandGroup)
+
+        first = group.get_command(None, "health")
+
+        assert group.get_command(None, "health") is first
+
+    def test_legacy_reexports_resolve_lazily(self):
+        from src.cli import feedback_app, run_command
+        from src.cli.feedback import app as feedback_module_app
+        from src.cli.run import run_command as run_module_command
+
+        assert run_command is run_module_command
+        assert feedback_app is feedback_module_app
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            src.cli.not_a_command  # noqa: B018
+
+
+@pytest.mark.benchmark
+class TestStartupBudget:
+    def test_package_import_loads_no_command_module(self):
+        code = (
+            "import sys, src.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.cli.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            timeout=60,
+        )
+
+        assert result.stdout.strip() == "['src.cli.registry']"
+
+    @pytest.mark.parametrize("module", ["health", "validate", "catalog"])
+    def test_lightweight_command_stays_within_import_budget(self, module):
+        command_modules = sorted({spec.module for spec in COMMANDS.values()})
+        light_modules = _imported_modules(f"import src.cli.{module}")
+        eager_modules = _imported_modules("import " + ", ".join(command_modules))
+
+        heavy = sorted(
+            name
+            for name in light_modules
+            for prefix in HEAVY_MODULES
+            if name == prefix or name.startswith(prefix + ".")
+        )
+        assert heavy == []
+        assert light_modules < eager_modules
+        assert len(light_modules) <= LIGHTWEIGHT_IMPORT_BUDGET * len(eager_modules)
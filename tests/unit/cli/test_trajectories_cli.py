@@ -113,7 +113,7 @@ class TestListCommand:
         storage_dir.mkdir()
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = []
+        mock_collector.summaries.return_value = []
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -134,9 +134,10 @@ class TestListCommand:
         mock_traj = MagicMock()
         mock_traj.trajectory_id = "test_trajectory_123"
         mock_traj.question = "How does attention work?"
-        mock_traj.answer = "Attention uses Q, K, V matrices."
+        mock_traj.has_answer = True
+        mock_traj.answer_preview = "Attention uses Q, K, V matrices."
         mock_traj.quality_score = 0.85
-        mock_traj.turns = [MagicMock()] * 5
+        mock_traj.turn_count = 5
         mock_traj.papers_opened = 3
         mock_traj.unique_searches = 2
         mock_traj.find_operations = 1
@@ -144,7 +145,7 @@ class TestListCommand:
         mock_traj.created_at = datetime.now(UTC)
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -166,9 +167,10 @@ class TestListCommand:
         mock_traj = MagicMock()
         mock_traj.trajectory_id = "traj_1"
         mock_traj.question = "Test question"
-        mock_traj.answer = "Test answer"
+        mock_traj.has_answer = True
+        mock_traj.answer_preview = "Test answer"
         mock_traj.quality_score = 0.8
-        mock_traj.turns = [MagicMock()] * 3
+        mock_traj.turn_count = 3
         mock_traj.papers_opened = 2
         mock_traj.unique_searches = 4
         mock_traj.find_operations = 2
@@ -176,7 +178,7 @@ class TestListCommand:
         mock_traj.created_at = datetime.now(UTC)
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -216,7 +218,7 @@ class TestAnalyzeCommand:
         storage_dir.mkdir()
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = []
+        mock_collector.summaries.return_value = []
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -253,7 +255,7 @@ class TestAnalyzeCommand:
         ]
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
         mock_collector.analyze_patterns.return_value = mock_insights
         mock_collector.generate_contextual_tips.return_value = mock_tips
 
@@ -265,6 +267,10 @@ class TestAnalyzeCommand:
                 result = runner.invoke(trajectories_app, ["analyze"])
 
         assert result.exit_code == 0
+        # Patterns come from the index, not from loaded trajectories
+        mock_collector.analyze_patterns.assert_called_once_with(
+            min_turns=3, require_answer=True, min_quality_score=0.5
+        )
         assert "Trajectory Analysis Results" in result.stdout
         assert "Effective Query Patterns" in result.stdout
         assert "attention" in result.stdout
@@ -286,7 +292,7 @@ class TestAnalyzeCommand:
         )
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
         mock_collector.analyze_patterns.return_value = mock_insights
         mock_collector.generate_contextual_tips.return_value = []
 
@@ -486,7 +492,7 @@ class TestStatsCommand:
         storage_dir.mkdir()
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = []
+        mock_collector.summaries.return_value = []
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -509,21 +515,23 @@ class TestStatsCommand:
 
         # Create mock trajectories
         mock_traj1 = MagicMock()
-        mock_traj1.answer = "Answer 1"
+        mock_traj1.has_answer = True
+        mock_traj1.answer_preview = "Answer 1"
         mock_traj1.quality_score = 0.8
-        mock_traj1.turns = [MagicMock()] * 5
+        mock_traj1.turn_count = 5
         mock_traj1.context_length_tokens = 1000
         mock_traj1.created_at = datetime(2024, 1, 1, tzinfo=UTC)
 
         mock_traj2 = MagicMock()
-        mock_traj2.answer = None
+        mock_traj2.has_answer = False
+        mock_traj2.answer_preview = None
         mock_traj2.quality_score = 0.3
-        mock_traj2.turns = [MagicMock()] * 10
+        mock_traj2.turn_count = 10
         mock_traj2.context_length_tokens = 2000
         mock_traj2.created_at = datetime(2024, 1, 15, tzinfo=UTC)
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj1, mock_traj2]
+        mock_collector.summaries.return_value = [mock_traj1, mock_traj2]
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -635,7 +643,7 @@ class TestMinQualityFilter:
         storage_dir.mkdir()
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = []
+        mock_collector.summaries.return_value = []
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -644,9 +652,9 @@ class TestMinQualityFilter:
             ):
                 runner.invoke(trajectories_app, ["list", "--min-quality", "0.8"])
 
-        # Verify filter_quality was called with correct min_quality
-        mock_collector.filter_quality.assert_called_once()
-        call_kwargs = mock_collector.filter_quality.call_args[1]
+        # Verify summaries was called with correct min_quality
+        mock_collector.summaries.assert_called_once()
+        call_kwargs = mock_collector.summaries.call_args[1]
         assert call_kwargs["min_quality_score"] == 0.8
 
 
@@ -853,16 +861,17 @@ class TestListDetailedOutput:
     """Tests for list command detailed output paths."""
 
     def test_list_with_long_answer(self, tmp_path):
-        """Test list command truncates long answers in details."""
+        """Test list command shows the truncated answer preview in details."""
         storage_dir = tmp_path / "trajectories"
         storage_dir.mkdir()
 
         mock_traj = MagicMock()
         mock_traj.trajectory_id = "long_answer_traj"
         mock_traj.question = "Question with long answer?"
-        mock_traj.answer = "A" * 150  # Long answer > 100 chars
+        mock_traj.has_answer = True
+        mock_traj.answer_preview = "A" * 100 + "..."
         mock_traj.quality_score = 0.8
-        mock_traj.turns = [MagicMock()] * 5
+        mock_traj.turn_count = 5
         mock_traj.papers_opened = 2
         mock_traj.unique_searches = 3
         mock_traj.find_operations = 1
@@ -870,7 +879,7 @@ class TestListDetailedOutput:
         mock_traj.created_at = datetime.now(UTC)
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
@@ -880,7 +889,7 @@ class TestListDetailedOutput:
                 result = runner.invoke(trajectories_app, ["list", "--details"])
 
         assert result.exit_code == 0
-        assert "..." in result.stdout  # Truncated answer
+        assert "A" * 100 + "..." in result.stdout  # Truncated answer
 
     def test_list_with_short_answer(self, tmp_path):
         """Test list command shows full short answers."""
@@ -890,9 +899,10 @@ class TestListDetailedOutput:
         mock_traj = MagicMock()
         mock_traj.trajectory_id = "short_answer_traj"
         mock_traj.question = "Short question?"
-        mock_traj.answer = "Short answer"  # < 100 chars
+        mock_traj.has_answer = True
+        mock_traj.answer_preview = "Short answer"
         mock_traj.quality_score = 0.9
-        mock_traj.turns = [MagicMock()] * 3
+        mock_traj.turn_count = 3
         mock_traj.papers_opened = 1
         mock_traj.unique_searches = 1
         mock_traj.find_operations = 0
@@ -900,7 +910,7 @@ class TestListDetailedOutput:
         mock_traj.created_at = datetime.now(UTC)
 
         mock_collector = MagicMock()
-        mock_collector.filter_quality.return_value = [mock_traj]
+        mock_collector.summaries.return_value = [mock_traj]
 
         with patch("src.cli.trajectories._get_storage_dir", return_value=storage_dir):
             with patch(
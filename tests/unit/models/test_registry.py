@@ -6,6 +6,7 @@ from src.models.registry import (
     ProcessingAction,
     RegistryEntry,
     IdentityMatch,
+    RegistryChangeKind,
     RegistryState,
 )
 
@@ -335,3 +336,74 @@ class TestRegistryState:
         state.add_entry(entry)
 
         assert state.updated_at > original_time
+
+
+class TestRegistryChangeJournal:
+    """Tests for the RegistryState change journal."""
+
+    @staticmethod
+    def _entry(i: int) -> RegistryEntry:
+        return RegistryEntry(
+            title_normalized=f"paper {i}",
+            extraction_target_hash="sha256:abc",
+        )
+
+    def test_adding_and_updating_entries_is_journaled(self):
+        """Test that new and updated entries get increasing sequences."""
+        state = RegistryState()
+        first, second = self._entry(0), self._entry(1)
+
+        state.add_entry(first)
+        state.add_entry(second)
+        state.add_entry(first)
+
+        assert state.change_sequence == 3
+        assert [(c.sequence, c.paper_id, c.kind) for c in state.change_journal] == [
+            (1, first.paper_id, RegistryChangeKind.ADDED),
+            (2, second.paper_id, RegistryChangeKind.ADDED),
+            (3, first.paper_id, RegistryChangeKind.UPDATED),
+        ]
+
+    def test_unchanged_update_is_not_journaled(self):
+        """Test that record_change=False skips journaling an update."""
+        state = RegistryState()
+        entry = self._entry(0)
+        state.add_entry(entry)
+
+        state.add_entry(entry, record_change=False)
+
+        assert state.change_sequence == 1
+
+    def test_changes_since_returns_only_later_changes(self):
+        """Test that changes_since slices the journal after a sequence."""
+        state = RegistryState()
+        for i in range(4):
+            state.add_entry(self._entry(i))
+
+        assert [c.sequence for c in state.changes_since(2)] == [3, 4]
+        assert state.changes_since(4) == []
+        assert len(state.changes_since(0)) == 4
+
+    def test_changes_since_unanswerable_returns_none(self, monkeypatch):
+        """Test that dropped or future sequences cannot be answered."""
+        from src.models import registry as registry_module
+
+        monkeypatch.setattr(registry_module, "MAX_CHANGE_JOURNAL_ENTRIES", 2)
+        state = RegistryState()
+        for i in range(4):
+            state.add_entry(self._entry(i))
+
+        assert [c.sequence for c in state.change_journal] == [3, 4]
+        assert [c.sequence for c in state.changes_since(2)] == [3, 4]
+        assert state.changes_since(1) is None
+        assert state.changes_since(5) is None
+
+    def test_journal_round_trips_through_json(self):
+        """Test that the journal survives serialization."""
+        state = RegistryState()
+        state.add_entry(self._entry(0))
+
+        restored = RegistryState.model_validate(state.model_dump(mode="json"))
+
+        assert restored.change_sequence == 1
+        assert restored.changes_since(0)[0].kind == RegistryChangeKind.ADDED
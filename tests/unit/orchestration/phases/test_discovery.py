@@ -1,5 +1,8 @@
 """Tests for DiscoveryPhase."""
 
+import asyncio
+import time
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +12,7 @@ from src.orchestration.phases.discovery import (
     DiscoveryResult,
     TopicDiscoveryResult,
 )
+from src.models.concurrency import ConcurrencyConfig
 from src.orchestration.context import PipelineContext
 from src.models.config import (
     ResearchTopic,
@@ -54,6 +58,7 @@ def mock_context():
     # Explicit None avoids MagicMock's truthy-attribute default masking the
     # real branch under test.
     context.config.settings.enhanced_discovery = None
+    context.config.settings.concurrency = ConcurrencyConfig()
     context.discovery_service = AsyncMock()
     context.catalog_service = MagicMock()
     context.registry_service = None
@@ -241,6 +246,28 @@ class TestDiscoveryPhase:
         # Default: no multi_source, no enhanced_discovery → SURFACE mode.
         assert call_args[1]["mode"] == DiscoveryMode.SURFACE
 
+    @pytest.mark.asyncio
+    async def test_execute_streams_topics_to_queue(
+        self, mock_context, sample_topic, sample_scored_papers
+    ):
+        """Test each topic is queued after its papers are stored, then None."""
+        mock_context.config.research_topics = [sample_topic]
+        mock_context.catalog_service.get_or_create_topic.return_value = MagicMock(
+            topic_slug="machine-learning"
+        )
+        mock_context.discovery_service.discover = AsyncMock(
+            return_value=make_discovery_result(sample_scored_papers)
+        )
+        topic_queue: asyncio.Queue = asyncio.Queue()
+
+        phase = DiscoveryPhase(mock_context, topic_queue=topic_queue)
+        await phase.execute()
+
+        mock_context.add_discovered_papers.assert_called_once()
+        assert topic_queue.get_nowait() is sample_topic
+        assert topic_queue.get_nowait() is None
+        assert topic_queue.empty()
+
     @pytest.mark.asyncio
     async def test_execute_topic_api_error(self, mock_context, sample_topic):
         """Test execute handles API errors."""
@@ -889,3 +916,105 @@ class TestPartitionSourceBreakdown:
         )
         assert providers == 100, "Provider count must be first in tuple"
         assert citations == 1
+
+
+def _topics(count: int) -> list:
+    return [
+        ResearchTopic(query=f"topic {i}", timeframe=TimeframeRecent(value="7d"))
+        for i in range(count)
+    ]
+
+
+def _slow_discover(latency: float, in_flight: list, fail: str | None = None):
+    """discover() stand-in: ``latency`` seconds per topic, tracking overlap."""
+
+    async def discover(topic, **kwargs):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            await asyncio.sleep(latency)
+            if topic == fail:
+                raise APIError("provider unavailable")
+            return make_discovery_result([])
+        finally:
+            in_flight[0] -= 1
+
+    return discover
+
+
+class TestDiscoveryPhaseTopicConcurrency:
+    """Tests for concurrent per-topic discovery."""
+
+    @pytest.mark.asyncio
+    async def test_topics_overlap_up_to_bound_in_config_order(self, mock_context):
+        """Test at most max_concurrent_topics topics are discovered at once."""
+        topics = _topics(6)
+        mock_context.config.research_topics = topics
+        mock_context.config.settings.concurrency.max_concurrent_topics = 3
+        mock_context.catalog_service.get_or_create_topic.side_effect = (
+            lambda query: MagicMock(topic_slug=query)
+        )
+        in_flight = [0, 0]
+        mock_context.discovery_service.discover = _slow_discover(0.01, in_flight)
+
+        result = await DiscoveryPhase(mock_context).execute()
+
+        assert in_flight[1] == 3
+        assert result.topics_processed == 6
+        assert [r.topic for r in result.topic_results] == topics
+
+    @pytest.mark.asyncio
+    async def test_topic_failure_is_isolated(self, mock_context):
+        """Test one failing topic does not affect topics running alongside."""
+        topics = _topics(3)
+        mock_context.config.research_topics = topics
+        mock_context.config.settings.concurrency.max_concurrent_topics = 3
+        mock_context.catalog_service.get_or_create_topic.side_effect = (
+            lambda query: MagicMock(topic_slug=query)
+        )
+        mock_context.discovery_service.discover = _slow_discover(
+            0.01, [0, 0], fail="topic 1"
+        )
+
+        result = await DiscoveryPhase(mock_context).execute()
+
+        assert result.topics_processed == 2
+        assert result.topics_failed == 1
+        assert [r.success for r in result.topic_results] == [True, False, True]
+        mock_context.add_error.assert_called_once_with(
+            "discovery", "provider unavailable", topic="topic 1"
+        )
+
+
+@pytest.mark.benchmark
+class TestTopicConcurrencyBenchmark:
+    """Wall-clock discovery time against topic count (mocked providers)."""
+
+    LATENCY = 0.05
+
+    async def _wall_clock(self, mock_context, topic_count: int, limit: int) -> float:
+        mock_context.config.research_topics = _topics(topic_count)
+        mock_context.config.settings.concurrency.max_concurrent_topics = limit
+        mock_context.catalog_service.get_or_create_topic.side_effect = (
+            lambda query: MagicMock(topic_slug=query)
+        )
+        mock_context.discovery_service.discover = _slow_discover(self.LATENCY, [0, 0])
+        started = time.perf_counter()
+        await DiscoveryPhase(mock_context).execute()
+        return time.perf_counter() - started
+
+    @pytest.mark.asyncio
+    async def test_wall_clock_scales_with_batches_not_topics(self, mock_context):
+        sequential = {
+            n: await self._wall_clock(mock_context, n, limit=1) for n in (1, 4, 8)
+        }
+        concurrent = {
+            n: await self._wall_clock(mock_context, n, limit=8) for n in (1, 4, 8, 16)
+        }
+
+        # Sequential: one provider latency per topic
+        assert sequential[8] >= 8 * self.LATENCY
+        # Concurrent: one latency per batch of max_concurrent_topics topics
+        assert concurrent[8] < 3 * self.LATENCY
+        assert concurrent[16] < 4 * self.LATENCY
+        assert concurrent[8] < sequential[8] / 3
@@ -1,13 +1,16 @@
 """Tests for ExtractionPhase."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.orchestration.phases.extraction import (
     ExtractionPhase,
     ExtractionResult,
     TopicExtractionResult,
 )
+from src.models.concurrency import ConcurrencyConfig
 from src.orchestration.context import PipelineContext
 
 
@@ -17,6 +20,7 @@ def mock_context():
     context = MagicMock(spec=PipelineContext)
     context.config = MagicMock()
     context.config.research_topics = []
+    context.config.settings.concurrency = ConcurrencyConfig()
     context.enable_phase2 = True
     context.enable_synthesis = True
     context.extraction_service = AsyncMock()
@@ -159,6 +163,32 @@ class TestExtractionPhase:
         assert result.topics_processed == 1
         assert len(result.output_files) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_consumes_topic_queue(self, mock_context, sample_topic):
+        """Test streaming mode extracts queued topics until None."""
+        other_topic = MagicMock()
+        other_topic.query = "not queued"
+        mock_context.config.research_topics = [sample_topic, other_topic]
+        mock_context.catalog_service.get_or_create_topic.return_value = MagicMock(
+            topic_slug="machine-learning"
+        )
+        topic_queue: asyncio.Queue = asyncio.Queue()
+        topic_queue.put_nowait(sample_topic)
+        topic_queue.put_nowait(None)
+
+        phase = ExtractionPhase(mock_context, topic_queue=topic_queue)
+        with patch.object(phase, "_extract_topic", new_callable=AsyncMock) as extract:
+            extract.return_value = TopicExtractionResult(
+                topic=sample_topic, topic_slug="machine-learning", success=True
+            )
+            mock_context.discovered_papers = {"machine-learning": [MagicMock()]}
+            result = await phase.execute()
+
+        extract.assert_awaited_once()
+        assert extract.call_args.kwargs["topic"] is sample_topic
+        assert result.topics_processed == 1
+        assert topic_queue.empty()
+
     @pytest.mark.asyncio
     async def test_execute_handles_extraction_error(
         self, mock_context, sample_topic, sample_papers
@@ -364,3 +394,70 @@ class TestExtractionPhase:
         # Error message should be in the call
         call_args = mock_context.add_error.call_args
         assert "Extraction service failed" in str(call_args)
+
+
+class TestExtractionPhaseTopicConcurrency:
+    """Tests for concurrent per-topic extraction."""
+
+    @pytest.mark.asyncio
+    async def test_topics_overlap_and_failures_stay_isolated(self, mock_context):
+        """Test topics run together and one failing topic fails alone."""
+        topics = []
+        for i in range(4):
+            topic = MagicMock()
+            topic.query = f"topic {i}"
+            topics.append(topic)
+        mock_context.config.research_topics = topics
+        mock_context.config.settings.concurrency.max_concurrent_topics = 2
+        mock_context.discovered_papers = {t.query: [MagicMock()] for t in topics}
+        mock_context.catalog_service.get_or_create_topic.side_effect = (
+            lambda query: MagicMock(topic_slug=query)
+        )
+        in_flight = [0, 0]
+
+        async def extract(topic, papers, topic_slug, catalog_topic):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            failed = topic_slug == "topic 2"
+            return TopicExtractionResult(
+                topic=topic,
+                topic_slug=topic_slug,
+                success=not failed,
+                error="LLM unavailable" if failed else None,
+                output_file=None if failed else f"{topic_slug}.md",
+            )
+
+        phase = ExtractionPhase(mock_context)
+        with patch.object(phase, "_extract_topic", side_effect=extract):
+            result = await phase.execute()
+
+        assert in_flight[1] == 2
+        assert result.topics_processed == 3
+        assert result.topics_failed == 1
+        assert result.output_files == ["topic 0.md", "topic 1.md", "topic 3.md"]
+        mock_context.add_error.assert_called_once_with(
+            "extraction", "LLM unavailable", topic="topic 2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_run_id_is_scoped_to_topic(
+        self, mock_context, sample_topic, sample_papers
+    ):
+        """Test topics extracted in the same second get distinct checkpoints."""
+        mock_context.extraction_service.process_papers = AsyncMock(return_value=[])
+        mock_context.extraction_service.get_extraction_summary = MagicMock(
+            return_value={}
+        )
+        phase = ExtractionPhase(mock_context)
+
+        await phase._run_extraction(
+            papers=sample_papers,
+            topic=sample_topic,
+            run_id="20260101-000000",
+            topic_slug="machine-learning",
+        )
+
+        call = mock_context.extraction_service.process_papers.call_args
+        assert call.kwargs["run_id"] == "20260101-000000-machine-learning"
@@ -196,6 +196,7 @@ class TestDiscoveryPhaseMultiSourceExecution:
         # Set up mock context
         mock_context = MagicMock()
         mock_context.config = MagicMock()
+        mock_context.config.settings.concurrency = None
         mock_context.config.research_topics = [
             ResearchTopic(
                 query="test query",
@@ -261,6 +262,7 @@ class TestDiscoveryPhaseMultiSourceExecution:
 
         mock_context = MagicMock()
         mock_context.config = MagicMock()
+        mock_context.config.settings.concurrency = None
         mock_context.config.research_topics = [
             ResearchTopic(
                 query="citation test",
@@ -341,6 +343,7 @@ class TestDiscoveryPhaseMultiSourceExecution:
 
         mock_context = MagicMock()
         mock_context.config = MagicMock()
+        mock_context.config.settings.concurrency = None
         mock_context.config.research_topics = [
             ResearchTopic(
                 query="source breakdown test",
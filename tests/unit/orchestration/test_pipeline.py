@@ -355,3 +355,167 @@ class TestPipelineEmitsSloEventsAtEnd:
         )
         # The exception was caught and recorded
         assert any("discovery exploded" in e.get("error", "") for e in result.errors)
+
+
+class TestStreamingExtraction:
+    """Tests for overlapping discovery and extraction (stream_extraction)."""
+
+    @staticmethod
+    def _context(queries):
+        from src.models.config import ResearchTopic, TimeframeRecent
+
+        context = MagicMock(spec=PipelineContext)
+        context.config = MagicMock()
+        context.config.research_topics = [
+            ResearchTopic(query=q, timeframe=TimeframeRecent(value="7d"))
+            for q in queries
+        ]
+        context.config.settings.query_expansion = None
+        context.config.settings.citation_exploration = None
+        context.config.settings.aggregation = None
+        context.config.settings.concurrency = None
+        context.catalog_service = MagicMock()
+        context.catalog_service.get_or_create_topic.side_effect = (
+            lambda query: MagicMock(topic_slug=query)
+        )
+        context.discovered_papers = {}
+        context.add_discovered_papers.side_effect = (
+            context.discovered_papers.__setitem__
+        )
+        return context
+
+    @staticmethod
+    def _patch_phases(events):
+        import asyncio
+
+        from src.orchestration.phases.discovery import TopicDiscoveryResult
+        from src.orchestration.phases.extraction import TopicExtractionResult
+
+        async def discover(self, topic):
+            events.append(("discover_start", topic.query))
+            await asyncio.sleep(0.01)
+            events.append(("discover_end", topic.query))
+            return TopicDiscoveryResult(
+                topic=topic,
+                topic_slug=topic.query,
+                papers=[MagicMock(paper_id=f"{topic.query}-paper")],
+                success=True,
+            )
+
+        async def extract(self, topic, papers, topic_slug, catalog_topic):
+            events.append(("extract", topic_slug))
+            await asyncio.sleep(0)
+            return TopicExtractionResult(
+                topic=topic,
+                topic_slug=topic_slug,
+                papers_processed=len(papers),
+                output_file=f"{topic_slug}.md",
+                success=True,
+            )
+
+        return (
+            patch(
+                "src.orchestration.phases.discovery.DiscoveryPhase._discover_topic",
+                discover,
+            ),
+            patch(
+                "src.orchestration.phases.extraction.ExtractionPhase._extract_topic",
+                extract,
+            ),
+        )
+
+    def test_init_stream_extraction(self):
+        """Test streaming is off unless requested."""
+        assert ResearchPipeline().stream_extraction is False
+        assert ResearchPipeline(stream_extraction=True).stream_extraction is True
+
+    @pytest.mark.asyncio
+    async def test_extraction_starts_before_discovery_finishes(self):
+        """Test the first topic is extracted while later topics are discovered."""
+        events: list = []
+        pipeline = ResearchPipeline(stream_extraction=True)
+        pipeline._context = self._context(["t1", "t2", "t3"])
+        discover_patch, extract_patch = self._patch_phases(events)
+
+        with discover_patch, extract_patch:
+            discovery_result, extraction_result = await pipeline._run_streaming()
+
+        assert events.index(("extract", "t1")) < events.index(("discover_end", "t3"))
+        assert discovery_result.topics_processed == 3
+        assert discovery_result.total_papers == 3
+        assert extraction_result.topics_processed == 3
+        assert extraction_result.output_files == ["t1.md", "t2.md", "t3.md"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_matches_sequential_results(self):
+        """Test streamed and sequential runs produce the same results."""
+        from src.orchestration.phases import ExtractionPhase
+
+        results = []
+        for stream in (False, True):
+            pipeline = ResearchPipeline(stream_extraction=stream)
+            pipeline._context = self._context(["t1", "t2", "t3"])
+            discover_patch, extract_patch = self._patch_phases([])
+            with discover_patch, extract_patch:
+                if stream:
+                    _, extraction_result = await pipeline._run_streaming()
+                else:
+                    await pipeline._create_discovery_phase().run()
+                    extraction_result = await ExtractionPhase(pipeline._context).run()
+            results.append(extraction_result)
+
+        sequential, streamed = results
+        assert streamed == sequential
+
+    @pytest.mark.asyncio
+    async def test_discovery_failure_surfaces_original_error(self):
+        """Test a failing discovery phase cancels extraction and re-raises."""
+        pipeline = ResearchPipeline(stream_extraction=True)
+        pipeline._context = self._context(["t1"])
+
+        with patch(
+            "src.orchestration.phases.discovery.DiscoveryPhase.execute",
+            side_effect=RuntimeError("providers down"),
+        ):
+            with pytest.raises(RuntimeError, match="providers down"):
+                await pipeline._run_streaming()
+
+    @pytest.mark.asyncio
+    async def test_run_uses_streaming_when_enabled(self, mock_config):
+        """Test run() takes the streaming path and reports its results."""
+        pipeline = ResearchPipeline(stream_extraction=True)
+        mock_context = MagicMock(spec=PipelineContext)
+        mock_context.config = mock_config
+        mock_context.errors = []
+        discovery_result = MagicMock(
+            topics_processed=2, topics_failed=0, total_papers=7, source_breakdown={}
+        )
+        extraction_result = MagicMock(
+            total_papers_processed=7,
+            total_papers_with_extraction=7,
+            total_papers_with_pdf=0,
+            total_papers_with_abstract_fallback=7,
+            total_tokens_used=0,
+            total_cost_usd=0.0,
+            output_files=["a.md", "b.md"],
+        )
+
+        with (
+            patch.object(
+                pipeline, "_create_context", AsyncMock(return_value=mock_context)
+            ),
+            patch.object(
+                pipeline,
+                "_run_streaming",
+                AsyncMock(return_value=(discovery_result, extraction_result)),
+            ) as mock_streaming,
+            patch("src.orchestration.pipeline.SynthesisPhase") as mock_synthesis,
+            patch("src.orchestration.pipeline.CrossSynthesisPhase") as mock_cross,
+        ):
+            mock_synthesis.return_value.run = AsyncMock()
+            mock_cross.return_value.run = AsyncMock(return_value=MagicMock(report=None))
+            result = await pipeline.run()
+
+        mock_streaming.assert_awaited_once()
+        assert result.papers_discovered == 7
+        assert result.output_files == ["a.md", "b.md"]
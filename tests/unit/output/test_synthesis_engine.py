@@ -1,17 +1,22 @@
 """Tests for Phase 3.6 SynthesisEngine."""
 
+import json
+import time
+
 import pytest
+from datetime import datetime, timezone
 from pathlib import Path
 
 from src.output.synthesis_engine import (
     SynthesisEngine,
     KNOWLEDGE_BASE_FILENAME,
+    SECTION_STORE_FILENAME,
 )
 from src.models.synthesis import (
     KnowledgeBaseEntry,
     UserNoteAnchor,
 )
-from src.models.registry import RegistryEntry
+from src.models.registry import RegistryChange, RegistryChangeKind, RegistryEntry
 
 
 @pytest.fixture
@@ -28,6 +33,8 @@ def mock_registry_service(mocker):
     mock = mocker.MagicMock()
     mock.get_entries_for_topic.return_value = []
     mock.load.return_value = mocker.MagicMock(entries={})
+    mock.get_change_sequence.return_value = 0
+    mock.get_changes_since.return_value = []
     return mock
 
 
@@ -600,6 +607,264 @@ class TestSynthesize:
         assert stats.total_papers == 0
 
 
+def _paper(
+    paper_id: str,
+    abstract: str = "Abstract.",
+    processed_at: datetime = datetime(2025, 1, 15, tzinfo=timezone.utc),
+) -> RegistryEntry:
+    return RegistryEntry(
+        paper_id=paper_id,
+        title_normalized=paper_id,
+        extraction_target_hash="sha256:1",
+        topic_affiliations=["test-topic"],
+        processed_at=processed_at,
+        metadata_snapshot={
+            "title": f"Paper {paper_id}",
+            "abstract": abstract,
+            "quality_score": 50.0,
+        },
+    )
+
+
+def _journal(mock_registry_service, *paper_ids: str) -> None:
+    """Record registry changes to ``paper_ids`` after the current sequence."""
+    sequence = mock_registry_service.get_change_sequence.return_value
+    changes = [
+        RegistryChange(
+            sequence=sequence + i,
+            paper_id=paper_id,
+            kind=RegistryChangeKind.UPDATED,
+        )
+        for i, paper_id in enumerate(paper_ids, 1)
+    ]
+    mock_registry_service.get_change_sequence.return_value = sequence + len(changes)
+    mock_registry_service.get_changes_since.side_effect = lambda seq: [
+        c for c in changes if c.sequence > seq
+    ]
+
+
+class TestIncrementalSynthesis:
+    """Tests for section-level incremental rendering."""
+
+    def test_unchanged_papers_are_not_rerendered(
+        self, engine, mock_registry_service, temp_output_dir, mocker
+    ):
+        """Test that a second run reuses every stored section."""
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper("p2"),
+        ]
+        first = engine.synthesize("test-topic")
+        kb_path = temp_output_dir / "test-topic" / KNOWLEDGE_BASE_FILENAME
+        first_content = kb_path.read_text()
+
+        render = mocker.spy(engine, "_render_paper_section")
+        stamp = mocker.spy(engine, "_section_stamp")
+        second = engine.synthesize("test-topic")
+
+        assert (first.sections_rendered, first.sections_reused) == (2, 0)
+        assert (second.sections_rendered, second.sections_reused) == (0, 2)
+        render.assert_not_called()
+        # The journal covers the store, so no per-paper stamp is computed
+        stamp.assert_not_called()
+        body = first_content.split("## All Papers", 1)[1]
+        assert kb_path.read_text().split("## All Papers", 1)[1] == body
+
+    def test_assembled_document_matches_full_render(
+        self, engine, mock_registry_service, temp_output_dir
+    ):
+        """Test that assembling from the store yields the full rendering."""
+        entries = [_paper("p1"), _paper("p2", abstract="Résumé ⭐")]
+        mock_registry_service.get_entries_for_topic.return_value = entries
+        engine.synthesize("test-topic")
+        engine.synthesize("test-topic")
+
+        kb_entries = [engine._entry_to_kb_entry(e) for e in entries]
+        expected = engine._render_knowledge_base("test-topic", kb_entries, {})
+        kb_path = temp_output_dir / "test-topic" / KNOWLEDGE_BASE_FILENAME
+        assert (
+            kb_path.read_text(encoding="utf-8").split("## All Papers", 1)[1]
+            == expected.split("## All Papers", 1)[1]
+        )
+
+    def test_journaled_paper_is_rerendered(
+        self, engine, mock_registry_service, temp_output_dir
+    ):
+        """Test that a paper the registry journal reports is re-rendered."""
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper("p2"),
+        ]
+        engine.synthesize("test-topic")
+
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper("p2", abstract="Revised abstract."),
+        ]
+        _journal(mock_registry_service, "p2")
+        stats = engine.synthesize("test-topic")
+
+        assert stats.sections_rendered == 1
+        kb_path = temp_output_dir / "test-topic" / KNOWLEDGE_BASE_FILENAME
+        assert "Revised abstract." in kb_path.read_text()
+
+        # The store now records the new sequence: nothing left to re-render
+        assert engine.synthesize("test-topic").sections_rendered == 0
+
+    def test_stamps_are_compared_when_journal_does_not_cover_store(
+        self, engine, mock_registry_service
+    ):
+        """Test the processed_at fallback when the journal was truncated."""
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper("p2"),
+        ]
+        engine.synthesize("test-topic")
+
+        mock_registry_service.get_changes_since.return_value = None
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper(
+                "p2",
+                abstract="Revised abstract.",
+                processed_at=datetime(2025, 2, 1, tzinfo=timezone.utc),
+            ),
+        ]
+        stats = engine.synthesize("test-topic")
+
+        assert stats.sections_rendered == 1
+
+    def test_user_note_edit_rerenders_its_section(
+        self, engine, mock_registry_service, temp_output_dir
+    ):
+        """Test that a note typed into the KB is kept on the next run."""
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        engine.synthesize("test-topic")
+        kb_path = temp_output_dir / "test-topic" / KNOWLEDGE_BASE_FILENAME
+        start_tag = UserNoteAnchor.create_start_tag("p1")
+        kb_path.write_text(
+            kb_path.read_text().replace(start_tag, f"{start_tag}\nMy note")
+        )
+
+        stats = engine.synthesize("test-topic")
+
+        assert stats.sections_rendered == 1
+        assert stats.user_notes_preserved == 1
+        assert "My note" in kb_path.read_text()
+
+    def test_store_keeps_live_sections_only(
+        self, engine, mock_registry_service, temp_output_dir
+    ):
+        """Test that papers leaving the topic are dropped from the store."""
+        store_path = temp_output_dir / "test-topic" / SECTION_STORE_FILENAME
+        mock_registry_service.get_entries_for_topic.return_value = [
+            _paper("p1"),
+            _paper("p2"),
+        ]
+        engine.synthesize("test-topic")
+
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        stats = engine.synthesize("test-topic")
+
+        header, _, body = store_path.read_bytes().partition(b"\n")
+        index = json.loads(header)["sections"]
+        assert stats.sections_rendered == 0
+        assert list(index) == ["p1"]
+        assert len(body) == index["p1"][3]
+
+    def test_torn_store_is_rerendered(
+        self, engine, mock_registry_service, temp_output_dir
+    ):
+        """Test that a store cut short is not assembled into the KB."""
+        store_path = temp_output_dir / "test-topic" / SECTION_STORE_FILENAME
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        engine.synthesize("test-topic")
+        store_path.write_bytes(store_path.read_bytes()[:-10])
+
+        stats = engine.synthesize("test-topic")
+
+        assert stats.sections_rendered == 1
+        assert store_path.read_bytes().endswith(b"---\n")
+
+    @pytest.mark.parametrize(
+        "header",
+        [b"not json", b'{"version": 1, "change_sequence": 0, "sections": {}}'],
+    )
+    def test_unusable_store_rerenders_everything(
+        self, engine, mock_registry_service, temp_output_dir, header
+    ):
+        """Test that a corrupt or outdated store is ignored."""
+        store_path = temp_output_dir / "test-topic" / SECTION_STORE_FILENAME
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        engine.synthesize("test-topic")
+        body = store_path.read_bytes().partition(b"\n")[2]
+        store_path.write_bytes(header + b"\n" + body)
+
+        assert engine.synthesize("test-topic").sections_rendered == 1
+
+    def test_unreadable_store_rerenders_everything(
+        self, engine, mock_registry_service, temp_output_dir, mocker
+    ):
+        """Test that an I/O error reading the store is not fatal."""
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        engine.synthesize("test-topic")
+        mocker.patch.object(Path, "read_bytes", side_effect=OSError("EIO"))
+
+        assert engine.synthesize("test-topic").sections_rendered == 1
+
+    def test_store_write_failure_keeps_knowledge_base(
+        self, engine, mock_registry_service, temp_output_dir, mocker
+    ):
+        """Test that failing to store sections only costs a re-render."""
+        mock_registry_service.get_entries_for_topic.return_value = [_paper("p1")]
+        mocker.patch.object(engine, "_write_section_store", return_value=False)
+
+        stats = engine.synthesize("test-topic")
+
+        topic_dir = temp_output_dir / "test-topic"
+        assert stats.total_papers == 1
+        assert (topic_dir / KNOWLEDGE_BASE_FILENAME).exists()
+        assert not (topic_dir / SECTION_STORE_FILENAME).exists()
+
+
+@pytest.mark.benchmark
+class TestIncrementalSynthesisBenchmark:
+    """Warm section assembly against rendering every section."""
+
+    PAPERS = 3000
+    RUNS = 5
+
+    def test_warm_run_beats_full_render(self, engine, mock_registry_service):
+        entries = [
+            _paper(f"p{i}", abstract="Long abstract. " * 60) for i in range(self.PAPERS)
+        ]
+        mock_registry_service.get_entries_for_topic.return_value = entries
+        engine.synthesize("test-topic")
+        topic_dir = engine.output_base_dir / "test-topic"
+        kb_entries = [engine._entry_to_kb_entry(e) for e in entries]
+
+        def full() -> None:
+            for entry in kb_entries:
+                engine._render_paper_section(entry).encode("utf-8")
+
+        def warm() -> None:
+            sequence, index, body = engine._load_section_store(topic_dir)
+            _, _, rendered = engine._render_sections(
+                kb_entries, {}, index, body, engine._changed_paper_ids(sequence)
+            )
+            assert rendered == 0
+
+        def best(run) -> float:
+            timings = []
+            for _ in range(self.RUNS):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        assert best(warm) < best(full)
+
+
 class TestAtomicWrite:
     """Tests for atomic file write operation."""
 
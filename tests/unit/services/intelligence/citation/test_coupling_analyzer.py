@@ -19,11 +19,13 @@ Covers:
 
 from __future__ import annotations
 
+import random
 import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterator
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import structlog
@@ -39,7 +41,12 @@ from src.services.intelligence.citation.coupling_repository import (
     DEFAULT_MAX_AGE_DAYS,
     CitationCouplingRepository,
 )
-from src.services.intelligence.models import EdgeType, GraphEdge
+from src.services.intelligence.models import (
+    EdgeType,
+    GraphEdge,
+    GraphNode,
+    NodeType,
+)
 from src.storage.intelligence_graph import SQLiteGraphStore
 
 # ---------------------------------------------------------------------------
@@ -121,6 +128,23 @@ def _mock_store_with_refs(
     store.get_papers_citing_both.side_effect = _get_papers_citing_both
     store.count_papers_citing_both.side_effect = _count_papers_citing_both
 
+    # Bulk loaders used by the batch engine (analyze_for_paper /
+    # analyze_all_pairs); they serve the same maps.
+    def _list_outgoing(ids: list[str], _types: list[str]) -> dict[str, list[str]]:
+        return {pid: list(refs_map[pid]) for pid in ids if refs_map.get(pid)}
+
+    def _list_incoming(ids: list[str], _types: list[str]) -> dict[str, list[str]]:
+        return {
+            pid: list(effective_citers[pid]) for pid in ids if effective_citers.get(pid)
+        }
+
+    def _count_incoming(ids: list[str], _types: list[str]) -> dict[str, int]:
+        return {pid: len(v) for pid, v in _list_incoming(ids, _types).items()}
+
+    store._list_outgoing_edges_for_nodes.side_effect = _list_outgoing
+    store._list_incoming_edges_for_nodes.side_effect = _list_incoming
+    store._count_incoming_edges_for_nodes.side_effect = _count_incoming
+
     return store
 
 
@@ -750,3 +774,370 @@ class TestCoCitationCount:
         # Verify count_papers_citing_both was never called (DoS guard works).
         store.count_papers_citing_both.assert_not_called()
         store.get_papers_citing_both.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# 8. Sparse-matrix batch engine
+# ---------------------------------------------------------------------------
+
+
+def _real_store(
+    db_path: Path, cites: list[tuple[str, str]], extra_nodes: list[str] = ()
+) -> SQLiteGraphStore:
+    """SQLite store holding the given ``(source, target)`` CITES edges."""
+    store = SQLiteGraphStore(db_path)
+    store.initialize()
+    node_ids = sorted({n for edge in cites for n in edge} | set(extra_nodes))
+    store.add_nodes_batch(
+        [
+            GraphNode(node_id=n, node_type=NodeType.PAPER, properties={})
+            for n in node_ids
+        ]
+    )
+    edges = [
+        GraphEdge(
+            edge_id=f"edge:cites:{i}",
+            edge_type=EdgeType.CITES,
+            source_id=src,
+            target_id=tgt,
+            properties={},
+        )
+        for i, (src, tgt) in enumerate(cites)
+    ]
+    for start in range(0, len(edges), 10_000):
+        store.add_edges_batch(edges[start : start + 10_000])
+    return store
+
+
+def _random_cites(
+    papers: list[str], pool: list[str], *, seed: int, refs_per_paper: int
+) -> list[tuple[str, str]]:
+    """Random reference lists plus random citers among ``pool``."""
+    rng = random.Random(seed)
+    cites: set[tuple[str, str]] = set()
+    for p in papers:
+        for ref in rng.sample(pool, refs_per_paper):
+            cites.add((p, ref))
+        for citer in rng.sample(pool, refs_per_paper // 2):
+            cites.add((citer, p))
+    # A couple of self-citations and a paper citing another input paper.
+    cites.add((papers[0], papers[0]))
+    cites.add((papers[1], papers[0]))
+    return sorted(cites)
+
+
+def _key(result):
+    return (
+        result.paper_a_id,
+        result.paper_b_id,
+        result.shared_references,
+        round(result.coupling_strength, 12),
+        result.co_citation_count,
+    )
+
+
+class TestBatchEngine:
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_matches_per_pair_path(self, db_path: Path) -> None:
+        papers = [f"paper:s2:p{i:03d}" for i in range(30)]
+        pool = [f"paper:s2:r{i:03d}" for i in range(60)]
+        store = _real_store(
+            db_path, _random_cites(papers, pool, seed=7, refs_per_paper=12)
+        )
+        analyzer = CouplingAnalyzer(store)
+        seed, candidates = papers[0], papers[1:]
+
+        batch = await analyzer.analyze_for_paper(seed, candidates, top_k=100)
+        per_pair = [await analyzer.analyze_pair(seed, c) for c in candidates]
+        per_pair.sort(key=lambda r: (-r.coupling_strength, r.paper_b_id))
+
+        assert [_key(r) for r in batch] == [_key(r) for r in per_pair]
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_matches_per_pair_path(self, db_path: Path) -> None:
+        papers = [f"paper:s2:p{i:03d}" for i in range(15)]
+        pool = [f"paper:s2:r{i:03d}" for i in range(80)]
+        store = _real_store(
+            db_path,
+            _random_cites(papers, pool, seed=11, refs_per_paper=6),
+            extra_nodes=["paper:s2:isolated"],
+        )
+        analyzer = CouplingAnalyzer(store)
+        ids = [*papers, "paper:s2:isolated", papers[3]]  # duplicate collapsed
+
+        results = await analyzer.analyze_all_pairs(ids)
+
+        expected = []
+        unique = sorted(set(ids))
+        for i, a in enumerate(unique):
+            for b in unique[i + 1 :]:
+                r = await analyzer.analyze_pair(a, b)
+                if r.shared_references or r.co_citation_count:
+                    expected.append(r)
+        expected.sort(key=lambda r: (-r.coupling_strength, r.paper_a_id, r.paper_b_id))
+        assert [_key(r) for r in results] == [_key(r) for r in expected]
+        # The isolated paper shares nothing with anyone → never reported.
+        assert all(
+            "paper:s2:isolated" not in (r.paper_a_id, r.paper_b_id) for r in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_reports_co_citation_only_pairs(self) -> None:
+        store = _mock_store_with_refs(
+            {}, citers_map={PAPER_A: [PAPER_X], PAPER_B: [PAPER_X, PAPER_Y]}
+        )
+        results = await CouplingAnalyzer(store).analyze_all_pairs([PAPER_B, PAPER_A])
+
+        assert len(results) == 1
+        assert (results[0].paper_a_id, results[0].paper_b_id) == (PAPER_A, PAPER_B)
+        assert results[0].coupling_strength == 0.0
+        assert results[0].shared_references == []
+        assert results[0].co_citation_count == 1
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_empty_input(self) -> None:
+        assert (
+            await CouplingAnalyzer(_mock_store_with_refs({})).analyze_all_pairs([])
+            == []
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_rejects_invalid_id(self) -> None:
+        analyzer = CouplingAnalyzer(_mock_store_with_refs({}))
+        with pytest.raises(ValueError, match="Invalid paper_id format"):
+            await analyzer.analyze_all_pairs([PAPER_A, "bad id!"])
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_exceeds_max_candidates_raises(self) -> None:
+        analyzer = CouplingAnalyzer(_mock_store_with_refs({}))
+        too_many = [f"paper:s2:c{i:06d}" for i in range(MAX_CANDIDATES + 1)]
+        with pytest.raises(ValueError, match="MAX_CANDIDATES"):
+            await analyzer.analyze_all_pairs(too_many)
+
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_rejects_self_candidate(self) -> None:
+        analyzer = CouplingAnalyzer(_mock_store_with_refs({}))
+        with pytest.raises(ValueError, match="must differ"):
+            await analyzer.analyze_for_paper(PAPER_A, [PAPER_B, PAPER_A])
+
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_rejects_invalid_candidate(self) -> None:
+        analyzer = CouplingAnalyzer(_mock_store_with_refs({}))
+        with pytest.raises(ValueError, match="Invalid paper_id format"):
+            await analyzer.analyze_for_paper(PAPER_A, ["../etc"])
+
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_keeps_duplicate_candidates(self) -> None:
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_B})
+        results = await CouplingAnalyzer(store).analyze_for_paper(
+            PAPER_A, [PAPER_B, PAPER_B]
+        )
+        assert [r.paper_b_id for r in results] == [PAPER_B, PAPER_B]
+        # Computed once: one bulk load for the unique candidate set.
+        store._list_outgoing_edges_for_nodes.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_references_truncated_event(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(analyzer_mod, "logger", structlog.get_logger())
+        monkeypatch.setattr(analyzer_mod, "_MAX_REFERENCES", 3)
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_A[:3]})
+
+        with structlog.testing.capture_logs() as logs:
+            [result] = await CouplingAnalyzer(store).analyze_for_paper(
+                PAPER_A, [PAPER_B]
+            )
+
+        events = [e for e in logs if e["event"] == "coupling_references_truncated"]
+        assert [(e["paper_id"], e["fetched"], e["cap"]) for e in events] == [
+            (PAPER_A, 5, 3)
+        ]
+        assert result.coupling_strength == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_batch_co_citation_cap_skips_loading_citers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(analyzer_mod, "logger", structlog.get_logger())
+        monkeypatch.setattr(analyzer_mod, "MAX_INBOUND_CITERS_FOR_CO_CITATION", 2)
+        store = _mock_store_with_refs(
+            {PAPER_A: REFS_A, PAPER_B: REFS_B, PAPER_C: REFS_B},
+            citers_map={
+                PAPER_A: [PAPER_X, PAPER_Y, PAPER_Z],
+                PAPER_B: [PAPER_X, PAPER_Y],
+                PAPER_C: [PAPER_X, PAPER_Y],
+            },
+        )
+
+        with structlog.testing.capture_logs() as logs:
+            results = await CouplingAnalyzer(store).analyze_all_pairs(
+                [PAPER_A, PAPER_B, PAPER_C]
+            )
+
+        trunc = [e for e in logs if e["event"] == "coupling_co_citation_truncated"]
+        assert [(e["paper_id"], e["inbound_count"]) for e in trunc] == [(PAPER_A, 3)]
+        loaded = store._list_incoming_edges_for_nodes.call_args.args[0]
+        assert PAPER_A not in loaded
+        by_pair = {(r.paper_a_id, r.paper_b_id): r for r in results}
+        # Pairs with the capped paper report the 0 sentinel; others are exact.
+        assert by_pair[(PAPER_A, PAPER_B)].co_citation_count == 0
+        assert by_pair[(PAPER_B, PAPER_C)].co_citation_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_computed_event_emitted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(analyzer_mod, "logger", structlog.get_logger())
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_B})
+        analyzer = CouplingAnalyzer(store)
+
+        with structlog.testing.capture_logs() as logs:
+            await analyzer.analyze_for_paper(PAPER_A, [PAPER_B, PAPER_C])
+            await analyzer.analyze_all_pairs([PAPER_A, PAPER_B, PAPER_C])
+
+        seed_events = [
+            e for e in logs if e["event"] == "coupling_analyzer_batch_computed"
+        ]
+        assert len(seed_events) == 1
+        assert seed_events[0]["pairs"] == 2
+        assert seed_events[0]["reference_edges"] == 10
+        all_events = [
+            e for e in logs if e["event"] == "coupling_analyzer_all_pairs_computed"
+        ]
+        assert all_events[0]["papers"] == 3
+        assert all_events[0]["pairs"] == 1
+
+
+class TestBatchCaching:
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_computes_only_cache_misses(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        store = _mock_store_with_refs(
+            {PAPER_A: REFS_A, PAPER_B: REFS_B, PAPER_C: REFS_A[:2]}
+        )
+        analyzer = CouplingAnalyzer(store, repo=repo)
+        await analyzer.analyze_pair(PAPER_A, PAPER_B)
+        store._list_outgoing_edges_for_nodes.reset_mock()
+
+        results = await analyzer.analyze_for_paper(PAPER_A, [PAPER_B, PAPER_C])
+
+        loaded = store._list_outgoing_edges_for_nodes.call_args.args[0]
+        assert loaded == [PAPER_A, PAPER_C]
+        assert {r.paper_b_id for r in results} == {PAPER_B, PAPER_C}
+        # The computed miss was written back.
+        assert repo.get(PAPER_A, PAPER_C) is not None
+
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_all_cached_skips_engine(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_B})
+        analyzer = CouplingAnalyzer(store, repo=repo)
+        await analyzer.analyze_for_paper(PAPER_A, [PAPER_B])
+        store._list_outgoing_edges_for_nodes.reset_mock()
+
+        [cached] = await analyzer.analyze_for_paper(PAPER_A, [PAPER_B])
+
+        store._list_outgoing_edges_for_nodes.assert_not_called()
+        assert cached.coupling_strength == pytest.approx(3 / 7, rel=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_analyze_for_paper_writes_in_one_batch(self) -> None:
+        repo = MagicMock(spec=CitationCouplingRepository)
+        repo.get_many.return_value = {}
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_B})
+
+        await CouplingAnalyzer(store, repo=repo).analyze_for_paper(
+            PAPER_A, [PAPER_B, PAPER_C]
+        )
+
+        repo.record_many.assert_called_once()
+        assert len(repo.record_many.call_args.args[0]) == 2
+        repo.record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_all_pairs_writes_in_one_batch(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        store = _mock_store_with_refs(
+            {PAPER_A: REFS_A, PAPER_B: REFS_B, PAPER_C: REFS_B}
+        )
+        analyzer = CouplingAnalyzer(store, repo=repo)
+
+        with patch.object(repo, "record_many", wraps=repo.record_many) as spy:
+            results = await analyzer.analyze_all_pairs([PAPER_A, PAPER_B, PAPER_C])
+
+        spy.assert_called_once_with(results)
+        assert repo.get(PAPER_B, PAPER_C).coupling_strength == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_batch_cache_write_failure_logged_and_swallowed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(analyzer_mod, "logger", structlog.get_logger())
+        repo = MagicMock(spec=CitationCouplingRepository)
+        repo.get_many.return_value = {}
+        repo.record_many.side_effect = Exception("disk full")
+        store = _mock_store_with_refs({PAPER_A: REFS_A, PAPER_B: REFS_B})
+
+        with structlog.testing.capture_logs() as logs:
+            results = await CouplingAnalyzer(store, repo=repo).analyze_for_paper(
+                PAPER_A, [PAPER_B]
+            )
+
+        assert len(results) == 1
+        errors = [
+            e for e in logs if e["event"] == "coupling_analyzer_cache_write_failed"
+        ]
+        assert errors[0]["paper_id"] == PAPER_A
+        assert errors[0]["pairs"] == 1
+        assert "disk full" in errors[0]["error"]
+
+
+class TestBatchVsPerPairBenchmark:
+    """Batch engine vs. the per-pair path on a 200-candidate neighbourhood.
+
+    Counts SQLite connections (one per store round-trip) as the stable
+    metric and checks wall-clock only as a coarse ordering, so the test
+    stays meaningful without being timing-flaky.
+    """
+
+    CANDIDATES = 200
+
+    @pytest.mark.asyncio
+    async def test_batch_beats_per_pair_round_trips_and_time(
+        self, db_path: Path
+    ) -> None:
+        papers = [f"paper:s2:p{i:04d}" for i in range(self.CANDIDATES + 1)]
+        pool = [f"paper:s2:r{i:04d}" for i in range(400)]
+        store = _real_store(
+            db_path, _random_cites(papers, pool, seed=3, refs_per_paper=20)
+        )
+        analyzer = CouplingAnalyzer(store)
+        seed, candidates = papers[0], papers[1:]
+
+        real_connect = store._get_connection
+        with patch.object(
+            store, "_get_connection", side_effect=real_connect
+        ) as connections:
+            start = time.perf_counter()
+            per_pair = [await analyzer.analyze_pair(seed, c) for c in candidates]
+            per_pair_seconds = time.perf_counter() - start
+            per_pair_round_trips = connections.call_count
+
+            connections.reset_mock()
+            start = time.perf_counter()
+            batch = await analyzer.analyze_for_paper(
+                seed, candidates, top_k=self.CANDIDATES
+            )
+            batch_seconds = time.perf_counter() - start
+            batch_round_trips = connections.call_count
+
+        # Per pair: 2 reference fetches + 2 inbound counts + 1 co-citer count.
+        assert per_pair_round_trips == 5 * self.CANDIDATES
+        assert batch_round_trips == 3
+        assert batch_seconds < per_pair_seconds
+        per_pair.sort(key=lambda r: (-r.coupling_strength, r.paper_b_id))
+        assert [_key(r) for r in batch] == [_key(r) for r in per_pair]
@@ -616,3 +616,87 @@ class TestNaiveDatetimeFix:
         # freshness check and return a result (not None).
         assert fetched is not None
         assert fetched.coupling_strength == pytest.approx(0.7)
+
+
+# ---------------------------------------------------------------------------
+# Batch read / write (all-pairs engine)
+# ---------------------------------------------------------------------------
+
+
+class TestBatchOperations:
+    def test_record_many_then_get_many_round_trip(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        results = [
+            _result(PAPER_B, PAPER_A, strength=0.25),
+            _result("paper:s2:c", "paper:s2:d", strength=0.75, co_citations=3),
+        ]
+        repo.record_many(results)
+
+        found = repo.get_many(
+            [(PAPER_A, PAPER_B), ("paper:s2:d", "paper:s2:c"), ("paper:s2:x", PAPER_A)]
+        )
+
+        # Keys and results are canonical; the unknown pair is a miss.
+        assert set(found) == {(PAPER_A, PAPER_B), ("paper:s2:c", "paper:s2:d")}
+        assert found[(PAPER_A, PAPER_B)].coupling_strength == pytest.approx(0.25)
+        assert found[("paper:s2:c", "paper:s2:d")].co_citation_count == 3
+
+    def test_record_many_upserts_existing_rows(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        repo.record(_result(strength=0.1))
+        repo.record_many([_result(strength=0.9)])
+        assert repo.get(PAPER_A, PAPER_B).coupling_strength == pytest.approx(0.9)
+
+    def test_record_many_empty_is_noop(
+        self, repo: CitationCouplingRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            repo, "_connect", lambda: pytest.fail("connection opened for no rows")
+        )
+        repo.record_many([])
+
+    def test_record_many_rolls_back_whole_batch(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        bad = _result("paper:s2:c", "paper:s2:d").model_copy(
+            update={"co_citation_count": -1}
+        )
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.record_many([_result(), bad])
+        assert repo.get(PAPER_A, PAPER_B) is None
+
+    def test_get_many_filters_stale_rows(
+        self, repo: CitationCouplingRepository, db_path: Path
+    ) -> None:
+        repo.record_many([_result(), _result("paper:s2:c", "paper:s2:d")])
+        stale = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        with conn_mod.open_connection(db_path) as conn:
+            conn.execute(
+                "UPDATE citation_coupling SET computed_at = ? WHERE paper_a_id = ?",
+                (stale, "paper:s2:c"),
+            )
+            conn.commit()
+
+        found = repo.get_many([(PAPER_A, PAPER_B), ("paper:s2:c", "paper:s2:d")])
+        assert list(found) == [(PAPER_A, PAPER_B)]
+
+    def test_get_many_spans_multiple_chunks(
+        self, repo: CitationCouplingRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(repo_mod, "_GET_MANY_CHUNK_PAIRS", 3)
+        pairs = [(PAPER_A, f"paper:s2:p{i:02d}") for i in range(10)]
+        repo.record_many([_result(a, b) for a, b in pairs])
+
+        found = repo.get_many(pairs)
+        assert len(found) == 10
+
+    def test_get_many_empty_input(self, repo: CitationCouplingRepository) -> None:
+        assert repo.get_many([]) == {}
+
+    def test_get_many_rejects_non_positive_max_age(
+        self, repo: CitationCouplingRepository
+    ) -> None:
+        with pytest.raises(ValueError, match="max_age_days must be positive"):
+            repo.get_many([(PAPER_A, PAPER_B)], max_age_days=0)
@@ -990,3 +990,381 @@ async def test_crawl_both_direction_starvation_regression(store, s2_client):
 
     # All 5 backward nodes must have been visited; 50 forward nodes
     assert result.papers_visited == 55  # 5 backward + 50 forward
+
+
+# ---------------------------------------------------------------------------
+# Layer-parallel mode
+# ---------------------------------------------------------------------------
+
+
+def _layered(**kwargs) -> CrawlConfig:
+    return CrawlConfig(layer_parallel=True, **kwargs)
+
+
+def test_crawl_config_layer_parallel_defaults():
+    cfg = CrawlConfig()
+    assert cfg.layer_parallel is False
+    assert cfg.max_concurrent_requests == crawler_module._MAX_CONCURRENT_REQUESTS
+
+
+def test_crawl_config_validates_max_concurrent_requests():
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        CrawlConfig(max_concurrent_requests=0)
+    with pytest.raises(ValidationError):
+        CrawlConfig(max_concurrent_requests=101)
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_matches_sequential(temp_db, s2_client):
+    """Both modes visit the same papers and write the same graph."""
+    a, b, c = _node("a", citation_count=3), _node("b", citation_count=2), _node("c")
+    refs = {"seed": [a, b], a.paper_id: [c], b.paper_id: [c, a]}
+    cites = {"seed": [c], c.paper_id: [b]}
+    _wire_references(s2_client, refs)
+    _wire_citations(s2_client, cites)
+
+    seq_store = SQLiteGraphStore(temp_db)
+    seq_store.initialize()
+    seq = await CitationCrawler(store=seq_store, s2_client=s2_client).crawl(
+        "seed", CrawlConfig(max_depth=2)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        par_store = SQLiteGraphStore(Path(tmp) / "layered.db")
+        par_store.initialize()
+        par = await CitationCrawler(store=par_store, s2_client=s2_client).crawl(
+            "seed", _layered(max_depth=2)
+        )
+        for node in (a, b, c):
+            assert par_store.get_node(node.paper_id) is not None
+
+    assert par.papers_visited == seq.papers_visited == 3
+    assert par.levels_reached == seq.levels_reached == 2
+    assert par.api_calls_made == seq.api_calls_made
+    assert par.persistence_aborted is False
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_persists_one_batch_per_layer(s2_client):
+    fake_store = MagicMock()
+    children = [_node(f"L1_{i}") for i in range(5)]
+    mapping = {"seed": children}
+    for child in children:
+        mapping[child.paper_id] = [
+            _node(f"L2_{child.paper_id[-1]}_{j}") for j in range(3)
+        ]
+    _wire_references(s2_client, mapping)
+
+    crawler = CitationCrawler(store=fake_store, s2_client=s2_client)
+    result = await crawler.crawl(
+        "seed", _layered(max_depth=2, direction=CrawlDirection.BACKWARD)
+    )
+
+    assert result.papers_visited == 5 + 15
+    assert fake_store.add_nodes_batch.call_count == 2
+    assert fake_store.add_edges_batch.call_count == 2
+    # Layer 1 writes all 15 grandchildren in one batch; the 5 parents
+    # were already persisted with layer 0.
+    assert len(fake_store.add_nodes_batch.call_args_list[1].args[0]) == 15
+    assert result.edges_added == 5 + 15
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_dedupes_shared_edges_within_layer(store, s2_client):
+    """``a -> b`` seen from a's references and b's citations is written once."""
+    a, b = _node("a"), _node("b")
+    _wire_references(s2_client, {"seed": [a, b], a.paper_id: [b]})
+    _wire_citations(s2_client, {b.paper_id: [a]})
+
+    result = await CitationCrawler(store=store, s2_client=s2_client).crawl(
+        "seed", _layered(max_depth=2)
+    )
+
+    assert result.persistence_aborted is False
+    # seed->a, seed->b, then a->b once (not twice).
+    assert result.edges_added == 3
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_chunks_oversized_layers(s2_client, monkeypatch):
+    monkeypatch.setattr(crawler_module, "_LAYER_BATCH_SIZE", 2)
+    fake_store = MagicMock()
+    _wire_references(s2_client, {"seed": [_node(f"c{i}") for i in range(4)]})
+
+    crawler = CitationCrawler(store=fake_store, s2_client=s2_client)
+    await crawler.crawl(
+        "seed", _layered(max_depth=1, direction=CrawlDirection.BACKWARD)
+    )
+
+    # 5 nodes (seed + 4) in chunks of 2, 4 edges in chunks of 2.
+    assert fake_store.add_nodes_batch.call_count == 3
+    assert fake_store.add_edges_batch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_expands_frontier_concurrently(store, s2_client):
+    """Depth-2, 50 papers per level: about one round-trip per level."""
+    in_flight = 0
+    peak = 0
+    delay = 0.05
+    level_one = [_node(f"L1_{i}") for i in range(50)]
+
+    async def slow_refs(paper_id, *args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(delay)
+        in_flight -= 1
+        if paper_id == "seed":
+            seed = _node("seed")
+            return seed, level_one, [_edge(seed, n) for n in level_one]
+        return _node(paper_id.split(":")[-1]), [], []
+
+    s2_client.get_references.side_effect = slow_refs
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    config = _layered(
+        max_depth=2,
+        direction=CrawlDirection.BACKWARD,
+        max_concurrent_requests=50,
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await crawler.crawl("seed", config)
+    elapsed = loop.time() - started
+
+    assert result.papers_visited == 50
+    assert result.api_calls_made == 51
+    assert peak == 50
+    # Sequential would take 51 round-trips; allow generous slack over 2.
+    assert elapsed < delay * 10
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_respects_concurrency_bound(store, s2_client):
+    in_flight = 0
+    peak = 0
+    children = [_node(f"c{i}") for i in range(30)]
+
+    async def refs(paper_id, *args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if paper_id == "seed":
+            return _node("seed"), children, []
+        return _node(paper_id.split(":")[-1]), [], []
+
+    s2_client.get_references.side_effect = refs
+    s2_client.get_citations.side_effect = refs
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    await crawler.crawl("seed", _layered(max_depth=2, max_concurrent_requests=4))
+
+    assert 1 < peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_budget_runs_out_mid_layer(store, s2_client, monkeypatch):
+    """Only the affordable prefix of the frontier is dispatched."""
+    monkeypatch.setattr(crawler_module, "logger", structlog.get_logger())
+    children = [_node(f"L1_{i}", citation_count=10 - i) for i in range(5)]
+    mapping = {"seed": children}
+    for child in children:
+        mapping[child.paper_id] = [_node(f"gc_{child.paper_id[-1]}")]
+    _wire_references(s2_client, mapping)
+
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    config = _layered(max_depth=3, direction=CrawlDirection.BACKWARD, max_api_calls=3)
+    with structlog.testing.capture_logs() as logs:
+        result = await crawler.crawl("seed", config)
+
+    assert result.budget_exhausted is True
+    assert result.api_calls_made == 3
+    assert s2_client.get_references.await_count == 3
+    # The two highest-ranked L1 papers were expanded and persisted.
+    expanded_ids = {c.args[0] for c in s2_client.get_references.await_args_list}
+    assert expanded_ids == {"seed", children[0].paper_id, children[1].paper_id}
+    assert store.get_node(make_paper_node_id("s2", "gc_0")) is not None
+    assert result.papers_visited == 5 + 2
+    budget_events = [
+        e for e in logs if e.get("event") == "citation_crawl_budget_exhausted"
+    ]
+    assert len(budget_events) == 1
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_never_half_expands_both(store, s2_client, monkeypatch):
+    """BOTH needs two calls per paper; a single leftover call is not spent."""
+    monkeypatch.setattr(crawler_module, "logger", structlog.get_logger())
+    _wire_references(s2_client, {"seed": [_node("a")]})
+    _wire_citations(s2_client, {"seed": [_node("b")]})
+
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    result = await crawler.crawl("seed", _layered(max_depth=2, max_api_calls=3))
+
+    assert result.budget_exhausted is True
+    assert result.api_calls_made == 2
+    assert s2_client.get_references.await_count == 1
+    assert s2_client.get_citations.await_count == 1
+    assert result.papers_visited == 2
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_budget_exhausted_before_first_layer(store, s2_client):
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    result = await crawler.crawl("seed", _layered(max_api_calls=1))
+
+    assert result.budget_exhausted is True
+    assert result.api_calls_made == 0
+    s2_client.get_references.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_provider_failure_is_fail_soft(
+    store, s2_client, monkeypatch
+):
+    monkeypatch.setattr(crawler_module, "logger", structlog.get_logger())
+    a, b = _node("a"), _node("b")
+
+    async def refs(paper_id, *args, **kwargs):
+        if paper_id == "seed":
+            seed = _node("seed")
+            return seed, [a, b], [_edge(seed, a), _edge(seed, b)]
+        if paper_id == b.paper_id:
+            raise APIError("boom on b")
+        return _node("a"), [_node("a_ref")], [_edge(a, _node("a_ref"))]
+
+    s2_client.get_references.side_effect = refs
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    with structlog.testing.capture_logs() as logs:
+        result = await crawler.crawl(
+            "seed", _layered(max_depth=2, direction=CrawlDirection.BACKWARD)
+        )
+
+    assert result.papers_visited == 3
+    skips = [
+        e
+        for e in logs
+        if e.get("event") == "citation_crawl_provider_failed_skipping_node"
+    ]
+    assert [e["paper_id"] for e in skips] == [b.paper_id]
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_failed_layer_keeps_crawl_alive(store, s2_client):
+    """A layer where every expansion fails writes nothing and stops cleanly."""
+    s2_client.get_references.side_effect = APIError("down")
+    s2_client.get_citations.side_effect = APIError("down")
+
+    result = await CitationCrawler(store=store, s2_client=s2_client).crawl(
+        "seed", _layered()
+    )
+
+    assert result.papers_visited == 0
+    assert result.levels_reached == 0
+    assert result.persistence_aborted is False
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_unexpected_error_propagates(store, s2_client):
+    _wire_references(s2_client, {})
+    s2_client.get_citations.side_effect = RuntimeError("bug")
+
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    with pytest.raises(RuntimeError, match="bug"):
+        await crawler.crawl("seed", _layered())
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_persistence_failure_aborts(s2_client, monkeypatch):
+    monkeypatch.setattr(crawler_module, "logger", structlog.get_logger())
+    fake_store = MagicMock()
+    fake_store.add_edges_batch.side_effect = GraphStoreError("fk violation")
+    a = _node("a")
+    _wire_references(s2_client, {"seed": [a], a.paper_id: [_node("aa")]})
+
+    crawler = CitationCrawler(store=fake_store, s2_client=s2_client)
+    with structlog.testing.capture_logs() as logs:
+        result = await crawler.crawl(
+            "seed", _layered(max_depth=3, direction=CrawlDirection.BACKWARD)
+        )
+
+    assert result.persistence_aborted is True
+    assert result.papers_visited == 0
+    assert s2_client.get_references.await_count == 1
+    abort = [
+        e
+        for e in logs
+        if e.get("event") == "citation_crawl_persistence_failed_aborting"
+    ]
+    assert abort[0]["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_cancellation_cancels_in_flight_expansions(
+    store, s2_client
+):
+    started = asyncio.Event()
+    cancelled = 0
+    children = [_node(f"c{i}") for i in range(5)]
+
+    async def refs(paper_id, *args, **kwargs):
+        nonlocal cancelled
+        if paper_id == "seed":
+            return _node("seed"), children, []
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return _node(paper_id), [], []  # pragma: no cover
+
+    s2_client.get_references.side_effect = refs
+    crawler = CitationCrawler(store=store, s2_client=s2_client)
+    task = asyncio.create_task(
+        crawler.crawl("seed", _layered(max_depth=2, direction=CrawlDirection.BACKWARD))
+    )
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cancelled == 5
+
+
+@pytest.mark.asyncio
+async def test_layered_crawl_forward_only(crawler, s2_client, store):
+    citers = [_node("x"), _node("y")]
+    _wire_citations(s2_client, {"seed": citers})
+
+    result = await crawler.crawl(
+        "seed", _layered(max_depth=1, direction=CrawlDirection.FORWARD)
+    )
+
+    assert result.papers_visited == 2
+    assert s2_client.get_references.await_count == 0
+    assert store.get_node(make_paper_node_id("s2", "seed")) is not None
+
+
+# ---------------------------------------------------------------------------
+# aclose
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_every_configured_client(store, s2_client, oa_client):
+    cr = CitationCrawler(store=store, s2_client=s2_client, openalex_client=oa_client)
+    await cr.aclose()
+    s2_client.aclose.assert_awaited_once()
+    oa_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_aclose_skips_missing_client(store, oa_client):
+    cr = CitationCrawler(store=store, openalex_client=oa_client)
+    await cr.aclose()
+    oa_client.aclose.assert_awaited_once()
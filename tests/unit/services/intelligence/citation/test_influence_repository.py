@@ -4,6 +4,7 @@ Covers:
 - Round-trip persistence (record + get).
 - TTL semantics on the read path -- stale rows return ``None``.
 - ``delete_stale`` row count.
+- Batched ``record_many`` / ``get_many`` and ``list_computed_at``.
 - ``record_metrics`` retry path on lock contention.
 - ``record_metrics`` swallows non-contention ``sqlite3.Error``
   (preserves the original ``_write_cache`` don't-fail-the-API-call
@@ -647,6 +648,155 @@ class TestGetMetricsRetry:
         assert result.paper_id == "paper:s2:read-retry"
 
 
+# ---------------------------------------------------------------------------
+# Batch operations
+# ---------------------------------------------------------------------------
+
+
+class TestBatchOperations:
+    def test_record_many_persists_every_row(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        rows = [_metrics(f"paper:s2:batch{i}", citation_count=i) for i in range(5)]
+        repo.record_many(rows)
+        found = repo.get_many([m.paper_id for m in rows])
+        assert set(found) == {m.paper_id for m in rows}
+        assert found["paper:s2:batch3"].citation_count == 3
+
+    def test_record_many_upserts_existing_rows(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        repo.record_metrics(_metrics("paper:s2:batch-up", citation_count=1))
+        repo.record_many([_metrics("paper:s2:batch-up", citation_count=9)])
+        out = repo.get_metrics("paper:s2:batch-up")
+        assert out is not None
+        assert out.citation_count == 9
+
+    def test_record_many_empty_is_noop(
+        self, repo: CitationInfluenceRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _boom(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("no connection should be opened")
+
+        monkeypatch.setattr(repo_mod, "open_connection", _boom)
+        repo.record_many([])
+
+    def test_record_many_logs_and_swallows_non_lock_error(
+        self, repo: CitationInfluenceRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(repo_mod, "logger", structlog.get_logger())
+        fake_open, _ = _make_begin_immediate_failure_open("disk full")
+        monkeypatch.setattr(repo_mod, "open_connection", fake_open)
+
+        with structlog.testing.capture_logs() as logs:
+            repo.record_many([_metrics("paper:s2:b1"), _metrics("paper:s2:b2")])
+
+        events = [
+            e for e in logs if e.get("event") == "citation_influence_repo_write_failed"
+        ]
+        assert len(events) == 1
+        assert events[0]["rows"] == 2
+        assert "disk full" in events[0]["error"]
+
+    def test_record_many_rolls_back_partial_batch(
+        self, repo: CitationInfluenceRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failing ``executemany`` leaves no row of the batch behind."""
+        monkeypatch.setattr(repo_mod, "logger", structlog.get_logger())
+        real_open = conn_mod.open_connection
+
+        class _Proxy:
+            def __init__(self, c: sqlite3.Connection) -> None:
+                self._c = c
+
+            def execute(self, sql: str, *args: Any, **kw: Any) -> Any:
+                return self._c.execute(sql, *args, **kw)
+
+            def executemany(self, sql: str, rows: Any) -> Any:
+                rows = list(rows)
+                self._c.execute(sql, rows[0])
+                raise sqlite3.IntegrityError("constraint violation")
+
+            def commit(self) -> None:
+                self._c.commit()
+
+            def rollback(self) -> None:
+                self._c.rollback()
+
+        @contextmanager
+        def fake_open(p: Path) -> Iterator[_Proxy]:
+            with real_open(p) as conn:
+                yield _Proxy(conn)
+
+        monkeypatch.setattr(repo_mod, "open_connection", fake_open)
+        with structlog.testing.capture_logs() as logs:
+            repo.record_many([_metrics("paper:s2:rb1"), _metrics("paper:s2:rb2")])
+        monkeypatch.setattr(repo_mod, "open_connection", real_open)
+
+        assert repo.get_many(["paper:s2:rb1", "paper:s2:rb2"]) == {}
+        assert any(
+            e.get("event") == "citation_influence_repo_write_failed" for e in logs
+        )
+
+    def test_get_many_skips_missing_and_stale_rows(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        repo.record_many(
+            [
+                _metrics("paper:s2:fresh"),
+                _metrics(
+                    "paper:s2:stale",
+                    computed_at=datetime.now(timezone.utc) - timedelta(days=30),
+                ),
+            ]
+        )
+        found = repo.get_many(["paper:s2:fresh", "paper:s2:stale", "paper:s2:none"])
+        assert list(found) == ["paper:s2:fresh"]
+
+    def test_get_many_chunks_large_inputs(
+        self, repo: CitationInfluenceRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(repo_mod, "_GET_MANY_CHUNK_SIZE", 2)
+        ids = [f"paper:s2:chunk{i}" for i in range(5)]
+        repo.record_many([_metrics(pid) for pid in ids])
+        # Duplicates collapse before chunking.
+        assert set(repo.get_many(ids + ids[:2])) == set(ids)
+
+    def test_get_many_empty_input(self, repo: CitationInfluenceRepository) -> None:
+        assert repo.get_many([]) == {}
+
+    def test_get_many_rejects_non_positive_max_age_days(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        with pytest.raises(ValueError, match="max_age_days must be positive"):
+            repo.get_many(["paper:s2:x"], max_age_days=0)
+
+    def test_list_computed_at_returns_every_row(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        repo.record_many(
+            [_metrics("paper:s2:new"), _metrics("paper:s2:old", computed_at=old)]
+        )
+        stamps = repo.list_computed_at()
+        assert set(stamps) == {"paper:s2:new", "paper:s2:old"}
+        # No TTL filter: the 30-day-old row is still listed.
+        assert stamps["paper:s2:old"] == old
+
+    def test_list_computed_at_treats_naive_timestamps_as_utc(
+        self, repo: CitationInfluenceRepository
+    ) -> None:
+        with conn_mod.open_connection(repo.db_path) as conn:
+            conn.execute(
+                "INSERT INTO citation_influence_metrics (paper_id, computed_at) "
+                "VALUES (?, ?)",
+                ("paper:s2:naive", "2026-01-01T00:00:00"),
+            )
+            conn.commit()
+        stamps = repo.list_computed_at()
+        assert stamps["paper:s2:naive"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
 # ---------------------------------------------------------------------------
 # Path safety
 # ---------------------------------------------------------------------------
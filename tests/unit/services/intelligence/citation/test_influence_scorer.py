@@ -692,9 +692,9 @@ async def test_compute_for_paper_wraps_reads_in_to_thread(store, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_compute_for_graph_wraps_each_write_in_to_thread(store, monkeypatch):
-    """``compute_for_graph`` writes one row per requested paper -- each
-    must be wrapped in ``asyncio.to_thread``.
+async def test_compute_for_graph_wraps_batch_write_in_to_thread(store, monkeypatch):
+    """``compute_for_graph`` writes every requested paper in one
+    ``record_many`` batch, wrapped in ``asyncio.to_thread``.
     """
     nodes = [_node(f"atg{i}", citation_count=i, year=2020) for i in range(3)]
     _persist_chain(store, *nodes)
@@ -702,19 +702,19 @@ async def test_compute_for_graph_wraps_each_write_in_to_thread(store, monkeypatc
     repo = CitationInfluenceRepository.from_path(store.db_path)
     s = InfluenceScorer(store=store, repo=repo)
 
-    record_calls: list[object] = []
+    record_calls: list[list[InfluenceMetrics]] = []
     real_to_thread = scorer_module.asyncio.to_thread
 
     async def spy_to_thread(func, *args, **kwargs):
         underlying = getattr(func, "__func__", func)
-        if underlying is CitationInfluenceRepository.record_metrics:
+        if underlying is CitationInfluenceRepository.record_many:
             record_calls.append(args[0])
         return await real_to_thread(func, *args, **kwargs)
 
     monkeypatch.setattr(scorer_module.asyncio, "to_thread", spy_to_thread)
     await s.compute_for_graph([n.paper_id for n in nodes])
-    assert len(record_calls) == 3
-    assert {m.paper_id for m in record_calls} == {n.paper_id for n in nodes}
+    assert len(record_calls) == 1
+    assert {m.paper_id for m in record_calls[0]} == {n.paper_id for n in nodes}
 
 
 @pytest.mark.asyncio
@@ -939,3 +939,189 @@ async def test_pagerank_skipped_when_graph_exceeds_limit(store, monkeypatch):
     assert len(metrics_list) == 3
     for m in metrics_list:
         assert m.pagerank_score == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Shared sparse backend + batched persistence
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_adjacency_loaded_once_for_pagerank_and_hits(store):
+    """PageRank and HITS share one adjacency matrix per computation."""
+    nodes = [_node(f"adj{i}", year=2020) for i in range(4)]
+    _persist_chain(store, *nodes)
+    s = InfluenceScorer(store=store)
+
+    with patch.object(
+        scorer_module.GraphAlgorithms,
+        "adjacency",
+        wraps=scorer_module.GraphAlgorithms.adjacency,
+    ) as mock_adj:
+        out = await s.compute_for_graph([n.paper_id for n in nodes])
+
+    mock_adj.assert_called_once()
+    assert all(m.hub_score > 0 or m.authority_score > 0 for m in out)
+
+
+@pytest.mark.asyncio
+async def test_compute_for_graph_reads_cache_in_one_batch(store):
+    nodes = [_node(f"gm{i}", year=2020) for i in range(3)]
+    _persist_chain(store, *nodes)
+    cached = InfluenceMetrics(paper_id=nodes[0].paper_id, citation_count=77)
+
+    mock_repo = MagicMock(spec=CitationInfluenceRepository)
+    mock_repo.get_many.return_value = {cached.paper_id: cached}
+    s = InfluenceScorer(store=store, repo=mock_repo)
+
+    out = await s.compute_for_graph([n.paper_id for n in nodes])
+
+    mock_repo.get_many.assert_called_once_with(
+        [n.paper_id for n in nodes], s._max_age_days()
+    )
+    mock_repo.get_metrics.assert_not_called()
+    assert out[0] is cached
+    written = mock_repo.record_many.call_args.args[0]
+    assert {m.paper_id for m in written} == {n.paper_id for n in nodes[1:]}
+
+
+@pytest.mark.asyncio
+async def test_compute_for_graph_skips_graph_work_when_all_cached(store):
+    n = _node("allcached", year=2020)
+    _persist_chain(store, n)
+    s = InfluenceScorer(store=store)
+    await s.compute_for_graph([n.paper_id])
+
+    with patch.object(scorer_module.GraphAlgorithms, "adjacency") as mock_adj:
+        out = await s.compute_for_graph([n.paper_id])
+
+    mock_adj.assert_not_called()
+    assert out[0].paper_id == n.paper_id
+
+
+@pytest.mark.asyncio
+async def test_oversize_graph_skips_adjacency_load(store, monkeypatch):
+    monkeypatch.setattr(scorer_module, "MAX_GRAPH_NODES_FOR_HITS", 0)
+    monkeypatch.setattr(scorer_module, "MAX_GRAPH_NODES_FOR_PAGERANK", 0)
+    n = _node("big", citation_count=4, year=2020)
+    _persist_chain(store, n)
+    s = InfluenceScorer(store=store)
+
+    with patch.object(scorer_module.GraphAlgorithms, "adjacency") as mock_adj:
+        metrics = await s.compute_for_paper(n.paper_id)
+
+    mock_adj.assert_not_called()
+    assert metrics.pagerank_score == 0.0
+    assert metrics.citation_count == 4
+
+
+# ---------------------------------------------------------------------------
+# Incremental recomputation
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recompute_changed_computes_every_uncached_paper(store):
+    nodes = [_node(f"inc{i}", citation_count=i, year=2020) for i in range(3)]
+    _persist_chain(store, *nodes)
+    s = InfluenceScorer(store=store)
+
+    refreshed = await s.recompute_changed()
+
+    assert [m.paper_id for m in refreshed] == sorted(n.paper_id for n in nodes)
+    stored = s._repo.get_many([n.paper_id for n in nodes])
+    assert set(stored) == {n.paper_id for n in nodes}
+
+
+@pytest.mark.asyncio
+async def test_recompute_changed_is_noop_when_nothing_changed(store, monkeypatch):
+    monkeypatch.setattr(scorer_module, "logger", structlog.get_logger())
+    nodes = [_node(f"noop{i}", year=2020) for i in range(2)]
+    _persist_chain(store, *nodes)
+    s = InfluenceScorer(store=store)
+    await s.recompute_changed()
+
+    with patch.object(scorer_module.GraphAlgorithms, "adjacency") as mock_adj:
+        with structlog.testing.capture_logs() as logs:
+            refreshed = await s.recompute_changed()
+
+    assert refreshed == []
+    mock_adj.assert_not_called()
+    events = [
+        e for e in logs if e.get("event") == "influence_scorer_incremental_recompute"
+    ]
+    assert events == [
+        {
+            "event": "influence_scorer_incremental_recompute",
+            "log_level": "info",
+            "changed": 0,
+            "total": 2,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recompute_changed_refreshes_only_new_edge_endpoints(store):
+    a, b, c, d = (_node(x, year=2020) for x in ("ra", "rb", "rc", "rd"))
+    _persist_chain(store, a, b)
+    _persist_chain(store, c, d)
+    s = InfluenceScorer(store=store)
+    await s.recompute_changed()
+
+    edge = CitationEdge(
+        citing_paper_id=b.paper_id, cited_paper_id=c.paper_id, source="s2"
+    ).to_graph_edge()
+    store.add_edge(
+        edge.edge_id, edge.source_id, edge.target_id, edge.edge_type, edge.properties
+    )
+
+    refreshed = await s.recompute_changed()
+
+    refreshed_ids = {m.paper_id for m in refreshed}
+    assert {b.paper_id, c.paper_id} <= refreshed_ids
+    # PageRank/HITS are global: rows off the new edge moved as well, and
+    # every stored row now matches a full pass over the new graph.
+    assert refreshed_ids - {b.paper_id, c.paper_id}
+    ids = [n.paper_id for n in (a, b, c, d)]
+    expected = await s._compute_metrics_for_graph(target_ids=set(ids))
+    stored = s._repo.get_many(ids)
+    for paper_id in ids:
+        assert stored[paper_id].pagerank_score == pytest.approx(
+            expected[paper_id].pagerank_score
+        )
+        assert stored[paper_id].hub_score == pytest.approx(expected[paper_id].hub_score)
+        assert stored[paper_id].authority_score == pytest.approx(
+            expected[paper_id].authority_score
+        )
+
+
+def test_metrics_match_tolerates_only_negligible_moves():
+    cached = InfluenceMetrics(paper_id="p", citation_count=3, pagerank_score=0.2)
+
+    assert InfluenceScorer._metrics_match(
+        cached, cached.model_copy(update={"pagerank_score": 0.2 + 1e-9})
+    )
+    assert not InfluenceScorer._metrics_match(
+        cached, cached.model_copy(update={"pagerank_score": 0.21})
+    )
+    assert not InfluenceScorer._metrics_match(
+        cached, cached.model_copy(update={"citation_count": 4})
+    )
+    # Missing or expired rows are always rewritten
+    assert not InfluenceScorer._metrics_match(None, cached)
+
+
+@pytest.mark.asyncio
+async def test_recompute_changed_refreshes_updated_node(store):
+    a, b = _node("ua", citation_count=1, year=2020), _node("ub", year=2020)
+    _persist_chain(store, a, b)
+    s = InfluenceScorer(store=store)
+    await s.recompute_changed()
+
+    store.update_node(a.paper_id, {"citation_count": 40})
+    refreshed = await s.recompute_changed()
+
+    assert [m.paper_id for m in refreshed] == [a.paper_id]
+    assert refreshed[0].citation_count == 40
+    stored = s._repo.get_metrics(a.paper_id)
+    assert stored is not None and stored.citation_count == 40
@@ -6,6 +6,7 @@ All HTTP is mocked. No live API calls.
 from __future__ import annotations
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -1003,12 +1004,14 @@ def _mock_aiohttp_response(
 
 
 def _patch_session(response_cm):
+    # The client keeps one long-lived session, so ``ClientSession()``
+    # returns the session itself rather than a per-request context.
     session = MagicMock()
+    session.closed = False
     session.get = MagicMock(return_value=response_cm)
-    session_cm = MagicMock()
-    session_cm.__aenter__ = AsyncMock(return_value=session)
-    session_cm.__aexit__ = AsyncMock(return_value=False)
-    return patch("aiohttp.ClientSession", return_value=session_cm), session
+    session.post = MagicMock(return_value=response_cm)
+    session.close = AsyncMock()
+    return patch("aiohttp.ClientSession", return_value=session), session
 
 
 @pytest.mark.asyncio
@@ -1086,12 +1089,10 @@ async def test_http_get_raises_api_error_on_500(client):
 
 @pytest.mark.asyncio
 async def test_http_get_wraps_timeout_as_api_error(client):
-    session_cm = MagicMock()
     session = MagicMock()
+    session.closed = False
     session.get = MagicMock(side_effect=asyncio.TimeoutError())
-    session_cm.__aenter__ = AsyncMock(return_value=session)
-    session_cm.__aexit__ = AsyncMock(return_value=False)
-    with patch("aiohttp.ClientSession", return_value=session_cm):
+    with patch("aiohttp.ClientSession", return_value=session):
         with pytest.raises(APIError, match="timed out"):
             await client._http_get("http://x", {})
 
@@ -1210,6 +1211,9 @@ async def test_429_with_numeric_retry_after(client):
         with pytest.raises(RateLimitError) as exc_info:
             await client._http_get("http://x", {})
     assert exc_info.value.retry_after == pytest.approx(120.0)
+    # The shared limiter backs off and pauses for the server's hint.
+    assert client.rate_limiter.penalty < 1.0
+    assert client.rate_limiter.last_update > time.time() + 100
 
 
 @pytest.mark.asyncio
@@ -1509,3 +1513,342 @@ def test_payload_to_node_with_malformed_publication_date(client):
     assert any(
         "malformed_publication_date" in e.get("event", "") for e in warning_events
     )
+
+
+# ---------------------------------------------------------------------------
+# Batch hydration, node cache, coalescing, shared session
+# ---------------------------------------------------------------------------
+
+
+def _filter_ids(params):
+    return params["filter"].removeprefix("openalex:").split("|")
+
+
+@pytest.mark.asyncio
+async def test_get_papers_uses_filter_batch(client):
+    async def fake_http_get(url, params):
+        assert url.endswith("/works")
+        # Result order is not guaranteed; the client must map by id.
+        ids = [i for i in _filter_ids(params) if i != "W9"]
+        return {"results": [_hydrated_ref(i) for i in reversed(ids)]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get) as get:
+        nodes = await client.get_papers(["W1", "https://openalex.org/W2", "W9", "W1"])
+
+    assert get.call_count == 1
+    assert _filter_ids(get.call_args.kwargs["params"]) == ["W1", "W2", "W9"]
+    assert set(nodes) == {"W1", "https://openalex.org/W2"}
+    assert nodes["W1"].paper_id == make_paper_node_id("openalex", "W1")
+
+
+@pytest.mark.asyncio
+async def test_get_papers_chunks_at_filter_limit(client):
+    ids = [f"W{i}" for i in range(1, 121)]
+
+    async def fake_http_get(url, params):
+        return {"results": [_hydrated_ref(i) for i in _filter_ids(params)]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get) as get:
+        nodes = await client.get_papers(ids)
+
+    sizes = [len(_filter_ids(c.kwargs["params"])) for c in get.call_args_list]
+    assert sizes == [50, 50, 20]
+    assert len(nodes) == 120
+
+
+@pytest.mark.asyncio
+async def test_get_papers_rejects_invalid_id_before_any_request(client):
+    with patch.object(client, "_http_get", new=AsyncMock()) as get:
+        with pytest.raises(ValueError):
+            await client.get_papers(["W1", "W1|W2"])
+    get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_papers_skips_payload_that_fails_node_conversion(client):
+    async def fake_http_get(url, params):
+        return {"results": [_hydrated_ref("W1"), _hydrated_ref("W2")]}
+
+    good = client._payload_to_node(_hydrated_ref("W2"))
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        with patch.object(
+            client, "_payload_to_node", side_effect=[ValueError("bad"), good]
+        ):
+            nodes = await client.get_papers(["W1", "W2"])
+
+    assert set(nodes) == {"W2"}
+
+
+@pytest.mark.asyncio
+async def test_get_papers_ignores_results_without_valid_id(client):
+    async def fake_http_get(url, params):
+        return {"results": [{"title": "no id"}, _hydrated_ref("W1")]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        nodes = await client.get_papers(["W1"])
+
+    assert set(nodes) == {"W1"}
+
+
+@pytest.mark.asyncio
+async def test_cached_references_are_not_rehydrated(client):
+    filter_calls: list[list[str]] = []
+
+    async def fake_http_get(url, params):
+        if url.endswith("/works/W1"):
+            return SEED_PAYLOAD
+        filter_calls.append(_filter_ids(params))
+        return {"results": [_hydrated_ref(i) for i in _filter_ids(params)]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        await client.get_papers(["W101", "W102"])
+        _, related, _ = await client.get_references("W1", max_results=10)
+
+    assert filter_calls == [["W101", "W102"], ["W103"]]
+    # Reference order is preserved regardless of where payloads came from.
+    assert [n.title for n in related] == ["Ref W101", "Ref W102", "Ref W103"]
+
+
+@pytest.mark.asyncio
+async def test_cached_work_serves_later_seed_lookup(client):
+    seed_calls = 0
+
+    async def fake_http_get(url, params):
+        nonlocal seed_calls
+        if url.endswith("/works/W1"):
+            seed_calls += 1
+            return SEED_PAYLOAD
+        if "filter" in params and params["filter"].startswith("cites:"):
+            return {"results": [_citing_payload("W201")], "meta": {}}
+        return {"results": [_hydrated_ref(i) for i in _filter_ids(params)]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        await client.get_references("W1", max_results=10)
+        await client.get_citations("W1", max_results=10)
+        # W101 was hydrated as a reference; using it as a seed now is free.
+        await client.get_references("W101", max_results=10)
+
+    assert seed_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_citing_works_feed_node_cache(client):
+    async def fake_http_get(url, params):
+        if url.endswith("/works/W1"):
+            return SEED_PAYLOAD
+        return {"results": [_citing_payload("W201")], "meta": {}}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        await client.get_citations("W1", max_results=1)
+    with patch.object(client, "_http_get", new=AsyncMock()) as get:
+        nodes = await client.get_papers(["W201", "W1"])
+
+    get.assert_not_called()
+    assert set(nodes) == {"W201", "W1"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_relationship_calls_are_coalesced(client):
+    calls: list[str] = []
+
+    async def fake_http_get(url, params):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        if url.endswith("/works/W1"):
+            return SEED_PAYLOAD
+        return {"results": [_hydrated_ref(i) for i in _filter_ids(params)]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        results = await asyncio.gather(
+            *(client.get_references("W1", max_results=10) for _ in range(4))
+        )
+
+    assert len(calls) == 2
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_concurrent_batches_share_in_flight_ids(client):
+    release = asyncio.Event()
+    requested: list[list[str]] = []
+
+    async def fake_http_get(url, params):
+        ids = _filter_ids(params)
+        requested.append(ids)
+        await release.wait()
+        return {"results": [_hydrated_ref(i) for i in ids if i != "W9"]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        first = asyncio.create_task(client.get_papers(["W1", "W9"]))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(client.get_papers(["W1", "W9", "W2"]))
+        await asyncio.sleep(0)
+        release.set()
+        a, b = await asyncio.gather(first, second)
+
+    assert requested == [["W1", "W9"], ["W2"]]
+    assert set(a) == {"W1"}
+    assert set(b) == {"W1", "W2"}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_propagates_to_waiters(client):
+    release = asyncio.Event()
+
+    async def fake_http_get(url, params):
+        await release.wait()
+        raise RateLimitError("slow down")
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        owner = asyncio.create_task(client.get_papers(["W1", "W2"]))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client.get_papers(["W2"]))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert client._coalescer.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_seed_fetch_propagates_to_concurrent_waiter(client):
+    release = asyncio.Event()
+
+    async def fake_fetch_work(work_id):
+        await release.wait()
+        raise APIError("not found")
+
+    with patch.object(client, "_fetch_work", side_effect=fake_fetch_work):
+        owner = asyncio.create_task(client._get_work_payload("W1"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client._get_work_payload("W1"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    assert all(isinstance(r, APIError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_seed_lookup_waiting_on_batch_miss_raises_not_found(client):
+    release = asyncio.Event()
+
+    async def fake_http_get(url, params):
+        await release.wait()
+        return {"results": []}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        batch = asyncio.create_task(client.get_papers(["W9"]))
+        await asyncio.sleep(0)
+        seed = asyncio.create_task(client._get_work_payload("W9"))
+        await asyncio.sleep(0)
+        release.set()
+        nodes, err = await asyncio.gather(batch, seed, return_exceptions=True)
+
+    assert nodes == {}
+    assert isinstance(err, APIError)
+    assert "not found" in str(err)
+
+
+@pytest.mark.asyncio
+async def test_work_payloads_persist_to_disk_cache(tmp_path, fast_limiter):
+    first = OpenAlexCitationClient(
+        polite_email="a@b.c", rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    with patch.object(
+        first,
+        "_http_get",
+        new=AsyncMock(return_value={"results": [_hydrated_ref("W1")]}),
+    ):
+        await first.get_papers(["W1"])
+    first.close()
+
+    second = OpenAlexCitationClient(
+        polite_email="a@b.c", rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    try:
+        with patch.object(second, "_http_get", new=AsyncMock()) as get:
+            nodes = await second.get_papers(["W1"])
+        get.assert_not_called()
+        assert nodes["W1"].title == "Ref W1"
+    finally:
+        second.close()
+
+
+def test_node_cache_size_zero_disables_memory_layer(fast_limiter):
+    c = OpenAlexCitationClient(
+        polite_email="a@b.c",
+        rate_limiter=fast_limiter,
+        cache_dir=None,
+        node_cache_size=0,
+    )
+    c._node_payloads_put([("W1", _hydrated_ref("W1"))])
+    assert c._node_payload_get("W1") is None
+
+
+def test_node_cache_key_segregates_polite_pool(fast_limiter, monkeypatch):
+    monkeypatch.delenv("OPENALEX_POLITE_EMAIL", raising=False)
+    polite = OpenAlexCitationClient(
+        polite_email="a@b.c", rate_limiter=fast_limiter, cache_dir=None
+    )
+    anon = OpenAlexCitationClient(
+        polite_email=None, rate_limiter=fast_limiter, cache_dir=None
+    )
+    assert polite._node_cache_key("W1") != anon._node_cache_key("W1")
+
+
+@pytest.mark.asyncio
+async def test_http_session_is_reused_across_requests(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p as factory:
+        await client._http_get("http://x", {})
+        await client._http_get("http://y", {})
+    assert factory.call_count == 1
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_http_session_recreated_when_closed(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p as factory:
+        await client._http_get("http://x", {})
+        session.closed = True
+        await client._http_get("http://x", {})
+    assert factory.call_count == 2
+
+
+def test_http_session_recreated_on_new_event_loop(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, _ = _patch_session(cm)
+    with p as factory:
+        asyncio.run(client._http_get("http://x", {}))
+        asyncio.run(client._http_get("http://x", {}))
+    assert factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_session_and_cache(tmp_path, fast_limiter):
+    c = OpenAlexCitationClient(
+        polite_email="a@b.c", rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p:
+        await c._http_get("http://x", {})
+    await c.aclose()
+    session.close.assert_awaited_once()
+    assert c._session is None
+    assert c._cache is None
+    await c.aclose()
+    session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_client(client):
+    with patch.object(client, "aclose", new=AsyncMock()) as aclose:
+        async with client as entered:
+            assert entered is client
+    aclose.assert_awaited_once()
@@ -0,0 +1,196 @@
+"""Tests for the citation clients' in-process request sharing helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.services.intelligence.citation._request_cache import (
+    PayloadLRU,
+    RequestCoalescer,
+)
+
+# ---------------------------------------------------------------------------
+# PayloadLRU
+# ---------------------------------------------------------------------------
+
+
+def test_lru_rejects_negative_size():
+    with pytest.raises(ValueError, match="max_entries"):
+        PayloadLRU(-1)
+
+
+def test_lru_get_miss_returns_none():
+    assert PayloadLRU(2).get("a") is None
+
+
+def test_lru_evicts_least_recently_used():
+    lru = PayloadLRU(2)
+    lru.put("a", {"v": 1})
+    lru.put("b", {"v": 2})
+    # Touch "a" so "b" becomes the eviction candidate.
+    assert lru.get("a") == {"v": 1}
+    lru.put("c", {"v": 3})
+    assert len(lru) == 2
+    assert lru.get("b") is None
+    assert lru.get("a") == {"v": 1}
+    assert lru.get("c") == {"v": 3}
+
+
+def test_lru_put_overwrites_existing_key():
+    lru = PayloadLRU(2)
+    lru.put("a", {"v": 1})
+    lru.put("a", {"v": 2})
+    assert len(lru) == 1
+    assert lru.get("a") == {"v": 2}
+
+
+def test_lru_zero_size_disables_cache():
+    lru = PayloadLRU(0)
+    lru.put("a", {"v": 1})
+    assert len(lru) == 0
+    assert lru.get("a") is None
+
+
+# ---------------------------------------------------------------------------
+# RequestCoalescer.run
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_run_shares_one_call_between_concurrent_callers():
+    coalescer = RequestCoalescer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "payload"
+
+    tasks = [asyncio.create_task(coalescer.run("k", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert coalescer.in_flight() == 1
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["payload"] * 5
+    assert calls == 1
+    assert coalescer.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_share_across_keys():
+    coalescer = RequestCoalescer()
+    seen: list[str] = []
+
+    async def fetch(key: str) -> str:
+        seen.append(key)
+        return key
+
+    results = await asyncio.gather(
+        coalescer.run("a", lambda: fetch("a")),
+        coalescer.run("b", lambda: fetch("b")),
+    )
+    assert results == ["a", "b"]
+    assert sorted(seen) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exception_to_every_waiter():
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    tasks = [asyncio.create_task(coalescer.run("k", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert coalescer.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_run_forgets_key_after_settling():
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await coalescer.run("k", fetch) == 1
+    # Sequential calls are not coalesced: caching is not this class's job.
+    assert await coalescer.run("k", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_cancelling_one_waiter_keeps_request_alive_for_others():
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "ok"
+
+    first = asyncio.create_task(coalescer.run("k", fetch))
+    second = asyncio.create_task(coalescer.run("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+# ---------------------------------------------------------------------------
+# RequestCoalescer.claim
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_claim_first_caller_owns_and_later_callers_wait():
+    coalescer = RequestCoalescer()
+    future, owned = coalescer.claim("k")
+    again, owned_again = coalescer.claim("k")
+
+    assert owned is True
+    assert owned_again is False
+    assert again is future
+
+    future.set_result({"v": 1})
+    assert await again == {"v": 1}
+    # Settled keys are released immediately.
+    await asyncio.sleep(0)
+    assert coalescer.in_flight() == 0
+    _, owned_after = coalescer.claim("k")
+    assert owned_after is True
+
+
+@pytest.mark.asyncio
+async def test_claim_unawaited_exception_is_marked_retrieved():
+    coalescer = RequestCoalescer()
+    future, _ = coalescer.claim("k")
+    future.set_exception(RuntimeError("nobody listens"))
+    await asyncio.sleep(0)
+    assert coalescer.in_flight() == 0
+    # Retrieval flag set by the done-callback: no "never retrieved" warning.
+    assert future._log_traceback is False
+
+
+@pytest.mark.asyncio
+async def test_claim_cancelled_future_is_released():
+    coalescer = RequestCoalescer()
+    future, _ = coalescer.claim("k")
+    future.cancel()
+    await asyncio.sleep(0)
+    assert coalescer.in_flight() == 0
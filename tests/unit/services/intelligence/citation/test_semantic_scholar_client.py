@@ -638,12 +638,14 @@ def _mock_aiohttp_response(
 
 
 def _patch_session(response_cm):
+    # The client keeps one long-lived session, so ``ClientSession()``
+    # returns the session itself rather than a per-request context.
     session = MagicMock()
+    session.closed = False
     session.get = MagicMock(return_value=response_cm)
-    session_cm = MagicMock()
-    session_cm.__aenter__ = AsyncMock(return_value=session)
-    session_cm.__aexit__ = AsyncMock(return_value=False)
-    return patch("aiohttp.ClientSession", return_value=session_cm), session
+    session.post = MagicMock(return_value=response_cm)
+    session.close = AsyncMock()
+    return patch("aiohttp.ClientSession", return_value=session), session
 
 
 @pytest.mark.asyncio
@@ -707,12 +709,10 @@ async def test_http_get_raises_api_error_on_500(client):
 
 @pytest.mark.asyncio
 async def test_http_get_wraps_timeout_as_api_error(client):
-    session_cm = MagicMock()
     session = MagicMock()
+    session.closed = False
     session.get = MagicMock(side_effect=asyncio.TimeoutError())
-    session_cm.__aenter__ = AsyncMock(return_value=session)
-    session_cm.__aexit__ = AsyncMock(return_value=False)
-    with patch("aiohttp.ClientSession", return_value=session_cm):
+    with patch("aiohttp.ClientSession", return_value=session):
         with pytest.raises(APIError, match="timed out"):
             await client._http_get("http://x", {})
 
@@ -1532,3 +1532,375 @@ def test_payload_to_node_without_influential_citation_count(client):
     }
     node = client._payload_to_node(payload)
     assert node.influential_citation_count is None
+
+
+# ---------------------------------------------------------------------------
+# Batch hydration, node cache, coalescing, shared session
+# ---------------------------------------------------------------------------
+
+
+def _paper_payload(paper_id: str, **overrides):
+    body = {
+        "paperId": paper_id,
+        "externalIds": {"DOI": "10.1/" + paper_id},
+        "title": f"Paper {paper_id}",
+        "year": 2018,
+        "citationCount": 3,
+        "referenceCount": 4,
+    }
+    body.update(overrides)
+    return body
+
+
+@pytest.mark.asyncio
+async def test_get_papers_uses_one_batch_post(client):
+    async def fake_post(url, params, json_body):
+        assert url.endswith("/paper/batch")
+        assert "paperId" in params["fields"]
+        return [
+            _paper_payload(pid) if pid != "gone" else None for pid in json_body["ids"]
+        ]
+
+    with patch.object(client, "_http_post", side_effect=fake_post) as post:
+        nodes = await client.get_papers(["p1", "p2", "gone", "p1"])
+
+    assert post.call_count == 1
+    # Duplicates collapsed before the request.
+    assert post.call_args.kwargs["json_body"] == {"ids": ["p1", "p2", "gone"]}
+    assert set(nodes) == {"p1", "p2"}
+    assert nodes["p1"].paper_id == make_paper_node_id("s2", "p1")
+
+
+@pytest.mark.asyncio
+async def test_get_papers_serves_cached_ids_without_request(client):
+    async def fake_post(url, params, json_body):
+        return [_paper_payload(pid) for pid in json_body["ids"]]
+
+    with patch.object(client, "_http_post", side_effect=fake_post) as post:
+        await client.get_papers(["p1", "p2"])
+        nodes = await client.get_papers(["p1", "p2", "p3"])
+
+    assert post.call_count == 2
+    assert post.call_args.kwargs["json_body"] == {"ids": ["p3"]}
+    assert set(nodes) == {"p1", "p2", "p3"}
+
+
+@pytest.mark.asyncio
+async def test_get_papers_chunks_at_batch_limit(client):
+    ids = [f"p{i}" for i in range(1201)]
+
+    async def fake_post(url, params, json_body):
+        return [_paper_payload(pid) for pid in json_body["ids"]]
+
+    with patch.object(client, "_http_post", side_effect=fake_post) as post:
+        nodes = await client.get_papers(ids)
+
+    assert [len(c.kwargs["json_body"]["ids"]) for c in post.call_args_list] == [
+        500,
+        500,
+        201,
+    ]
+    assert len(nodes) == 1201
+
+
+@pytest.mark.asyncio
+async def test_get_papers_rejects_invalid_id_before_any_request(client):
+    with patch.object(client, "_http_post", new=AsyncMock()) as post:
+        with pytest.raises(ValueError):
+            await client.get_papers(["p1", "../etc/passwd"])
+    post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_papers_raises_on_misaligned_batch_response(client):
+    with patch.object(client, "_http_post", new=AsyncMock(return_value=[None])):
+        with pytest.raises(APIError, match="does not match"):
+            await client.get_papers(["p1", "p2"])
+
+
+@pytest.mark.asyncio
+async def test_get_papers_skips_payload_that_fails_node_conversion(client):
+    async def fake_post(url, params, json_body):
+        return [_paper_payload("p1"), _paper_payload("p2")]
+
+    with patch.object(client, "_http_post", side_effect=fake_post):
+        with patch.object(
+            client,
+            "_payload_to_node",
+            side_effect=[
+                ValueError("bad"),
+                client._payload_to_node(_paper_payload("p2")),
+            ],
+        ):
+            nodes = await client.get_papers(["p1", "p2"])
+
+    assert set(nodes) == {"p2"}
+
+
+@pytest.mark.asyncio
+async def test_get_papers_caches_under_canonical_id(client):
+    async def fake_post(url, params, json_body):
+        return [_paper_payload("abc123")]
+
+    with patch.object(client, "_http_post", side_effect=fake_post) as post:
+        nodes = await client.get_papers(["DOI:10.1/abc"])
+        again = await client.get_papers(["abc123"])
+
+    assert post.call_count == 1
+    assert nodes["DOI:10.1/abc"].paper_id == again["abc123"].paper_id
+
+
+@pytest.mark.asyncio
+async def test_relationship_neighbours_feed_node_cache(client):
+    async def fake_http_get(url, params):
+        if url.endswith("/paper/seed1"):
+            return SEED_PAYLOAD
+        if int(params["offset"]) == 0:
+            return {"data": [_ref_entry("ref1")], "next": 1}
+        return {"data": []}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        await client.get_references("seed1", max_results=10)
+    with patch.object(client, "_http_post", new=AsyncMock()) as post:
+        nodes = await client.get_papers(["ref1", "seed1"])
+
+    post.assert_not_called()
+    assert set(nodes) == {"ref1", "seed1"}
+
+
+@pytest.mark.asyncio
+async def test_seed_metadata_fetched_once_across_endpoints(client):
+    seed_calls = 0
+
+    async def fake_http_get(url, params):
+        nonlocal seed_calls
+        if url.endswith("/paper/seed1"):
+            seed_calls += 1
+            return SEED_PAYLOAD
+        return {"data": []}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        await client.get_references("seed1", max_results=5)
+        await client.get_citations("seed1", max_results=5)
+
+    assert seed_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_relationship_calls_are_coalesced(client):
+    calls: list[str] = []
+
+    async def fake_http_get(url, params):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        if url.endswith("/paper/seed1"):
+            return SEED_PAYLOAD
+        return {"data": [_ref_entry("ref1")]}
+
+    with patch.object(client, "_http_get", side_effect=fake_http_get):
+        results = await asyncio.gather(
+            *(client.get_references("seed1", max_results=1) for _ in range(4))
+        )
+
+    assert len(calls) == 2
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_concurrent_batches_share_in_flight_ids(client):
+    release = asyncio.Event()
+    requested: list[list[str]] = []
+
+    async def fake_post(url, params, json_body):
+        requested.append(list(json_body["ids"]))
+        await release.wait()
+        return [
+            _paper_payload(pid) if pid != "gone" else None for pid in json_body["ids"]
+        ]
+
+    with patch.object(client, "_http_post", side_effect=fake_post):
+        first = asyncio.create_task(client.get_papers(["p1", "gone"]))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(client.get_papers(["p1", "gone", "p2"]))
+        await asyncio.sleep(0)
+        release.set()
+        a, b = await asyncio.gather(first, second)
+
+    assert requested == [["p1", "gone"], ["p2"]]
+    assert set(a) == {"p1"}
+    assert set(b) == {"p1", "p2"}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_propagates_to_waiters(client):
+    release = asyncio.Event()
+
+    async def fake_post(url, params, json_body):
+        await release.wait()
+        raise RateLimitError("slow down")
+
+    with patch.object(client, "_http_post", side_effect=fake_post):
+        owner = asyncio.create_task(client.get_papers(["p1", "p2"]))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client.get_papers(["p2"]))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert client._coalescer.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_seed_fetch_propagates_to_concurrent_waiter(client):
+    release = asyncio.Event()
+
+    async def fake_fetch_paper(paper_id):
+        await release.wait()
+        raise APIError("not found")
+
+    with patch.object(client, "_fetch_paper", side_effect=fake_fetch_paper):
+        owner = asyncio.create_task(client._get_paper_payload("seed1"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client._get_paper_payload("seed1"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    assert all(isinstance(r, APIError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_node_payloads_persist_to_disk_cache(tmp_path, fast_limiter):
+    first = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    with patch.object(
+        first, "_http_post", new=AsyncMock(return_value=[_paper_payload("p1")])
+    ):
+        await first.get_papers(["p1"])
+    first.close()
+
+    second = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    try:
+        with patch.object(second, "_http_post", new=AsyncMock()) as post:
+            nodes = await second.get_papers(["p1"])
+        post.assert_not_called()
+        assert nodes["p1"].title == "Paper p1"
+    finally:
+        second.close()
+
+
+def test_node_cache_size_zero_disables_memory_layer(fast_limiter):
+    c = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=None, node_cache_size=0
+    )
+    c._node_payloads_put([("p1", _paper_payload("p1"))])
+    assert c._node_payload_get("p1") is None
+
+
+def test_node_cache_key_segregates_auth(fast_limiter):
+    anon = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=None
+    )
+    authed = SemanticScholarCitationClient(
+        api_key="k", rate_limiter=fast_limiter, cache_dir=None
+    )
+    assert anon._node_cache_key("p1") != authed._node_cache_key("p1")
+    assert anon._node_cache_key("p1") != anon._cache_key("references", "p1", 1)
+
+
+@pytest.mark.asyncio
+async def test_http_post_sends_json_body(client):
+    cm = _mock_aiohttp_response(200, json_body=[{"paperId": "p1"}])
+    p, session = _patch_session(cm)
+    with p:
+        body = await client._http_post("http://x", {"fields": "f"}, {"ids": ["p1"]})
+    assert body == [{"paperId": "p1"}]
+    session.get.assert_not_called()
+    _, kwargs = session.post.call_args
+    assert kwargs["json"] == {"ids": ["p1"]}
+    assert kwargs["allow_redirects"] is False
+
+
+@pytest.mark.asyncio
+async def test_http_session_is_reused_across_requests(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p as factory:
+        await client._http_get("http://x", {})
+        await client._http_get("http://y", {})
+    assert factory.call_count == 1
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_http_session_recreated_when_closed(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p as factory:
+        await client._http_get("http://x", {})
+        session.closed = True
+        await client._http_get("http://x", {})
+    assert factory.call_count == 2
+
+
+def test_http_session_recreated_on_new_event_loop(client):
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, _ = _patch_session(cm)
+    with p as factory:
+        asyncio.run(client._http_get("http://x", {}))
+        asyncio.run(client._http_get("http://x", {}))
+    assert factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_session_and_cache(tmp_path, fast_limiter):
+    c = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=tmp_path
+    )
+    cm = _mock_aiohttp_response(200, json_body={})
+    p, session = _patch_session(cm)
+    with p:
+        await c._http_get("http://x", {})
+    await c.aclose()
+    session.close.assert_awaited_once()
+    assert c._session is None
+    assert c._cache is None
+    # Idempotent.
+    await c.aclose()
+    session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_client(fast_limiter):
+    c = SemanticScholarCitationClient(
+        api_key=None, rate_limiter=fast_limiter, cache_dir=None
+    )
+    with patch.object(c, "aclose", new=AsyncMock()) as aclose:
+        async with c as entered:
+            assert entered is c
+    aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_seed_lookup_waiting_on_batch_miss_raises_not_found(client):
+    release = asyncio.Event()
+
+    async def fake_post(url, params, json_body):
+        await release.wait()
+        return [None]
+
+    with patch.object(client, "_http_post", side_effect=fake_post):
+        batch = asyncio.create_task(client.get_papers(["gone"]))
+        await asyncio.sleep(0)
+        seed = asyncio.create_task(client._get_paper_payload("gone"))
+        await asyncio.sleep(0)
+        release.set()
+        nodes, err = await asyncio.gather(batch, seed, return_exceptions=True)
+
+    assert nodes == {}
+    assert isinstance(err, APIError)
+    assert "not found" in str(err)
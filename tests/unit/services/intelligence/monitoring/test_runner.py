@@ -136,6 +136,38 @@ def _result_for(
     return ArxivMonitorResult(run=run, new_papers=[], deduplicated_papers=[])
 
 
+def _make_scorer(
+    score_batch: AsyncMock,
+    *,
+    batch_size: int = 10,
+    resolved: dict | None = None,
+) -> MagicMock:
+    """Scorer double whose ``prefilter`` resolves ``resolved`` papers.
+
+    Every other paper is passed through to ``score_batch``.
+    """
+    resolved = resolved or {}
+
+    async def prefilter(_subscription, papers):
+        hits = {
+            p.paper_id: resolved[p.paper_id] for p in papers if p.paper_id in resolved
+        }
+        return hits, [p for p in papers if p.paper_id not in hits]
+
+    scorer = MagicMock()
+    scorer.batch_size = batch_size
+    scorer.prefilter = AsyncMock(side_effect=prefilter)
+    scorer.score_batch = score_batch
+    return scorer
+
+
+def _score_all(result) -> AsyncMock:
+    """``score_batch`` double returning ``result`` for every paper."""
+    return AsyncMock(
+        side_effect=lambda _subscription, papers: {p.paper_id: result for p in papers}
+    )
+
+
 # ---------------------------------------------------------------------------
 # Factory: from_paths
 # ---------------------------------------------------------------------------
@@ -738,8 +770,8 @@ class TestScorerIntegration:
     """C-1: RelevanceScorer is called per paper, scores written to records."""
 
     @pytest.mark.asyncio
-    async def test_scorer_called_per_paper(self) -> None:
-        """When a scorer is wired, it is called once per paper in the run."""
+    async def test_scorer_scores_papers_in_one_batch(self) -> None:
+        """When a scorer is wired, the run's papers share one batch call."""
         from unittest.mock import AsyncMock as _AsyncMock, MagicMock as _MagicMock
 
         from src.services.intelligence.monitoring.models import MonitoringPaperRecord
@@ -768,14 +800,13 @@ class TestScorerIntegration:
 
         result = ArxivMonitorResult(run=run_obj, new_papers=[], deduplicated_papers=[])
 
-        scorer = _MagicMock()
         score_result = RelevanceScoreResult(
             score=0.8,
             reasoning="Good match indeed",
             model_used="gemini-1.5-flash",
             cost_usd=0.0001,
         )
-        scorer.score = _AsyncMock(return_value=score_result)
+        scorer = _make_scorer(_score_all(score_result))
 
         sub_mgr = _MagicMock()
         sub_mgr.list_subscriptions = _MagicMock(return_value=[sub])
@@ -793,8 +824,10 @@ class TestScorerIntegration:
         )
         runs = await runner.run_once()
 
-        # Scorer must be called once per paper.
-        assert scorer.score.await_count == 2
+        # Both papers go out in a single batch call.
+        assert scorer.score_batch.await_count == 1
+        batch = scorer.score_batch.await_args.args[1]
+        assert [p.paper_id for p in batch] == ["p1", "p2"]
         # Scores must be written back to the paper records.
         assert runs[0].papers[0].relevance_score == pytest.approx(0.8)
         assert runs[0].papers[1].relevance_score == pytest.approx(0.8)
@@ -838,9 +871,10 @@ class TestScorerIntegration:
             model_used="gemini-1.5-flash",
             cost_usd=0.0,
         )
-        scorer = _MagicMock()
-        scorer.score = _AsyncMock(
-            side_effect=[LLMResponseError("malformed"), ok_result]
+        # One paper per batch so each paper gets its own call.
+        scorer = _make_scorer(
+            _AsyncMock(side_effect=[LLMResponseError("malformed"), {"p2": ok_result}]),
+            batch_size=1,
         )
 
         sub_mgr = _MagicMock()
@@ -948,8 +982,7 @@ class TestScorerIntegration:
             model_used="gemini-1.5-flash",
             cost_usd=0.0,
         )
-        scorer = _MagicMock()
-        scorer.score = _AsyncMock(return_value=ok_result)
+        scorer = _make_scorer(_score_all(ok_result))
 
         sub_mgr = _MagicMock()
         sub_mgr.list_subscriptions = _MagicMock(return_value=[sub])
@@ -972,8 +1005,9 @@ class TestScorerIntegration:
         # The paper with URL is scored; the paper without URL is skipped.
         assert runs[0].papers[0].relevance_score is None  # no URL → skipped
         assert runs[0].papers[1].relevance_score == pytest.approx(0.7)
-        # Scorer is called only once (for the URL paper).
-        assert scorer.score.await_count == 1
+        # Only the URL paper reaches the scorer.
+        batch = scorer.score_batch.await_args.args[1]
+        assert [p.paper_id for p in batch] == ["p-url"]
 
         skip_events = [
             e
@@ -987,6 +1021,99 @@ class TestScorerIntegration:
         assert skip_events[0]["source"] == PaperSource.OPENALEX.value
 
 
+class TestBatchedScoring:
+    """The runner prefilters, then scores the survivors in batches."""
+
+    @staticmethod
+    def _papers(count: int) -> list:
+        from src.services.intelligence.monitoring.models import MonitoringPaperRecord
+
+        return [
+            MonitoringPaperRecord(
+                paper_id=f"p{i}",
+                title=f"Paper {i}",
+                is_new=True,
+                url=f"https://arxiv.org/abs/p{i}",
+                source=PaperSource.ARXIV,
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _result(score: float):
+        from src.services.intelligence.monitoring.relevance_scorer import (
+            RelevanceScoreResult,
+        )
+
+        return RelevanceScoreResult(
+            score=score,
+            reasoning="Reasoning long enough to pass the guard",
+            model_used="gemini-1.5-flash",
+            cost_usd=0.0,
+        )
+
+    async def _run(self, papers: list, scorer: MagicMock) -> tuple[list, list[int]]:
+        import asyncio
+
+        runner = MonitoringRunner(
+            subscription_manager=MagicMock(),
+            monitor=MagicMock(),
+            run_repo=MagicMock(),
+            scorer=scorer,
+        )
+        llm_calls_used = [0]
+        await runner._score_papers(
+            _make_subscription(), papers, asyncio.Semaphore(10), llm_calls_used
+        )
+        return papers, llm_calls_used
+
+    @pytest.mark.asyncio
+    async def test_prefiltered_papers_skip_the_llm(self) -> None:
+        scorer = _make_scorer(
+            _score_all(self._result(0.8)),
+            resolved={"p0": self._result(0.0), "p1": self._result(0.6)},
+        )
+
+        papers, llm_calls_used = await self._run(self._papers(3), scorer)
+
+        assert [p.relevance_score for p in papers] == [0.0, 0.6, 0.8]
+        batch = scorer.score_batch.await_args.args[1]
+        assert [p.paper_id for p in batch] == ["p2"]
+        assert llm_calls_used == [1]
+
+    @pytest.mark.asyncio
+    async def test_papers_are_chunked_by_batch_size(self) -> None:
+        scorer = _make_scorer(_score_all(self._result(0.5)), batch_size=2)
+
+        papers, llm_calls_used = await self._run(self._papers(5), scorer)
+
+        sizes = [len(call.args[1]) for call in scorer.score_batch.await_args_list]
+        assert sorted(sizes) == [1, 2, 2]
+        # The cycle budget counts calls, not papers
+        assert llm_calls_used == [3]
+        assert all(p.relevance_score == 0.5 for p in papers)
+
+    @pytest.mark.asyncio
+    async def test_paper_missing_from_batch_response_stays_unscored(self) -> None:
+        scorer = _make_scorer(AsyncMock(return_value={"p0": self._result(0.7)}))
+
+        papers, _ = await self._run(self._papers(2), scorer)
+
+        assert papers[0].relevance_score == 0.7
+        assert papers[1].relevance_score is None
+
+    @pytest.mark.asyncio
+    async def test_duplicate_paper_ids_are_scored_once(self) -> None:
+        papers = self._papers(1) * 2
+        papers[1] = papers[0].model_copy()
+        scorer = _make_scorer(_score_all(self._result(0.4)))
+
+        papers, _ = await self._run(papers, scorer)
+
+        assert len(scorer.score_batch.await_args.args[1]) == 1
+        assert [p.relevance_score for p in papers] == [0.4, 0.4]
+
+
 # ---------------------------------------------------------------------------
 # H-C1: Public delegation methods
 # ---------------------------------------------------------------------------
@@ -1103,14 +1230,14 @@ class TestLLMBudgetCap:
         run_obj = run_obj.model_copy(update={"papers": papers})
         result = ArxivMonitorResult(run=run_obj, new_papers=[], deduplicated_papers=[])
 
-        scorer = _MagicMock()
         ok_result = RelevanceScoreResult(
             score=0.5,
             reasoning="Some match found here",
             model_used="gemini-1.5-flash",
             cost_usd=0.0,
         )
-        scorer.score = _AsyncMock(return_value=ok_result)
+        # One paper per batch, so each paper costs one call.
+        scorer = _make_scorer(_score_all(ok_result), batch_size=1)
 
         sub_mgr = _MagicMock()
         sub_mgr.list_subscriptions = _MagicMock(return_value=[sub])
@@ -1127,7 +1254,7 @@ class TestLLMBudgetCap:
             scorer=scorer,
         )
 
-        # Patch MAX_LLM_CALLS_PER_CYCLE to 1 so we hit the cap after 1 paper.
+        # Patch MAX_LLM_CALLS_PER_CYCLE to 1 so we hit the cap after 1 batch.
         with patch(
             "src.services.intelligence.monitoring.runner.MAX_LLM_CALLS_PER_CYCLE", 1
         ):
@@ -1171,7 +1298,9 @@ class TestMultiProviderMonitorBudgetPassthrough:
         # Build a MultiProviderMonitor mock that records what was passed.
         received_kwargs: dict = {}
 
-        async def mock_check(subscription, *, llm_calls_used=None, max_calls=None):
+        async def mock_check(
+            subscription, *, llm_calls_used=None, max_calls=None, searches=None
+        ):
             received_kwargs["llm_calls_used"] = llm_calls_used
             received_kwargs["max_calls"] = max_calls
             run = _make_run(subscription_id=subscription.subscription_id)
@@ -1201,14 +1330,115 @@ class TestMultiProviderMonitorBudgetPassthrough:
         assert received_kwargs.get("max_calls") == MAX_LLM_CALLS_PER_CYCLE
 
 
+class TestConcurrentSubscriptions:
+    """Subscriptions run concurrently and share coalesced searches."""
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_overlap_and_keep_order(self) -> None:
+        import asyncio
+
+        subs = [_make_subscription(subscription_id=f"sub-{i}") for i in range(3)]
+        in_flight = 0
+        peak = 0
+
+        async def check_fn(sub: ResearchSubscription) -> ArxivMonitorResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later subscriptions finish first.
+            await asyncio.sleep(0.01 * (3 - int(sub.subscription_id[-1])))
+            in_flight -= 1
+            return _result_for(sub)
+
+        runner, _, monitor, _ = _build_runner(subscriptions=subs)
+        monitor.check = AsyncMock(side_effect=check_fn)
+
+        runs = await runner.run_once()
+
+        assert peak == 3
+        assert [r.subscription_id for r in runs] == ["sub-0", "sub-1", "sub-2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        import asyncio
+
+        subs = [_make_subscription(subscription_id=f"sub-{i}") for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def check_fn(sub: ResearchSubscription) -> ArxivMonitorResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _result_for(sub)
+
+        monitor = MagicMock()
+        monitor.check = AsyncMock(side_effect=check_fn)
+        sub_mgr = MagicMock()
+        sub_mgr.list_subscriptions = MagicMock(return_value=subs)
+        runner = MonitoringRunner(
+            subscription_manager=sub_mgr,
+            monitor=monitor,
+            run_repo=MagicMock(),
+            max_concurrent_subscriptions=2,
+        )
+
+        runs = await runner.run_once()
+
+        assert peak == 2
+        assert len(runs) == 5
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrent_subscriptions"):
+            MonitoringRunner(
+                subscription_manager=MagicMock(),
+                monitor=MagicMock(),
+                run_repo=MagicMock(),
+                max_concurrent_subscriptions=0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_overlapping_subscriptions_share_one_fetch(self) -> None:
+        import asyncio
+
+        from src.services.intelligence.monitoring.models import PaperSource
+
+        async def search(_topic):
+            await asyncio.sleep(0.01)
+            return []
+
+        provider = MagicMock()
+        provider.search = AsyncMock(side_effect=search)
+        monitor = MultiProviderMonitor(
+            providers={PaperSource.ARXIV: provider}, registry=MagicMock()
+        )
+        subs = [
+            _make_subscription(subscription_id="sub-a", user_id="alice"),
+            _make_subscription(subscription_id="sub-b", user_id="bob"),
+        ]
+        sub_mgr = MagicMock()
+        sub_mgr.list_subscriptions = MagicMock(return_value=subs)
+        runner = MonitoringRunner(
+            subscription_manager=sub_mgr,
+            monitor=monitor,
+            run_repo=MagicMock(),
+        )
+
+        runs = await runner.run_once()
+
+        assert provider.search.await_count == 1
+        assert [r.status for r in runs] == [MonitoringRunStatus.SUCCESS] * 2
+
+
 # ---------------------------------------------------------------------------
-# C-1: Additional coverage for _score_paper branches (lines 364, 417-424,
-# 432-439, 499, 501)
+# C-1: Additional coverage for _score_papers / _score_batch branches
 # ---------------------------------------------------------------------------
 
 
 class TestScorePaperBranches:
-    """Cover the remaining _score_paper / _run_one branches.
+    """Cover the remaining _score_papers / _score_batch / _run_one branches.
 
     Uses monkeypatch.setattr(runner_module, "logger", ...) before
     capture_logs() so the structlog processor swap reaches the module-
@@ -1217,12 +1447,12 @@ class TestScorePaperBranches:
 
     @pytest.mark.asyncio
     async def test_score_paper_returns_early_when_scorer_is_none(self) -> None:
-        """Line 364: _score_paper early-returns when self._scorer is None.
+        """_score_papers early-returns when self._scorer is None.
 
-        Although _run_one gates on scorer is not None before spawning
-        scoring tasks, the defensive early-return in _score_paper itself
-        is valid code that must be reachable for coverage. Call
-        _score_paper directly on a runner with no scorer.
+        Although _run_one gates on scorer is not None before scoring,
+        the defensive early-return in _score_papers itself is valid code
+        that must be reachable for coverage. Call _score_papers directly
+        on a runner with no scorer.
         """
         import asyncio
         from unittest.mock import MagicMock as _MagicMock
@@ -1247,7 +1477,7 @@ class TestScorePaperBranches:
         sem = asyncio.Semaphore(10)
         llm_calls_used: list[int] = [0]
         # Must not raise; must return without touching scorer.
-        await runner._score_paper(sub, paper, sem, llm_calls_used)
+        await runner._score_papers(sub, [paper], sem, llm_calls_used)
         assert paper.relevance_score is None
         assert llm_calls_used[0] == 0
 
@@ -1256,7 +1486,7 @@ class TestScorePaperBranches:
         self,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Lines 417-424: unexpected Exception in scorer is caught, logged,
+        """An unexpected Exception in the scorer is caught, logged,
         and does not propagate — the paper is left unscored.
         """
         import asyncio
@@ -1270,8 +1500,7 @@ class TestScorePaperBranches:
 
         monkeypatch.setattr(runner_module, "logger", structlog.get_logger())
 
-        scorer = _MagicMock()
-        scorer.score = _AsyncMock(side_effect=RuntimeError("GPU exploded"))
+        scorer = _make_scorer(_AsyncMock(side_effect=RuntimeError("GPU exploded")))
 
         runner = MonitoringRunner(
             subscription_manager=_MagicMock(),
@@ -1291,7 +1520,7 @@ class TestScorePaperBranches:
         llm_calls_used: list[int] = [0]
 
         with structlog.testing.capture_logs() as logs:
-            await runner._score_paper(sub, paper, sem, llm_calls_used)
+            await runner._score_papers(sub, [paper], sem, llm_calls_used)
 
         # Paper must be left unscored.
         assert paper.relevance_score is None
@@ -1310,14 +1539,14 @@ class TestScorePaperBranches:
         self,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Lines 432-439: high score (>=0.95) with reasoning < 30 chars is
+        """A high score (>=0.95) with reasoning < 30 chars is
         rejected as a sanity-guard against prompt-injection. Paper is left
         unscored and monitoring_relevance_score_sanity_rejected is logged.
         """
         import asyncio
         import structlog
         import structlog.testing
-        from unittest.mock import AsyncMock as _AsyncMock, MagicMock as _MagicMock
+        from unittest.mock import MagicMock as _MagicMock
 
         import src.services.intelligence.monitoring.runner as runner_module
         from src.services.intelligence.monitoring.models import MonitoringPaperRecord
@@ -1335,8 +1564,7 @@ class TestScorePaperBranches:
             model_used="gemini-1.5-flash",
             cost_usd=0.0,
         )
-        scorer = _MagicMock()
-        scorer.score = _AsyncMock(return_value=thin_result)
+        scorer = _make_scorer(_score_all(thin_result))
 
         runner = MonitoringRunner(
             subscription_manager=_MagicMock(),
@@ -1356,7 +1584,7 @@ class TestScorePaperBranches:
         llm_calls_used: list[int] = [0]
 
         with structlog.testing.capture_logs() as logs:
-            await runner._score_paper(sub, paper, sem, llm_calls_used)
+            await runner._score_papers(sub, [paper], sem, llm_calls_used)
 
         # Paper must remain unscored after sanity rejection.
         assert paper.relevance_score is None
@@ -0,0 +1,178 @@
+"""Tests for ``SearchCoalescer``: cycle-scoped provider search sharing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.config.core import ResearchTopic, TimeframeSinceYear
+from src.models.paper import PaperMetadata
+from src.services.intelligence.monitoring.models import PaperSource
+from src.services.intelligence.monitoring.search_coalescer import SearchCoalescer
+
+
+def _papers(count: int) -> list[PaperMetadata]:
+    return [
+        PaperMetadata(
+            paper_id=f"2401.{i:05d}",
+            title=f"Paper {i}",
+            url=f"https://arxiv.org/abs/2401.{i:05d}",  # type: ignore[arg-type]
+        )
+        for i in range(count)
+    ]
+
+
+def _provider(papers: list[PaperMetadata]) -> MagicMock:
+    async def search(topic: ResearchTopic) -> list[PaperMetadata]:
+        await asyncio.sleep(0.01)
+        return papers[: topic.max_papers]
+
+    provider = MagicMock()
+    provider.search = AsyncMock(side_effect=search)
+    return provider
+
+
+def _topic(query: str = "tree of thoughts", **kwargs: object) -> ResearchTopic:
+    return ResearchTopic(
+        query=query,
+        timeframe=kwargs.pop("timeframe", TimeframeSinceYear(value=2024)),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestSearchCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_fetch(self) -> None:
+        provider = _provider(_papers(3))
+        coalescer = SearchCoalescer()
+
+        first, second = await asyncio.gather(
+            coalescer.search(PaperSource.ARXIV, provider, _topic()),
+            coalescer.search(PaperSource.ARXIV, provider, _topic()),
+        )
+
+        assert first == second == _papers(3)
+        assert provider.search.await_count == 1
+        assert (coalescer.fetches, coalescer.coalesced) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_queries_are_normalized(self) -> None:
+        provider = _provider(_papers(2))
+        coalescer = SearchCoalescer()
+
+        await coalescer.search(PaperSource.ARXIV, provider, _topic("Tree of thoughts"))
+        await coalescer.search(
+            PaperSource.ARXIV, provider, _topic("  tree  OF thoughts ")
+        )
+
+        assert provider.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_smaller_cap_is_served_from_larger_fetch(self) -> None:
+        provider = _provider(_papers(10))
+        coalescer = SearchCoalescer()
+
+        await coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=10))
+        results = await coalescer.search(
+            PaperSource.ARXIV, provider, _topic(max_papers=4)
+        )
+
+        assert results == _papers(4)
+        assert provider.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_larger_cap_refetches_a_truncated_fetch(self) -> None:
+        provider = _provider(_papers(10))
+        coalescer = SearchCoalescer()
+
+        await coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=4))
+        results = await coalescer.search(
+            PaperSource.ARXIV, provider, _topic(max_papers=8)
+        )
+
+        assert results == _papers(8)
+        assert provider.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_larger_cap_reuses_a_complete_fetch(self) -> None:
+        provider = _provider(_papers(2))
+        coalescer = SearchCoalescer()
+
+        await coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=4))
+        results = await coalescer.search(
+            PaperSource.ARXIV, provider, _topic(max_papers=8)
+        )
+
+        assert results == _papers(2)
+        assert provider.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_windows_and_sources_are_not_merged(self) -> None:
+        provider = _provider(_papers(1))
+        coalescer = SearchCoalescer()
+
+        await coalescer.search(PaperSource.ARXIV, provider, _topic())
+        await coalescer.search(
+            PaperSource.ARXIV,
+            provider,
+            _topic(timeframe=TimeframeSinceYear(value=2023)),
+        )
+        await coalescer.search(PaperSource.SEMANTIC_SCHOLAR, provider, _topic())
+
+        assert provider.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self) -> None:
+        provider = MagicMock()
+        provider.search = AsyncMock(side_effect=RuntimeError("rate limited"))
+        coalescer = SearchCoalescer()
+
+        outcomes = await asyncio.gather(
+            coalescer.search(PaperSource.ARXIV, provider, _topic()),
+            coalescer.search(PaperSource.ARXIV, provider, _topic()),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+        assert provider.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_larger_cap_does_not_wait_on_an_in_flight_smaller_fetch(
+        self,
+    ) -> None:
+        provider = _provider(_papers(10))
+        coalescer = SearchCoalescer()
+
+        small, large = await asyncio.gather(
+            coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=4)),
+            coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=8)),
+        )
+
+        # Whether the first fetch is truncated is unknown until it ends
+        assert (small, large) == (_papers(4), _papers(8))
+        assert (coalescer.fetches, coalescer.coalesced) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_larger_cap_refetches_after_a_failed_fetch(self) -> None:
+        provider = _provider(_papers(3))
+        search = provider.search.side_effect
+        failures = [RuntimeError("rate limited")]
+
+        async def fail_once(topic: ResearchTopic) -> list[PaperMetadata]:
+            if failures:
+                raise failures.pop()
+            return await search(topic)
+
+        provider.search.side_effect = fail_once
+        coalescer = SearchCoalescer()
+
+        with pytest.raises(RuntimeError):
+            await coalescer.search(PaperSource.ARXIV, provider, _topic(max_papers=2))
+        results = await coalescer.search(
+            PaperSource.ARXIV, provider, _topic(max_papers=8)
+        )
+
+        assert results == _papers(3)
+        assert provider.search.await_count == 2
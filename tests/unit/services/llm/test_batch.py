@@ -0,0 +1,536 @@
+"""Tests for batch-submission mode: LocalBatchProvider and BatchExtractor."""
+
+import asyncio
+import json
+import re
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.checkpoint import CheckpointConfig
+from src.models.extraction import ExtractionTarget
+from src.models.llm import BatchConfig, CostLimits, LLMConfig
+from src.services.checkpoint_service import CheckpointService
+from src.services.llm.batch import BatchExtractor, LocalBatchProvider, _custom_id
+from src.services.llm.exceptions import LLMProviderError
+from src.services.llm.providers.anthropic import AnthropicBatchProvider
+from src.services.llm.providers.base import BatchRequest, LLMResponse
+from src.services.llm.service import LLMService
+from src.utils.exceptions import CostLimitExceeded, LLMAPIError
+from tests.conftest_types import make_paper_metadata
+
+TARGETS = [
+    ExtractionTarget(name="title", description="Paper title", output_format="text")
+]
+
+
+class _TitleProvider:
+    """Fake provider answering every prompt with the paper's title."""
+
+    name = "anthropic"
+
+    def __init__(self, fail_titles: tuple[str, ...] = ()):
+        self.fail_titles = fail_titles
+        self.calls = 0
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        self.calls += 1
+        match = re.search(r"^- Title: (.+)$", prompt, re.MULTILINE)
+        title = match.group(1) if match else ""
+        if title in self.fail_titles:
+            raise LLMProviderError("overloaded", provider=self.name)
+        content = json.dumps(
+            {
+                "extractions": [
+                    {
+                        "target_name": "title",
+                        "success": True,
+                        "content": title,
+                        "confidence": 0.9,
+                        "error": None,
+                    }
+                ]
+            }
+        )
+        return LLMResponse(
+            content=content,
+            input_tokens=1000,
+            output_tokens=100,
+            model="claude-3-5-sonnet",
+            provider=self.name,
+            latency_ms=1.0,
+        )
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return 0.02
+
+    def calculate_cache_cost(
+        self, cache_read_tokens: int, cache_write_tokens: int
+    ) -> float:
+        return 0.0
+
+
+def _request(custom_id: str, title: str) -> BatchRequest:
+    return BatchRequest(
+        custom_id=custom_id,
+        system="Extract.",
+        prompt=f"- Title: {title}\n",
+        max_tokens=100,
+        temperature=0.0,
+    )
+
+
+def _papers(count: int) -> list:
+    return [
+        make_paper_metadata(paper_id=f"arxiv:2401.{i:05d}", title=f"Paper {i}")
+        for i in range(count)
+    ]
+
+
+class TestLocalBatchProvider:
+    """Tests for the file-backed stand-in batch provider."""
+
+    @pytest.mark.asyncio
+    async def test_batch_ends_after_configured_polls(self, tmp_path: Path) -> None:
+        provider = _TitleProvider()
+        batches = LocalBatchProvider(provider, tmp_path, ready_after_polls=1)
+
+        batch_id = await batches.submit([_request("a", "A"), _request("b", "B")])
+
+        assert await batches.poll(batch_id) is None
+        results = await batches.poll(batch_id)
+        assert [r.custom_id for r in results] == ["a", "b"]
+        assert '"content": "B"' in results[1].response.content
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_results_are_read_back_by_another_instance(
+        self, tmp_path: Path
+    ) -> None:
+        provider = _TitleProvider()
+        batch_id = await LocalBatchProvider(provider, tmp_path).submit(
+            [_request("a", "A")]
+        )
+        first = await LocalBatchProvider(provider, tmp_path).poll(batch_id)
+
+        second = await LocalBatchProvider(provider, tmp_path).poll(batch_id)
+
+        assert second == first
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_becomes_error_result(self, tmp_path: Path) -> None:
+        batches = LocalBatchProvider(_TitleProvider(fail_titles=("B",)), tmp_path)
+
+        batch_id = await batches.submit([_request("a", "A"), _request("b", "B")])
+        results = await batches.poll(batch_id)
+
+        assert results[0].error is None
+        assert results[1].response is None
+        assert results[1].error == "overloaded"
+
+    @pytest.mark.asyncio
+    async def test_unknown_batch_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(LLMProviderError, match="Unknown batch"):
+            await LocalBatchProvider(_TitleProvider(), tmp_path).poll("local-x")
+
+    @pytest.mark.asyncio
+    async def test_batched_responses_cost_half(self, tmp_path: Path) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        response = await _TitleProvider().generate("- Title: A", 100, 0.0)
+
+        assert batches.calculate_cost(response) == pytest.approx(0.01)
+
+
+@pytest.fixture
+def llm_service() -> LLMService:
+    config = LLMConfig(
+        provider="anthropic",
+        api_key="test-api-key",
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=4096,
+        batch=BatchConfig(),
+    )
+    with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+        return LLMService(config=config, cost_limits=CostLimits())
+
+
+@pytest.fixture
+def checkpoint_service(tmp_path: Path) -> CheckpointService:
+    return CheckpointService(CheckpointConfig(checkpoint_dir=str(tmp_path / "ckpt")))
+
+
+def _extractor(
+    llm_service: LLMService,
+    batch_provider: LocalBatchProvider,
+    checkpoint_service: CheckpointService,
+    **config: float,
+) -> BatchExtractor:
+    return BatchExtractor(
+        llm_service=llm_service,
+        batch_provider=batch_provider,
+        checkpoint_service=checkpoint_service,
+        run_id="batches-topic",
+        targets=TARGETS,
+        config=BatchConfig(
+            **{
+                "flush_interval_seconds": 0.01,
+                "poll_interval_seconds": 0.01,
+                **config,
+            }
+        ),
+    )
+
+
+class TestBatchExtractor:
+    """Tests for collecting a run's extractions into batch jobs."""
+
+    def test_service_creates_batch_provider_in_batch_mode(
+        self, llm_service: LLMService
+    ) -> None:
+        assert isinstance(llm_service.batch_provider, AnthropicBatchProvider)
+
+        interactive_config = llm_service.config.model_copy(update={"batch": None})
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            interactive = LLMService(
+                config=interactive_config, cost_limits=CostLimits()
+            )
+        assert interactive.batch_provider is None
+
+    @pytest.mark.asyncio
+    async def test_requests_are_collected_into_batches(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path / "batches")
+        extractor = _extractor(
+            llm_service, batches, checkpoint_service, max_batch_size=2
+        )
+        extractor.start()
+        papers = _papers(5)
+
+        extractions = await asyncio.gather(
+            *(extractor.extract(f"Content of {p.title}", p) for p in papers)
+        )
+        await extractor.aclose()
+
+        assert len(list((tmp_path / "batches").glob("*.requests.jsonl"))) == 3
+        assert [e.paper_id for e in extractions] == [p.paper_id for p in papers]
+        assert [e.extraction_results[0].content for e in extractions] == [
+            p.title for p in papers
+        ]
+        assert llm_service.usage_stats.papers_processed == 5
+        assert llm_service.usage_stats.total_cost_usd == pytest.approx(0.05)
+        assert checkpoint_service.load_checkpoint("batches-topic") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_only_its_paper(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(fail_titles=("Paper 1",)), tmp_path)
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+        extractor.start()
+        papers = _papers(2)
+
+        ok, failed = await asyncio.gather(
+            *(extractor.extract("Content", p) for p in papers),
+            return_exceptions=True,
+        )
+        await extractor.aclose()
+
+        assert ok.extraction_results[0].content == "Paper 0"
+        assert isinstance(failed, LLMAPIError)
+
+    @pytest.mark.asyncio
+    async def test_crashed_run_resumes_polling(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        provider = _TitleProvider()
+        papers = _papers(2)
+
+        # First run: the batch is submitted, then the run dies mid-poll
+        crashed = _extractor(
+            llm_service,
+            LocalBatchProvider(provider, tmp_path, ready_after_polls=1000),
+            checkpoint_service,
+        )
+        crashed.start()
+        waiting = [asyncio.create_task(crashed.extract("Content", p)) for p in papers]
+        while not checkpoint_service.get_batches("batches-topic"):
+            await asyncio.sleep(0.01)
+        await crashed.aclose()
+        await asyncio.gather(*waiting, return_exceptions=True)
+
+        (batch_id,) = checkpoint_service.get_batches("batches-topic")
+        assert provider.calls == 0
+
+        # Second run: polls the checkpointed batch instead of resubmitting
+        resumed = _extractor(
+            llm_service, LocalBatchProvider(provider, tmp_path), checkpoint_service
+        )
+        assert resumed.start() == 1
+        extractions = [await resumed.extract("Content", p) for p in papers]
+        await resumed.aclose()
+
+        assert [e.extraction_results[0].content for e in extractions] == [
+            "Paper 0",
+            "Paper 1",
+        ]
+        assert len(list(tmp_path.glob("*.requests.jsonl"))) == 1
+        assert provider.calls == 2
+        assert checkpoint_service.load_checkpoint("batches-topic") is None
+
+    @pytest.mark.asyncio
+    async def test_long_paper_is_extracted_interactively(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        llm_service.config = llm_service.config.model_copy(
+            update={"section_token_threshold": 1000}
+        )
+        llm_service.extract = AsyncMock()  # type: ignore[method-assign]
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+        paper = _papers(1)[0]
+
+        await extractor.extract("x" * 10_000, paper)
+        await extractor.aclose()
+
+        llm_service.extract.assert_awaited_once_with("x" * 10_000, TARGETS, paper)
+        assert not list(tmp_path.glob("*.requests.jsonl"))
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_fails_batch_before_submission(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        llm_service.usage_stats.total_cost_usd = 1_000.0
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+
+        with pytest.raises(CostLimitExceeded):
+            await extractor.extract("Content", _papers(1)[0])
+        await extractor.aclose()
+
+        assert not list(tmp_path.glob("*.requests.jsonl"))
+
+    @pytest.mark.asyncio
+    async def test_threshold_counts_the_full_prompt(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        # The content alone is far below the threshold; the instructions
+        # around it in the prompt push it over, as LLMService.extract sees it
+        llm_service.config = llm_service.config.model_copy(
+            update={"section_token_threshold": 20}
+        )
+        llm_service.extract = AsyncMock()  # type: ignore[method-assign]
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+        paper = _papers(1)[0]
+
+        await extractor.extract("Short", paper)
+        await extractor.aclose()
+
+        llm_service.extract.assert_awaited_once_with("Short", TARGETS, paper)
+
+    @pytest.mark.asyncio
+    async def test_interactive_fallback_holds_llm_semaphore(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        llm_service.config = llm_service.config.model_copy(
+            update={"section_token_threshold": 1000}
+        )
+        semaphore = asyncio.Semaphore(1)
+        held = []
+
+        async def extract(*args: object) -> None:
+            held.append(semaphore.locked())
+
+        llm_service.extract = extract  # type: ignore[method-assign]
+        extractor = BatchExtractor(
+            llm_service=llm_service,
+            batch_provider=LocalBatchProvider(_TitleProvider(), tmp_path),
+            checkpoint_service=checkpoint_service,
+            run_id="batches-topic",
+            targets=TARGETS,
+            config=BatchConfig(),
+            llm_semaphore=semaphore,
+        )
+
+        await extractor.extract("x" * 10_000, _papers(1)[0])
+        await extractor.aclose()
+
+        assert held == [True]
+        assert not semaphore.locked()
+
+    @pytest.mark.asyncio
+    async def test_in_flight_batches_reserve_budget(
+        self,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        config = LLMConfig(
+            provider="anthropic",
+            api_key="test-api-key",
+            model="claude-3-5-sonnet-20241022",
+            max_tokens=4096,
+            batch=BatchConfig(),
+        )
+        # Room for one batch (estimated at 0.01) but not for two
+        limits = CostLimits(max_daily_spend_usd=0.015, max_total_spend_usd=0.015)
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            service = LLMService(config=config, cost_limits=limits)
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path, ready_after_polls=2)
+        extractor = _extractor(service, batches, checkpoint_service, max_batch_size=1)
+
+        first, second = await asyncio.gather(
+            *(extractor.extract("Content", p) for p in _papers(2)),
+            return_exceptions=True,
+        )
+        await extractor.aclose()
+
+        assert first.extraction_results[0].content == "Paper 0"
+        assert isinstance(second, CostLimitExceeded)
+        assert len(list(tmp_path.glob("*.requests.jsonl"))) == 1
+        # Collected: the reservation gave way to the billed cost
+        assert service.usage_stats.total_cost_usd == pytest.approx(0.01)
+        with pytest.raises(CostLimitExceeded):
+            service.reserve_cost(0.01)
+        service.reserve_cost(0.005)
+
+    @pytest.mark.asyncio
+    async def test_poll_failures_are_retried(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        poll = batches.poll
+        failures = [LLMProviderError("timeout", provider="anthropic")]
+
+        async def poll_failing_once(batch_id: str):
+            if failures:
+                raise failures.pop()
+            return await poll(batch_id)
+
+        batches.poll = poll_failing_once  # type: ignore[method-assign]
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+
+        extraction = await extractor.extract("Content", _papers(1)[0])
+        await extractor.aclose()
+
+        assert extraction.extraction_results[0].content == "Paper 0"
+        assert checkpoint_service.load_checkpoint("batches-topic") is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_poll_failures_fail_the_batch(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        batches.poll = AsyncMock(  # type: ignore[method-assign]
+            side_effect=LLMProviderError("timeout", provider="anthropic")
+        )
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+
+        with patch("src.services.llm.batch.MAX_POLL_FAILURES", 3):
+            with pytest.raises(LLMProviderError, match="timeout"):
+                await extractor.extract("Content", _papers(1)[0])
+        await extractor.aclose()
+
+        assert batches.poll.await_count == 3
+        # Still checkpointed: the next run resumes polling it
+        assert len(checkpoint_service.get_batches("batches-topic")) == 1
+
+    @pytest.mark.asyncio
+    async def test_unrequested_resumed_batch_is_dropped_on_close(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path, ready_after_polls=1000)
+        stale, wanted = _papers(2)
+        stale_id = await batches.submit([_request(_custom_id(0), stale.title)])
+        wanted_id = await batches.submit([_request(_custom_id(0), wanted.title)])
+        checkpoint_service.save_batches(
+            "batches-topic",
+            {stale_id: [stale.paper_id], wanted_id: [wanted.paper_id]},
+        )
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+        assert extractor.start() == 2
+
+        waiting = asyncio.create_task(extractor.extract("Content", wanted))
+        await asyncio.sleep(0.05)
+        await extractor.aclose()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+        assert checkpoint_service.get_batches("batches-topic") == {
+            wanted_id: [wanted.paper_id]
+        }
+
+    @pytest.mark.asyncio
+    async def test_close_clears_checkpoint_when_no_batch_was_requested(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path, ready_after_polls=1000)
+        paper = _papers(1)[0]
+        batch_id = await batches.submit([_request(_custom_id(0), paper.title)])
+        checkpoint_service.save_batches("batches-topic", {batch_id: [paper.paper_id]})
+        extractor = _extractor(llm_service, batches, checkpoint_service)
+        extractor.start()
+
+        await extractor.aclose()
+
+        assert checkpoint_service.load_checkpoint("batches-topic") is None
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_papers_waiting_for_flush(
+        self,
+        llm_service: LLMService,
+        checkpoint_service: CheckpointService,
+        tmp_path: Path,
+    ) -> None:
+        batches = LocalBatchProvider(_TitleProvider(), tmp_path)
+        extractor = _extractor(
+            llm_service, batches, checkpoint_service, flush_interval_seconds=60
+        )
+        waiting = asyncio.create_task(extractor.extract("Content", _papers(1)[0]))
+        await asyncio.sleep(0)
+
+        await extractor.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert not list(tmp_path.glob("*.requests.jsonl"))
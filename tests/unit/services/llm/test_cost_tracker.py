@@ -185,6 +185,22 @@ class TestCostTracker:
         assert "anthropic" in summary["by_provider"]
         assert "google" in summary["by_provider"]
 
+    def test_record_usage_tracks_cache_tokens(self, tracker: CostTracker) -> None:
+        """Test prompt-cache reads and writes are totalled and per provider."""
+        tracker.record_usage(
+            tokens=3000, cost=0.01, provider="anthropic", cache_write_tokens=2000
+        )
+        tracker.record_usage(
+            tokens=3000, cost=0.005, provider="anthropic", cache_read_tokens=2000
+        )
+
+        summary = tracker.get_summary()
+
+        assert summary["cache_read_tokens"] == 2000
+        assert summary["cache_write_tokens"] == 2000
+        assert summary["by_provider"]["anthropic"]["cache_read_tokens"] == 2000
+        assert summary["by_provider"]["anthropic"]["cache_write_tokens"] == 2000
+
     def test_should_reset_daily(self, tracker: CostTracker) -> None:
         """Test daily reset detection."""
         # Same day - should not reset
@@ -0,0 +1,144 @@
+"""Tests for map-reduce extraction: section splitting and result merging."""
+
+import pytest
+
+from src.models.extraction import ExtractionResult, ExtractionTarget
+from src.services.llm.map_reduce import (
+    SectionSplitter,
+    estimate_tokens,
+    merge_extraction_results,
+)
+
+
+def _section(title: str, paragraphs: int, words: int = 40) -> str:
+    body = "\n\n".join(
+        " ".join(f"{title.lower()}{p}w{w}" for w in range(words))
+        for p in range(paragraphs)
+    )
+    return f"## {title}\n\n{body}"
+
+
+class TestSectionSplitter:
+    """Tests for SectionSplitter."""
+
+    def test_short_paper_is_one_part(self) -> None:
+        markdown = _section("Introduction", 1) + "\n\n" + _section("Methods", 1)
+
+        assert SectionSplitter(10_000).split(markdown) == [markdown]
+
+    def test_parts_follow_section_headers(self) -> None:
+        sections = [_section(t, 2) for t in ("Introduction", "Methods", "Results")]
+        budget = estimate_tokens(sections[0]) + 10
+
+        parts = SectionSplitter(budget).split("\n".join(sections))
+
+        assert parts == sections
+
+    def test_small_sections_are_packed_together(self) -> None:
+        sections = [_section(f"S{i}", 1, words=5) for i in range(6)]
+        markdown = "\n".join(sections)
+
+        parts = SectionSplitter(estimate_tokens(markdown) // 2 + 5).split(markdown)
+
+        assert len(parts) == 2
+        assert "\n".join(parts) == markdown
+
+    def test_oversized_section_splits_at_paragraphs(self) -> None:
+        section = _section("Methods", 8)
+        budget = estimate_tokens(section) // 3
+
+        parts = SectionSplitter(budget).split(section)
+
+        assert len(parts) > 1
+        assert all(estimate_tokens(part) <= budget for part in parts)
+        assert all(not part.startswith(" ") for part in parts)
+        assert " ".join(parts).split() == section.split()
+
+    def test_unbroken_text_is_split_at_fixed_width(self) -> None:
+        parts = SectionSplitter(100).split("x" * 1_000)
+
+        assert [len(part) for part in parts] == [400, 400, 200]
+
+    def test_preamble_before_first_header_is_kept(self) -> None:
+        markdown = "Title and authors\n" + _section("Abstract", 1)
+
+        parts = SectionSplitter(estimate_tokens(markdown) - 1).split(markdown)
+
+        assert parts[0] == "Title and authors"
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError):
+            SectionSplitter(0)
+
+
+def _target(name: str, output_format: str = "text") -> ExtractionTarget:
+    return ExtractionTarget(
+        name=name, description=f"Extract {name}", output_format=output_format
+    )
+
+
+def _result(name: str, content, confidence: float = 0.5, success: bool = True):
+    return ExtractionResult(
+        target_name=name, success=success, content=content, confidence=confidence
+    )
+
+
+class TestMergeExtractionResults:
+    """Tests for merge_extraction_results."""
+
+    def test_lists_are_concatenated_without_duplicates(self) -> None:
+        merged = merge_extraction_results(
+            [_target("prompts", "list")],
+            [
+                [_result("prompts", ["a", "b"])],
+                [_result("prompts", ["b", "c"])],
+            ],
+        )
+
+        assert merged[0].content == ["a", "b", "c"]
+
+    def test_json_objects_merge_with_earliest_part_winning(self) -> None:
+        merged = merge_extraction_results(
+            [_target("metrics", "json")],
+            [
+                [_result("metrics", {"acc": 0.9})],
+                [_result("metrics", {"acc": 0.1, "f1": 0.8})],
+            ],
+        )
+
+        assert merged[0].content == {"acc": 0.9, "f1": 0.8}
+
+    def test_text_is_joined_in_part_order(self) -> None:
+        merged = merge_extraction_results(
+            [_target("summary")],
+            [
+                [_result("summary", "First.", confidence=0.6)],
+                [_result("summary", None, confidence=0.99)],
+                [_result("summary", "Second.", confidence=0.8)],
+            ],
+        )
+
+        assert merged[0].success
+        assert merged[0].content == "First.\n\nSecond."
+        assert merged[0].confidence == 0.99
+
+    def test_target_found_in_no_part_fails(self) -> None:
+        merged = merge_extraction_results(
+            [_target("code", "code"), _target("summary")],
+            [
+                [
+                    _result("code", None, success=False),
+                    _result("summary", "Only here."),
+                ],
+                [ExtractionResult(target_name="code", success=False, error="absent")],
+            ],
+        )
+
+        assert not merged[0].success
+        assert merged[0].error == "absent"
+        assert merged[1].content == "Only here."
+
+    def test_missing_target_gets_default_error(self) -> None:
+        merged = merge_extraction_results([_target("code", "code")], [[], []])
+
+        assert merged[0].error == "Not found in any of 2 parts"
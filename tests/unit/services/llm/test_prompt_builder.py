@@ -171,6 +171,46 @@ class TestPromptBuilder:
 
         assert "Unknown" in prompt
 
+    def test_build_prompt_for_part(
+        self,
+        builder: PromptBuilder,
+        paper_metadata: PaperMetadata,
+        extraction_targets: list[ExtractionTarget],
+    ) -> None:
+        """Test a map-reduce part is labelled and whole papers are not."""
+        whole = builder.build_prompt("# Methods", extraction_targets, paper_metadata)
+        part = builder.build_prompt(
+            "# Methods", extraction_targets, paper_metadata, part=(2, 5)
+        )
+
+        assert "**Paper Content (part 2 of 5):**\n\n# Methods" in part.user
+        assert "part 2 of 5 of the paper" in part.user
+        assert "**Paper Content:**\n\n# Methods" in whole.user
+        assert "part" not in whole.user
+        assert part.system == whole.system
+
+    def test_prefix_is_invariant_across_papers(
+        self,
+        builder: PromptBuilder,
+        paper_metadata: PaperMetadata,
+        extraction_targets: list[ExtractionTarget],
+    ) -> None:
+        """Test only the per-paper part depends on the paper."""
+        other = paper_metadata.model_copy(
+            update={"paper_id": "other-456", "title": "Other Title"}
+        )
+
+        first = builder.build_prompt("# A", extraction_targets, paper_metadata)
+        second = builder.build_prompt("# B", extraction_targets, other)
+
+        assert first.system == second.system
+        assert "summary" in first.system
+        assert "**Required JSON Structure:**" in first.system
+        assert paper_metadata.title not in first.system
+        assert first.user.startswith("**Paper Metadata:**")
+        assert "Other Title" in second.user and "# B" in second.user
+        assert builder.build("# A", extraction_targets, paper_metadata) == (first.text)
+
 
 class TestPromptBuilderBehavioralEquivalence:
     """Behavioral equivalence tests for prompt building.
@@ -246,7 +246,12 @@ class TestProviderManager:
         for _ in range(config.circuit_breaker.failure_threshold):
             circuit.record_failure()
 
-        results = manager.health_check()
+        try:
+            results = manager.health_check()
+        finally:
+            # The registry is a process-wide singleton: don't leave the
+            # breaker open for later tests on this worker
+            circuit.reset()
 
         assert "anthropic" in results
         assert results["anthropic"]["available"] is False
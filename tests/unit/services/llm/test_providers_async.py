@@ -50,6 +50,71 @@ class TestAnthropicProviderGenerate:
             assert result.output_tokens == 50
             assert result.provider == "anthropic"
 
+    @pytest.mark.asyncio
+    async def test_generate_caches_system_prompt(self) -> None:
+        """Test system prompt is a cacheable block and cache usage is read."""
+        from src.services.llm.providers.anthropic import AnthropicProvider
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Generated response")]
+        mock_response.usage = MagicMock(
+            input_tokens=100,
+            output_tokens=50,
+            cache_read_input_tokens=2000,
+            cache_creation_input_tokens=0,
+        )
+        mock_response.stop_reason = "end_turn"
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            provider = AnthropicProvider(api_key="test-key")
+            provider._client = mock_client
+
+            result = await provider.generate(
+                prompt="Paper", max_tokens=1024, system_prompt="Instructions"
+            )
+
+        request = mock_client.messages.create.call_args.kwargs
+        assert request["system"] == [
+            {
+                "type": "text",
+                "text": "Instructions",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert request["messages"] == [{"role": "user", "content": "Paper"}]
+        assert result.cache_read_tokens == 2000
+        assert result.cache_write_tokens == 0
+        assert result.total_tokens == 2150
+        assert provider.calculate_cache_cost(1_000_000, 1_000_000) == pytest.approx(
+            0.30 + 3.75
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_without_system_prompt(self) -> None:
+        """Test plain prompts send no system block."""
+        from src.services.llm.providers.anthropic import AnthropicProvider
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Generated response")]
+        mock_response.usage = MagicMock(input_tokens=100, output_tokens=50)
+        mock_response.stop_reason = "end_turn"
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            provider = AnthropicProvider(api_key="test-key")
+            provider._client = mock_client
+
+            result = await provider.generate(prompt="Test prompt")
+
+        assert "system" not in mock_client.messages.create.call_args.kwargs
+        assert result.cache_read_tokens == 0
+        assert result.cache_write_tokens == 0
+
     @pytest.mark.asyncio
     async def test_generate_rate_limit_error(self) -> None:
         """Test rate limit error handling."""
@@ -215,6 +280,96 @@ class TestAnthropicProviderGenerate:
             assert result is None
 
 
+class TestAnthropicBatchProvider:
+    """Tests for AnthropicBatchProvider (Message Batches API)."""
+
+    @staticmethod
+    def _provider(mock_client: MagicMock):
+        from src.services.llm.providers.anthropic import (
+            AnthropicBatchProvider,
+            AnthropicProvider,
+        )
+
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            provider = AnthropicProvider(api_key="test-key")
+        provider._client = mock_client
+        return AnthropicBatchProvider(provider)
+
+    @pytest.mark.asyncio
+    async def test_submit_sends_message_params(self) -> None:
+        """Test each request carries the same params as an interactive call."""
+        from src.services.llm.providers.base import BatchRequest
+
+        mock_client = MagicMock()
+        mock_client.messages.batches.create = AsyncMock(
+            return_value=MagicMock(id="msgbatch_1")
+        )
+        batches = self._provider(mock_client)
+
+        batch_id = await batches.submit(
+            [BatchRequest("paper-0", "Instructions", "Paper", 1024, 0.0)]
+        )
+
+        assert batch_id == "msgbatch_1"
+        (request,) = mock_client.messages.batches.create.call_args.kwargs["requests"]
+        assert request["custom_id"] == "paper-0"
+        assert request["params"]["messages"] == [{"role": "user", "content": "Paper"}]
+        assert request["params"]["system"][0]["text"] == "Instructions"
+
+    @pytest.mark.asyncio
+    async def test_poll_returns_none_while_in_progress(self) -> None:
+        """Test a running batch reports no results."""
+        mock_client = MagicMock()
+        mock_client.messages.batches.retrieve = AsyncMock(
+            return_value=MagicMock(processing_status="in_progress")
+        )
+
+        assert await self._provider(mock_client).poll("msgbatch_1") is None
+
+    @pytest.mark.asyncio
+    async def test_poll_maps_ended_batch_results(self) -> None:
+        """Test succeeded and errored entries become batch results."""
+        message = MagicMock()
+        message.content = [MagicMock(text="{}")]
+        message.usage = MagicMock(input_tokens=100, output_tokens=50)
+        message.stop_reason = "end_turn"
+        succeeded = MagicMock(custom_id="paper-0")
+        succeeded.result = MagicMock(type="succeeded", message=message)
+        expired = MagicMock(custom_id="paper-1")
+        expired.result = MagicMock(type="expired", spec=["type"])
+
+        async def entries():
+            for entry in (succeeded, expired):
+                yield entry
+
+        mock_client = MagicMock()
+        mock_client.messages.batches.retrieve = AsyncMock(
+            return_value=MagicMock(processing_status="ended")
+        )
+        mock_client.messages.batches.results = AsyncMock(return_value=entries())
+        batches = self._provider(mock_client)
+
+        results = await batches.poll("msgbatch_1")
+
+        assert results[0].response.input_tokens == 100
+        assert results[1].response is None
+        assert results[1].error == "expired"
+        assert batches.calculate_cost(results[0].response) == pytest.approx(
+            (100 * 3.00 + 50 * 15.00) / 1_000_000 / 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_poll_classifies_errors(self) -> None:
+        """Test API errors surface as provider errors."""
+        mock_client = MagicMock()
+        mock_client.messages.batches.retrieve = AsyncMock(
+            side_effect=Exception("429 rate limit")
+        )
+
+        with pytest.raises(RateLimitError):
+            await self._provider(mock_client).poll("msgbatch_1")
+
+
 class TestGoogleProviderGenerate:
     """Tests for GoogleProvider.generate() method."""
 
@@ -255,6 +410,38 @@ class TestGoogleProviderGenerate:
             assert result.output_tokens == 50
             assert result.provider == "google"
 
+    @pytest.mark.asyncio
+    async def test_generate_reports_cached_tokens(self) -> None:
+        """Test system instruction is sent and cached tokens are split out."""
+        from src.services.llm.providers.google import GoogleProvider
+
+        mock_response = MagicMock()
+        mock_response.text = "Generated response"
+        mock_response.usage_metadata = MagicMock(
+            prompt_token_count=1000,
+            candidates_token_count=50,
+            cached_content_token_count=800,
+        )
+        mock_response.candidates = [MagicMock(finish_reason="STOP")]
+
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        genai = MagicMock()
+
+        with patch.dict("sys.modules", {"google": MagicMock(), "google.genai": genai}):
+            provider = GoogleProvider(api_key="test-key")
+            provider._client = mock_client
+
+            result = await provider.generate(
+                prompt="Paper", max_tokens=1024, system_prompt="Instructions"
+            )
+
+        config_kwargs = genai.types.GenerateContentConfig.call_args.kwargs
+        assert config_kwargs["system_instruction"] == "Instructions"
+        assert result.input_tokens == 200
+        assert result.cache_read_tokens == 800
+        assert result.total_tokens == 1050
+
     @pytest.mark.asyncio
     async def test_generate_with_fallback_token_counts(self) -> None:
         """Test generate with fallback to total token count."""
@@ -3,10 +3,15 @@
 Phase 5.1: Tests for the refactored LLMService as thin orchestrator.
 """
 
+import asyncio
+import json
+import re
+
 import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from src.services.llm.map_reduce import estimate_tokens
 from src.services.llm.service import LLMService
 from src.services.llm.providers.base import LLMResponse, ProviderHealth
 from src.services.llm.exceptions import LLMProviderError
@@ -717,3 +722,266 @@ class TestLLMServiceFallback:
 
             assert result is not None
             assert service.usage_stats.total_fallback_activations == 1
+
+
+class _RecordingProvider:
+    """Fake provider recording prompt sizes and peak concurrency.
+
+    Each call reports, as the ``sections`` list target, the markdown
+    headers found in its prompt.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.prompt_tokens: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        self.prompt_tokens.append(estimate_tokens(f"{system_prompt}\n\n{prompt}"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        headers = re.findall(r"^## (.+)$", prompt, re.MULTILINE)
+        content = json.dumps(
+            {
+                "extractions": [
+                    {
+                        "target_name": "sections",
+                        "success": True,
+                        "content": headers,
+                        "confidence": 0.5 + len(headers) / 100,
+                        "error": None,
+                    }
+                ]
+            }
+        )
+        return LLMResponse(
+            content=content,
+            input_tokens=100,
+            output_tokens=10,
+            model="claude-3-5-sonnet",
+            provider="anthropic",
+            latency_ms=1.0,
+        )
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return 0.01
+
+
+class TestLLMServiceMapReduce:
+    """Tests for section-by-section extraction of long papers."""
+
+    TARGETS = [
+        ExtractionTarget(
+            name="sections", description="List section titles", output_format="list"
+        )
+    ]
+
+    @staticmethod
+    def _paper(sections: int) -> str:
+        return "\n\n".join(
+            f"## Section {i}\n\n" + " ".join(f"word{w}" for w in range(400))
+            for i in range(sections)
+        )
+
+    def _service(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        provider: _RecordingProvider,
+        **overrides: object,
+    ) -> LLMService:
+        config = llm_config.model_copy(
+            update={"section_token_threshold": 2000, **overrides}
+        )
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            service = LLMService(config=config, cost_limits=cost_limits)
+        service._providers["anthropic"] = provider  # type: ignore[assignment]
+        service._provider_health["anthropic"] = ProviderHealth(provider="anthropic")
+        return service
+
+    @pytest.mark.asyncio
+    async def test_long_paper_is_extracted_by_section(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        provider = _RecordingProvider()
+        service = self._service(
+            llm_config, cost_limits, provider, max_concurrent_sections=3
+        )
+
+        result = await service.extract(self._paper(12), self.TARGETS, paper_metadata)
+
+        assert len(provider.prompt_tokens) > 3
+        assert max(provider.prompt_tokens) <= 2000
+        assert provider.max_in_flight == 3
+        assert result.extraction_results[0].content == [
+            f"Section {i}" for i in range(12)
+        ]
+        assert result.tokens_used == 110 * len(provider.prompt_tokens)
+        assert result.cost_usd == pytest.approx(0.01 * len(provider.prompt_tokens))
+        assert service.usage_stats.papers_processed == 1
+        assert service._cost_tracker.papers_processed == 1
+
+    @pytest.mark.asyncio
+    async def test_merge_ignores_completion_order(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        sequential = _RecordingProvider()
+        concurrent = _RecordingProvider()
+        paper = self._paper(8)
+
+        first = await self._service(
+            llm_config, cost_limits, sequential, max_concurrent_sections=1
+        ).extract(paper, self.TARGETS, paper_metadata)
+        second = await self._service(
+            llm_config, cost_limits, concurrent, max_concurrent_sections=8
+        ).extract(paper, self.TARGETS, paper_metadata)
+
+        assert sequential.max_in_flight == 1
+        assert concurrent.max_in_flight > 1
+        assert first.extraction_results == second.extraction_results
+
+    @pytest.mark.asyncio
+    async def test_short_paper_uses_single_prompt(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        provider = _RecordingProvider()
+        service = self._service(llm_config, cost_limits, provider)
+
+        await service.extract(self._paper(1), self.TARGETS, paper_metadata)
+
+        assert len(provider.prompt_tokens) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        provider = _RecordingProvider()
+        service = self._service(
+            llm_config, cost_limits, provider, section_token_threshold=None
+        )
+
+        await service.extract(self._paper(12), self.TARGETS, paper_metadata)
+
+        assert len(provider.prompt_tokens) == 1
+
+    @pytest.mark.asyncio
+    async def test_sections_stop_when_budget_is_spent(
+        self,
+        llm_config: LLMConfig,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        provider = _RecordingProvider()
+        service = self._service(
+            llm_config,
+            CostLimits(max_daily_spend_usd=0.02, max_total_spend_usd=0.02),
+            provider,
+            max_concurrent_sections=1,
+        )
+
+        with pytest.raises(CostLimitExceeded):
+            await service.extract(self._paper(12), self.TARGETS, paper_metadata)
+
+        assert len(provider.prompt_tokens) == 2
+
+
+class _CachingProvider:
+    """Fake provider with a prompt cache keyed on the system prompt.
+
+    Echoes cache usage the way Anthropic reports it: the system prompt is
+    a cache write the first time and a cache read afterwards, and only
+    the user prompt counts as uncached input.
+    """
+
+    def __init__(self) -> None:
+        self.cached: set[str] = set()
+        self.system_prompts: list[str | None] = []
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        self.system_prompts.append(system_prompt)
+        prefix_tokens = estimate_tokens(system_prompt or "")
+        hit = system_prompt in self.cached
+        self.cached.add(system_prompt or "")
+        return LLMResponse(
+            content='{"extractions": []}',
+            input_tokens=estimate_tokens(prompt),
+            output_tokens=10,
+            model="claude-3-5-sonnet",
+            provider="anthropic",
+            latency_ms=1.0,
+            cache_read_tokens=prefix_tokens if hit else 0,
+            cache_write_tokens=0 if hit else prefix_tokens,
+        )
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return (input_tokens * 3.00 + output_tokens * 15.00) / 1_000_000
+
+    def calculate_cache_cost(
+        self, cache_read_tokens: int, cache_write_tokens: int
+    ) -> float:
+        return (cache_read_tokens * 0.30 + cache_write_tokens * 3.75) / 1_000_000
+
+
+class TestLLMServicePromptCaching:
+    """Tests for the cacheable extraction prompt prefix."""
+
+    @pytest.mark.asyncio
+    async def test_topic_batch_reuses_cached_prefix(
+        self,
+        llm_config: LLMConfig,
+        cost_limits: CostLimits,
+        paper_metadata: PaperMetadata,
+    ) -> None:
+        targets = [
+            ExtractionTarget(
+                name=f"target_{i}",
+                description="Extract a detailed aspect of the paper " * 20,
+            )
+            for i in range(5)
+        ]
+        provider = _CachingProvider()
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            service = LLMService(config=llm_config, cost_limits=cost_limits)
+        service._providers["anthropic"] = provider  # type: ignore[assignment]
+        service._provider_health["anthropic"] = ProviderHealth(provider="anthropic")
+
+        costs = []
+        for i in range(3):
+            paper = paper_metadata.model_copy(update={"paper_id": f"paper-{i}"})
+            result = await service.extract(f"# Paper {i}", targets, paper)
+            costs.append(result.cost_usd)
+
+        assert len(set(provider.system_prompts)) == 1
+        prefix_tokens = estimate_tokens(provider.system_prompts[0] or "")
+        assert service._cost_tracker.cache_write_tokens == prefix_tokens
+        assert service._cost_tracker.cache_read_tokens == 2 * prefix_tokens
+        assert costs[1] < costs[0] / 2
+        assert costs[2] == pytest.approx(costs[1])
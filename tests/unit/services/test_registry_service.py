@@ -1075,3 +1075,37 @@ class TestProviderIdLookup:
         # Should find the paper using the provider ID lookup
         assert result is not None
         assert result.entry is not None
+
+
+class TestRegistryServiceChangeJournal:
+    """Tests for change-journal access through the service."""
+
+    def test_changes_are_journaled_and_persisted(
+        self, service, sample_paper, temp_registry_path
+    ):
+        """Test that registration and affiliation changes are journaled."""
+        entry = service.register_paper(sample_paper, topic_slug="first-topic")
+        service.add_topic_affiliation(entry, "second-topic")
+
+        reloaded = RegistryService(registry_path=temp_registry_path)
+
+        assert reloaded.get_change_sequence() == 2
+        assert [c.kind.value for c in reloaded.get_changes_since(0)] == [
+            "added",
+            "updated",
+        ]
+        assert reloaded.get_changes_since(2) == []
+
+    def test_rediscovering_unchanged_paper_is_not_journaled(
+        self, service, sample_paper
+    ):
+        """Test that a discovery-only hit on a known paper records nothing."""
+        service.register_paper(
+            sample_paper, topic_slug="test-topic", discovery_only=True
+        )
+
+        service.register_paper(
+            sample_paper, topic_slug="test-topic", discovery_only=True
+        )
+
+        assert service.get_change_sequence() == 1
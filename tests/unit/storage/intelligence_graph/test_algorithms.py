@@ -124,3 +124,158 @@ class TestPageRank:
         graph_store.add_node("paper:1", NodeType.PAPER, {})
         # Empty edge_type_values: no SQL is executed; returns []
         assert graph_store._list_edges_by_types([]) == []
+
+
+def _reference_pagerank(
+    node_ids: list[str],
+    edges: list[tuple[str, str]],
+    damping: float = 0.85,
+    iterations: int = 20,
+) -> dict[str, float]:
+    """Adjacency-list PageRank the sparse implementation must reproduce."""
+    n = len(node_ids)
+    scores = {nid: 1.0 / n for nid in node_ids}
+    outgoing: dict[str, list[str]] = {nid: [] for nid in node_ids}
+    incoming: dict[str, list[str]] = {nid: [] for nid in node_ids}
+    for source, target in edges:
+        outgoing[source].append(target)
+        incoming[target].append(source)
+    for _ in range(iterations):
+        scores = {
+            nid: (1 - damping) / n
+            + sum(damping * scores[src] / len(outgoing[src]) for src in incoming[nid])
+            for nid in node_ids
+        }
+    return scores
+
+
+def _build_graph(store: SQLiteGraphStore, n: int) -> list[tuple[str, str]]:
+    edges = []
+    for i in range(n):
+        store.add_node(f"paper:{i}", NodeType.PAPER, {})
+    for i in range(n):
+        for j in (i * 3 + 1, i * 7 + 2):
+            target = j % n
+            if target != i:
+                edges.append((f"paper:{i}", f"paper:{target}"))
+                store.add_edge(
+                    f"e:{i}:{target}",
+                    f"paper:{i}",
+                    f"paper:{target}",
+                    EdgeType.CITES,
+                    {},
+                )
+    return edges
+
+
+class TestAdjacency:
+    """Tests for ``GraphAlgorithms.adjacency``."""
+
+    def test_adjacency_drops_edges_outside_node_set(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:1", NodeType.PAPER, {})
+        graph_store.add_node("paper:2", NodeType.PAPER, {})
+        graph_store.add_node("entity:1", NodeType.ENTITY, {})
+        graph_store.add_edge("e:1", "paper:1", "paper:2", EdgeType.CITES, {})
+        graph_store.add_edge("e:2", "paper:1", "entity:1", EdgeType.CITES, {})
+
+        adjacency = GraphAlgorithms.adjacency(
+            graph_store, CITES, node_type=NodeType.PAPER
+        )
+
+        assert sorted(adjacency.node_ids) == ["paper:1", "paper:2"]
+        assert adjacency.matrix.shape == (2, 2)
+        assert adjacency.matrix.nnz == 1
+
+    def test_adjacency_counts_parallel_edges(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:1", NodeType.PAPER, {})
+        graph_store.add_node("paper:2", NodeType.PAPER, {})
+        graph_store.add_edge("e:1", "paper:1", "paper:2", EdgeType.CITES, {})
+        graph_store.add_edge("e:2", "paper:1", "paper:2", EdgeType.CITES, {})
+
+        node_ids, matrix = GraphAlgorithms.adjacency(graph_store, CITES)
+
+        i, j = node_ids.index("paper:1"), node_ids.index("paper:2")
+        assert matrix[i, j] == 2.0
+
+    def test_adjacency_rejects_empty_edge_types(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        with pytest.raises(ValueError, match="at least one edge type"):
+            GraphAlgorithms.adjacency(graph_store, [])
+
+    def test_prebuilt_adjacency_skips_store_reads(
+        self, graph_store: SQLiteGraphStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _build_graph(graph_store, 6)
+        adjacency = GraphAlgorithms.adjacency(graph_store, CITES)
+
+        def _boom(*args: object, **kwargs: object) -> None:
+            raise AssertionError("store must not be read")
+
+        monkeypatch.setattr(graph_store, "_list_node_ids", _boom)
+        monkeypatch.setattr(graph_store, "_list_edges_by_types", _boom)
+
+        assert len(GraphAlgorithms.pagerank(graph_store, CITES, adjacency=adjacency))
+        hubs, _ = GraphAlgorithms.hits(graph_store, CITES, adjacency=adjacency)
+        assert len(hubs) == 6
+
+
+class TestSparsePageRankEquivalence:
+    """The sparse PageRank matches the adjacency-list reference."""
+
+    def test_matches_reference_implementation(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        edges = _build_graph(graph_store, 40)
+        node_ids = graph_store._list_node_ids()
+
+        scores = GraphAlgorithms.pagerank(graph_store, edge_types=CITES)
+        expected = _reference_pagerank(node_ids, edges)
+
+        assert scores.keys() == expected.keys()
+        for nid in node_ids:
+            assert scores[nid] == pytest.approx(expected[nid], abs=1e-12)
+
+
+class TestHITS:
+    """Tests for ``GraphAlgorithms.hits``."""
+
+    def test_hits_empty_graph(self, graph_store: SQLiteGraphStore) -> None:
+        assert GraphAlgorithms.hits(graph_store, CITES) == ({}, {})
+
+    def test_hits_star_graph(self, graph_store: SQLiteGraphStore) -> None:
+        """Citers of a shared target are hubs; the target is the authority."""
+        for i in range(4):
+            graph_store.add_node(f"paper:{i}", NodeType.PAPER, {})
+        for i in range(1, 4):
+            graph_store.add_edge(f"e:{i}", f"paper:{i}", "paper:0", EdgeType.CITES, {})
+
+        hubs, authorities = GraphAlgorithms.hits(graph_store, CITES)
+
+        assert authorities["paper:0"] == pytest.approx(1.0)
+        assert hubs["paper:0"] == 0.0
+        for i in range(1, 4):
+            assert hubs[f"paper:{i}"] == pytest.approx(3**-0.5)
+            assert authorities[f"paper:{i}"] == 0.0
+
+    def test_hits_scores_are_l2_normalised(self, graph_store: SQLiteGraphStore) -> None:
+        _build_graph(graph_store, 30)
+        hubs, authorities = GraphAlgorithms.hits(graph_store, CITES)
+        assert sum(v * v for v in hubs.values()) == pytest.approx(1.0)
+        assert sum(v * v for v in authorities.values()) == pytest.approx(1.0)
+
+    def test_hits_edgeless_graph_returns_zeros(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:1", NodeType.PAPER, {})
+        hubs, authorities = GraphAlgorithms.hits(graph_store, CITES)
+        assert hubs == {"paper:1": 0.0}
+        assert authorities == {"paper:1": 0.0}
+
+    def test_hits_rejects_empty_edge_types(self, graph_store: SQLiteGraphStore) -> None:
+        with pytest.raises(ValueError, match="at least one edge type"):
+            GraphAlgorithms.hits(graph_store, edge_types=[])
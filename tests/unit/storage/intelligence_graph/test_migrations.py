@@ -28,6 +28,7 @@ from src.storage.intelligence_graph.migrations import (
     MIGRATION_V6_CITATION_COUPLING_CACHE,
     MIGRATION_V7_BACKFILL_COLUMNS,
     MIGRATION_V8_BACKFILL_PAPERS,
+    MIGRATION_V9_TIME_SERIES_ROLLUPS,
 )
 from src.utils.security import SecurityError
 
@@ -1977,12 +1978,13 @@ class TestLatestMigrationVersion:
     def test_latest_version_constant_matches_all_migrations(self) -> None:
         assert LATEST_MIGRATION_VERSION == max(m.version for m in ALL_MIGRATIONS)
 
-    def test_latest_version_is_8(self) -> None:
+    def test_latest_version_is_9(self) -> None:
         # Pinned literal so an accidental version bump shows up in
         # review even if ``ALL_MIGRATIONS`` is also extended.
         # Updated from 7 to 8 for the PR #152 fix-up: V8 adds
-        # backfill_papers column to monitoring_runs.
-        assert LATEST_MIGRATION_VERSION == 8
+        # backfill_papers column to monitoring_runs. Updated from 8 to 9
+        # for V9 time_series_rollups.
+        assert LATEST_MIGRATION_VERSION == 9
 
 
 class TestMigrationV7BackfillColumns:
@@ -2345,3 +2347,68 @@ class TestMigrationV8BackfillPapers:
                         -1,
                     ),
                 )
+
+
+class TestMigrationV9TimeSeriesRollups:
+    """Tests for MIGRATION_V9_TIME_SERIES_ROLLUPS."""
+
+    def test_migrate_v9_creates_rollup_table_and_index(self, temp_db: Path) -> None:
+        manager = MigrationManager(temp_db)
+        manager.migrate()
+        with open_connection(temp_db) as conn:
+            cols = {
+                row["name"]
+                for row in conn.execute(
+                    "PRAGMA table_info(time_series_rollups)"
+                ).fetchall()
+            }
+            indexes = {
+                row["name"]
+                for row in conn.execute("PRAGMA index_list(time_series)").fetchall()
+            }
+        assert {"granularity", "bucket_start", "point_count", "sum_value"} <= cols
+        assert "idx_time_series_series_metric_period" in indexes
+
+    def test_migrate_v9_backfills_existing_points(self, temp_db: Path) -> None:
+        """Pre-V9 points are rolled up into Monday-start weeks and months."""
+        manager = MigrationManager(temp_db)
+        conn = manager._get_connection()
+        try:
+            manager._ensure_migrations_table(conn)
+            for migration in ALL_MIGRATIONS:
+                if migration.version < 9:
+                    manager.apply_migration(conn, migration)
+            # 2024-03-31 is a Sunday, 2024-04-01 the following Monday.
+            conn.executemany(
+                "INSERT INTO time_series (series_id, period, metric_name, value) "
+                "VALUES ('s', ?, 'm', ?)",
+                [("2024-03-25", 1.0), ("2024-03-31", 2.0), ("2024-04-01", 4.0)],
+            )
+            conn.commit()
+            manager.apply_migration(conn, MIGRATION_V9_TIME_SERIES_ROLLUPS)
+        finally:
+            conn.close()
+
+        with open_connection(temp_db) as conn:
+            rows = [tuple(row) for row in conn.execute("""
+                    SELECT granularity, bucket_start, bucket_end, point_count,
+                           sum_value, min_value, max_value
+                    FROM time_series_rollups ORDER BY granularity, bucket_start
+                    """).fetchall()]
+        assert rows == [
+            ("monthly", "2024-03-01", "2024-03-31", 2, 3.0, 1.0, 2.0),
+            ("monthly", "2024-04-01", "2024-04-30", 1, 4.0, 4.0, 4.0),
+            ("weekly", "2024-03-25", "2024-03-31", 2, 3.0, 1.0, 2.0),
+            ("weekly", "2024-04-01", "2024-04-07", 1, 4.0, 4.0, 4.0),
+        ]
+
+    def test_migrate_v9_rejects_unknown_granularity(self, temp_db: Path) -> None:
+        manager = MigrationManager(temp_db)
+        manager.migrate()
+        with open_connection(temp_db) as conn:
+            with pytest.raises(sqlite3.IntegrityError, match=r"CHECK constraint"):
+                conn.execute("""
+                    INSERT INTO time_series_rollups VALUES
+                        ('s', 'm', 'daily', '2024-01-01', '2024-01-01',
+                         1, 1.0, 1.0, 1.0)
+                    """)
@@ -5,17 +5,22 @@ Tests cover:
 - Range queries
 - Aggregation functions
 - Velocity and acceleration computation
+- Materialized rollups and bulk trends
 - Edge cases
 """
 
+import random
+import sqlite3
 import tempfile
 from datetime import date, timedelta
 from pathlib import Path
 
 import pytest
 
+from src.storage.intelligence_graph import time_series as ts_module
 from src.storage.intelligence_graph.time_series import (
     AggregationPeriod,
+    TimeSeriesAggregate,
     TimeSeriesPoint,
     TimeSeriesStore,
 )
@@ -623,6 +628,266 @@ class TestTimeSeriesAdditionalEdgeCases:
         assert aggs[1].period_start < aggs[2].period_start
 
 
+def _reference_aggregate(
+    store: TimeSeriesStore,
+    series_id: str,
+    metric_name: str,
+    period: AggregationPeriod,
+    start: date,
+    end: date,
+) -> list[TimeSeriesAggregate]:
+    """Bucket raw points in Python — the pre-rollup implementation."""
+    buckets: dict[tuple[date, date], list[float]] = {}
+    for point in store.get_range(series_id, metric_name, start, end):
+        buckets.setdefault(store._get_bucket(point.period, period), []).append(
+            point.value
+        )
+    return [
+        TimeSeriesAggregate(
+            series_id=series_id,
+            metric_name=metric_name,
+            period_start=lo,
+            period_end=hi,
+            count=len(values),
+            sum_value=sum(values),
+            avg_value=sum(values) / len(values),
+            min_value=min(values),
+            max_value=max(values),
+        )
+        for (lo, hi), values in sorted(buckets.items())
+    ]
+
+
+def _rollup_rows(store: TimeSeriesStore) -> list[tuple]:
+    conn = store._get_connection()
+    try:
+        return [tuple(row) for row in conn.execute("""
+                SELECT series_id, granularity, bucket_start, point_count, sum_value
+                FROM time_series_rollups
+                ORDER BY series_id, granularity, bucket_start
+                """).fetchall()]
+    finally:
+        conn.close()
+
+
+class TestRollups:
+    """Materialized weekly / monthly rollups and SQL-pushed aggregation."""
+
+    @pytest.fixture
+    def history(self, ts_store: TimeSeriesStore) -> TimeSeriesStore:
+        rng = random.Random(7)
+        start = date(2023, 11, 1)
+        points = [
+            TimeSeriesPoint(
+                series_id="topic:hist",
+                period=start + timedelta(days=offset),
+                metric_name="count",
+                value=float(rng.randint(0, 50)),
+                metadata={},
+            )
+            for offset in range(200)
+            if rng.random() < 0.7
+        ]
+        ts_store.add_points_batch(points)
+        return ts_store
+
+    @pytest.mark.parametrize(
+        "period", [AggregationPeriod.WEEKLY, AggregationPeriod.MONTHLY]
+    )
+    @pytest.mark.parametrize(
+        ("start", "end"),
+        [
+            (date(2023, 11, 1), date(2024, 5, 18)),  # both edges partial
+            (date(2023, 11, 6), date(2024, 3, 31)),  # Monday .. month end
+            (date(2024, 1, 3), date(2024, 1, 5)),  # inside one bucket
+            (date(2023, 1, 1), date(2025, 1, 1)),  # wider than the data
+        ],
+    )
+    def test_aggregate_matches_python_bucketing(
+        self,
+        history: TimeSeriesStore,
+        period: AggregationPeriod,
+        start: date,
+        end: date,
+    ) -> None:
+        actual = history.aggregate("topic:hist", "count", period, start, end)
+        expected = _reference_aggregate(
+            history, "topic:hist", "count", period, start, end
+        )
+        assert actual == expected
+
+    def test_aligned_range_reads_only_rollups(
+        self, history: TimeSeriesStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        raw_calls: list[tuple] = []
+        real = TimeSeriesStore._aggregate_raw
+
+        def spy(*args: object) -> list[sqlite3.Row]:
+            raw_calls.append(args[-2:])
+            return real(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(TimeSeriesStore, "_aggregate_raw", staticmethod(spy))
+        aggs = history.aggregate(
+            "topic:hist",
+            "count",
+            AggregationPeriod.MONTHLY,
+            date(2023, 12, 1),
+            date(2024, 3, 31),
+        )
+        assert [a.period_start.month for a in aggs] == [12, 1, 2, 3]
+        assert raw_calls == []
+
+        history.aggregate(
+            "topic:hist",
+            "count",
+            AggregationPeriod.MONTHLY,
+            date(2023, 12, 10),
+            date(2024, 3, 31),
+        )
+        # Only the partial December edge is grouped from raw rows.
+        assert raw_calls == [(date(2023, 12, 10), date(2023, 12, 31))]
+
+    def test_aggregate_inverted_range_is_empty(self, history: TimeSeriesStore) -> None:
+        assert (
+            history.aggregate(
+                "topic:hist",
+                "count",
+                AggregationPeriod.WEEKLY,
+                date(2024, 2, 1),
+                date(2024, 1, 1),
+            )
+            == []
+        )
+
+    def test_upsert_updates_rollup(self, ts_store: TimeSeriesStore) -> None:
+        ts_store.add_point("s", date(2024, 1, 1), "m", 1.0)
+        ts_store.add_point("s", date(2024, 1, 2), "m", 2.0)
+        ts_store.add_point("s", date(2024, 1, 2), "m", 10.0)  # replaces 2.0
+        assert _rollup_rows(ts_store) == [
+            ("s", "monthly", "2024-01-01", 2, 11.0),
+            ("s", "weekly", "2024-01-01", 2, 11.0),
+        ]
+
+    def test_batch_spanning_buckets_refreshes_each(
+        self, ts_store: TimeSeriesStore
+    ) -> None:
+        ts_store.add_points_batch(
+            [
+                TimeSeriesPoint("a", date(2024, 1, 31), "m", 1.0, {}),
+                TimeSeriesPoint("a", date(2024, 2, 1), "m", 2.0, {}),
+                TimeSeriesPoint("b", date(2024, 2, 5), "m", 4.0, {}),
+            ]
+        )
+        assert _rollup_rows(ts_store) == [
+            ("a", "monthly", "2024-01-01", 1, 1.0),
+            ("a", "monthly", "2024-02-01", 1, 2.0),
+            ("a", "weekly", "2024-01-29", 2, 3.0),
+            ("b", "monthly", "2024-02-01", 1, 4.0),
+            ("b", "weekly", "2024-02-05", 1, 4.0),
+        ]
+
+    def test_delete_range_refreshes_and_drops_empty_buckets(
+        self, ts_store: TimeSeriesStore
+    ) -> None:
+        for day in (1, 2, 8):
+            ts_store.add_point("s", date(2024, 1, day), "m", float(day))
+        ts_store.delete_range("s", "m", date(2024, 1, 2), date(2024, 1, 8))
+        assert _rollup_rows(ts_store) == [
+            ("s", "monthly", "2024-01-01", 1, 1.0),
+            ("s", "weekly", "2024-01-01", 1, 1.0),
+        ]
+
+    def test_delete_series_drops_rollups(self, ts_store: TimeSeriesStore) -> None:
+        ts_store.add_point("s", date(2024, 1, 1), "m", 1.0)
+        ts_store.add_point("t", date(2024, 1, 1), "m", 1.0)
+        ts_store.delete_series("s")
+        assert {row[0] for row in _rollup_rows(ts_store)} == {"t"}
+
+
+class TestBulkTrends:
+    """``compute_trends`` and its single-series wrappers."""
+
+    @staticmethod
+    def _window_avg(
+        store: TimeSeriesStore, series_id: str, start: date, end: date
+    ) -> float:
+        values = [p.value for p in store.get_range(series_id, "count", start, end)]
+        return sum(values) / len(values)
+
+    @pytest.fixture
+    def trending(self, ts_store: TimeSeriesStore) -> TimeSeriesStore:
+        today = date.today()
+        rng = random.Random(11)
+        points = []
+        for series_id, slope in (("up", 1.0), ("down", -0.5), ("flat", 0.0)):
+            for i in range(90):
+                points.append(
+                    TimeSeriesPoint(
+                        series_id,
+                        today - timedelta(days=i),
+                        "count",
+                        100.0 - slope * i + rng.random(),
+                        {},
+                    )
+                )
+        # Only recent data: no older window, so no trend.
+        points.append(TimeSeriesPoint("new", today, "count", 5.0, {}))
+        ts_store.add_points_batch(points)
+        return ts_store
+
+    def test_bulk_matches_window_definitions(self, trending: TimeSeriesStore) -> None:
+        today = date.today()
+        w = 30
+        w1, w2, w3 = (today - timedelta(days=w * k) for k in (1, 2, 3))
+        day = timedelta(days=1)
+        trends = trending.compute_trends(window_days=w)
+
+        for series_id in ("up", "down", "flat"):
+            trend = trends[(series_id, "count")]
+            recent = self._window_avg(trending, series_id, w1, today)
+            older = self._window_avg(trending, series_id, w2, w1 - day)
+            assert trend.velocity == pytest.approx((recent - older) / w)
+
+            a1 = self._window_avg(trending, series_id, w1, today - day)
+            a2 = older
+            a3 = self._window_avg(trending, series_id, w3, w2 - day)
+            expected = ((a1 - a2) / w - (a2 - a3) / w) / w
+            assert trend.acceleration == pytest.approx(expected)
+
+        assert trends[("up", "count")].velocity > 0
+        assert trends[("down", "count")].velocity < 0
+        assert trends[("new", "count")].velocity is None
+        assert trends[("new", "count")].acceleration is None
+
+    def test_single_series_wrappers_match_bulk(self, trending: TimeSeriesStore) -> None:
+        trends = trending.compute_trends(window_days=20)
+        for series_id in ("up", "down", "flat", "new"):
+            trend = trends[(series_id, "count")]
+            assert (
+                trending.compute_velocity(series_id, "count", window_days=20)
+                == trend.velocity
+            )
+            assert (
+                trending.compute_acceleration(series_id, "count", window_days=20)
+                == trend.acceleration
+            )
+
+    def test_requested_series_are_filtered_and_chunked(
+        self, trending: TimeSeriesStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ts_module, "_TRENDS_CHUNK_SERIES", 1)
+        trends = trending.compute_trends(
+            [("up", "count"), ("down", "count"), ("up", "count"), ("gone", "count")]
+        )
+        assert set(trends) == {("up", "count"), ("down", "count")}
+
+    def test_unknown_series_wrappers_return_none(
+        self, ts_store: TimeSeriesStore
+    ) -> None:
+        assert ts_store.compute_velocity("missing", "count") is None
+        assert ts_store.compute_acceleration("missing", "count") is None
+
+
 class TestTimeSeriesPathTraversalRejection:
     """Security tests: TimeSeriesStore must reject unsafe paths."""
 
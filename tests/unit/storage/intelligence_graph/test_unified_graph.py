@@ -17,6 +17,7 @@ PageRank tests now live in
 import sqlite3
 import tempfile
 import threading
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -1824,6 +1825,49 @@ class TestListOutgoingEdgesForNodes:
         assert result == {}
 
 
+class TestIncomingEdgeBulkHelpers:
+    """Coverage for ``_list_incoming_edges_for_nodes`` and
+    ``_count_incoming_edges_for_nodes`` — bulk loaders used by the
+    coupling analyzer's sparse-matrix engine."""
+
+    @pytest.fixture
+    def cited_graph(self, graph_store: SQLiteGraphStore) -> SQLiteGraphStore:
+        for nid in ("paper:a", "paper:b", "paper:c", "paper:d"):
+            graph_store.add_node(nid, NodeType.PAPER, {})
+        graph_store.add_edge("edge:1", "paper:c", "paper:a", EdgeType.CITES, {})
+        graph_store.add_edge("edge:2", "paper:d", "paper:a", EdgeType.CITES, {})
+        graph_store.add_edge("edge:3", "paper:c", "paper:b", EdgeType.CITES, {})
+        graph_store.add_edge("edge:4", "paper:d", "paper:b", EdgeType.CITED_BY, {})
+        return graph_store
+
+    @pytest.mark.parametrize(
+        "method", ["_list_incoming_edges_for_nodes", "_count_incoming_edges_for_nodes"]
+    )
+    def test_empty_inputs_short_circuit(
+        self, graph_store: SQLiteGraphStore, method: str
+    ) -> None:
+        helper = getattr(graph_store, method)
+        assert helper([], [EdgeType.CITES.value]) == {}
+        assert helper(["paper:a"], []) == {}
+
+    def test_lists_sources_grouped_by_target(
+        self, cited_graph: SQLiteGraphStore
+    ) -> None:
+        result = cited_graph._list_incoming_edges_for_nodes(
+            ["paper:a", "paper:b", "paper:c"], [EdgeType.CITES.value]
+        )
+        # CITED_BY edge filtered out; paper:c has no inbound edges → absent.
+        assert set(result) == {"paper:a", "paper:b"}
+        assert sorted(result["paper:a"]) == ["paper:c", "paper:d"]
+        assert result["paper:b"] == ["paper:c"]
+
+    def test_counts_grouped_by_target(self, cited_graph: SQLiteGraphStore) -> None:
+        result = cited_graph._count_incoming_edges_for_nodes(
+            ["paper:a", "paper:b", "paper:c"], [EdgeType.CITES.value]
+        )
+        assert result == {"paper:a": 2, "paper:b": 1}
+
+
 # ---------------------------------------------------------------------------
 # Co-citation helpers (Issue #148)
 # ---------------------------------------------------------------------------
@@ -2212,3 +2256,86 @@ class TestCountPapersCitingBoth:
 
         assert "paper:m" not in result
         assert "paper:c" in result
+
+
+class TestInfluenceBulkHelpers:
+    """Coverage for ``_get_nodes_by_ids`` and ``_list_neighbourhood_changes``
+    — bulk readers used by ``InfluenceScorer``."""
+
+    @staticmethod
+    def _set_timestamps(store: SQLiteGraphStore, sql: str, *params: str) -> None:
+        conn = store._get_connection()
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_get_nodes_by_ids_skips_missing(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:a", NodeType.PAPER, {"citation_count": 3})
+        graph_store.add_node("paper:b", NodeType.PAPER, {})
+        result = graph_store._get_nodes_by_ids(["paper:a", "paper:b", "paper:zz"])
+        assert set(result) == {"paper:a", "paper:b"}
+        assert result["paper:a"].properties == {"citation_count": 3}
+
+    def test_get_nodes_by_ids_empty_input(self, graph_store: SQLiteGraphStore) -> None:
+        assert graph_store._get_nodes_by_ids([]) == {}
+
+    def test_neighbourhood_changes_take_latest_incident_timestamp(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        for nid in ("paper:a", "paper:b", "paper:c"):
+            graph_store.add_node(nid, NodeType.PAPER, {})
+        graph_store.add_node("entity:x", NodeType.ENTITY, {})
+        graph_store.add_edge("edge:1", "paper:a", "paper:b", EdgeType.CITES, {})
+        graph_store.add_edge("edge:2", "paper:c", "entity:x", EdgeType.MENTIONS, {})
+        self._set_timestamps(
+            graph_store, "UPDATE nodes SET updated_at = ?", "2026-01-01T00:00:00+00:00"
+        )
+        self._set_timestamps(
+            graph_store,
+            "UPDATE edges SET created_at = ? WHERE edge_id = 'edge:1'",
+            "2026-02-01T00:00:00+00:00",
+        )
+        self._set_timestamps(
+            graph_store,
+            "UPDATE edges SET created_at = ? WHERE edge_id = 'edge:2'",
+            "2026-03-01T00:00:00+00:00",
+        )
+
+        result = graph_store._list_neighbourhood_changes(
+            [EdgeType.CITES.value], NodeType.PAPER
+        )
+
+        edge_time = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        node_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # Both CITES endpoints see the edge; the MENTIONS edge is ignored
+        # and the entity node is filtered out by node type.
+        assert result == {
+            "paper:a": edge_time,
+            "paper:b": edge_time,
+            "paper:c": node_time,
+        }
+
+    def test_neighbourhood_changes_without_node_type_filter(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:a", NodeType.PAPER, {})
+        graph_store.add_node("entity:x", NodeType.ENTITY, {})
+        # Rows written by SQLite's ``datetime('now')`` default are naive.
+        self._set_timestamps(
+            graph_store, "UPDATE nodes SET updated_at = ?", "2026-01-01 00:00:00"
+        )
+        result = graph_store._list_neighbourhood_changes([EdgeType.CITES.value])
+        assert result == {
+            "paper:a": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "entity:x": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        }
+
+    def test_neighbourhood_changes_empty_edge_types(
+        self, graph_store: SQLiteGraphStore
+    ) -> None:
+        graph_store.add_node("paper:a", NodeType.PAPER, {})
+        assert graph_store._list_neighbourhood_changes([]) == {}
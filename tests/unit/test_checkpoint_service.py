@@ -350,3 +350,13 @@ def test_list_checkpoints_directory_access_error(
     result = checkpoint_service.list_checkpoints()
 
     assert result == []
+
+
+def test_save_and_get_batches(checkpoint_service):
+    """Test batch IDs awaiting collection round-trip through a checkpoint"""
+    batches = {"msgbatch_1": ["paper1", "paper2"], "msgbatch_2": ["paper3"]}
+
+    assert checkpoint_service.save_batches("batches-topic", batches) is True
+
+    assert checkpoint_service.get_batches("batches-topic") == batches
+    assert checkpoint_service.get_batches("other-run") == {}
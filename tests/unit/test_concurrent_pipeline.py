@@ -1,15 +1,18 @@
 """Unit tests for ConcurrentPipeline (Phase 3.1)"""
 
+import asyncio
 from pathlib import Path
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 
 from src.orchestration.concurrent_pipeline import ConcurrentPipeline
 from src.models.concurrency import ConcurrencyConfig, PipelineStats
+from src.models.llm import BatchConfig
 from src.models.paper import PaperMetadata, Author
 from src.models.extraction import ExtractionTarget, PaperExtraction, ExtractionResult
 from src.models.pdf_extraction import PDFExtractionResult, PDFBackend
+from src.services.llm.providers.base import BatchProvider
 
 
 @pytest.fixture
@@ -177,6 +180,58 @@ async def test_concurrent_processing_success(
     assert pipeline.stats.papers_failed == 0
 
 
+@pytest.mark.asyncio
+async def test_batch_mode_extracts_through_batch_extractor(
+    pipeline, mock_services, sample_papers, sample_targets
+):
+    """Test batch mode hands every paper to the run's batch extractor"""
+    mock_services["dedup"].find_duplicates.return_value = (sample_papers, [])
+    mock_services["filter"].filter_and_rank.return_value = sample_papers
+    mock_services["fallback_pdf"].extract_with_fallback.return_value = (
+        PDFExtractionResult(
+            success=True,
+            markdown="# Test Content",
+            metadata={"backend": PDFBackend.PYMUPDF},
+            quality_score=0.9,
+        )
+    )
+    mock_services["llm"].batch_provider = Mock(spec=BatchProvider)
+    mock_services["llm"].config.batch = BatchConfig()
+
+    batch = Mock()
+    batch.extract = AsyncMock(
+        side_effect=lambda markdown, paper: PaperExtraction(
+            paper_id=paper.paper_id, extraction_results=[]
+        )
+    )
+    batch.aclose = AsyncMock()
+
+    with patch(
+        "src.orchestration.concurrent_pipeline.BatchExtractor", return_value=batch
+    ) as extractor_cls:
+        results = [
+            paper
+            async for paper in pipeline.process_papers_concurrent(
+                papers=sample_papers,
+                targets=sample_targets,
+                run_id="20260101-000000-topic-a",
+                query="test query",
+                topic_slug="topic-a",
+            )
+        ]
+
+    assert len(results) == len(sample_papers)
+    assert extractor_cls.call_args.kwargs["run_id"] == "batches-topic-a"
+    # Long papers fall back to interactive extraction under the LLM limit
+    assert extractor_cls.call_args.kwargs["llm_semaphore"] is pipeline.llm_sem
+    assert batch.extract.await_count == len(sample_papers)
+    batch.start.assert_called_once_with()
+    batch.aclose.assert_awaited_once_with()
+    mock_services["llm"].extract.assert_not_awaited()
+    # Every pending paper waits on its batch in its own worker
+    assert len(pipeline.worker_stats) == len(sample_papers)
+
+
 @pytest.mark.asyncio
 async def test_deduplication_integration(
     pipeline, mock_services, sample_papers, sample_targets
@@ -458,6 +513,50 @@ async def test_get_stats(pipeline):
     assert stats.papers_failed == 0
 
 
+@pytest.mark.asyncio
+async def test_concurrent_topics_keep_separate_stats(
+    pipeline, mock_services, sample_papers, sample_targets
+):
+    """Test topics sharing the pipeline do not overwrite each other's stats"""
+    mock_services["dedup"].find_duplicates.side_effect = lambda papers: (papers, [])
+    mock_services["filter"].filter_and_rank.side_effect = lambda papers, query: papers
+    mock_services["fallback_pdf"].extract_with_fallback.return_value = (
+        PDFExtractionResult(
+            success=True,
+            markdown="# Test Content",
+            metadata={"backend": PDFBackend.PYMUPDF},
+            quality_score=0.9,
+        )
+    )
+    mock_services["llm"].extract.return_value = PaperExtraction(
+        paper_id="test", extraction_results=[]
+    )
+
+    async def _run(papers, run_id):
+        return [
+            paper
+            async for paper in pipeline.process_papers_concurrent(
+                papers=papers,
+                targets=sample_targets,
+                run_id=run_id,
+                query="test query",
+            )
+        ]
+
+    results = await asyncio.gather(
+        _run(sample_papers, "run-a"), _run(sample_papers[:2], "run-b")
+    )
+
+    assert [len(r) for r in results] == [5, 2]
+    stats_a, stats_b = pipeline.get_stats("run-a"), pipeline.get_stats("run-b")
+    assert (stats_a.total_papers, stats_a.papers_completed) == (5, 5)
+    assert (stats_b.total_papers, stats_b.papers_completed) == (2, 2)
+    # Workers are counted per run (min(max_concurrent_downloads, pending))
+    assert len(pipeline.run_worker_stats["run-a"]) == 3
+    assert len(pipeline.run_worker_stats["run-b"]) == 2
+    assert pipeline.get_stats() in (stats_a, stats_b)
+
+
 @pytest.mark.asyncio
 async def test_worker_stats_tracking(
     pipeline, mock_services, sample_papers, sample_targets
@@ -895,6 +994,42 @@ class TestRegistryIntegration:
         assert len(processing_results) == 1
         assert processing_results[0].status == ProcessingStatus.SKIPPED
 
+    @pytest.mark.asyncio
+    async def test_processing_results_are_replaced_per_topic(
+        self, pipeline_with_registry, mock_services, mock_registry_service
+    ):
+        """Test a topic run replaces only its own processing results."""
+        from src.models.registry import ProcessingAction, RegistryEntry
+
+        mock_registry_service.determine_action.return_value = (
+            ProcessingAction.SKIP,
+            Mock(spec=RegistryEntry),
+        )
+        mock_services["dedup"].find_duplicates.return_value = ([], [])
+        mock_services["filter"].filter_and_rank.return_value = []
+        targets = [ExtractionTarget(name="summary", description="Summary")]
+
+        for topic_slug in ("topic-a", "topic-b", "topic-a"):
+            paper = PaperMetadata(
+                paper_id=f"{topic_slug}-paper",
+                title="Paper",
+                url="https://example.com",
+            )
+            async for _ in pipeline_with_registry.process_papers_concurrent(
+                papers=[paper],
+                targets=targets,
+                run_id=f"run-{topic_slug}",
+                query="test",
+                topic_slug=topic_slug,
+            ):
+                pass
+
+        processing_results = pipeline_with_registry.get_processing_results()
+        assert sorted(r.topic_slug for r in processing_results) == [
+            "topic-a",
+            "topic-b",
+        ]
+
     @pytest.mark.asyncio
     async def test_process_with_registry_backfill(
         self, pipeline_with_registry, mock_services, mock_registry_service
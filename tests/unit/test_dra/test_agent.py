@@ -691,13 +691,19 @@ class TestDeepResearchAgent:
             confidence=0.9,
         )
 
-        mock_browser.validate_citation.side_effect = [check1, check2]
+        mock_browser.validate_citations.return_value = [check1, check2]
 
         results = agent.validate_citations_in_answer(answer)
 
         assert len(results) == 2
         assert all(r.found for r in results)
-        assert mock_browser.validate_citation.call_count == 2
+        mock_browser.validate_citations.assert_called_once_with(
+            [
+                ("achieves 95% accuracy", "paper1"),
+                ("shows 90% performance", "paper2"),
+            ],
+            fuzzy_threshold=0.7,
+        )
 
     def test_validate_citations_no_citations_found(self, agent, mock_browser):
         """Test validation when answer has no citations."""
@@ -706,7 +712,7 @@ class TestDeepResearchAgent:
         results = agent.validate_citations_in_answer(answer)
 
         assert len(results) == 0
-        mock_browser.validate_citation.assert_not_called()
+        mock_browser.validate_citations.assert_not_called()
 
     def test_validate_citations_some_invalid(self, agent, mock_browser):
         """Test validation with some invalid citations."""
@@ -727,7 +733,7 @@ class TestDeepResearchAgent:
             confidence=0.2,
         )
 
-        mock_browser.validate_citation.side_effect = [check1, check2]
+        mock_browser.validate_citations.return_value = [check1, check2]
 
         results = agent.validate_citations_in_answer(answer)
 
@@ -186,18 +186,30 @@ class TestResearchBrowser:
             query="test query",
             top_k=10,
             section_filter=None,
+            paper_ids=None,
+            min_year=None,
+            max_year=None,
         )
 
     def test_search_with_section_filter(self, browser, mock_corpus_manager):
         """Test search with section filter."""
         mock_corpus_manager.search_engine.search.return_value = []
 
-        browser.search("test", top_k=5, section_filter=ChunkType.METHODS)
+        browser.search(
+            "test",
+            top_k=5,
+            section_filter=ChunkType.METHODS,
+            paper_ids=["paper1"],
+            min_year=2020,
+        )
 
         mock_corpus_manager.search_engine.search.assert_called_once_with(
             query="test",
             top_k=5,
             section_filter=ChunkType.METHODS,
+            paper_ids=["paper1"],
+            min_year=2020,
+            max_year=None,
         )
 
     def test_search_truncates_long_query(self, browser, mock_corpus_manager):
@@ -254,6 +266,68 @@ class TestResearchBrowser:
         assert browser.open_document_count == 1
         assert browser._current_doc == doc
 
+    def test_open_reuses_cached_document(self, mock_corpus_manager):
+        """Test browsers sharing a cache assemble each document once."""
+        from src.models.dra import CorpusChunk
+        from src.services.dra.utils import LRUCache
+
+        mock_corpus_manager.get_paper_info.return_value = PaperRecord(
+            paper_id="paper1",
+            title="Test Paper",
+            checksum="abc123",
+            chunk_ids=["paper1:0"],
+        )
+        mock_corpus_manager.search_engine.version = 1
+        mock_corpus_manager.search_engine.get_chunk.return_value = CorpusChunk(
+            chunk_id="paper1:0",
+            paper_id="paper1",
+            section_type=ChunkType.ABSTRACT,
+            title="Test Paper",
+            content="First sentence. Second sentence.",
+            token_count=10,
+        )
+        shared: LRUCache = LRUCache(8)
+        first = ResearchBrowser(mock_corpus_manager, document_cache=shared)
+        second = ResearchBrowser(mock_corpus_manager, document_cache=shared)
+
+        doc = first.open("paper1")
+        assert second.open("paper1") is doc
+        assert mock_corpus_manager.search_engine.get_chunk.call_count == 1
+
+        # A new corpus version re-assembles the document
+        mock_corpus_manager.search_engine.version = 2
+        assert second.open("paper1") is not doc
+        assert mock_corpus_manager.search_engine.get_chunk.call_count == 2
+
+    def test_open_cached_document_of_removed_paper_fails(
+        self, browser, mock_corpus_manager
+    ):
+        """Test the cache never resurrects a paper removed from the corpus."""
+        mock_corpus_manager.get_paper_info.return_value = None
+        browser.document_cache.put(
+            ("paper1", None, mock_corpus_manager.search_engine.version),
+            OpenedDocument(
+                paper_id="paper1", title="T", content="Content.", token_count=1
+            ),
+        )
+
+        with pytest.raises(ValueError, match="Paper not found"):
+            browser.open("paper1")
+
+    def test_document_sentences_are_split_once(self):
+        """Test the sentence split is computed once and reused."""
+        doc = OpenedDocument(
+            paper_id="paper1",
+            title="T",
+            content="One claim. Another Claim! Third?",
+            token_count=5,
+        )
+
+        assert doc.sentences == ["One claim.", "Another Claim!", "Third?"]
+        assert doc.sentences is doc.sentences
+        assert doc.sentences_lower[1] == "another claim!"
+        assert doc.sentence_index is doc.sentence_index
+
     def test_open_specific_section(self, browser, mock_corpus_manager):
         """Test opening a specific section."""
         paper_record = PaperRecord(
@@ -718,6 +792,73 @@ class TestResearchBrowser:
         # Verify high threshold check was executed (variable used)
         assert check_high is not None
 
+    def test_validate_citations_batch(self, browser, mock_corpus_manager):
+        """Test batch validation opens each paper once and keeps order."""
+        from src.models.dra import CorpusChunk
+
+        def _paper_info(paper_id):
+            if paper_id == "missing":
+                return None
+            return PaperRecord(
+                paper_id=paper_id,
+                title="Test Paper",
+                checksum="abc123",
+                chunk_ids=[f"{paper_id}:0"],
+            )
+
+        mock_corpus_manager.get_paper_info.side_effect = _paper_info
+        mock_corpus_manager.search_engine.get_chunk.return_value = CorpusChunk(
+            chunk_id="paper1:0",
+            paper_id="paper1",
+            section_type=ChunkType.RESULTS,
+            title="Test Paper",
+            content="Our model achieves 95% accuracy on the benchmark. "
+            "Training takes three days on eight GPUs.",
+            token_count=100,
+        )
+
+        checks = browser.validate_citations(
+            [
+                ("The model achieves 95% accuracy on benchmark", "paper1"),
+                ("Training takes three days", "paper1"),
+                ("Quantum annealing solves everything", "paper1"),
+                ("Any claim here", "missing"),
+            ]
+        )
+
+        assert [c.found for c in checks] == [True, True, False, False]
+        assert "Our model achieves" in checks[0].evidence
+        assert checks[1].evidence.startswith("Training takes")
+        assert checks[3].cited_paper_id == "missing"
+        assert mock_corpus_manager.get_paper_info.call_count == 2
+        assert mock_corpus_manager.search_engine.get_chunk.call_count == 1
+
+    def test_validate_citations_matches_single_validation(
+        self, browser, mock_corpus_manager
+    ):
+        """Test batch results equal per-citation results."""
+        browser._opened_docs["paper1"] = OpenedDocument(
+            paper_id="paper1",
+            title="Test Paper",
+            content="Transformers dominate. Attention models scale well! "
+            "Scaling laws predict loss. Attention attention everywhere?",
+            token_count=50,
+        )
+        claims = [
+            ("attention models scale", "paper1"),
+            ("transformer scaling predicts losses", "paper1"),
+            ("attention attention", "paper1"),
+        ]
+
+        batch = browser.validate_citations(claims, fuzzy_threshold=0.5)
+        single = [
+            browser.validate_citation(claim, paper_id, fuzzy_threshold=0.5)
+            for claim, paper_id in claims
+        ]
+
+        assert batch == single
+        assert batch[0].evidence == "Attention models scale well!"
+
     def test_close_document(self, browser):
         """Test closing an opened document."""
         browser._opened_docs["paper1"] = OpenedDocument(
@@ -0,0 +1,197 @@
+"""Unit tests for the compact, lazily loaded chunk store."""
+
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.models.dra import ChunkType, CorpusChunk
+from src.services.dra.chunk_store import (
+    INDEX_FILE_NAME,
+    LEGACY_FILE_NAME,
+    ChunkStore,
+    metadata_year,
+)
+
+
+def _chunk(paper: str, index: int, **overrides) -> CorpusChunk:
+    fields = {
+        "chunk_id": f"{paper}:{index}",
+        "paper_id": paper,
+        "section_type": ChunkType.METHODS if index % 2 else ChunkType.RESULTS,
+        "title": f"Title of {paper}",
+        "content": f"Chunk {index} of {paper} – naïve ünïcode ∑ content",
+        "token_count": 12,
+        "checksum": f"{index:064x}",
+        "metadata": {"doi": f"10.1/{paper}"},
+    }
+    fields.update(overrides)
+    return CorpusChunk(**fields)
+
+
+def _saved_store(tmp_path, chunks) -> ChunkStore:
+    ChunkStore({c.chunk_id: c for c in chunks}).save(tmp_path)
+    return ChunkStore.open(tmp_path)
+
+
+class TestChunkStore:
+    def test_round_trip_preserves_every_field(self, tmp_path):
+        chunks = [_chunk("p1", i) for i in range(3)] + [
+            _chunk("p2", 0, checksum=None, metadata={})
+        ]
+
+        store = _saved_store(tmp_path, chunks)
+
+        assert len(store) == 4
+        assert list(store) == [c.chunk_id for c in chunks]
+        assert [store[c.chunk_id] for c in chunks] == chunks
+
+    def test_filter_lookups_do_not_need_content(self, tmp_path):
+        store = _saved_store(tmp_path, [_chunk("p1", 0), _chunk("p2", 1)])
+        store._content = b""  # any content read would now fail
+
+        assert store.section_type("p2:1") == ChunkType.METHODS
+        assert store.paper_id("p1:0") == "p1"
+        assert store.section_type("missing") is None
+        assert store.paper_id("missing") is None
+
+    def test_papers_and_metadata_are_deduplicated(self, tmp_path):
+        _saved_store(tmp_path, [_chunk("p1", i) for i in range(10)])
+
+        with np.load(tmp_path / INDEX_FILE_NAME) as index:
+            header = json.loads(index["header"].tobytes())
+
+        assert header["papers"] == [["p1", "Title of p1"]]
+        assert header["metadata"] == [{"doi": "10.1/p1"}]
+
+    def test_memory_chunks_shadow_persisted_rows(self, tmp_path):
+        store = _saved_store(tmp_path, [_chunk("p1", 0), _chunk("p1", 1)])
+        replacement = _chunk("p1", 0, content="Updated content")
+
+        store["p1:0"] = replacement
+        store["p1:2"] = _chunk("p1", 2)
+        store["p1:3"] = _chunk("p1", 3)
+        del store["p1:1"]
+        del store["p1:3"]
+
+        assert len(store) == 2
+        assert store["p1:0"] is replacement
+        assert store.paper_id("p1:2") == "p1"
+        assert "p1:1" not in store
+        with pytest.raises(KeyError):
+            store["p1:1"]
+
+    def test_resave_replaces_content_generation(self, tmp_path):
+        store = _saved_store(tmp_path, [_chunk("p1", 0)])
+        (tmp_path / LEGACY_FILE_NAME).write_text("{}")
+        store["p2:0"] = _chunk("p2", 0)
+
+        store.save(tmp_path)
+        reopened = ChunkStore.open(tmp_path)
+
+        assert len(list(tmp_path.glob("chunk_content.*.bin"))) == 1
+        assert not (tmp_path / LEGACY_FILE_NAME).exists()
+        assert reopened["p1:0"] == _chunk("p1", 0)
+        assert reopened["p2:0"] == _chunk("p2", 0)
+
+    def test_empty_store_round_trips(self, tmp_path):
+        store = _saved_store(tmp_path, [])
+
+        assert len(store) == 0
+        assert ChunkStore.exists(tmp_path)
+
+    def test_mismatched_content_file_is_rejected(self, tmp_path):
+        _saved_store(tmp_path, [_chunk("p1", 0)])
+        (content_file,) = tmp_path.glob("chunk_content.*.bin")
+        content_file.write_bytes(b"truncated")
+
+        with pytest.raises(ValueError, match="does not match"):
+            ChunkStore.open(tmp_path)
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        header = json.dumps({"format": 99}).encode()
+        np.savez(
+            tmp_path / INDEX_FILE_NAME,
+            header=np.frombuffer(header, dtype=np.uint8),
+            offsets=np.zeros(1),
+            token_counts=np.zeros(0),
+            sections=np.zeros(0),
+            paper_rows=np.zeros(0),
+            metadata_rows=np.zeros(0),
+        )
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            ChunkStore.open(tmp_path)
+
+    def test_inconsistent_arrays_are_rejected(self, tmp_path):
+        _saved_store(tmp_path, [_chunk("p1", 0)])
+        with np.load(tmp_path / INDEX_FILE_NAME) as index:
+            arrays = {name: index[name] for name in index.files}
+        arrays["sections"] = np.zeros(2, dtype=np.uint8)
+        np.savez(tmp_path / INDEX_FILE_NAME, **arrays)
+
+        with pytest.raises(ValueError, match="inconsistent"):
+            ChunkStore.open(tmp_path)
+
+    def test_legacy_json_is_loaded_into_memory(self, tmp_path):
+        chunk = _chunk("p1", 0)
+        path = tmp_path / LEGACY_FILE_NAME
+        path.write_text(json.dumps({chunk.chunk_id: chunk.model_dump(mode="json")}))
+
+        store = ChunkStore.from_legacy_json(path)
+
+        assert store["p1:0"] == chunk
+
+
+@pytest.mark.parametrize(
+    "metadata, year",
+    [
+        ({"year": 2021}, 2021),
+        ({"year": "2019"}, 2019),
+        ({"publication_date": "2018-05-01T00:00:00"}, 2018),
+        ({"year": True, "publication_date": "n/a"}, None),
+        ({}, None),
+    ],
+)
+def test_metadata_year(metadata, year):
+    assert metadata_year(metadata) == year
+
+
+def test_year_lookup(tmp_path):
+    store = _saved_store(tmp_path, [_chunk("p1", 0, metadata={"year": 2020})])
+    store["p2:0"] = _chunk("p2", 0, metadata={"publication_date": "2022-01-01"})
+
+    assert store.year("p1:0") == 2020
+    assert store.year("p2:0") == 2022
+    assert store.year("missing") is None
+
+
+@pytest.mark.benchmark
+class TestChunkStoreLoadBenchmark:
+    """Opening a saved corpus costs index-sized memory, not corpus-sized."""
+
+    CHUNKS = 5_000
+    CONTENT_CHARS = 2_000
+
+    def test_open_memory_is_independent_of_content_size(self, tmp_path):
+        chunks = [
+            _chunk(f"p{i // 20}", i, content="x" * self.CONTENT_CHARS)
+            for i in range(self.CHUNKS)
+        ]
+        ChunkStore({c.chunk_id: c for c in chunks}).save(tmp_path)
+        content_bytes = self.CHUNKS * self.CONTENT_CHARS
+        del chunks
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        store = ChunkStore.open(tmp_path)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(store) == self.CHUNKS
+        assert store["p3:60"].content == "x" * self.CONTENT_CHARS
+        assert peak < content_bytes / 5
+        assert elapsed < 2.0
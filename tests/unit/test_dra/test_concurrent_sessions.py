@@ -0,0 +1,390 @@
+"""Unit tests for async DRA sessions, the shared LLM gate and the runner."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import structlog
+
+from src.models.dra import AgentLimits, ResearchResult, ToolCallType
+from src.services.dra import agent as agent_module
+from src.services.dra.agent import (
+    DeepResearchAgent,
+    LLMGate,
+    ResearchSessionOutcome,
+    ResearchSessionRunner,
+)
+from src.services.dra.browser import ResearchBrowser
+
+SEARCH = 'Reasoning: Look around.\nAction: {"tool": "search"}'
+ANSWER = 'Reasoning: Done.\nAction: {"tool": "answer"}'
+
+
+def _response(content: str, total_tokens: int = 100) -> SimpleNamespace:
+    return SimpleNamespace(content=content, total_tokens=total_tokens)
+
+
+def _result(question: str, answer: str) -> ResearchResult:
+    return ResearchResult(question=question, answer=answer, total_turns=1)
+
+
+@pytest.fixture
+def mock_browser():
+    browser = MagicMock(spec=ResearchBrowser)
+    browser.corpus_manager = MagicMock()
+    browser.corpus_manager.paper_count = 100
+    browser.search.return_value = []
+    return browser
+
+
+@pytest.fixture
+def corpus_manager():
+    manager = MagicMock()
+    manager.paper_count = 100
+    return manager
+
+
+class TestLLMGate:
+    """Tests for the shared LLM concurrency/budget gate."""
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            LLMGate(max_concurrent_calls=0)
+
+    @pytest.mark.asyncio
+    async def test_counts_calls_and_tokens(self):
+        service = MagicMock()
+        service.complete = AsyncMock(return_value=_response("x", total_tokens=40))
+        gate = LLMGate(max_total_tokens=100)
+
+        response = await gate.complete(service, prompt="p", max_tokens=10)
+
+        assert response.content == "x"
+        service.complete.assert_awaited_once_with(prompt="p", max_tokens=10)
+        assert gate.calls == 1
+        assert gate.tokens_used == 40
+        assert gate.exhausted is False
+
+    @pytest.mark.asyncio
+    async def test_sync_service_and_missing_usage(self):
+        service = MagicMock()
+        service.complete.return_value = MagicMock()  # no int total_tokens
+        gate = LLMGate()
+
+        await gate.complete(service, prompt="p")
+
+        assert gate.calls == 1
+        assert gate.tokens_used == 0
+        assert gate.exhausted is False
+
+    @pytest.mark.asyncio
+    async def test_exhausted_once_budget_spent(self):
+        service = MagicMock()
+        service.complete = AsyncMock(return_value=_response("x", total_tokens=60))
+        gate = LLMGate(max_total_tokens=100)
+
+        await gate.complete(service)
+        await gate.complete(service)
+
+        assert gate.exhausted is True
+
+    @pytest.mark.asyncio
+    async def test_bounds_calls_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def _complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response("x")
+
+        service = MagicMock()
+        service.complete = _complete
+        gate = LLMGate(max_concurrent_calls=2)
+
+        await asyncio.gather(*(gate.complete(service) for _ in range(6)))
+
+        assert peak == 2
+        assert gate.calls == 6
+
+
+class TestResearchAsync:
+    """Tests for DeepResearchAgent.research_async."""
+
+    @pytest.mark.asyncio
+    async def test_complete_session(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock(side_effect=[_response(SEARCH), _response(ANSWER)])
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+
+        result = await agent.research_async("Question?")
+
+        assert result.answer == ""
+        assert result.total_turns == 2
+        assert result.exhausted is False
+        assert result.trajectory[1].action.tool == ToolCallType.ANSWER
+        mock_browser.search.assert_called_once()
+        # Same request as the synchronous loop
+        kwargs = service.complete.await_args_list[0].kwargs
+        assert set(kwargs) == {"prompt", "system_prompt", "max_tokens"}
+        assert kwargs["max_tokens"] == 2000
+
+    @pytest.mark.asyncio
+    async def test_tools_run_off_the_event_loop(self, mock_browser):
+        loop_thread = threading.get_ident()
+        tool_threads: list[int] = []
+        mock_browser.search.side_effect = lambda *args, **kwargs: (
+            tool_threads.append(threading.get_ident()) or []
+        )
+        service = MagicMock()
+        service.complete = AsyncMock(side_effect=[_response(SEARCH), _response(ANSWER)])
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+
+        await agent.research_async("Question?")
+
+        assert tool_threads and tool_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_summarizes_every_10_turns(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock(
+            side_effect=[_response(SEARCH)] * 10
+            + [_response("Summary of ten turns")]
+            + [_response(ANSWER)]
+        )
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+
+        result = await agent.research_async("Question?")
+
+        assert result.answer == ""
+        assert agent.working_memory.summary == "Summary of ten turns"
+        assert agent.working_memory.last_summarized_turn == 10
+
+    @pytest.mark.asyncio
+    async def test_summarization_failure_is_logged(self, mock_browser, monkeypatch):
+        monkeypatch.setattr(agent_module, "logger", structlog.get_logger())
+        service = MagicMock()
+        service.complete = AsyncMock(side_effect=[_response(SEARCH)] * 10)
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+        agent.limits.max_turns = 10
+
+        with structlog.testing.capture_logs() as logs:
+            result = await agent.research_async("Question?")
+
+        assert result.exhausted is True
+        assert any(e["event"] == "summarization_failed" for e in logs)
+
+    @pytest.mark.asyncio
+    async def test_summarize_without_new_turns_is_noop(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock()
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+
+        await agent._summarize_trajectory_async(up_to_turn=10)
+
+        service.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stops_when_shared_budget_exhausted(self, mock_browser, monkeypatch):
+        monkeypatch.setattr(agent_module, "logger", structlog.get_logger())
+        service = MagicMock()
+        service.complete = AsyncMock(return_value=_response(SEARCH, 600))
+        gate = LLMGate(max_total_tokens=1000)
+        agent = DeepResearchAgent(
+            browser=mock_browser, llm_service=service, llm_gate=gate
+        )
+
+        with structlog.testing.capture_logs() as logs:
+            result = await agent.research_async("Question?")
+
+        assert result.exhausted is True
+        assert result.total_turns == 2
+        assert gate.tokens_used == 1200
+        assert any(e["event"] == "research_budget_exhausted" for e in logs)
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, mock_browser, monkeypatch):
+        clock = iter([0.0, 100.0, 100.0])
+        monkeypatch.setattr(
+            agent_module, "time", SimpleNamespace(time=lambda: next(clock))
+        )
+        service = MagicMock()
+        service.complete = AsyncMock()
+        agent = DeepResearchAgent(
+            browser=mock_browser,
+            llm_service=service,
+            limits=AgentLimits(max_session_duration_seconds=60),
+        )
+
+        result = await agent.research_async("Question?")
+
+        assert result.exhausted is True
+        service.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_context_limit(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock(return_value=_response(SEARCH))
+        agent = DeepResearchAgent(
+            browser=mock_browser,
+            llm_service=service,
+            limits=AgentLimits(max_context_tokens=1000),
+        )
+        agent.context_tokens = 5000
+
+        result = await agent.research_async("Question?")
+
+        assert result.exhausted is True
+        assert result.total_turns == 1
+
+    @pytest.mark.asyncio
+    async def test_turn_failure_ends_session(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock(side_effect=RuntimeError("API down"))
+        agent = DeepResearchAgent(browser=mock_browser, llm_service=service)
+
+        result = await agent.research_async("Question?")
+
+        assert result.exhausted is True
+        assert result.total_turns == 0
+
+    @pytest.mark.asyncio
+    async def test_max_turns_exhausted(self, mock_browser):
+        service = MagicMock()
+        service.complete = AsyncMock(return_value=_response(SEARCH))
+        agent = DeepResearchAgent(
+            browser=mock_browser,
+            llm_service=service,
+            limits=AgentLimits(max_turns=3),
+        )
+
+        result = await agent.research_async("Question?")
+
+        assert result.answer is None
+        assert result.exhausted is True
+        assert result.total_turns == 3
+
+
+class TestResearchSessionRunner:
+    """Tests for concurrent sessions over a shared corpus."""
+
+    def test_rejects_zero_sessions(self, corpus_manager):
+        with pytest.raises(ValueError):
+            ResearchSessionRunner(
+                corpus_manager, MagicMock(), max_concurrent_sessions=0
+            )
+
+    def test_new_agent_has_own_browser_over_shared_corpus(self, corpus_manager):
+        session_runner = ResearchSessionRunner(
+            corpus_manager,
+            MagicMock(),
+            limits=AgentLimits(max_open_documents=5),
+        )
+
+        first = session_runner.new_agent()
+        second = session_runner.new_agent()
+
+        assert first.browser is not second.browser
+        assert first.working_memory is not second.working_memory
+        assert first.browser.corpus_manager is corpus_manager
+        assert first.browser.search_engine is corpus_manager.search_engine
+        assert first.browser.max_open_documents == 5
+        assert first.llm_gate is second.llm_gate is session_runner.gate
+        assert first.browser.document_cache is second.browser.document_cache
+
+    @pytest.mark.asyncio
+    async def test_streams_outcomes_in_completion_order(
+        self, corpus_manager, monkeypatch
+    ):
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def _complete(prompt: str, **kwargs):
+            question = "slow" if "slow" in prompt else "fast"
+            await asyncio.sleep(delays[question])
+            return _response(ANSWER, total_tokens=10)
+
+        service = MagicMock()
+        service.complete = _complete
+        monkeypatch.setattr(agent_module, "logger", structlog.get_logger())
+        session_runner = ResearchSessionRunner(corpus_manager, service)
+
+        with structlog.testing.capture_logs() as logs:
+            outcomes = [o async for o in session_runner.run(["slow", "fast"])]
+
+        assert [o.index for o in outcomes] == [1, 0]
+        assert [o.result.question for o in outcomes] == ["fast", "slow"]
+        assert session_runner.gate.tokens_used == 20
+        complete = [e for e in logs if e["event"] == "research_batch_complete"]
+        assert complete[0]["llm_calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_sessions(self, corpus_manager, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def _research(self, question):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result(question, "a")
+
+        monkeypatch.setattr(DeepResearchAgent, "research_async", _research)
+        session_runner = ResearchSessionRunner(
+            corpus_manager, MagicMock(), max_concurrent_sessions=2
+        )
+
+        outcomes = [o async for o in session_runner.run([f"q{i}" for i in range(5)])]
+
+        assert len(outcomes) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_session_yields_error_outcome(
+        self, corpus_manager, monkeypatch
+    ):
+        async def _research(self, question):
+            if question == "bad":
+                raise RuntimeError("boom")
+            return _result(question, "ok")
+
+        monkeypatch.setattr(DeepResearchAgent, "research_async", _research)
+        session_runner = ResearchSessionRunner(corpus_manager, MagicMock())
+
+        outcomes = {o.index: o async for o in session_runner.run(["good", "bad"])}
+
+        assert outcomes[0].result.answer == "ok"
+        assert outcomes[1] == ResearchSessionOutcome(
+            index=1, question="bad", error="boom"
+        )
+
+    @pytest.mark.asyncio
+    async def test_leftover_sessions_cancelled_when_consumer_stops(
+        self, corpus_manager, monkeypatch
+    ):
+        cancelled: list[str] = []
+
+        async def _research(self, question):
+            try:
+                await asyncio.sleep(0 if question == "fast" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(question)
+                raise
+            return _result(question, "a")
+
+        monkeypatch.setattr(DeepResearchAgent, "research_async", _research)
+        session_runner = ResearchSessionRunner(corpus_manager, MagicMock())
+
+        stream = session_runner.run(["fast", "slow"])
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert first.question == "fast"
+        assert cancelled == ["slow"]
@@ -14,6 +14,7 @@ from src.services.dra.corpus_manager import (
     FreshnessStatus,
     PaperRecord,
 )
+from src.services.dra.utils import compute_checksum
 
 
 class TestCorpusStats:
@@ -285,6 +286,50 @@ This is the introduction.
 
         assert manager._papers["paper1"].metadata == metadata
 
+    @patch("src.services.dra.corpus_manager.HybridSearchEngine")
+    def test_ingest_paper_file_matches_ingest_paper(self, mock_engine_class, tmp_path):
+        """Test streaming a file yields the same chunks and checksum."""
+        mock_engine_class.return_value = MagicMock(
+            corpus_size=0, get_chunk=MagicMock(return_value=None)
+        )
+        content = "# Abstract\n\nShort abstract.\n\n# Methods\n\n" + "\n\n".join(
+            f"Paragraph {i}. " * 60 for i in range(6)
+        )
+        path = tmp_path / "content.md"
+        path.write_text(content, encoding="utf-8")
+
+        from_string = CorpusManager().ingest_paper("paper1", "Test", content)
+        manager = CorpusManager()
+        from_file = manager.ingest_paper_file("paper1", "Test", path)
+
+        assert len(from_file) > 2
+        assert [c.model_dump() for c in from_file] == [
+            c.model_dump() for c in from_string
+        ]
+        assert manager._papers["paper1"].checksum == compute_checksum(content)
+
+    @patch("src.services.dra.corpus_manager.HybridSearchEngine")
+    def test_ingest_paper_file_headers_only(self, mock_engine_class, tmp_path):
+        """Test a file with only headers is ingested whole as OTHER."""
+        mock_engine_class.return_value = MagicMock(
+            corpus_size=0, get_chunk=MagicMock(return_value=None)
+        )
+        path = tmp_path / "content.md"
+        path.write_text("# Title\n## Subtitle\n")
+
+        chunks = CorpusManager().ingest_paper_file("paper1", "Test", path)
+
+        assert len(chunks) == 1
+        assert chunks[0].section_type == ChunkType.OTHER
+        assert chunks[0].content == "# Title\n## Subtitle"
+
+    def test_ingest_paper_file_whitespace_only(self, tmp_path):
+        """Test a whitespace-only file is not ingested."""
+        path = tmp_path / "content.md"
+        path.write_text("  \n\n")
+
+        assert CorpusManager().ingest_paper_file("paper1", "Test", path) == []
+
     def test_ingest_from_registry_not_found(self):
         """Test ingestion from non-existent registry."""
         manager = CorpusManager()
@@ -398,7 +398,11 @@ class TestCorpusManagerCoverageGaps:
             manager._search_engine = mock_engine
 
             # Mock chunk builder to return empty list
-            with patch.object(manager._chunk_builder, "build_chunks", return_value=[]):
+            builder = manager._chunk_builder
+            with (
+                patch.object(builder, "iter_chunks", return_value=iter([])),
+                patch.object(builder, "build_chunks", return_value=[]),
+            ):
                 content = "# Abstract\n\nSome content."
                 result = manager.ingest_paper("paper1", "Test", content)
 
@@ -0,0 +1,304 @@
+"""Unit tests for the long-lived research server and its client."""
+
+import asyncio
+import json
+import os
+import stat
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.cli.research_client import ResearchClient, ResearchServerError
+from src.models.dra import CorpusConfig, ResearchResult, ResearchSessionOutcome
+from src.services.dra.server import (
+    ResearchRequest,
+    ResearchServer,
+    bind_socket,
+    create_research_app,
+)
+
+
+def _outcome(index: int, question: str) -> ResearchSessionOutcome:
+    return ResearchSessionOutcome(
+        index=index,
+        question=question,
+        result=ResearchResult(
+            question=question,
+            answer=f"Answer to {question}",
+            total_turns=1,
+            papers_consulted=[],
+            trajectory=[],
+            exhausted=False,
+            duration_seconds=0.1,
+            total_tokens=10,
+        ),
+    )
+
+
+class _FakeRunner:
+    """Stands in for ResearchSessionRunner: answers every question."""
+
+    def __init__(self):
+        self.gate = MagicMock(tokens_used=0)
+
+    async def run(self, questions):
+        for index, question in enumerate(questions):
+            self.gate.tokens_used += 10
+            yield _outcome(index, question)
+
+
+@pytest.fixture
+def server(tmp_path):
+    return ResearchServer(
+        corpus_config=CorpusConfig(corpus_dir=str(tmp_path / "corpus")),
+        llm_service=MagicMock(),
+    )
+
+
+class TestResearchServer:
+    def test_loads_and_warms_up_corpus(self, tmp_path):
+        with patch("src.services.dra.server.CorpusManager") as manager_cls:
+            server = ResearchServer(
+                corpus_config=CorpusConfig(corpus_dir=str(tmp_path)),
+                llm_service=MagicMock(),
+            )
+
+        manager = manager_cls.return_value
+        manager.load.assert_called_once_with()
+        manager.search_engine.warm_up.assert_called_once_with()
+        manager.check_freshness.assert_not_called()
+        assert server.corpus_manager is manager
+
+    def test_stale_registry_is_ingested_and_saved(self, tmp_path):
+        registry = tmp_path / "registry.json"
+        updated = datetime(2026, 1, 1, tzinfo=UTC)
+        with patch("src.services.dra.server.CorpusManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.check_freshness.return_value = MagicMock(
+                is_fresh=False, registry_updated=updated
+            )
+            manager.ingest_from_registry.return_value = 2
+            server = ResearchServer(
+                corpus_config=CorpusConfig(corpus_dir=str(tmp_path)),
+                llm_service=MagicMock(),
+                registry_path=registry,
+            )
+
+        manager.ingest_from_registry.assert_called_once_with(registry)
+        manager.save.assert_called_once_with()
+        # Same registry update seen again: nothing new to reload
+        assert not server.needs_reload()
+
+    def test_stale_registry_without_new_papers_is_not_saved(self, tmp_path):
+        with patch("src.services.dra.server.CorpusManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.check_freshness.return_value = MagicMock(is_fresh=False)
+            manager.ingest_from_registry.return_value = 0
+            ResearchServer(
+                corpus_config=CorpusConfig(corpus_dir=str(tmp_path)),
+                llm_service=MagicMock(),
+                registry_path=tmp_path / "registry.json",
+            )
+
+        manager.save.assert_not_called()
+
+    def test_needs_reload_when_saved_corpus_changes(self, server, tmp_path):
+        assert not server.needs_reload()
+
+        (tmp_path / "corpus").mkdir()
+        (tmp_path / "corpus" / "stats.json").write_text("{}")
+
+        assert server.needs_reload()
+
+    @pytest.mark.asyncio
+    async def test_reload_swaps_manager(self, server, tmp_path):
+        old_manager = server.corpus_manager
+
+        assert not await server.reload()
+        assert await server.reload(force=True)
+
+        assert server.corpus_manager is not old_manager
+        assert server.reloads == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_keeps_current_corpus(self, server):
+        old_manager = server.corpus_manager
+
+        with patch.object(server, "_load_corpus", side_effect=OSError("disk")):
+            assert not await server.reload(force=True)
+
+        assert server.corpus_manager is old_manager
+        assert server.reloads == 0
+
+    @pytest.mark.asyncio
+    async def test_watch_checks_for_changes_every_interval(self, server):
+        reload = AsyncMock(side_effect=[False, asyncio.CancelledError])
+        with (
+            patch("src.services.dra.server.asyncio.sleep", new=AsyncMock()) as sleep,
+            patch.object(server, "reload", new=reload),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await server.watch(5.0)
+
+        assert sleep.await_args_list == [((5.0,),), ((5.0,),)]
+        assert reload.await_count == 2
+
+    def test_new_runner_uses_request_limits(self, server):
+        runner = server.new_runner(
+            ResearchRequest(questions=["Q?"], max_turns=7, token_budget=100)
+        )
+
+        assert runner.corpus_manager is server.corpus_manager
+        assert runner.limits.max_turns == 7
+        assert runner.gate.max_total_tokens == 100
+
+
+class TestResearchApp:
+    def test_status(self, server):
+        client = TestClient(create_research_app(server))
+
+        response = client.get("/research/status")
+
+        assert response.status_code == 200
+        assert response.json()["papers"] == 0
+        assert response.json()["reloads"] == 0
+        assert client.get("/live").status_code == 200
+
+    def test_research_streams_outcomes_then_tokens(self, server):
+        client = TestClient(create_research_app(server))
+
+        with patch.object(server, "new_runner", return_value=_FakeRunner()):
+            response = client.post("/research", json={"questions": ["A?", "B?"]})
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["outcome"]["question"] for line in lines[:2]] == ["A?", "B?"]
+        assert lines[2] == {"tokens_used": 20}
+
+    def test_research_rejects_empty_batch(self, server):
+        client = TestClient(create_research_app(server))
+
+        assert client.post("/research", json={"questions": []}).status_code == 422
+
+    def test_reload(self, server):
+        client = TestClient(create_research_app(server))
+
+        response = client.post("/research/reload")
+
+        assert response.json()["reloaded"] is True
+        assert response.json()["reloads"] == 1
+
+
+def test_bind_socket_is_owner_only(tmp_path):
+    path = tmp_path / "research.sock"
+
+    sock = bind_socket(path)
+    try:
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    finally:
+        sock.close()
+
+
+def test_bind_socket_closes_socket_on_failure(tmp_path):
+    with patch("src.services.dra.server.socket.socket") as socket_cls:
+        sock = socket_cls.return_value
+        sock.bind.side_effect = OSError("in use")
+        with pytest.raises(OSError, match="in use"):
+            bind_socket(tmp_path / "research.sock")
+
+    sock.close.assert_called_once_with()
+
+
+class TestResearchClient:
+    @pytest.fixture
+    def socket_path(self, server, tmp_path):
+        """Serve ``server`` over a real Unix socket in a background thread."""
+        import uvicorn
+
+        path = tmp_path / "research.sock"
+        sock = bind_socket(path)
+        uvicorn_server = uvicorn.Server(
+            uvicorn.Config(create_research_app(server), log_level="error")
+        )
+        thread = threading.Thread(
+            target=uvicorn_server.run, kwargs={"sockets": [sock]}, daemon=True
+        )
+        thread.start()
+        deadline = time.monotonic() + 10
+        while not uvicorn_server.started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        yield path
+        uvicorn_server.should_exit = True
+        thread.join(timeout=10)
+        sock.close()
+
+    def test_not_running_without_socket(self, tmp_path):
+        assert not ResearchClient(tmp_path / "missing.sock").is_running()
+
+    def test_not_running_when_nothing_listens(self, tmp_path):
+        path = tmp_path / "research.sock"
+        bind_socket(path).close()  # socket file left behind, no listener
+
+        assert not ResearchClient(path).is_running()
+
+    def test_stream_ending_early_raises(self, tmp_path):
+        client = ResearchClient(tmp_path / "research.sock")
+        lines = [
+            b"\n",
+            json.dumps({"outcome": _outcome(0, "A?").model_dump(mode="json")}).encode(),
+            b'{"progress": 1}\n',
+        ]
+
+        with patch.object(ResearchClient, "_send", return_value=iter(lines)):
+            outcomes = client.research(["A?", "B?"])
+            assert next(outcomes) == _outcome(0, "A?")
+            with pytest.raises(ResearchServerError, match="closed the stream early"):
+                next(outcomes)
+
+        assert client.tokens_used == 0
+
+    def test_research_round_trip(self, server, socket_path):
+        client = ResearchClient(socket_path)
+
+        with patch.object(server, "new_runner", return_value=_FakeRunner()):
+            outcomes = list(client.research(["A?", "B?"]))
+
+        assert client.is_running()
+        assert outcomes == [_outcome(0, "A?"), _outcome(1, "B?")]
+        assert client.tokens_used == 20
+
+    def test_status_and_reload(self, socket_path):
+        client = ResearchClient(socket_path)
+
+        assert client.status()["reloads"] == 0
+        assert client.reload()["reloads"] == 1
+
+    def test_rejected_request_raises(self, socket_path):
+        client = ResearchClient(socket_path)
+
+        with pytest.raises(ResearchServerError, match="422"):
+            list(client.research([]))
+
+
+def test_client_does_not_import_search_stack():
+    """Dispatching to the server must stay cheap to import."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, src.cli.research_client; "
+        "print('src.services.dra.search_engine' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[3],
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
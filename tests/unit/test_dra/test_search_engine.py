@@ -1,6 +1,8 @@
 """Unit tests for Phase 8 DRA search engine."""
 
+import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,10 +10,12 @@ import numpy as np
 import pytest
 
 from src.models.dra import ChunkType, CorpusChunk, CorpusConfig, SearchConfig
+from src.services.dra.chunk_store import ChunkStore
 from src.services.dra.search_engine import (
     BM25Index,
     DenseIndex,
     EmbeddingModel,
+    FilterPostings,
     HybridSearchEngine,
 )
 
@@ -46,6 +50,26 @@ class TestEmbeddingModel:
         dim = model.dimension
         assert dim == 768
 
+    def test_load_model_skips_load_finished_by_another_thread(self):
+        """Test a caller waiting on the lock doesn't reload the model."""
+        model = EmbeddingModel()
+        loaded = MagicMock()
+
+        class _Lock:
+            # Another thread finishes loading while this one waits.
+            def __enter__(self):
+                model._model = loaded
+
+            def __exit__(self, *exc):
+                return False
+
+        model._load_lock = _Lock()
+        with patch.object(model, "_load_model_locked") as mock_locked:
+            model._load_model()
+
+        mock_locked.assert_not_called()
+        assert model._model is loaded
+
     def test_encode_empty_list(self):
         """Test encoding empty list."""
         model = EmbeddingModel()
@@ -360,6 +384,14 @@ class TestHybridSearchEngine:
         assert engine.corpus_config.chunk_max_tokens == 256
         assert engine.search_config.dense_weight == 0.8
 
+    @patch.object(EmbeddingModel, "_load_model")
+    def test_warm_up_loads_embedding_model(self, mock_load_model):
+        """Test warm_up loads the model before any search."""
+        engine = HybridSearchEngine()
+        engine.warm_up()
+
+        mock_load_model.assert_called_once_with()
+
     def test_index_chunks_empty(self):
         """Test indexing empty chunk list."""
         engine = HybridSearchEngine()
@@ -471,8 +503,10 @@ class TestHybridSearchEngine:
                 with patch.object(BM25Index, "save"):
                     engine.save(path)
 
-            # Verify chunks file exists
-            assert (path / "chunks.json").exists()
+            # Verify chunk index and content files exist
+            assert (path / "chunk_index.npz").exists()
+            assert len(list(path.glob("chunk_content.*.bin"))) == 1
+            assert not (path / "chunks.json").exists()
 
             # Load
             with patch.object(DenseIndex, "load"):
@@ -484,6 +518,7 @@ class TestHybridSearchEngine:
             loaded_chunk = new_engine._chunks["paper1:0"]
             assert loaded_chunk.title == "Test Paper"
             assert loaded_chunk.section_type == ChunkType.ABSTRACT
+            assert loaded_chunk == chunk
 
     def test_load_not_found(self):
         """Test loading from non-existent path."""
@@ -497,16 +532,18 @@ class TestHybridSearchEngine:
     def test_search_with_section_filter(
         self, mock_bm25_search, mock_dense_search, mock_encode
     ):
-        """Test search with section type filter."""
+        """Test section filter is resolved to index positions before retrieval."""
         mock_encode.return_value = np.random.rand(768)
-        mock_dense_search.return_value = [("paper1:0", 0.9), ("paper1:1", 0.8)]
-        mock_bm25_search.return_value = [("paper1:0", 5.0), ("paper1:1", 3.0)]
+        mock_dense_search.return_value = [("paper1:0", 0.9)]
+        mock_bm25_search.return_value = [("paper1:0", 5.0)]
 
         engine = HybridSearchEngine()
         engine._embedding_model = MagicMock()
         engine._embedding_model.encode_single = mock_encode
         engine._dense_index._index = MagicMock()  # Make it "built"
         engine._bm25_index._index = MagicMock()
+        engine._dense_index._chunk_ids = ["paper1:0", "paper1:1"]
+        engine._bm25_index._chunk_ids = ["paper1:0", "paper1:1"]
 
         # Add chunks with different section types
         engine._chunks["paper1:0"] = CorpusChunk(
@@ -531,3 +568,226 @@ class TestHybridSearchEngine:
         # Should only return METHODS chunk
         assert len(results) == 1
         assert results[0].section_type == ChunkType.METHODS
+        for mock_search in (mock_dense_search, mock_bm25_search):
+            assert mock_search.call_args.args[1] == 1  # one candidate
+            assert mock_search.call_args.kwargs["positions"].tolist() == [0]
+
+    def _ready_engine(self, **search_config) -> HybridSearchEngine:
+        """Engine with mocked indexes over two chunks."""
+        engine = HybridSearchEngine(search_config=SearchConfig(**search_config))
+        engine._embedding_model = MagicMock()
+        engine._embedding_model.encode_single.return_value = np.random.rand(768)
+        engine._dense_index = MagicMock()
+        engine._dense_index.search.return_value = [("p1:0", 0.9), ("p1:1", 0.8)]
+        engine._bm25_index = MagicMock()
+        engine._bm25_index.search.return_value = [("p1:1", 5.0)]
+        engine._dense_index.chunk_ids = engine._bm25_index.chunk_ids = ["p1:0", "p1:1"]
+        for i, section in enumerate([ChunkType.METHODS, ChunkType.RESULTS]):
+            engine._chunks[f"p1:{i}"] = CorpusChunk(
+                chunk_id=f"p1:{i}",
+                paper_id="p1",
+                section_type=section,
+                title="Test",
+                content=f"content {i}",
+                token_count=2,
+            )
+        return engine
+
+    def test_repeated_search_served_from_cache(self):
+        """Test a repeated (whitespace-variant) query skips encoder and indexes."""
+        engine = self._ready_engine()
+
+        first = engine.search("attention  heads", top_k=5)
+        second = engine.search(" attention heads ", top_k=5)
+
+        assert second == first
+        assert second is not first
+        engine._embedding_model.encode_single.assert_called_once_with("attention heads")
+        engine._dense_index.search.assert_called_once()
+        engine._bm25_index.search.assert_called_once()
+
+    def test_cache_key_includes_filter_and_top_k(self):
+        """Test different filters/top_k re-run retrieval but reuse the embedding."""
+        engine = self._ready_engine()
+
+        engine.search("query", top_k=5)
+        engine.search("query", top_k=5, section_filter=ChunkType.RESULTS)
+        engine.search("query", top_k=3)
+
+        assert engine._dense_index.search.call_count == 3
+        engine._embedding_model.encode_single.assert_called_once()
+
+    def test_indexing_invalidates_cached_results(self):
+        """Test index_chunks bumps the version and drops cached results."""
+        engine = self._ready_engine()
+        engine.search("query")
+        version = engine.version
+
+        engine._embedding_model.encode.return_value = np.random.rand(1, 768)
+        engine.index_chunks([engine._chunks["p1:0"]])
+        engine.search("query")
+
+        assert engine.version == version + 1
+        assert engine._dense_index.search.call_count == 2
+        # The query embedding doesn't depend on the corpus
+        engine._embedding_model.encode_single.assert_called_once()
+
+    def test_load_invalidates_cached_results(self, tmp_path):
+        """Test load bumps the corpus version."""
+        engine = HybridSearchEngine()
+        version = engine.version
+
+        engine.load(tmp_path)
+
+        assert engine.version == version + 1
+
+    def test_caches_can_be_disabled(self):
+        """Test zero cache sizes re-run every query."""
+        engine = self._ready_engine(query_cache_size=0, result_cache_size=0)
+
+        engine.search("query")
+        engine.search("query")
+
+        assert engine._embedding_model.encode_single.call_count == 2
+
+
+def _filter_chunk(i: int, section: ChunkType, year: int | None) -> CorpusChunk:
+    return CorpusChunk(
+        chunk_id=f"p{i % 4}:{i}",
+        paper_id=f"p{i % 4}",
+        section_type=section,
+        title=f"Paper {i % 4}",
+        content=f"transformer attention heads analysis number {i}",
+        token_count=8,
+        metadata={} if year is None else {"year": year},
+    )
+
+
+class TestFilteredSearch:
+    """Tests for metadata pre-filtering (FilterPostings + index positions)."""
+
+    CHUNKS = [
+        _filter_chunk(i, ChunkType.RESULTS if i % 5 == 0 else ChunkType.METHODS, y)
+        for i, y in enumerate([2019, 2020, 2021, None] * 10)
+    ]
+
+    def _postings(self) -> FilterPostings:
+        store = ChunkStore({c.chunk_id: c for c in self.CHUNKS})
+        return FilterPostings([c.chunk_id for c in self.CHUNKS] + ["gone:0"], store)
+
+    def test_select_combines_filters(self):
+        postings = self._postings()
+
+        results = postings.select(ChunkType.RESULTS, frozenset({"p0"}))
+        years = postings.select(min_year=2020, max_year=2021)
+
+        assert results.tolist() == [0, 20]
+        assert [self.CHUNKS[i].metadata["year"] for i in years] == [2020, 2021] * 10
+        assert postings.select().tolist() == list(range(41))
+        assert postings.select(paper_ids=frozenset({"missing"})).size == 0
+        assert postings.select(ChunkType.ABSTRACT).size == 0
+
+    def test_bm25_scores_only_given_positions(self):
+        index = BM25Index()
+        index.build(self.CHUNKS)
+
+        results = index.search("attention", top_k=10, positions=np.array([3, 7]))
+
+        assert {cid for cid, _ in results} == {"p3:3", "p3:7"}
+        assert index.search("attention", positions=np.array([], dtype=int)) == []
+
+    def test_dense_search_passes_id_selector(self):
+        index = DenseIndex()
+        index._chunk_ids = ["a", "b", "c"]
+        index._index = MagicMock()
+        index._index.search.return_value = (np.array([[0.9]]), np.array([[2]]))
+        mock_faiss = MagicMock()
+
+        with patch.dict(sys.modules, {"faiss": mock_faiss}):
+            results = index.search(np.ones(4), top_k=5, positions=np.array([0, 2]))
+            empty = index.search(np.ones(4), positions=np.array([], dtype=int))
+
+        assert results == [("c", 0.9)]
+        assert empty == []
+        args, kwargs = index._index.search.call_args
+        assert args[1] == 2
+        assert kwargs["params"] is mock_faiss.SearchParameters.return_value
+        assert mock_faiss.IDSelectorBatch.call_args.args[0] == 2
+
+    def _engine(self) -> HybridSearchEngine:
+        engine = HybridSearchEngine()
+        engine._embedding_model = MagicMock()
+        engine._embedding_model.encode.return_value = np.random.rand(40, 768)
+        with patch.object(DenseIndex, "build"):
+            engine.index_chunks(self.CHUNKS)
+        engine._dense_index = MagicMock()
+        engine._dense_index.search.return_value = []
+        engine._dense_index.chunk_ids = engine._bm25_index.chunk_ids
+        return engine
+
+    def test_selective_filter_still_fills_top_k(self):
+        engine = self._engine()
+
+        results = engine.search("attention", top_k=5, section_filter=ChunkType.RESULTS)
+        papers = engine.search("attention", top_k=5, paper_ids=["p1"], max_year=2020)
+
+        assert len(results) == 5
+        assert {r.section_type for r in results} == {ChunkType.RESULTS}
+        assert len(papers) == 5
+        assert {r.paper_id for r in papers} == {"p1"}
+
+    def test_empty_filter_skips_retrieval(self):
+        engine = self._engine()
+
+        assert engine.search("attention", paper_ids=[]) == []
+        engine._embedding_model.encode_single.assert_not_called()
+
+    def test_postings_are_rebuilt_after_corpus_change(self):
+        engine = self._engine()
+        engine.search("attention", section_filter=ChunkType.RESULTS)
+        postings = engine._postings
+
+        engine._corpus_changed()
+        engine.search("attention", section_filter=ChunkType.RESULTS)
+
+        assert postings is not None
+        assert engine._postings is not postings
+
+    def test_dense_postings_follow_dense_index_order(self):
+        engine = self._engine()
+        engine._dense_index.chunk_ids = engine._bm25_index.chunk_ids[::-1]
+
+        engine.search("attention", top_k=5, section_filter=ChunkType.RESULTS)
+
+        dense_positions = engine._dense_index.search.call_args.kwargs["positions"]
+        assert dense_positions.tolist() == [
+            39 - i for i in (35, 30, 25, 20, 15, 10, 5, 0)
+        ]
+
+
+@pytest.mark.benchmark
+class TestFilteredSearchBenchmark:
+    """A selective filter must make BM25 retrieval cheaper, not dearer."""
+
+    def test_filtered_bm25_query_is_cheaper_than_unfiltered(self):
+        vocabulary = [f"term{i}" for i in range(500)]
+        rng = np.random.default_rng(0)
+        chunks = [
+            _filter_chunk(i, ChunkType.METHODS, 2020).model_copy(
+                update={"content": " ".join(rng.choice(vocabulary, 60))}
+            )
+            for i in range(20_000)
+        ]
+        index = BM25Index()
+        index.build(chunks)
+        positions = np.arange(0, len(chunks), 50)
+
+        def best_of(runs, **kwargs):
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                index.search("term1 term2 term3", top_k=30, **kwargs)
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        assert best_of(3, positions=positions) < best_of(3)
@@ -0,0 +1,236 @@
+"""Unit tests for the SQLite trajectory index."""
+
+import json
+import os
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import structlog
+
+from src.models.dra import ToolCall, ToolCallType, TrajectoryRecord, Turn
+from src.services.dra import trajectory_store as store_module
+from src.services.dra.trajectory import TrajectoryCollector
+from src.services.dra.trajectory_store import (
+    INDEX_FILE_NAME,
+    PATTERN_SECTION,
+    PATTERN_SEQUENCE,
+    PATTERN_TERM,
+    TrajectoryStore,
+    extract_patterns,
+)
+
+
+def _turn(number: int, tool: ToolCallType, **arguments) -> Turn:
+    return Turn(
+        turn_number=number,
+        reasoning="r",
+        action=ToolCall(tool=tool, arguments=arguments, timestamp=datetime.now(UTC)),
+        observation="o",
+        observation_tokens=10,
+    )
+
+
+def _turns(query: str = "transformer attention", section: str = "methods"):
+    return [
+        _turn(1, ToolCallType.SEARCH, query=query),
+        _turn(2, ToolCallType.OPEN, paper_id="p1", section=section),
+        _turn(3, ToolCallType.FIND, pattern="accuracy"),
+    ]
+
+
+def _record(
+    trajectory_id: str,
+    quality: float = 0.8,
+    answer: str | None = "Answer",
+    turns: list[Turn] | None = None,
+    age_days: int = 0,
+) -> TrajectoryRecord:
+    return TrajectoryRecord(
+        trajectory_id=trajectory_id,
+        question=f"Question {trajectory_id}",
+        answer=answer,
+        turns=_turns() if turns is None else turns,
+        quality_score=quality,
+        created_at=datetime.now(UTC) - timedelta(days=age_days),
+    )
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return TrajectoryCollector(storage_dir=tmp_path)
+
+
+class TestExtractPatterns:
+    def test_counts_terms_sequences_and_sections(self):
+        turns = _turns() + [
+            _turn(4, ToolCallType.SEARCH, query="attention is all"),
+            _turn(5, ToolCallType.OPEN, paper_id="p2"),
+        ]
+
+        counts = extract_patterns(turns)
+
+        assert counts[PATTERN_TERM] == {"transformer": 1, "attention": 2}
+        assert counts[PATTERN_SEQUENCE]["search -> open -> find"] == 1
+        assert sum(counts[PATTERN_SEQUENCE].values()) == 3
+        assert counts[PATTERN_SECTION] == {"methods": 1, "full_paper": 1}
+
+    def test_short_trajectory_has_no_sequences(self):
+        counts = extract_patterns(_turns()[:2])
+
+        assert not counts[PATTERN_SEQUENCE]
+
+
+class TestTrajectoryStore:
+    def test_summaries_filter_and_sort_newest_first(self, collector):
+        collector._save_trajectory(_record("old", age_days=2))
+        collector._save_trajectory(_record("new"))
+        collector._save_trajectory(_record("low", quality=0.2))
+        collector._save_trajectory(_record("unanswered", answer=None))
+
+        summaries = collector.store.summaries(
+            min_turns=3, require_answer=True, min_quality_score=0.5
+        )
+
+        assert [s.trajectory_id for s in summaries] == ["new", "old"]
+        assert summaries[0].turn_count == 3
+        assert summaries[0].has_answer
+        assert collector.store.count() == 4
+        assert len(collector.store.summaries(limit=1)) == 1
+
+    def test_naive_timestamps_are_indexed_as_utc(self, collector):
+        record = _record("naive")
+        record.created_at = datetime(2024, 1, 1, 12, 0)
+        collector._save_trajectory(record)
+
+        (summary,) = collector.store.summaries()
+
+        assert summary.created_at == datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+    def test_answer_preview_is_truncated(self, collector):
+        collector._save_trajectory(_record("long", answer="A" * 150))
+
+        (summary,) = collector.store.summaries()
+
+        assert summary.answer_preview == "A" * 100 + "..."
+
+    def test_resaving_replaces_header_and_patterns(self, collector):
+        collector._save_trajectory(_record("t1"))
+        collector._save_trajectory(
+            _record("t1", turns=_turns(query="diffusion models"))
+        )
+
+        counts = collector.store.pattern_counts()
+
+        assert collector.store.count() == 1
+        assert counts[PATTERN_TERM] == {"diffusion": 1, "models": 1}
+
+    def test_pattern_counts_sum_over_matching_trajectories(self, collector):
+        collector._save_trajectory(_record("a"))
+        collector._save_trajectory(_record("b"))
+        collector._save_trajectory(_record("c", quality=0.1))
+
+        counts = collector.store.pattern_counts(min_quality_score=0.5)
+
+        assert counts[PATTERN_TERM]["attention"] == 2
+        assert counts[PATTERN_SECTION] == {"methods": 2}
+
+    def test_sync_indexes_unindexed_and_drops_deleted_files(self, collector):
+        collector._save_trajectory(_record("kept"))
+        collector._save_trajectory(_record("deleted"))
+        (collector.storage_dir / "deleted.json").unlink()
+        # Written by an older version (or another process): no index row
+        legacy = _record("legacy").model_dump(mode="json")
+        (collector.storage_dir / "legacy.json").write_text(json.dumps(legacy))
+
+        collector.store.sync()
+
+        ids = {s.trajectory_id for s in collector.store.summaries()}
+        assert ids == {"kept", "legacy"}
+
+    def test_sync_reindexes_modified_files(self, collector):
+        collector._save_trajectory(_record("t1", quality=0.8))
+        path = collector.storage_dir / "t1.json"
+        data = json.loads(path.read_text())
+        data["quality_score"] = 0.3
+        path.write_text(json.dumps(data))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        collector.store.sync()
+
+        assert collector.store.summaries()[0].quality_score == 0.3
+
+    def test_unreadable_file_is_reported_once(self, collector, monkeypatch):
+        monkeypatch.setattr(store_module, "logger", structlog.get_logger())
+        (collector.storage_dir / "corrupt.json").write_text("not valid json {")
+
+        with structlog.testing.capture_logs() as logs:
+            collector.store.sync()
+            collector.store.sync()
+
+        failures = [e for e in logs if e["event"] == "trajectory_load_failed"]
+        assert len(failures) == 1
+        assert collector.store.count() == 0
+
+    def test_index_persists_across_instances(self, collector):
+        collector._save_trajectory(_record("t1"))
+
+        reopened = TrajectoryStore(collector.storage_dir)
+
+        assert reopened.count() == 1
+        assert (collector.storage_dir / INDEX_FILE_NAME).exists()
+
+
+class TestCollectorUsesIndex:
+    def test_filter_quality_only_parses_matching_files(self, collector, monkeypatch):
+        collector._save_trajectory(_record("good"))
+        for i in range(5):
+            collector._save_trajectory(_record(f"bad{i}", quality=0.1))
+        loaded = []
+        original = collector._load_trajectory_file
+        monkeypatch.setattr(
+            collector,
+            "_load_trajectory_file",
+            lambda path: loaded.append(path.name) or original(path),
+        )
+
+        result = collector.filter_quality()
+
+        assert [t.trajectory_id for t in result] == ["good"]
+        assert loaded == ["good.json"]
+
+    def test_indexed_analysis_matches_in_memory_analysis(self, collector):
+        collector._save_trajectory(_record("a"))
+        collector._save_trajectory(
+            _record("b", turns=_turns("graph neural networks", "results"))
+        )
+        collector._save_trajectory(_record("low", quality=0.1))
+
+        indexed = collector.analyze_patterns()
+        in_memory = collector.analyze_patterns(collector.filter_quality())
+
+        assert indexed == in_memory
+        assert indexed.paper_consultation_patterns == {"methods": 1, "results": 1}
+        assert indexed.average_turns_to_success == 3.0
+
+    def test_summaries_and_lazy_turn_loading(self, collector):
+        collector._save_trajectory(_record("t1"))
+
+        (summary,) = collector.summaries()
+        record = collector.load_trajectory(summary.trajectory_id)
+
+        assert summary.turn_count == 3
+        assert record is not None
+        assert len(record.turns) == 3
+        assert collector.load_trajectory("missing") is None
+
+    def test_index_failure_keeps_record_for_next_sync(self, collector, monkeypatch):
+        def _fail(record, file_path):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(collector.store, "add", _fail)
+        collector._save_trajectory(_record("t1"))
+        monkeypatch.undo()
+
+        assert [t.trajectory_id for t in collector.filter_quality()] == ["t1"]
@@ -1,7 +1,13 @@
 """Unit tests for Phase 8 DRA utility functions."""
 
+import io
 import json
+import random
+import string
+import subprocess
+import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,15 +16,35 @@ import pytest
 from src.models.dra import ChunkType, CorpusChunk
 from src.services.dra.utils import (
     ChunkBuilder,
+    LRUCache,
     SectionParser,
+    SentenceIndex,
     TextNormalizer,
     TokenCounter,
+    atomic_write_bytes,
     atomic_write_json,
     compute_checksum,
+    scan_text_file,
     set_secure_permissions,
     validate_chunk_integrity,
 )
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Markdown exercising section headers, blank-line runs, whitespace-only
+# lines and sections both shorter and longer than one chunk.
+STREAMING_MARKDOWN = (
+    "Preamble before any header.\n\n"
+    "# Abstract\n\nShort abstract.\n"
+    "## Methods\n\n"
+    + "\n\n\n".join(f"Method paragraph {i}. " * 12 for i in range(8))
+    + "\n   \n"
+    + "Trailing line\nwith a soft break.\n"
+    "# Results\n   \n\n"
+    + "\n\n".join(f"Result {i} " * (5 + 7 * i) for i in range(6))
+    + "\n\n# Empty section\n\n\n# References\n[1] A paper.\n"
+)
+
 
 class TestTokenCounter:
     """Tests for TokenCounter class."""
@@ -440,6 +466,203 @@ class TestChunkBuilder:
             assert chunk.chunk_id == f"paper1:{i}"
 
 
+class TestTokenCounterRunning:
+    """Tests for the running (line by line) token count."""
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            [],
+            ["", "   "],
+            ["  leading", "words here  ", "", "  "],
+            ["x" * 41],
+            ["a b c d e f g h"],
+            ["", "\tfirst", "", "", "second line ", "   "],
+        ],
+    )
+    def test_matches_count_of_joined_stripped_text(self, lines):
+        counter = TokenCounter()
+        running = counter.running()
+
+        for line in lines:
+            running.add_line(line)
+
+        assert running.tokens == counter.count("\n".join(lines).strip())
+
+
+class TestStreamingChunks:
+    """Tests for ChunkBuilder.iter_chunks."""
+
+    @pytest.mark.parametrize("max_tokens,overlap", [(20, 0), (40, 10), (512, 64)])
+    def test_matches_parse_then_build(self, max_tokens, overlap):
+        builder = ChunkBuilder(max_tokens=max_tokens, overlap_tokens=overlap)
+        sections = SectionParser().parse(STREAMING_MARKDOWN)
+
+        expected = builder.build_chunks("p1", "Title", sections, {"k": "v"})
+        streamed = list(
+            builder.iter_chunks(
+                "p1", "Title", io.StringIO(STREAMING_MARKDOWN), {"k": "v"}
+            )
+        )
+
+        assert [c.model_dump() for c in streamed] == [c.model_dump() for c in expected]
+
+    def test_yields_chunks_before_input_is_exhausted(self):
+        builder = ChunkBuilder(max_tokens=20, overlap_tokens=0)
+        consumed = []
+
+        def lines():
+            for i in range(100):
+                consumed.append(i)
+                yield f"Paragraph {i} has a handful of words in it."
+                yield ""
+
+        first = next(builder.iter_chunks("p1", "Title", lines()))
+
+        assert first.chunk_id == "p1:0"
+        assert len(consumed) < 10
+
+    def test_overlap_carries_trailing_paragraphs(self):
+        builder = ChunkBuilder(max_tokens=30, overlap_tokens=12)
+        lines = []
+        for i in range(6):
+            lines += [f"Paragraph number {i} with several words.", ""]
+
+        chunks = list(builder.iter_chunks("p1", "Title", lines))
+
+        assert len(chunks) > 1
+        for previous, chunk in zip(chunks, chunks[1:]):
+            last_paragraph = previous.content.split("\n\n")[-1]
+            assert chunk.content.startswith(last_paragraph)
+
+
+class TestLRUCache:
+    """Tests for LRUCache class."""
+
+    def test_get_and_put(self):
+        """Test stored values are returned and counted as hits."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted first."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_zero_size_disables_cache(self):
+        """Test max_entries=0 stores nothing."""
+        cache: LRUCache[str, int] = LRUCache(0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Test clear drops all entries."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_negative_size_rejected(self):
+        """Test negative max_entries raises."""
+        with pytest.raises(ValueError):
+            LRUCache(-1)
+
+
+class TestSentenceIndex:
+    """Tests for SentenceIndex class."""
+
+    SENTENCES = [
+        "the model achieves high accuracy.",
+        "training the models takes days.",
+        "accuracy of the model is reported; the model is small.",
+    ]
+
+    def test_terms_match_word_substrings(self):
+        """Test a term matches words containing it, like `in` on the text."""
+        index = SentenceIndex(self.SENTENCES)
+
+        assert index.sentences_containing("model") == {0, 1, 2}
+        assert index.sentences_containing("train") == {1}
+        assert index.sentences_containing("quantum") == frozenset()
+
+    def test_match_scores_best_sentence(self):
+        """Test the sentence with most key terms wins (earliest on ties)."""
+        index = SentenceIndex(self.SENTENCES)
+
+        assert index.match(["model", "accuracy", "quantum"]) == (2, 2, 0)
+        assert index.match(["training", "days"]) == (2, 2, 1)
+
+    def test_repeated_terms_count_repeatedly(self):
+        """Test duplicate key terms are counted per occurrence."""
+        index = SentenceIndex(self.SENTENCES)
+
+        assert index.match(["model", "model", "days"]) == (3, 3, 1)
+
+    def test_no_match(self):
+        """Test no sentence contains any term."""
+        index = SentenceIndex(self.SENTENCES)
+
+        assert index.match(["quantum"]) == (0, 0, None)
+
+    def test_agrees_with_substring_scan(self):
+        """Test results equal the naive per-sentence substring scan."""
+        index = SentenceIndex(self.SENTENCES)
+        terms = ["model", "accuracy", "small", "days", "report"]
+
+        scores = [sum(t in s for t in terms) for s in self.SENTENCES]
+        terms_found = sum(any(t in s for s in self.SENTENCES) for t in terms)
+
+        assert index.match(terms) == (
+            terms_found,
+            max(scores),
+            scores.index(max(scores)),
+        )
+
+    def test_many_terms_are_not_scanned_against_the_vocabulary(self):
+        """Test uncached lookups cost far less than a vocabulary scan each."""
+        rng = random.Random(0)
+        vocabulary = sorted(
+            {
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+                for _ in range(20_000)
+            }
+        )
+        sentences = [" ".join(rng.choices(vocabulary, k=15)) for _ in range(2_000)]
+        index = SentenceIndex(sentences)
+        terms = sorted({word[1:5] for word in vocabulary})[:1_000]
+
+        start = time.perf_counter()
+        found = [index.sentences_containing(term) for term in terms]
+        index_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for term in terms[:100]:
+            [word for word in vocabulary if term in word]
+        scan_seconds = time.perf_counter() - start
+
+        for term, sentence_ids in list(zip(terms, found))[::50]:
+            assert sentence_ids == {
+                i for i, sentence in enumerate(sentences) if term in sentence
+            }
+        # 1,000 indexed lookups vs 100 vocabulary scans: a per-term scan
+        # would take ten times as long as the scans measured here
+        assert index_seconds < scan_seconds
+
+
 class TestComputeChecksum:
     """Tests for compute_checksum function."""
 
@@ -472,6 +695,105 @@ class TestComputeChecksum:
         assert all(c in "0123456789abcdef" for c in checksum)
 
 
+class TestScanTextFile:
+    """Tests for scan_text_file."""
+
+    def test_checksum_matches_compute_checksum(self, tmp_path):
+        path = tmp_path / "paper.md"
+        path.write_bytes("# Title\r\nCaf\u00e9 content\r\n".encode("utf-8") * 50)
+
+        checksum, has_content = scan_text_file(path, block_chars=7)
+
+        assert checksum == compute_checksum(path.read_text(encoding="utf-8"))
+        assert has_content is True
+
+    def test_whitespace_only_file_has_no_content(self, tmp_path):
+        path = tmp_path / "blank.md"
+        path.write_text("  \n\n\t\n")
+
+        assert scan_text_file(path)[1] is False
+
+
+# Chunks a generated markdown file in a fresh interpreter, either streamed
+# from disk or read whole and parsed up front, and reports the peak RSS
+# growth, the peak traced Python allocation and the chunk throughput.
+_CHUNKING_BENCHMARK = """
+import json, resource, sys, time, tracemalloc
+from pathlib import Path
+from src.services.dra.utils import ChunkBuilder, SectionParser
+
+mode, path = sys.argv[1], Path(sys.argv[2])
+builder = ChunkBuilder(max_tokens=512, overlap_tokens=64)
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tracemalloc.start()
+start = time.perf_counter()
+chunks = 0
+if mode == "stream":
+    with open(path, encoding="utf-8") as f:
+        for _ in builder.iter_chunks("p", "t", f):
+            chunks += 1
+else:
+    markdown = path.read_text(encoding="utf-8")
+    for _ in builder.build_chunks("p", "t", SectionParser().parse(markdown)):
+        chunks += 1
+elapsed = time.perf_counter() - start
+traced_peak = tracemalloc.get_traced_memory()[1]
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+print(json.dumps({
+    "chunks": chunks,
+    "chunks_per_second": chunks / elapsed,
+    "traced_peak_bytes": traced_peak,
+    "rss_growth_bytes": rss_kb * 1024,
+}))
+"""
+
+
+def _write_large_markdown(path: Path, size: int) -> None:
+    words = "model attention transformer results accuracy dataset baseline".split()
+    with open(path, "w", encoding="utf-8") as f:
+        written = paragraph = 0
+        while written < size:
+            if paragraph % 40 == 0:
+                written += f.write(f"# Appendix {paragraph}\n\n")
+            text = " ".join(words[(paragraph + i) % len(words)] for i in range(80))
+            written += f.write(text + "\n\n")
+            paragraph += 1
+
+
+def _run_chunking_benchmark(mode: str, path: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _CHUNKING_BENCHMARK, mode, str(path)],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+class TestStreamingChunkingBenchmark:
+    """Peak memory and throughput of chunking a 5 MB markdown file."""
+
+    FILE_SIZE = 5 * 1024 * 1024
+
+    def test_streaming_memory_is_bounded(self, tmp_path):
+        path = tmp_path / "thesis.md"
+        _write_large_markdown(path, self.FILE_SIZE)
+
+        streamed = _run_chunking_benchmark("stream", path)
+        materialized = _run_chunking_benchmark("materialize", path)
+
+        assert streamed["chunks"] == materialized["chunks"] > 0
+        # Streaming holds one section's worth of text, not the document
+        assert streamed["traced_peak_bytes"] < self.FILE_SIZE // 10
+        assert streamed["traced_peak_bytes"] < materialized["traced_peak_bytes"] // 5
+        assert streamed["rss_growth_bytes"] < self.FILE_SIZE // 2
+        # ...without giving up throughput
+        assert streamed["chunks_per_second"] > 0.5 * materialized["chunks_per_second"]
+
+
 class TestValidateChunkIntegrity:
     """Tests for validate_chunk_integrity function."""
 
@@ -649,6 +971,30 @@ class TestAtomicWriteJson:
             assert target_path.exists()
 
 
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes function (SR-8.1)."""
+
+    def test_streams_blocks_and_sets_mode(self, tmp_path):
+        target_path = tmp_path / "blob.bin"
+
+        written = atomic_write_bytes(target_path, iter([b"ab", b"", b"cde"]), 0o600)
+
+        assert written == 5
+        assert target_path.read_bytes() == b"abcde"
+        assert target_path.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [target_path]
+
+    def test_cleans_up_temp_file_on_error(self, tmp_path):
+        def blocks():
+            yield b"partial"
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            atomic_write_bytes(tmp_path / "blob.bin", blocks())
+
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestSetSecurePermissions:
     """Tests for set_secure_permissions function (SR-8.1)."""
 
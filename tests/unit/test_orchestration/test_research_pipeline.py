@@ -334,6 +334,7 @@ class TestResearchPipelineDiscoveryModeWiring:
             "citation_exploration"
         )
         mock_context.config.settings.aggregation = settings_overrides.get("aggregation")
+        mock_context.config.settings.concurrency = None
         mock_context.config.settings.enhanced_discovery = settings_overrides.get(
             "enhanced_discovery"
         )
@@ -1079,6 +1080,7 @@ class TestProcessTopicWithSynthesis:
             # Create mock config
             mock_config = MagicMock(spec=ResearchConfig)
             mock_config.research_topics = [mock_topic]
+            mock_config.settings = MagicMock(concurrency=None)
 
             # Create mock paper
             mock_paper = Mock()
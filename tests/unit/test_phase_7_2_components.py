@@ -1773,6 +1773,7 @@ class TestDiscoveryPhaseMultiSourceExecution:
         # Set up mock context
         mock_context = MagicMock()
         mock_context.config = MagicMock()
+        mock_context.config.settings.concurrency = None
         mock_context.config.research_topics = [
             ResearchTopic(
                 query="test query",
@@ -1838,6 +1839,7 @@ class TestDiscoveryPhaseMultiSourceExecution:
 
         mock_context = MagicMock()
         mock_context.config = MagicMock()
+        mock_context.config.settings.concurrency = None
         mock_context.config.research_topics = [
             ResearchTopic(
                 query="citation test",
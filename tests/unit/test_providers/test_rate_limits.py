@@ -0,0 +1,59 @@
+"""Tests for the rate-limit buckets shared by clients of one API."""
+
+import pytest
+
+from src.services.citation_explorer import CitationExplorer
+from src.services.intelligence.citation.openalex_client import (
+    OpenAlexCitationClient,
+)
+from src.services.intelligence.citation.semantic_scholar_client import (
+    SemanticScholarCitationClient,
+)
+from src.services.providers.openalex import OpenAlexProvider
+from src.services.providers.rate_limits import (
+    openalex_rate_limiter,
+    semantic_scholar_rate_limiter,
+)
+from src.services.providers.semantic_scholar import SemanticScholarProvider
+
+
+def _bucket(limiter):
+    return limiter.name, limiter.base_rate, limiter.burst_size
+
+
+def test_semantic_scholar_clients_share_one_config(monkeypatch):
+    monkeypatch.delenv("SEMANTIC_SCHOLAR_API_KEY", raising=False)
+    limiters = [
+        SemanticScholarProvider(api_key="key").rate_limiter,
+        CitationExplorer(api_key="key").rate_limiter,
+        SemanticScholarCitationClient(api_key="key").rate_limiter,
+    ]
+
+    assert {_bucket(limiter) for limiter in limiters} == {
+        _bucket(semantic_scholar_rate_limiter(authenticated=True))
+    }
+    assert limiters[0].name == "semantic_scholar"
+
+
+def test_anonymous_traffic_gets_its_own_bucket():
+    keyed = semantic_scholar_rate_limiter(authenticated=True)
+    anonymous = semantic_scholar_rate_limiter(authenticated=False)
+
+    assert anonymous.name != keyed.name
+    assert anonymous.base_rate < keyed.base_rate
+
+
+def test_openalex_clients_share_one_config(monkeypatch):
+    monkeypatch.delenv("OPENALEX_EMAIL", raising=False)
+    provider = OpenAlexProvider(email="a@b.c").rate_limiter
+    client = OpenAlexCitationClient(polite_email="a@b.c").rate_limiter
+
+    assert _bucket(provider) == _bucket(client) == _bucket(openalex_rate_limiter(True))
+    assert openalex_rate_limiter(False).name == "openalex_anonymous"
+
+
+def test_explicit_openalex_rate_is_not_shared():
+    limiter = OpenAlexProvider(requests_per_minute=120).rate_limiter
+
+    assert limiter.name is None
+    assert limiter.base_rate == pytest.approx(2.0)
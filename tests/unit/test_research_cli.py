@@ -1,6 +1,7 @@
 """Unit tests for Phase 8 DRA CLI research commands."""
 
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from typer.testing import CliRunner
 
@@ -321,7 +322,7 @@ class TestResearchCommandExecution:
             total_tokens=5000,
         )
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.return_value = mock_result
+        mock_agent_instance.research_async = AsyncMock(return_value=mock_result)
         mock_agent.return_value = mock_agent_instance
 
         result = runner.invoke(
@@ -372,7 +373,7 @@ class TestResearchCommandExecution:
             total_tokens=15000,
         )
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.return_value = mock_result
+        mock_agent_instance.research_async = AsyncMock(return_value=mock_result)
         mock_agent.return_value = mock_agent_instance
 
         result = runner.invoke(
@@ -486,7 +487,9 @@ class TestResearchCommandExecution:
         mock_corpus_manager.return_value = mock_manager
 
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.side_effect = Exception("LLM API error")
+        mock_agent_instance.research_async = AsyncMock(
+            side_effect=Exception("LLM API error")
+        )
         mock_agent.return_value = mock_agent_instance
 
         result = runner.invoke(
@@ -544,17 +547,20 @@ class TestResearchCommandExecution:
             for i in range(1, 3)
         ]
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.side_effect = results
+        mock_agent_instance.research_async = AsyncMock(side_effect=results)
         mock_agent.return_value = mock_agent_instance
 
         result = runner.invoke(
             research_app,
-            ["--question-file", str(question_file)],
+            ["--question-file", str(question_file), "--token-budget", "10000"],
         )
 
         assert result.exit_code == 0
         assert "[1/2]" in result.stdout
         assert "[2/2]" in result.stdout
+        # Results are written in question order, whatever order they finish in
+        assert result.stdout.index("Answer 1.") < result.stdout.index("Answer 2.")
+        assert "LLM tokens used: 0 / 10,000" in result.stdout
 
     def test_verbose_option_exists(self):
         """Test verbose option is defined in CLI."""
@@ -979,7 +985,7 @@ class TestDirectFunctionCalls:
             total_tokens=1000,
         )
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.return_value = mock_result
+        mock_agent_instance.research_async = AsyncMock(return_value=mock_result)
         mock_agent.return_value = mock_agent_instance
 
         # Call directly with output_file
@@ -991,6 +997,9 @@ class TestDirectFunctionCalls:
             max_turns=50,
             output_file=output_file,
             verbose=False,
+            concurrency=4,
+            llm_concurrency=4,
+            token_budget=None,
         )
 
         # Output file should be written
@@ -1045,7 +1054,7 @@ class TestDirectFunctionCalls:
             total_tokens=1000,
         )
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.return_value = mock_result
+        mock_agent_instance.research_async = AsyncMock(return_value=mock_result)
         mock_agent.return_value = mock_agent_instance
 
         # Call with verbose=True (line 208 should execute)
@@ -1057,6 +1066,9 @@ class TestDirectFunctionCalls:
             max_turns=50,
             output_file=None,
             verbose=True,
+            concurrency=4,
+            llm_concurrency=4,
+            token_budget=None,
         )
 
         # Just verify it ran without error
@@ -1217,7 +1229,7 @@ class TestDirectFunctionCalls:
             total_tokens=1000,
         )
         mock_agent_instance = MagicMock()
-        mock_agent_instance.research.return_value = mock_result
+        mock_agent_instance.research_async = AsyncMock(return_value=mock_result)
         mock_agent.return_value = mock_agent_instance
 
         # Call with question_file instead of question (covers elif branch)
@@ -1229,4 +1241,207 @@ class TestDirectFunctionCalls:
             max_turns=50,
             output_file=None,
             verbose=False,
+            concurrency=4,
+            llm_concurrency=4,
+            token_budget=None,
+        )
+
+
+class TestResearchServerDispatch:
+    """Tests for dispatching to a running research server."""
+
+    @staticmethod
+    def _config():
+        mock_config = MagicMock()
+        mock_config.settings.dra_settings = None
+        return mock_config
+
+    @patch("src.services.dra.corpus_manager.CorpusManager")
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_dispatches_to_running_server(
+        self, mock_load_config, mock_client_cls, mock_corpus_manager, tmp_path
+    ):
+        """Questions go to the server and the corpus is never loaded here."""
+        from src.models.dra import ResearchResult, ResearchSessionOutcome
+
+        mock_load_config.return_value = self._config()
+        client = mock_client_cls.return_value
+        client.is_running.return_value = True
+        client.tokens_used = 1234
+        client.research.return_value = iter(
+            [
+                ResearchSessionOutcome(
+                    index=0,
+                    question="Q?",
+                    result=ResearchResult(
+                        question="Q?",
+                        answer="Served answer.",
+                        total_turns=2,
+                        papers_consulted=[],
+                        trajectory=[],
+                        exhausted=False,
+                        duration_seconds=1.0,
+                        total_tokens=1234,
+                    ),
+                )
+            ]
+        )
+        output = tmp_path / "out.md"
+
+        result = runner.invoke(
+            research_app,
+            ["--token-budget", "5000", "--output", str(output), "Q?"],
+        )
+
+        assert result.exit_code == 0
+        assert "Dispatching to research server" in result.stdout
+        assert "LLM tokens used: 1,234 / 5,000" in result.stdout
+        assert "Served answer." in output.read_text()
+        client.research.assert_called_once_with(
+            ["Q?"], max_turns=50, concurrency=4, llm_concurrency=4, token_budget=5000
+        )
+        mock_client_cls.assert_called_once_with(
+            Path("./data/dra/corpus") / "research.sock"
+        )
+        mock_corpus_manager.assert_not_called()
+
+    @patch("src.services.dra.corpus_manager.CorpusManager")
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_no_server_runs_in_process(
+        self, mock_load_config, mock_client_cls, mock_corpus_manager
+    ):
+        """--no-server skips the server even when one is running."""
+        mock_load_config.return_value = self._config()
+        mock_client_cls.return_value.is_running.return_value = True
+        mock_corpus_manager.return_value.paper_count = 0
+
+        result = runner.invoke(research_app, ["--no-server", "Q?"])
+
+        assert result.exit_code == 1
+        assert "Corpus is empty" in result.stdout
+        mock_client_cls.return_value.research.assert_not_called()
+
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_serve_refuses_second_server(self, mock_load_config, mock_client_cls):
+        """serve exits when a server already answers on the socket."""
+        mock_load_config.return_value = self._config()
+        mock_client_cls.return_value.is_running.return_value = True
+
+        result = runner.invoke(research_app, ["serve"])
+
+        assert result.exit_code == 1
+        assert "already running" in result.stdout
+
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_reload_requires_running_server(self, mock_load_config, mock_client_cls):
+        """reload exits when no server is running."""
+        mock_load_config.return_value = self._config()
+        mock_client_cls.return_value.is_running.return_value = False
+
+        result = runner.invoke(research_app, ["reload"])
+
+        assert result.exit_code == 1
+        assert "No research server running" in result.stdout
+
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_reload_reports_new_corpus(self, mock_load_config, mock_client_cls):
+        """reload shows the size of the reloaded corpus."""
+        mock_load_config.return_value = self._config()
+        client = mock_client_cls.return_value
+        client.is_running.return_value = True
+        client.reload.return_value = {"reloaded": True, "papers": 3, "chunks": 40}
+
+        result = runner.invoke(research_app, ["reload"])
+
+        assert result.exit_code == 0
+        assert "3 papers, 40 chunks" in result.stdout
+
+    @patch("src.services.dra.server.serve_research", new_callable=AsyncMock)
+    @patch("src.services.dra.server.ResearchServer")
+    @patch("src.cli.research._create_llm_service")
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_serve_replaces_stale_socket(
+        self,
+        mock_load_config,
+        mock_client_cls,
+        mock_create_llm,
+        mock_server_cls,
+        mock_serve,
+        tmp_path,
+    ):
+        """serve removes a leftover socket file and serves until stopped."""
+        mock_load_config.return_value = self._config()
+        mock_client_cls.return_value.is_running.return_value = False
+        mock_server_cls.return_value.status.return_value = {"papers": 3, "chunks": 40}
+        socket_path = tmp_path / "run" / "research.sock"
+        socket_path.parent.mkdir()
+        socket_path.write_text("stale")
+
+        result = runner.invoke(
+            research_app,
+            ["serve", "--socket", str(socket_path), "--reload-interval", "5"],
+        )
+
+        assert result.exit_code == 0
+        assert "Research server ready: 3 papers, 40 chunks" in result.stdout
+        assert "Research server stopped" in result.stdout
+        assert not socket_path.exists()
+        mock_serve.assert_awaited_once_with(
+            mock_server_cls.return_value, socket_path, 5.0
+        )
+        assert mock_server_cls.call_args.kwargs["registry_path"] is None
+
+    @patch("src.services.dra.server.serve_research", new_callable=AsyncMock)
+    @patch("src.services.dra.server.ResearchServer")
+    @patch("src.cli.research._create_llm_service")
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_serve_stops_on_interrupt(
+        self,
+        mock_load_config,
+        mock_client_cls,
+        mock_create_llm,
+        mock_server_cls,
+        mock_serve,
+        tmp_path,
+    ):
+        """Ctrl+C stops the server cleanly."""
+        mock_load_config.return_value = self._config()
+        mock_client_cls.return_value.is_running.return_value = False
+        mock_server_cls.return_value.status.return_value = {"papers": 0, "chunks": 0}
+        mock_serve.side_effect = KeyboardInterrupt
+
+        result = runner.invoke(
+            research_app, ["serve", "--socket", str(tmp_path / "research.sock")]
         )
+
+        assert result.exit_code == 0
+        assert "Research server stopped" in result.stdout
+
+    @patch("src.services.dra.corpus_manager.CorpusManager")
+    @patch("src.cli.research.ResearchClient")
+    @patch("src.cli.research.load_config")
+    def test_status_reports_running_server(
+        self, mock_load_config, mock_client_cls, mock_corpus_manager, tmp_path
+    ):
+        """status shows what a running server has loaded."""
+        mock_config = self._config()
+        mock_config.settings.dra_settings = MagicMock(corpus_dir=str(tmp_path))
+        mock_load_config.return_value = mock_config
+        mock_corpus_manager.return_value.stats.last_updated = None
+        client = mock_client_cls.return_value
+        client.is_running.return_value = True
+        client.socket_path = tmp_path / "research.sock"
+        client.status.return_value = {"papers": 3, "chunks": 40, "reloads": 2}
+
+        result = runner.invoke(research_app, ["status"])
+
+        assert result.exit_code == 0
+        assert "Research server running" in result.stdout
+        assert "Serving: 3 papers, 40 chunks (reloads: 2)" in result.stdout
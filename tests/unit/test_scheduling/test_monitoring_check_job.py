@@ -169,6 +169,7 @@ class TestMonitoringCheckJobInit:
         assert kwargs["llm_service"] is None
         assert kwargs["extra_providers"] is None
         assert kwargs["query_expander"] is None
+        assert kwargs["embedding_service"] is None
 
     def test_init_with_llm_key_wires_tier1_providers_and_expander(
         self, monkeypatch: pytest.MonkeyPatch
@@ -198,6 +199,10 @@ class TestMonitoringCheckJobInit:
         assert PaperSource.HUGGINGFACE in kwargs["extra_providers"]
         assert PaperSource.SEMANTIC_SCHOLAR not in kwargs["extra_providers"]
         assert kwargs["query_expander"] is not None
+        # The scorer's embedding prefilter is wired alongside the LLM
+        from src.services.embeddings.embedding_service import EmbeddingService
+
+        assert isinstance(kwargs["embedding_service"], EmbeddingService)
 
     def test_init_with_llm_and_s2_keys_includes_s2_provider(
         self, monkeypatch: pytest.MonkeyPatch
@@ -51,6 +51,8 @@ def mock_registry_service():
     state = MagicMock(spec=RegistryState)
     state.entries = entries
     service.load.return_value = state
+    service.get_change_sequence.return_value = 0
+    service.get_changes_since.return_value = []
 
     return service
 
@@ -666,6 +668,117 @@ class TestIncrementalMode:
 
         assert should_skip is False
 
+    def test_should_skip_incremental_uses_change_journal(self, mock_registry_service):
+        """Test that the journal decides without hashing the registry."""
+        from src.models.cross_synthesis import SynthesisState
+
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            config=SynthesisConfig(incremental_mode=True),
+        )
+        service._state = SynthesisState(
+            last_registry_hash="oldhash123", last_change_sequence=7
+        )
+
+        should_skip, new_count = service._should_skip_incremental()
+
+        assert should_skip is True
+        assert new_count == 0
+        mock_registry_service.get_changes_since.assert_called_once_with(7)
+        mock_registry_service.load.assert_not_called()
+
+    def test_should_skip_incremental_counts_changed_papers_exactly(
+        self, mock_registry_service
+    ):
+        """Test that repeated changes to one paper count once."""
+        from src.models.cross_synthesis import SynthesisState
+        from src.models.registry import RegistryChange, RegistryChangeKind
+
+        mock_registry_service.get_changes_since.return_value = [
+            RegistryChange(sequence=8, paper_id="a", kind=RegistryChangeKind.ADDED),
+            RegistryChange(sequence=9, paper_id="b", kind=RegistryChangeKind.ADDED),
+            RegistryChange(sequence=10, paper_id="a", kind=RegistryChangeKind.UPDATED),
+        ]
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            config=SynthesisConfig(incremental_mode=True),
+        )
+        service._state = SynthesisState(last_change_sequence=7)
+
+        should_skip, new_count = service._should_skip_incremental()
+
+        assert should_skip is False
+        assert new_count == 2
+
+    def test_should_skip_incremental_falls_back_to_hash(self, mock_registry_service):
+        """Test that an unanswerable journal falls back to the registry hash."""
+        from src.models.cross_synthesis import SynthesisState
+
+        mock_registry_service.get_changes_since.return_value = None
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            config=SynthesisConfig(incremental_mode=True),
+        )
+        service._state = SynthesisState(
+            last_registry_hash=service._calculate_registry_hash(),
+            last_change_sequence=7,
+        )
+
+        should_skip, _ = service._should_skip_incremental()
+
+        assert should_skip is True
+
+    @pytest.mark.asyncio
+    async def test_synthesize_all_records_change_sequence(
+        self, synthesis_service, mock_registry_service
+    ):
+        """Test that a run records the journal sequence seen at its start."""
+        mock_registry_service.get_change_sequence.return_value = 42
+
+        await synthesis_service.synthesize_all()
+
+        assert synthesis_service._state.last_change_sequence == 42
+
+    @pytest.mark.asyncio
+    async def test_synthesize_all_skips_hash_when_journal_answers(
+        self, synthesis_service, mock_registry_service
+    ):
+        """Test that a journal-answered run does not hash the registry."""
+        from src.models.cross_synthesis import SynthesisState
+        from src.models.registry import RegistryChange, RegistryChangeKind
+
+        mock_registry_service.get_changes_since.return_value = [
+            RegistryChange(sequence=8, paper_id="a", kind=RegistryChangeKind.ADDED)
+        ]
+        mock_registry_service.get_change_sequence.return_value = 8
+        synthesis_service._state = SynthesisState(last_change_sequence=7)
+
+        with patch.object(
+            synthesis_service, "_calculate_registry_hash"
+        ) as calculate_hash:
+            await synthesis_service.synthesize_all()
+
+        calculate_hash.assert_not_called()
+        assert synthesis_service._state.last_change_sequence == 8
+        assert synthesis_service._state.last_registry_hash is None
+
+    @pytest.mark.asyncio
+    async def test_synthesize_all_hashes_registry_on_fallback(
+        self, synthesis_service, mock_registry_service
+    ):
+        """Test that the hash is recorded when the journal cannot answer."""
+        from src.models.cross_synthesis import SynthesisState
+
+        mock_registry_service.get_changes_since.return_value = None
+        synthesis_service._state = SynthesisState(last_change_sequence=7)
+
+        await synthesis_service.synthesize_all()
+
+        assert (
+            synthesis_service._state.last_registry_hash
+            == synthesis_service._calculate_registry_hash()
+        )
+
 
 class TestLLMIntegration:
     """Tests for LLM integration."""
@@ -996,6 +1109,184 @@ class TestBudgetManagement:
         assert len(report.results) == 2
 
 
+def _two_questions(**config) -> SynthesisConfig:
+    return SynthesisConfig(
+        questions=[
+            SynthesisQuestion(
+                id=f"q{i}",
+                name=f"Q{i}",
+                prompt=f"Test prompt {i} {{paper_summaries}}",
+                priority=i,
+                max_papers=2,
+            )
+            for i in (1, 2)
+        ],
+        **config,
+    )
+
+
+def _timed_llm(delays: list, cost_usd: float = 0.0):
+    """LLM double whose calls overlap for ``delays`` seconds each."""
+    import asyncio
+
+    from src.models.extraction import ExtractionResult, PaperExtraction
+
+    mock_llm = AsyncMock()
+    mock_llm.config = MagicMock()
+    mock_llm.config.model = "test-model"
+    mock_llm.in_flight = 0
+    mock_llm.peak = 0
+    calls = iter(delays)
+
+    async def mock_extract(*args, **kwargs):
+        delay = next(calls)
+        mock_llm.in_flight += 1
+        mock_llm.peak = max(mock_llm.peak, mock_llm.in_flight)
+        await asyncio.sleep(delay)
+        mock_llm.in_flight -= 1
+        return PaperExtraction(
+            paper_id="test",
+            extraction_results=[
+                ExtractionResult(
+                    target_name="cross_topic_synthesis",
+                    success=True,
+                    content=f"Took {delay}",
+                )
+            ],
+            tokens_used=100,
+            cost_usd=cost_usd,
+        )
+
+    mock_llm.extract = mock_extract
+    return mock_llm
+
+
+class TestConcurrentSynthesis:
+    """Tests for concurrent question synthesis under the budget."""
+
+    @pytest.mark.asyncio
+    async def test_questions_overlap_and_keep_priority_order(
+        self, mock_registry_service
+    ):
+        """Test that a slow first question does not reorder results."""
+        mock_llm = _timed_llm([0.05, 0.0])
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            config=_two_questions(),
+        )
+
+        report = await service.synthesize_all()
+
+        assert mock_llm.peak == 2
+        assert [r.question_id for r in report.results] == ["q1", "q2"]
+        assert report.results[0].synthesis_text == "Took 0.05"
+
+    @pytest.mark.asyncio
+    async def test_reservations_limit_dispatch_to_budget(self, mock_registry_service):
+        """Test that a question waits until its reservation fits the budget."""
+        mock_llm = _timed_llm([0.01, 0.01])
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            config=_two_questions(budget_per_synthesis_usd=0.005),
+        )
+        # One prompt's estimate fits the budget, two do not
+        service._answer_synthesizer.estimate_cost = lambda prompt: 0.003
+
+        report = await service.synthesize_all()
+
+        assert mock_llm.peak == 1
+        assert [r.question_id for r in report.results] == ["q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_actual_costs_are_charged_before_later_dispatch(
+        self, mock_registry_service
+    ):
+        """Test that a question is not dispatched once actual costs spent the budget."""
+        mock_llm = _timed_llm([0.0, 0.0], cost_usd=0.005)
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            config=_two_questions(budget_per_synthesis_usd=0.005),
+        )
+        service._answer_synthesizer.estimate_cost = lambda prompt: 0.003
+
+        report = await service.synthesize_all()
+
+        # q2 waited for q1 to settle, and q1 spent the whole budget
+        assert [r.question_id for r in report.results] == ["q1"]
+        assert report.total_cost_usd == pytest.approx(0.005)
+
+    @pytest.mark.asyncio
+    async def test_reservation_follows_the_actual_prompt(self, mock_registry_service):
+        """Test that a prompt costlier than the per-question cap still runs."""
+        mock_llm = _timed_llm([0.01, 0.01])
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            # A max_tokens_per_question prompt is estimated at $0.0045
+            config=_two_questions(
+                budget_per_synthesis_usd=0.01, max_tokens_per_question=1000
+            ),
+        )
+        service._answer_synthesizer.estimate_cost = lambda prompt: (
+            0.006 if "prompt 1" in prompt else 0.001
+        )
+
+        report = await service.synthesize_all()
+
+        assert [r.question_id for r in report.results] == ["q1", "q2"]
+        assert mock_llm.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_question_without_papers_costs_nothing(self, mock_registry_service):
+        """Test that a question no papers match is answered without the LLM."""
+        mock_llm = _timed_llm([0.0])
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            config=_two_questions(),
+        )
+        select_papers = service.select_papers
+        service.select_papers = lambda question: (
+            [] if question.id == "q1" else select_papers(question)
+        )
+
+        report = await service.synthesize_all()
+
+        assert [r.question_id for r in report.results] == ["q1", "q2"]
+        assert report.results[0].model_used == "none"
+        assert mock_llm.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_question_over_remaining_budget_stops_the_run(
+        self, mock_registry_service
+    ):
+        """Test that later questions are not dispatched once one ran out."""
+        mock_llm = _timed_llm([])
+        service = CrossTopicSynthesisService(
+            registry_service=mock_registry_service,
+            llm_service=mock_llm,
+            config=_two_questions(budget_per_synthesis_usd=0.005),
+        )
+        estimated = []
+
+        def estimate_cost(prompt):
+            estimated.append(prompt)
+            return 0.006
+
+        service._answer_synthesizer.estimate_cost = estimate_cost
+
+        report = await service.synthesize_all()
+
+        # q1 got the whole budget and gave up; q2 was never dispatched
+        assert report.results == []
+        assert mock_llm.peak == 0
+        # Prepared once for admission, checked once by the synthesizer
+        assert len(estimated) == 3
+
+
 class TestConfigValidation:
     """Tests for config validation edge cases."""
 
@@ -1270,7 +1561,11 @@ class TestCostLimitPaths:
 
     @pytest.mark.asyncio
     async def test_synthesize_all_zero_budget_stops(self, mock_registry_service):
-        """Test synthesize_all stops when budget is zero."""
+        """Test synthesize_all stops when budget is zero.
+
+        With one question in flight at a time, q1's actual cost is charged
+        before q2 could be dispatched.
+        """
         from src.models.extraction import PaperExtraction, ExtractionResult
 
         mock_llm = AsyncMock()
@@ -1294,6 +1589,7 @@ class TestCostLimitPaths:
 
         config = SynthesisConfig(
             budget_per_synthesis_usd=10.0,  # Exact budget for one question
+            max_concurrent_questions=1,
             questions=[
                 SynthesisQuestion(
                     id="q1",
@@ -1411,7 +1707,7 @@ class TestCostLimitPaths:
             config=config,
         )
 
-        # Patch synthesize_question to raise an exception directly
+        # Patch the answer synthesizer to raise an exception directly
         # This triggers the outer except block at lines 675-676
         call_count = 0
 
@@ -1432,7 +1728,9 @@ class TestCostLimitPaths:
                 cost_usd=0.0,
             )
 
-        with patch.object(service, "synthesize_question", mock_synthesize_question):
+        with patch.object(
+            service._answer_synthesizer, "synthesize", mock_synthesize_question
+        ):
             report = await service.synthesize_all()
 
         # Should continue after first exception and process second question
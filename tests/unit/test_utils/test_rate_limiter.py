@@ -0,0 +1,246 @@
+"""Unit tests for the fair, adaptive, optionally shared RateLimiter."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def sleeps():
+    """Patch asyncio.sleep inside the limiter and record requested waits."""
+    recorded: list[float] = []
+
+    async def _fake_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    with patch.object(rate_limiter_module.asyncio, "sleep", _fake_sleep):
+        yield recorded
+
+
+class TestFairness:
+    @pytest.mark.asyncio
+    async def test_burst_is_served_without_waiting(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=3)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquirers_get_distinct_fifo_slots(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=1)
+        await limiter.acquire()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        # One request per second: waiters are spaced ~1s apart instead of
+        # all sleeping the same wait and firing together.
+        assert len(sleeps) == 4
+        assert sleeps == sorted(sleeps)
+        for earlier, later in zip(sleeps, sleeps[1:]):
+            assert later - earlier == pytest.approx(1.0, abs=0.05)
+        assert limiter.tokens == pytest.approx(-4.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_up_to_burst(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=2)
+        limiter.tokens = 0.0
+        limiter.last_update = time.time() - 100
+
+        await limiter.acquire()
+
+        assert sleeps == []
+        assert limiter.tokens == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_its_slot(self):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.tokens == pytest.approx(-1.0, abs=0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.tokens == pytest.approx(0.0, abs=0.05)
+
+    def test_limiter_is_reusable_across_event_loops(self, tmp_path, sleeps):
+        # The shared backend yields while holding the lock, so concurrent
+        # callers contend for it and bind it to the running loop.
+        limiter = RateLimiter(
+            requests_per_minute=60,
+            burst_size=3,
+            name="s2",
+            shared_path=tmp_path / "rl.db",
+        )
+
+        async def _use() -> None:
+            await asyncio.gather(limiter.acquire(), limiter.acquire())
+
+        asyncio.run(_use())
+        asyncio.run(_use())
+
+        assert len(limiter.request_times) == 4
+
+
+class TestAbuseTracking:
+    @pytest.mark.asyncio
+    async def test_expired_request_times_are_dropped(self, sleeps):
+        limiter = RateLimiter()
+        stale = datetime.now(timezone.utc) - timedelta(minutes=5)
+        limiter.request_times.extend([stale] * 10)
+
+        await limiter.acquire()
+
+        assert len(limiter.request_times) == 1
+
+
+class TestAdaptiveRate:
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_bucket(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=5)
+
+        await limiter.record_throttled(30.0)
+        await limiter.acquire()
+
+        assert limiter.penalty == pytest.approx(0.5)
+        assert limiter.rate == pytest.approx(0.5)
+        assert sleeps[0] == pytest.approx(32.0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_without_hint_only_rate_drops(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60, burst_size=5)
+
+        await limiter.record_throttled()
+        await limiter.acquire()
+
+        assert limiter.rate == pytest.approx(0.5)
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_rate_never_drops_below_floor(self):
+        limiter = RateLimiter(requests_per_minute=60)
+
+        for _ in range(10):
+            await limiter.record_throttled()
+
+        assert limiter.penalty == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_rate_recovers_after_quiet_interval(self, sleeps):
+        limiter = RateLimiter(requests_per_minute=60)
+        await limiter.record_throttled()
+        await limiter.record_throttled()
+        limiter.penalized_at = time.time() - 61
+
+        await limiter.acquire()
+        assert limiter.penalty == pytest.approx(0.375)
+
+        limiter.penalty = 0.9
+        limiter.penalized_at = time.time() - 61
+        await limiter.acquire()
+        assert limiter.penalty == 1.0
+        assert limiter.rate == pytest.approx(limiter.base_rate)
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_logged(self, monkeypatch):
+        monkeypatch.setattr(rate_limiter_module, "logger", structlog.get_logger())
+        limiter = RateLimiter(requests_per_minute=60, name="openalex")
+
+        with structlog.testing.capture_logs() as logs:
+            await limiter.record_throttled(5.0)
+
+        events = [e for e in logs if e["event"] == "rate_limiter_backoff"]
+        assert events[0]["name"] == "openalex"
+        assert events[0]["requests_per_minute"] == 30.0
+        assert events[0]["retry_after"] == 5.0
+
+
+class TestSharedBackend:
+    def test_shared_path_requires_name(self, tmp_path):
+        limiter = RateLimiter(shared_path=tmp_path / "rl.db")
+
+        assert limiter.shared_path is None
+
+    def test_shared_path_defaults_to_env_var(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ARISP_RATE_LIMIT_DB", str(tmp_path / "rl.db"))
+
+        assert RateLimiter(name="arxiv").shared_path == tmp_path / "rl.db"
+        assert RateLimiter().shared_path is None
+
+    @pytest.mark.asyncio
+    async def test_same_name_shares_one_bucket(self, tmp_path, sleeps):
+        path = tmp_path / "rl.db"
+        first = RateLimiter(
+            requests_per_minute=60, burst_size=2, name="s2", shared_path=path
+        )
+        second = RateLimiter(
+            requests_per_minute=60, burst_size=2, name="s2", shared_path=path
+        )
+        other = RateLimiter(
+            requests_per_minute=60, burst_size=2, name="arxiv", shared_path=path
+        )
+
+        await first.acquire()
+        await second.acquire()
+        assert sleeps == []
+
+        # The shared budget is spent: a third request from either
+        # instance has to wait, while another name is unaffected.
+        await first.acquire()
+        assert len(sleeps) == 1
+        await other.acquire()
+        assert len(sleeps) == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_propagates_through_shared_row(self, tmp_path, sleeps):
+        path = tmp_path / "rl.db"
+        first = RateLimiter(requests_per_minute=60, name="s2", shared_path=path)
+        second = RateLimiter(requests_per_minute=60, name="s2", shared_path=path)
+
+        await first.record_throttled(20.0)
+        await second.acquire()
+
+        assert second.penalty == pytest.approx(0.5)
+        assert sleeps[0] == pytest.approx(22.0, abs=0.1)
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute("SELECT name FROM rate_limit_buckets").fetchall()
+        assert rows == [("s2",)]
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back_to_local_bucket(
+        self, tmp_path, sleeps, monkeypatch
+    ):
+        monkeypatch.setattr(rate_limiter_module, "logger", structlog.get_logger())
+        limiter = RateLimiter(name="s2", shared_path=tmp_path / "missing-dir" / "rl.db")
+
+        with structlog.testing.capture_logs() as logs:
+            await limiter.acquire()
+
+        assert limiter.tokens == pytest.approx(9.0, abs=0.01)
+        assert any(e["event"] == "rate_limiter_shared_backend_failed" for e in logs)
+
+    def test_transaction_rolls_back_on_error(self, tmp_path):
+        path = tmp_path / "rl.db"
+        limiter = RateLimiter(name="s2", shared_path=path)
+
+        def _boom(now: float) -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            limiter._shared_transaction(_boom)
+
+        with sqlite3.connect(path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM rate_limit_buckets").fetchone()
+        assert count == (0,)